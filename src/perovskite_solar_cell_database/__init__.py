@@ -1,21 +1,45 @@
 from pydantic import Field
-from temporalio import workflow
 
-# currently, imports inside workflow.unsafe.imports_passed_through() to avoid issues with temporalio workflow checks at the start of cpu-worker. TODO: move this init and related files to a dedicated folder, take care of m_def of the old files
-with workflow.unsafe.imports_passed_through():
+from perovskite_solar_cell_database.sandbox import imports_passed_through
+
+# TODO: move this init and related files to a dedicated folder, take care of m_def of
+# the old files
+with imports_passed_through():
     from nomad.config.models.plugins import (
         ParserEntryPoint,
         SchemaPackageEntryPoint,
     )
 
+
 class PerovskiteDatabasePackageEntryPoint(SchemaPackageEntryPoint):
-    # parameter: int = Field(0, description='Custom configuration parameter')
+    network_enrichment: bool = Field(
+        True,
+        description=(
+            'Query Crossref, PubChem and the search index during normalization. If '
+            'disabled, entries are only completed from the local caches and tagged as '
+            '`pending_enrichment` for a later batch enrichment. The setting applies to '
+            'the whole package, also if it is disabled on the ion parser.'
+        ),
+    )
+    warmup: bool = Field(
+        False,
+        description=(
+            'Load the heavy dependencies, the ion tables, the structure library and '
+            'the caches when the schema package is loaded instead of during the '
+            'normalization of the first entry. See `warmup.warmup`.'
+        ),
+    )
 
     def load(self):
         from perovskite_solar_cell_database.schema import (
             m_package,
         )
 
+        if self.warmup:
+            from perovskite_solar_cell_database.warmup import warmup
+
+            warmup()
+
         return m_package
 
 
@@ -1,8 +1,9 @@
 from nomad.actions import TaskQueue
 from pydantic import Field
-from temporalio import workflow
 
-with workflow.unsafe.imports_passed_through():
+from perovskite_solar_cell_database.sandbox import imports_passed_through
+
+with imports_passed_through():
     from nomad.config.models.plugins import ActionEntryPoint
 
 
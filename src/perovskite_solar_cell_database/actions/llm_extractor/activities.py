@@ -107,6 +107,11 @@ async def process_new_files(data: ProcessNewFilesInput) -> dict:
     from nomad.datamodel import User
     from nomad.utils import generate_entry_id
 
+    from perovskite_solar_cell_database.crossref import (
+        find_dois_in_files,
+        prefetch_crossref_metadata,
+    )
+
     upload_files = get_upload_files(
         data.upload_id,
         data.user_id,
@@ -147,6 +152,13 @@ async def process_new_files(data: ProcessNewFilesInput) -> dict:
         activity.logger.error(error_msg)
         return {'refs': [], 'success': False, 'errors': [error_msg]}
 
+    # Resolve the DOIs of all new entries at once, so that normalizing the entries
+    # reads the Crossref metadata from the cache.
+    await prefetch_crossref_metadata(
+        find_dois_in_files(operation['path'] for operation in file_operations),
+        logger=activity.logger,
+    )
+
     handle = upload.process_upload(
         file_operations=file_operations,
         path_filter='results',
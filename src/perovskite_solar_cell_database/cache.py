@@ -0,0 +1,178 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+CACHE_DIR_ENV = 'PEROVSKITE_DATABASE_CACHE_DIR'
+
+
+def get_cache_dir() -> str:
+    """
+    Returns the directory of the persistent caches. Set the
+    `PEROVSKITE_DATABASE_CACHE_DIR` environment variable to share it between workers.
+    """
+    return os.environ.get(
+        CACHE_DIR_ENV,
+        os.path.join(
+            os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')),
+            'perovskite_solar_cell_database',
+        ),
+    )
+
+
+class LRUCache:
+    """
+    A small thread-safe least recently used cache. Entries can expire after `ttl`
+    seconds.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _expired(self, created: float) -> bool:
+        return self.ttl is not None and time.monotonic() - created > self.ttl
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._data:
+                return default
+            value, created = self._data[key]
+            if self._expired(created):
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value) -> None:
+        with self._lock:
+            self._data[key] = (value, time.monotonic())
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            return key in self._data and not self._expired(self._data[key][1])
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class PersistentCache:
+    """
+    A JSON key-value store in a SQLite file that survives worker restarts and can be
+    shared between processes. Entries can expire after `ttl` seconds.
+
+    If the file can not be opened, e.g. on a read-only file system, the cache stays
+    empty and writes are ignored.
+    """
+
+    def __init__(self, name: str, ttl: float | None = None, path: str | None = None):
+        self.name = name
+        self.ttl = ttl
+        self.path = path or os.path.join(get_cache_dir(), f'{name}.sqlite')
+        self._local = threading.local()
+        self._disabled = False
+
+    def _connection(self) -> sqlite3.Connection | None:
+        if self._disabled:
+            return None
+        connection = getattr(self._local, 'connection', None)
+        # connections must not be shared with forked worker processes
+        if connection is not None and self._local.pid == os.getpid():
+            return connection
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS cache '
+                '(key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)'
+            )
+            connection.commit()
+        except (OSError, sqlite3.Error):
+            self._disabled = True
+            return None
+        self._local.connection = connection
+        self._local.pid = os.getpid()
+        return connection
+
+    def open(self) -> bool:
+        """
+        Opens the file of the cache in the current thread ahead of the first access.
+        Returns whether the cache is usable.
+        """
+        return self._connection() is not None
+
+    def get(self, key: str, default=None):
+        connection = self._connection()
+        if connection is None:
+            return default
+        try:
+            row = connection.execute(
+                'SELECT value, created FROM cache WHERE key = ?', (key,)
+            ).fetchone()
+        except sqlite3.Error:
+            return default
+        if row is None:
+            return default
+        value, created = row
+        if self.ttl is not None and time.time() - created > self.ttl:
+            return default
+        return json.loads(value)
+
+    def get_many(self, keys: list[str]) -> dict:
+        return {key: value for key in keys if (value := self.get(key)) is not None}
+
+    def set(self, key: str, value) -> None:
+        self.set_many({key: value})
+
+    def set_many(self, items: dict) -> None:
+        connection = self._connection()
+        if connection is None or not items:
+            return
+        now = time.time()
+        try:
+            connection.executemany(
+                'INSERT OR REPLACE INTO cache (key, value, created) VALUES (?, ?, ?)',
+                [(key, json.dumps(value), now) for key, value in items.items()],
+            )
+            connection.commit()
+        except sqlite3.Error:
+            pass
+
+    def delete(self, key: str) -> None:
+        connection = self._connection()
+        if connection is None:
+            return
+        try:
+            connection.execute('DELETE FROM cache WHERE key = ?', (key,))
+            connection.commit()
+        except sqlite3.Error:
+            pass
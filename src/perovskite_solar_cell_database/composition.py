@@ -19,10 +19,6 @@
 import re
 from typing import TYPE_CHECKING
 
-from ase import Atoms
-from nomad.atomutils import (
-    Formula,
-)
 from nomad.datamodel.data import (
     EntryData,
     EntryDataCategory,
@@ -43,7 +39,6 @@ from nomad.datamodel.metainfo.basesections import (
     PureSubstance,
     PureSubstanceComponent,
     SystemComponent,
-    elemental_composition_from_formula,
 )
 from nomad.datamodel.metainfo.common import (
     ProvenanceTracker,
@@ -66,52 +61,110 @@ from nomad.metainfo.metainfo import (
     Section,
     SubSection,
 )
-from nomad.normalizing.common import nomad_atoms_from_ase_atoms
 from nomad.normalizing.topology import (
     add_system,
     add_system_info,
 )
 from structlog.stdlib import BoundLogger
 
+from perovskite_solar_cell_database.cache import LRUCache
+from perovskite_solar_cell_database.conformers import (
+    convert_rdkit_mol_to_ase_atoms,
+    optimize_molecule,
+    optimize_molecules,
+)
+from perovskite_solar_cell_database.enrichment import mark_pending_enrichment
+from perovskite_solar_cell_database.formula import get_formula
+from perovskite_solar_cell_database.network import is_offline
+from perovskite_solar_cell_database.pubchem import normalize_pub_chem_section
+from perovskite_solar_cell_database.topology import (
+    cached_topology_system,
+    structure_atoms,
+)
+
 if TYPE_CHECKING:
     from nomad.datamodel.datamodel import EntryArchive
     from structlog.stdlib import BoundLogger
 
 m_package = Package()
 
+# seconds a resolved ion entry is reused before the search index is queried again
+ION_ENTRY_CACHE_TTL = 600
+
+_ion_entry_cache = LRUCache(maxsize=4096, ttl=ION_ENTRY_CACHE_TTL)
+
 
-def convert_rdkit_mol_to_ase_atoms(rdkit_mol):
+def find_ion_entries(abbreviations: list[str], user_id: str) -> dict[str, str]:
     """
-    Convert an RDKit molecule to an ASE atoms object.
+    Finds the `PerovskiteIon` entries of several abbreviations with one search, using
+    the `perovskite_ion_<abbreviation>` lab ids of the ion entries. The oldest entry
+    of each abbreviation is used. Found entries are cached per user for
+    `ION_ENTRY_CACHE_TTL` seconds.
 
     Args:
-        rdkit_mol (rdkit.Chem.Mol): RDKit molecule object.
+        abbreviations (list[str]): The ion abbreviations.
+        user_id (str): The id of the user whose visible entries are searched.
 
     Returns:
-        ase.Atoms: ASE atoms object.
+        dict[str, str]: The references to the `data` of the ion entries by
+        abbreviation. Abbreviations without an entry are missing.
     """
-    positions = rdkit_mol.GetConformer().GetPositions()
-    atomic_numbers = [atom.GetAtomicNum() for atom in rdkit_mol.GetAtoms()]
-    ase_atoms = Atoms(numbers=atomic_numbers, positions=positions)
-    return ase_atoms
-
-
-def optimize_molecule(smiles):
-    from rdkit import Chem
-    from rdkit.Chem import AllChem
-
-    try:
-        m = Chem.MolFromSmiles(smiles)
-        m = Chem.AddHs(m)
-
-        AllChem.EmbedMolecule(m)
-        AllChem.MMFFOptimizeMolecule(m)
-
-        ase_atoms = convert_rdkit_mol_to_ase_atoms(m)
+    references = {}
+    for abbreviation in abbreviations:
+        reference = _ion_entry_cache.get((user_id, abbreviation))
+        if reference is not None:
+            references[abbreviation] = reference
+    lab_ids = {
+        f'perovskite_ion_{abbreviation}': abbreviation
+        for abbreviation in abbreviations
+        if abbreviation not in references
+    }
+    if not lab_ids:
+        return references
+
+    from nomad.search import (
+        MetadataPagination,
+        MetadataRequired,
+        search,
+    )
 
-        return ase_atoms
-    except Exception as e:
-        print(f'An error occurred: {e}')
+    query = {
+        'section_defs.definition_qualified_name:all': [
+            'perovskite_solar_cell_database.composition.PerovskiteIon'
+        ],
+        'results.eln.lab_ids:any': list(lab_ids),
+    }  # TODO: Search also for smiles and molecular_formula
+    page_after_value = None
+    while True:
+        search_result = search(
+            owner='all',
+            query=query,
+            pagination=MetadataPagination(
+                page_size=max(len(lab_ids), 10),
+                order_by='entry_create_time',
+                order='asc',
+                page_after_value=page_after_value,
+            ),
+            required=MetadataRequired(
+                include=['entry_id', 'upload_id', 'results.eln.lab_ids']
+            ),
+            user_id=user_id,
+        )
+        for entry in search_result.data:
+            entry_lab_ids = entry.get('results', {}).get('eln', {}).get('lab_ids', [])
+            for lab_id in entry_lab_ids:
+                abbreviation = lab_ids.get(lab_id)
+                if abbreviation is None or abbreviation in references:
+                    continue
+                references[abbreviation] = (
+                    f'../uploads/{entry["upload_id"]}/archive/{entry["entry_id"]}#data'
+                )
+                _ion_entry_cache.set((user_id, abbreviation), references[abbreviation])
+        page_after_value = search_result.pagination.next_page_after_value
+        if page_after_value is None or all(
+            abbreviation in references for abbreviation in lab_ids.values()
+        ):
+            return references
 
 
 class PerovskiteCompositionCategory(EntryDataCategory):
@@ -150,17 +203,23 @@ class PerovskiteChemicalSection(ArchiveSection):
         shape=[],
     )
 
-    def to_topology_system(self) -> System:
+    def to_topology_system(self, logger: 'BoundLogger' = None) -> System:
         """
-        Convert the section to a system.
+        Convert the section to a system. If no structure can be generated from the
+        SMILES in time, the system only contains the label.
+
+        Args:
+            logger (BoundLogger): A structlog logger.
 
         Returns:
             System: The system object.
         """
         if self.smiles is None:
             return System(label=self.common_name)
-        ase_atoms = optimize_molecule(self.smiles)
-        atoms = nomad_atoms_from_ase_atoms(ase_atoms)
+        ase_atoms = optimize_molecule(self.smiles, logger=logger)
+        if ase_atoms is None:
+            return System(label=self.common_name)
+        atoms = structure_atoms(ase_atoms)
         structural_type = 'molecule'
         if len(ase_atoms) == 1:
             structural_type = 'atom'
@@ -171,6 +230,30 @@ class PerovskiteChemicalSection(ArchiveSection):
             structural_type=structural_type,
         )
 
+    def get_topology_system(self, logger: 'BoundLogger' = None) -> System:
+        """
+        Returns a copy of the cached system of `to_topology_system` with the
+        information of `add_system_info`. The template is shared by all sections of
+        the same type, abbreviation, SMILES and name.
+
+        Args:
+            logger (BoundLogger): A structlog logger.
+
+        Returns:
+            System: The system object, to be added to a topology with `add_system`.
+        """
+        key = (
+            self.m_def.qualified_name(),
+            getattr(self, 'abbreviation', None),
+            self.smiles,
+            self.common_name,
+        )
+        return cached_topology_system(
+            key,
+            lambda: self.to_topology_system(logger=logger),
+            keep=lambda system: self.smiles is None or system.atoms is not None,
+        )
+
 
 class PerovskiteIonSection(PerovskiteChemicalSection):
     abbreviation = Quantity(
@@ -257,16 +340,17 @@ class PerovskiteIon(PureSubstance, PerovskiteIonSection):
         """,
     )
 
-    def normalize(self, archive: 'EntryArchive', logger: 'BoundLogger') -> None:
+    def pub_chem_sections(
+        self,
+    ) -> tuple[PubChemPureSubstanceSection, PubChemPureSubstanceSection]:
         """
-        The normalizer for the `PerovskiteIon` class.
+        Returns the unnormalized PubChem sections of the ion and of its source
+        compound, as they are looked up during normalization.
 
-        Args:
-            archive (EntryArchive): The archive containing the section that is being
-            normalized.
-            logger (BoundLogger): A structlog logger.
+        Returns:
+            tuple[PubChemPureSubstanceSection, PubChemPureSubstanceSection]: The pure
+            substance and the source compound.
         """
-        self.lab_id = 'perovskite_ion_' + self.abbreviation
         pure_substance = PubChemPureSubstanceSection(
             molecular_formula=self.molecular_formula,
             smile=self.smiles,
@@ -276,7 +360,28 @@ class PerovskiteIon(PureSubstance, PerovskiteIonSection):
         )
         if isinstance(self.pure_substance, PubChemPureSubstanceSection):
             pure_substance.pub_chem_cid = self.pure_substance.pub_chem_cid
-        pure_substance.normalize(archive, logger)
+        source_compound = PubChemPureSubstanceSection(
+            molecular_formula=self.source_compound_molecular_formula,
+            smile=self.source_compound_smiles,
+            iupac_name=self.source_compound_iupac_name,
+            cas_number=self.source_compound_cas_number,
+        )
+        if isinstance(self.source_compound, PubChemPureSubstanceSection):
+            source_compound.pub_chem_cid = self.source_compound.pub_chem_cid
+        return pure_substance, source_compound
+
+    def normalize(self, archive: 'EntryArchive', logger: 'BoundLogger') -> None:
+        """
+        The normalizer for the `PerovskiteIon` class.
+
+        Args:
+            archive (EntryArchive): The archive containing the section that is being
+            normalized.
+            logger (BoundLogger): A structlog logger.
+        """
+        self.lab_id = 'perovskite_ion_' + self.abbreviation
+        pure_substance, source_compound = self.pub_chem_sections()
+        normalize_pub_chem_section(pure_substance, archive, logger)
         if self.molecular_formula is None:
             self.molecular_formula = pure_substance.molecular_formula
         if self.smiles is None:
@@ -293,15 +398,7 @@ class PerovskiteIon(PureSubstance, PerovskiteIonSection):
             self.pure_substance.molecular_formula = re.sub(
                 r'(?<=[A-Za-z])\d*[+-]', '', formula
             )
-        source_compound = PubChemPureSubstanceSection(
-            molecular_formula=self.source_compound_molecular_formula,
-            smile=self.source_compound_smiles,
-            iupac_name=self.source_compound_iupac_name,
-            cas_number=self.source_compound_cas_number,
-        )
-        if isinstance(self.source_compound, PubChemPureSubstanceSection):
-            source_compound.pub_chem_cid = self.source_compound.pub_chem_cid
-        source_compound.normalize(archive, logger)
+        normalize_pub_chem_section(source_compound, archive, logger)
         if self.source_compound_molecular_formula is None:
             self.source_compound_molecular_formula = source_compound.molecular_formula
         if self.source_compound_smiles is None:
@@ -314,11 +411,10 @@ class PerovskiteIon(PureSubstance, PerovskiteIonSection):
 
         super().normalize(archive, logger)
 
-        system = self.to_topology_system()
+        system = self.get_topology_system(logger=logger)
         system.system_relation = Relation(type='root')
         topology = {}
         add_system(system, topology)
-        add_system_info(system, topology)
         material = archive.m_setdefault('results.material')
         for system in topology.values():
             material.m_add_sub_section(Material.topology, system)
@@ -491,34 +587,27 @@ class PerovskiteIonComponent(SystemComponent, PerovskiteIonSection):
         if not isinstance(self.system, PerovskiteIon):
             if self.abbreviation is None or archive.metadata.main_author is None:
                 return
-            from nomad.search import (
-                MetadataPagination,
-                search,
-            )
-
-            query = {
-                'section_defs.definition_qualified_name:all': [
-                    'perovskite_solar_cell_database.composition.PerovskiteIon'
-                ],
-                'results.eln.lab_ids': 'perovskite_ion_' + self.abbreviation,
-            }  # TODO: Search also for smiles and molecular_formula
-            search_result = search(
-                owner='all',
-                query=query,
-                pagination=MetadataPagination(
-                    page_size=1,
-                    order_by='entry_create_time',
-                    order='asc',
-                ),
-                user_id=archive.metadata.main_author.user_id,
-            )
-            if search_result.pagination.total > 0:
-                entry_id = search_result.data[0]['entry_id']
-                upload_id = search_result.data[0]['upload_id']
-                self.system = f'../uploads/{upload_id}/archive/{entry_id}#data'
+            if isinstance(self.m_parent, PerovskiteCompositionSection):
+                # resolved with the other ions by the composition
+                return
+            if is_offline():
+                mark_pending_enrichment(archive)
             else:
-                logger.warn(f'Could not find system for ion {self.abbreviation}.')
+                reference = find_ion_entries(
+                    [self.abbreviation], archive.metadata.main_author.user_id
+                ).get(self.abbreviation)
+                if reference is not None:
+                    self.system = reference
+            if self.system is None:
+                if not is_offline():
+                    logger.warn(f'Could not find system for ion {self.abbreviation}.')
                 return  # TODO: Create ion
+        self.set_system_quantities()
+
+    def set_system_quantities(self) -> None:
+        """
+        Sets the quantities of the ion that are not set yet from its `system`.
+        """
         if self.abbreviation is None:
             self.abbreviation = self.system.abbreviation
         if self.common_name is None:
@@ -578,8 +667,8 @@ class PerovskiteAIonComponent(PerovskiteIonComponent):
         a_eln=dict(component='ReferenceEditQuantity'),
     )
 
-    def to_topology_system(self) -> System:
-        system = super().to_topology_system()
+    def to_topology_system(self, logger: 'BoundLogger' = None) -> System:
+        system = super().to_topology_system(logger=logger)
         system.label = 'Perovskite A Ion: ' + self.abbreviation
         return system
 
@@ -619,8 +708,8 @@ class PerovskiteBIonComponent(PerovskiteIonComponent):
         a_eln=dict(component='ReferenceEditQuantity'),
     )
 
-    def to_topology_system(self) -> System:
-        system = super().to_topology_system()
+    def to_topology_system(self, logger: 'BoundLogger' = None) -> System:
+        system = super().to_topology_system(logger=logger)
         system.label = 'Perovskite B Ion: ' + self.abbreviation
         return system
 
@@ -660,8 +749,8 @@ class PerovskiteXIonComponent(PerovskiteIonComponent):
         a_eln=dict(component='ReferenceEditQuantity'),
     )
 
-    def to_topology_system(self) -> System:
-        system = super().to_topology_system()
+    def to_topology_system(self, logger: 'BoundLogger' = None) -> System:
+        system = super().to_topology_system(logger=logger)
         system.label = 'Perovskite C Ion: ' + self.abbreviation
         return system
 
@@ -729,7 +818,7 @@ class Impurity(PureSubstanceComponent, PerovskiteChemicalSection):
         )
         if isinstance(self.pure_substance, PubChemPureSubstanceSection):
             pure_substance.pub_chem_cid = self.pure_substance.pub_chem_cid
-        pure_substance.normalize(archive, logger)
+        normalize_pub_chem_section(pure_substance, archive, logger)
         if self.molecular_formula is None:
             self.molecular_formula = pure_substance.molecular_formula
         if self.smiles is None:
@@ -824,8 +913,7 @@ class PerovskiteCompositionSection(ArchiveSection):
         )
         formula_str = self.get_formula_str()
         if formula_str:
-            formula = Formula(formula_str)
-            formula.populate(system, overwrite=True)
+            get_formula(formula_str).populate(system, overwrite=True)
         else:
             logger.warn('Could not find chemical formula for Perovskite.')
 
@@ -837,6 +925,67 @@ class PerovskiteCompositionSection(ArchiveSection):
         system.chemical_formula_descriptive = self.long_form
         return system
 
+    def resolve_ion_systems(
+        self, archive: 'EntryArchive', logger: 'BoundLogger'
+    ) -> None:
+        """
+        Sets the `system` of all ions of the composition that do not reference their
+        `PerovskiteIon` entry yet, with one search for the abbreviations of all sites,
+        and the quantities of the ions from their systems. Called by `normalize`, the
+        ions do not search their systems themselves.
+
+        Args:
+            archive (EntryArchive): The archive containing the section.
+            logger (BoundLogger): A structlog logger.
+        """
+        if archive.metadata is None or archive.metadata.main_author is None:
+            return
+        ions = [
+            ion
+            for ion in self.ions_a_site + self.ions_b_site + self.ions_x_site
+            if ion.abbreviation is not None
+            and not isinstance(ion.system, PerovskiteIon)
+        ]
+        if not ions:
+            return
+        if is_offline():
+            mark_pending_enrichment(archive)
+            return
+        references = find_ion_entries(
+            list(dict.fromkeys(ion.abbreviation for ion in ions)),
+            archive.metadata.main_author.user_id,
+        )
+        for ion in ions:
+            reference = references.get(ion.abbreviation)
+            if reference is None:
+                logger.warn(f'Could not find system for ion {ion.abbreviation}.')
+                continue
+            ion.system = reference
+            ion.set_system_quantities()
+
+    def get_topology_system(self, logger: 'BoundLogger') -> System:
+        """
+        Returns a copy of the cached system of `to_topology_system`. The template is
+        shared by all compositions with the same formula and dimensionality.
+
+        Args:
+            logger (BoundLogger): A structlog logger.
+
+        Returns:
+            System: The system object, to be added to a topology with `add_system`.
+        """
+        formula_str = self.get_formula_str()
+        if not formula_str:
+            system = self.to_topology_system(logger=logger)
+            add_system_info(system, {})
+            return system
+        system = cached_topology_system(
+            ('PerovskiteComposition', formula_str, self.dimensionality),
+            lambda: self.to_topology_system(logger=logger),
+        )
+        system.chemical_formula_descriptive = self.long_form
+        return system
+
     def get_formula_str(self) -> str:
         """
         Get the formula string for the perovskite composition.
@@ -882,6 +1031,8 @@ class PerovskiteCompositionSection(ArchiveSection):
             logger (BoundLogger): A structlog logger.
         """
         super().normalize(archive, logger)
+        # the ions are normalized before the composition
+        self.resolve_ion_systems(archive, logger)
         self.get_formula_str()
 
 
@@ -942,16 +1093,16 @@ class PerovskiteComposition(PerovskiteCompositionSection, CompositeSystem, Entry
         )
 
         try:
-            formula = Formula(self.get_formula_str())
+            formula = get_formula(self.get_formula_str())
             formula.populate(archive.results.material, overwrite=True)
         except Exception as e:
             logger.warn('Could not analyse chemical formula.', exc_info=e)
         archive.results.material.chemical_formula_descriptive = self.long_form
 
         if archive.results.material.chemical_formula_iupac is not None:
-            self.elemental_composition = elemental_composition_from_formula(
-                Formula(archive.results.material.chemical_formula_iupac)
-            )
+            self.elemental_composition = get_formula(
+                archive.results.material.chemical_formula_iupac
+            ).system_elemental_composition()
 
         if self.dimensionality in ['0D', '1D', '2D', '3D']:
             archive.results.properties.dimensionality = (
@@ -973,15 +1124,18 @@ class PerovskiteComposition(PerovskiteCompositionSection, CompositeSystem, Entry
             )
 
         topology = {}
-        parent_system = self.to_topology_system(logger=logger)
+        parent_system = self.get_topology_system(logger=logger)
         parent_system.system_relation = Relation(type='root')
         add_system(parent_system, topology)
-        add_system_info(parent_system, topology)
 
+        # embed all ions at once, to_topology_system then hits the cache
+        optimize_molecules(
+            [ion.smiles for ion in self.components if ion.smiles is not None],
+            logger=logger,
+        )
         for ion in self.components:
-            child_system = ion.to_topology_system()
+            child_system = ion.get_topology_system(logger=logger)
             add_system(child_system, topology, parent_system)
-            add_system_info(child_system, topology)
 
         for system in topology.values():
             archive.results.material.m_add_sub_section(Material.topology, system)
@@ -0,0 +1,421 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Shared service for the 3D structures of the perovskite ions.
+
+Structures are keyed by canonical SMILES. Lookups go through an in-memory LRU cache,
+the prebuilt library of all catalogued ions and a persistent SQLite store before
+RDKit embeds and optimizes the molecule. Embedding is seeded, so the cached
+structures are reproducible, and runs in a small pool of worker processes with a time
+budget per molecule, so a pathological SMILES can not stall the caller.
+
+Rebuild the library after editing the ion tables with:
+
+    python -m perovskite_solar_cell_database.conformers
+"""
+
+import atexit
+import multiprocessing
+import multiprocessing.pool
+import os
+import re
+import threading
+import time
+from functools import lru_cache
+
+import numpy as np
+from ase import Atoms
+from nomad import utils
+
+from perovskite_solar_cell_database.cache import LRUCache, PersistentCache
+
+EMBEDDING_SEED = 42
+# seconds RDKit may spend on embedding and optimizing a single molecule
+EMBEDDING_TIMEOUT = 30
+EMBEDDING_WORKERS = 2
+# seconds until a molecule that failed or timed out is embedded again
+FAILURE_TTL = 3600
+
+STRUCTURE_LIBRARY = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)),
+    'schema_sections',
+    'ions',
+    'ion_structures.npz',
+)
+
+_logger = utils.get_logger(__name__)
+
+_memory_cache = LRUCache(maxsize=512)
+_disk_cache = PersistentCache('conformers')
+# time of the last failure or timeout of molecules in this process
+_failed: dict[str, float] = {}
+
+_pool: multiprocessing.pool.Pool | None = None
+_pool_lock = threading.Lock()
+
+# SMILES of a single atom without hydrogens, e.g. `[Pb+2]` or `[I-]`
+MONATOMIC_SMILES = re.compile(r'\[([A-Z][a-z]?)(?:[+-]\d*|\++|-+)?\]')
+
+
+def convert_rdkit_mol_to_ase_atoms(rdkit_mol):
+    """
+    Convert an RDKit molecule to an ASE atoms object.
+
+    Args:
+        rdkit_mol (rdkit.Chem.Mol): RDKit molecule object.
+
+    Returns:
+        ase.Atoms: ASE atoms object.
+    """
+    positions = rdkit_mol.GetConformer().GetPositions()
+    atomic_numbers = [atom.GetAtomicNum() for atom in rdkit_mol.GetAtoms()]
+    ase_atoms = Atoms(numbers=atomic_numbers, positions=positions)
+    return ase_atoms
+
+
+@lru_cache(maxsize=4096)
+def canonical_smiles(smiles: str) -> str | None:
+    """
+    Returns the RDKit canonical form of a SMILES string or `None` if it can not be
+    parsed.
+    """
+    from rdkit import Chem
+
+    m = Chem.MolFromSmiles(smiles)
+    if m is None:
+        return None
+    return Chem.MolToSmiles(m)
+
+
+def monatomic_symbol(smiles: str | None) -> str | None:
+    """
+    Returns the element of a SMILES string of a single atom, e.g. `Pb` for `[Pb+2]`,
+    or `None` for molecules.
+    """
+    from ase.data import chemical_symbols
+
+    if not isinstance(smiles, str):
+        return None
+    match = MONATOMIC_SMILES.fullmatch(smiles.strip())
+    if match is None or match[1] not in chemical_symbols[1:]:
+        return None
+    return match[1]
+
+
+def single_atom(symbol: str) -> Atoms:
+    """
+    Returns the structure of a single atom at the origin, as RDKit embeds it.
+    """
+    return Atoms(symbols=[symbol], positions=[[0.0, 0.0, 0.0]])
+
+
+def embed_molecule(smiles: str) -> Atoms:
+    """
+    Embeds a molecule with RDKit and optimizes it with the MMFF force field.
+
+    Args:
+        smiles (str): The SMILES string of the molecule.
+
+    Returns:
+        ase.Atoms: The optimized structure.
+    """
+    from rdkit import Chem
+    from rdkit.Chem import AllChem
+
+    m = Chem.MolFromSmiles(smiles)
+    m = Chem.AddHs(m)
+
+    AllChem.EmbedMolecule(m, randomSeed=EMBEDDING_SEED)
+    AllChem.MMFFOptimizeMolecule(m)
+
+    return convert_rdkit_mol_to_ase_atoms(m)
+
+
+def atoms_to_dict(atoms: Atoms) -> dict:
+    return {
+        'numbers': atoms.numbers.tolist(),
+        'positions': atoms.positions.tolist(),
+    }
+
+
+def atoms_from_dict(data: dict) -> Atoms:
+    return Atoms(numbers=data['numbers'], positions=data['positions'])
+
+
+class StructureLibrary:
+    """
+    Read-only library of prebuilt ion structures stored in a single `.npz` file.
+
+    All structures share the flat `numbers` and `positions` arrays. The atoms of the
+    structure `i` are `numbers[offsets[i]:offsets[i + 1]]`.
+    """
+
+    def __init__(self, path: str = STRUCTURE_LIBRARY):
+        self.path = path
+        self._index: dict[str, int] | None = None
+
+    def _load(self) -> None:
+        self._index = {}
+        if not os.path.exists(self.path):
+            return
+        with np.load(self.path) as data:
+            self._offsets = data['offsets']
+            self._numbers = data['numbers']
+            self._positions = data['positions']
+            self._index = {str(key): i for i, key in enumerate(data['smiles'])}
+
+    def __contains__(self, smiles: str) -> bool:
+        if self._index is None:
+            self._load()
+        return smiles in self._index
+
+    def __len__(self) -> int:
+        if self._index is None:
+            self._load()
+        return len(self._index)
+
+    def get(self, smiles: str) -> Atoms | None:
+        """
+        Returns the structure of a canonical SMILES string or `None` if it is not in
+        the library.
+        """
+        if self._index is None:
+            self._load()
+        i = self._index.get(smiles)
+        if i is None:
+            return None
+        start, end = self._offsets[i], self._offsets[i + 1]
+        return Atoms(
+            numbers=self._numbers[start:end], positions=self._positions[start:end]
+        )
+
+
+_structure_library = StructureLibrary()
+
+
+def build_structure_library(target: str = STRUCTURE_LIBRARY) -> str:
+    """
+    Embeds and optimizes every ion with a SMILES in the ion tables and writes the
+    structures into a single `.npz` file.
+
+    Args:
+        target (str): Path of the library file.
+
+    Returns:
+        str: Path of the library file.
+    """
+    from perovskite_solar_cell_database.schema_sections.ions.ion_tables import (
+        load_ion_tables,
+    )
+
+    keys = []
+    for rows in load_ion_tables().values():
+        for row in rows:
+            if row['smile'] is None:
+                continue
+            key = canonical_smiles(row['smile'])
+            if key is not None and key not in keys:
+                keys.append(key)
+
+    smiles = []
+    offsets = [0]
+    numbers = []
+    positions = []
+    for key in keys:
+        try:
+            ase_atoms = embed_molecule(key)
+        except Exception as e:
+            _logger.warning('Could not embed the ion.', smiles=key, exc_info=e)
+            continue
+        smiles.append(key)
+        numbers.append(ase_atoms.numbers)
+        positions.append(ase_atoms.positions)
+        offsets.append(offsets[-1] + len(ase_atoms))
+
+    np.savez_compressed(
+        target,
+        smiles=np.array(smiles),
+        offsets=np.array(offsets, dtype=np.int32),
+        numbers=np.concatenate(numbers).astype(np.uint8),
+        positions=np.concatenate(positions),
+    )
+    return target
+
+
+def _embed_to_dict(smiles: str) -> dict:
+    return atoms_to_dict(embed_molecule(smiles))
+
+
+def _get_pool() -> multiprocessing.pool.Pool:
+    global _pool  # noqa: PLW0603
+    with _pool_lock:
+        if _pool is None:
+            _pool = multiprocessing.get_context('spawn').Pool(EMBEDDING_WORKERS)
+        return _pool
+
+
+def _terminate_pool() -> None:
+    """
+    Terminates the worker processes, e.g. if one of them is stuck in RDKit. A new
+    pool is started on the next call.
+    """
+    global _pool  # noqa: PLW0603
+    with _pool_lock:
+        if _pool is None:
+            return
+        _pool.terminate()
+        _pool = None
+
+
+# the workers are not stopped by the garbage collection of the pool at exit
+atexit.register(_terminate_pool)
+
+
+def _warn(logger, message: str, **kwargs) -> None:
+    (_logger if logger is None else logger).warning(message, **kwargs)
+
+
+def _recently_failed(key: str) -> bool:
+    failed_at = _failed.get(key)
+    if failed_at is None:
+        return False
+    if time.monotonic() - failed_at < FAILURE_TTL:
+        return True
+    _failed.pop(key, None)
+    return False
+
+
+def _get_cached(key: str) -> Atoms | None:
+    ase_atoms = _memory_cache.get(key)
+    if ase_atoms is None:
+        ase_atoms = _structure_library.get(key)
+    if ase_atoms is None:
+        data = _disk_cache.get(key)
+        if data is not None:
+            ase_atoms = atoms_from_dict(data)
+    if ase_atoms is not None:
+        _memory_cache.set(key, ase_atoms)
+    return ase_atoms
+
+
+def optimize_molecules(
+    smiles_list: list[str], timeout: float = EMBEDDING_TIMEOUT, logger=None
+) -> list[Atoms | None]:
+    """
+    Returns the optimized 3D structures of several molecules, e.g. all ions of an
+    upload.
+
+    Single atoms are created directly without RDKit. Molecules that are not cached
+    are embedded in parallel in a small pool of worker processes. A molecule that takes longer than `timeout` seconds is given up on, a
+    warning is recorded and `None` is returned for it. It is not embedded again in
+    this process for `FAILURE_TTL` seconds.
+
+    Args:
+        smiles_list (list[str]): The SMILES strings of the molecules.
+        timeout (float): The time budget per molecule in seconds.
+        logger (BoundLogger): A structlog logger, the module logger if not given.
+
+    Returns:
+        list[ase.Atoms | None]: Copies of the structures in the order of
+        `smiles_list`, `None` for molecules that could not be embedded in time.
+    """
+    keys = []
+    for smiles in smiles_list:
+        if monatomic_symbol(smiles) is not None:
+            keys.append(smiles)
+            continue
+        try:
+            key = canonical_smiles(smiles)
+        except Exception as e:
+            key = None
+            _warn(logger, f'An error occurred: {e}')
+        if key is None and smiles is not None:
+            _warn(logger, f'Could not parse SMILES {smiles}.')
+        keys.append(key)
+
+    results = {}
+    missing = []
+    for key in keys:
+        if key is None or key in results or key in missing:
+            continue
+        symbol = monatomic_symbol(key)
+        if symbol is not None:
+            results[key] = single_atom(symbol)
+            continue
+        if _recently_failed(key):
+            results[key] = None
+            continue
+        ase_atoms = _get_cached(key)
+        if ase_atoms is None:
+            missing.append(key)
+        else:
+            results[key] = ase_atoms
+
+    if missing:
+        pool = _get_pool()
+        pending = {key: pool.apply_async(_embed_to_dict, (key,)) for key in missing}
+        timed_out = False
+        for key, result in pending.items():
+            try:
+                data = result.get(timeout=timeout)
+            except multiprocessing.TimeoutError:
+                timed_out = True
+                _failed[key] = time.monotonic()
+                results[key] = None
+                _warn(
+                    logger,
+                    'Conformer generation timed out, no structure is added.',
+                    smiles=key,
+                    timeout=timeout,
+                )
+                continue
+            except Exception as e:
+                _failed[key] = time.monotonic()
+                results[key] = None
+                _warn(logger, f'An error occurred: {e}')
+                continue
+            _disk_cache.set(key, data)
+            results[key] = atoms_from_dict(data)
+            _memory_cache.set(key, results[key])
+        if timed_out:
+            _terminate_pool()
+
+    return [
+        None if key is None or results[key] is None else results[key].copy()
+        for key in keys
+    ]
+
+
+def optimize_molecule(smiles, logger=None, timeout: float = EMBEDDING_TIMEOUT):
+    """
+    Returns the optimized 3D structure of a molecule.
+
+    Args:
+        smiles (str): The SMILES string of the molecule.
+        logger (BoundLogger): A structlog logger, the module logger if not given.
+        timeout (float): The time budget in seconds.
+
+    Returns:
+        ase.Atoms: A copy of the cached structure, or `None` if the molecule could
+        not be embedded in time.
+    """
+    return optimize_molecules([smiles], timeout=timeout, logger=logger)[0]
+
+
+if __name__ == '__main__':
+    print(f'Structure library written to {build_structure_library()}')
@@ -0,0 +1,325 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Cache for the Crossref metadata of publications.
+
+Many cells are extracted from the same paper, so the metadata of a DOI is fetched once
+and kept in memory and in a persistent store, already parsed into the fields of
+`Ref`. Requests go through the shared pooled session with a timeout and retries. In
+offline mode only the cache is consulted.
+
+Before an upload with many entries is processed, `prefetch_crossref_metadata` fills
+the cache with the distinct DOIs of its archives, see `find_dois_in_files`. The LLM
+extractor does this before it processes the new entries. For classic uploads,
+`Ref.normalize` calls `prefetch_upload_crossref_metadata` if the DOI of its entry is
+not cached, which prefetches the DOIs of the next `.archive.json` files of the
+upload. The files read and the DOIs fetched by one entry are bounded, so that the
+latency of the upload is spread over its entries.
+"""
+
+import asyncio
+import json
+import os
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+from urllib.parse import quote
+
+from perovskite_solar_cell_database.cache import LRUCache, PersistentCache
+from perovskite_solar_cell_database.network import (
+    EXTERNAL_API_TIMEOUT,
+    get_session,
+    is_offline,
+)
+
+if TYPE_CHECKING:
+    from structlog.stdlib import BoundLogger
+
+CROSSREF_WORKS_PATH = 'https://api.crossref.org/works'
+CROSSREF_CACHE_TTL = 180 * 24 * 3600
+DOI_PREFIXES = (
+    'https://doi.org/',
+    'http://doi.org/',
+    'https://www.doi.org/',
+    'https://dx.doi.org/',
+    'doi:',
+)
+CROSSREF_CONCURRENCY = 8
+# files read and DOIs fetched at most when an entry prefetches its upload
+UPLOAD_PREFETCH_FILES = 500
+UPLOAD_PREFETCH_DOIS = 64
+
+_memory_cache = LRUCache(maxsize=1024)
+_disk_cache = PersistentCache('crossref', ttl=CROSSREF_CACHE_TTL)
+# the archive files of the uploads prefetched in this process and the number of
+# files read so far
+_prefetched_uploads: dict[str, tuple[list[str], int]] = {}
+
+
+def strip_doi(doi: str) -> str:
+    """
+    Returns the bare DOI, e.g. `10.1021/jp5126624` for
+    `https://doi.org/10.1021/jp5126624`.
+    """
+    doi = doi.strip()
+    for prefix in DOI_PREFIXES:
+        if doi.lower().startswith(prefix):
+            return doi[len(prefix) :]
+    return doi
+
+
+def parse_crossref_message(message: dict) -> dict:
+    """
+    Parses the `message` of a Crossref works response into the journal, the
+    publication date, the lead author and the authors of a publication.
+
+    Args:
+        message (dict): The message of the Crossref response.
+
+    Returns:
+        dict: The parsed metadata. Authors are dicts with `first_name`, `last_name`
+        and `name`.
+    """
+    authors = [
+        {
+            'first_name': author.get('given', None),
+            'last_name': author.get('family', None),
+            'name': author.get('given', '') + ' ' + author.get('family', ''),
+        }
+        for author in message.get('author', [])
+    ]
+    return {
+        'journal': (message.get('container-title') or [None])[0],
+        'publication_date': message.get('created', {}).get('date-time', None),
+        'lead_author': authors[0]['name'] if authors else None,
+        'authors': authors,
+    }
+
+
+def get_cached_crossref_metadata(doi: str) -> dict | None:
+    key = strip_doi(doi).lower()
+    metadata = _memory_cache.get(key)
+    if metadata is None:
+        metadata = _disk_cache.get(key)
+        if metadata is not None:
+            _memory_cache.set(key, metadata)
+    return metadata
+
+
+def set_cached_crossref_metadata(doi: str, metadata: dict) -> None:
+    key = strip_doi(doi).lower()
+    _memory_cache.set(key, metadata)
+    _disk_cache.set(key, metadata)
+
+
+def fetch_crossref_metadata(
+    doi: str, logger: 'BoundLogger' = None, session=None
+) -> dict | None:
+    """
+    Returns the parsed Crossref metadata of a DOI, from the cache if possible.
+
+    Args:
+        doi (str): The DOI, with or without the `https://doi.org/` prefix.
+        logger (BoundLogger): A structlog logger.
+        session (requests.Session): The session, the shared one if not given.
+
+    Returns:
+        dict: The metadata as returned by `parse_crossref_message` or `None` if the
+        DOI could not be resolved.
+    """
+    import requests
+
+    metadata = get_cached_crossref_metadata(doi)
+    if metadata is not None:
+        return metadata
+    if is_offline():
+        return None
+
+    session = session or get_session()
+    try:
+        response = session.get(
+            f'{CROSSREF_WORKS_PATH}/{quote(strip_doi(doi), safe="/")}',
+            timeout=EXTERNAL_API_TIMEOUT,
+        )
+        response.raise_for_status()
+        metadata = parse_crossref_message(response.json().get('message', {}))
+    except (requests.RequestException, ValueError) as e:
+        if logger is not None:
+            logger.warning(f'Could not fetch the Crossref metadata of {doi}: {e}')
+        return None
+    set_cached_crossref_metadata(doi, metadata)
+    return metadata
+
+
+def find_dois(archive: dict) -> list[str]:
+    """
+    Returns the DOIs of an archive dict that `Ref.normalize` would look up, i.e.
+    `data.ref.DOI_number` of cells without `ID_temp` and `data.DOI_number` of LLM
+    extracted cells.
+    """
+    data = archive.get('data') or {}
+    dois = []
+    ref = data.get('ref') or {}
+    if ref.get('DOI_number') and not ref.get('ID_temp'):
+        dois.append(ref['DOI_number'])
+    if isinstance(data.get('DOI_number'), str):
+        dois.append(data['DOI_number'])
+    return dois
+
+
+def find_dois_in_files(paths: Iterable[str]) -> list[str]:
+    """
+    Collects the distinct DOIs of several `.archive.json` files. Files that can not be
+    read are skipped.
+
+    Args:
+        paths (Iterable[str]): The paths of the archive files.
+
+    Returns:
+        list[str]: The DOIs, one per publication.
+    """
+    dois = {}
+    for path in paths:
+        try:
+            with open(path, encoding='utf-8') as f:
+                archive = json.load(f)
+        except (OSError, ValueError):
+            continue
+        for doi in find_dois(archive):
+            dois.setdefault(strip_doi(doi).lower(), doi)
+    return list(dois.values())
+
+
+async def prefetch_crossref_metadata(
+    dois: Iterable[str],
+    logger: 'BoundLogger' = None,
+    max_concurrency: int = CROSSREF_CONCURRENCY,
+    session=None,
+) -> int:
+    """
+    Fetches the metadata of several DOIs concurrently and stores it in the cache, so
+    that `Ref.normalize` does not query Crossref afterwards. At most
+    `max_concurrency` requests run at the same time on the pooled session.
+
+    Args:
+        dois (Iterable[str]): The DOIs.
+        logger (BoundLogger): A structlog logger.
+        max_concurrency (int): The maximum number of concurrent requests.
+        session (requests.Session): The session, the shared one if not given.
+
+    Returns:
+        int: The number of DOIs with metadata in the cache afterwards.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(doi):
+        async with semaphore:
+            return await asyncio.to_thread(
+                fetch_crossref_metadata, doi, logger, session
+            )
+
+    pending = {strip_doi(doi).lower(): doi for doi in dois if doi}
+    results = await asyncio.gather(*(fetch(doi) for doi in pending.values()))
+    return sum(metadata is not None for metadata in results)
+
+
+def upload_archive_files(context) -> list[str]:
+    """
+    Returns the local paths of the `.archive.json` raw files of an upload, or an empty
+    list if its raw files are not available as files, e.g. for published uploads.
+
+    Args:
+        context (Context): The `m_context` of an entry of the upload.
+
+    Returns:
+        list[str]: The paths of the archive files.
+    """
+    upload_files = getattr(context, 'upload_files', None)
+    local_dir = getattr(context, 'local_dir', None)
+    try:
+        if upload_files is not None:
+            return [
+                upload_files.raw_file_object(info.path).os_path
+                for info in upload_files.raw_directory_list(
+                    recursive=True, files_only=True
+                )
+                if info.path.endswith('.archive.json')
+            ]
+    except Exception:
+        return []
+    if local_dir is None:
+        return []
+    return [
+        os.path.join(directory, name)
+        for directory, _, names in os.walk(local_dir)
+        for name in names
+        if name.endswith('.archive.json')
+    ]
+
+
+def prefetch_upload_crossref_metadata(archive, logger: 'BoundLogger' = None) -> int:
+    """
+    Prefetches the metadata of the DOIs of the next `.archive.json` files of the
+    upload of an entry. All entries of an upload are processed by the same worker,
+    so the DOIs of the following entries are resolved concurrently and they read
+    them from the cache. Each call reads at most `UPLOAD_PREFETCH_FILES` files and
+    fetches at most `UPLOAD_PREFETCH_DOIS` DOIs that are not cached yet, and
+    continues where the previous call of the upload stopped.
+
+    Args:
+        archive (EntryArchive): An entry of the upload.
+        logger (BoundLogger): A structlog logger.
+
+    Returns:
+        int: The number of prefetched DOIs with metadata in the cache, 0 if all
+        files of the upload were read before.
+    """
+    context = getattr(archive, 'm_context', None)
+    if context is None or is_offline():
+        return 0
+    upload_key = getattr(context, 'upload_id', None) or getattr(
+        context, 'local_dir', None
+    )
+    if upload_key is None:
+        return 0
+    try:
+        asyncio.get_running_loop()
+        # `asyncio.run` can not be nested, the caller has to prefetch the upload
+        return 0
+    except RuntimeError:
+        pass
+    if upload_key not in _prefetched_uploads:
+        _prefetched_uploads[upload_key] = (sorted(upload_archive_files(context)), 0)
+    paths, start = _prefetched_uploads[upload_key]
+    if len(paths) < 2:
+        return 0
+
+    dois = {}
+    stop = start
+    while (
+        stop < len(paths)
+        and stop - start < UPLOAD_PREFETCH_FILES
+        and len(dois) < UPLOAD_PREFETCH_DOIS
+    ):
+        for doi in find_dois_in_files([paths[stop]]):
+            if get_cached_crossref_metadata(doi) is None:
+                dois.setdefault(strip_doi(doi).lower(), doi)
+        stop += 1
+    _prefetched_uploads[upload_key] = (paths, stop)
+    if not dois:
+        return 0
+    return asyncio.run(prefetch_crossref_metadata(dois.values(), logger))
@@ -1,3 +1,4 @@
+from .bundles import EntryBundle
 from .entry_writer import MyEncoder, PerovskiteEntryWriter
 from .eqe_parser import EQEAnalyzer
 from .jv_parser import jv_dict_generator
@@ -0,0 +1,186 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Upload bundles of archive files.
+
+`EntryBundle` streams the files of the entries into a zip or tar archive that can be
+uploaded to NOMAD as it is. Optionally the bundle is split into parts that stay below
+a size limit, e.g. the upload limit of the NOMAD installation.
+"""
+
+import io
+import tarfile
+import time
+import zipfile
+
+DEFAULT_COMPRESSION_LEVEL = 6
+BUNDLE_EXTENSIONS = ('.tar.gz', '.tgz', '.tar', '.zip')
+
+# bytes written by zip for an entry and its central directory record besides its
+# name and data, with room for zip64 extra fields and the end of the archive
+ZIP_ENTRY_OVERHEAD = 30 + 46 + 2 * 32
+ZIP_END_OVERHEAD = 22 + 56 + 20
+# the end of a tar archive is padded to a full record
+TAR_END_OVERHEAD = 2 * tarfile.BLOCKSIZE + tarfile.RECORDSIZE
+# compressed data that gzip may still hold in its buffers
+GZIP_BUFFER_OVERHEAD = 256 * 1024
+
+
+def split_bundle_path(path: str) -> tuple[str, str]:
+    """
+    Splits the path of a bundle into its stem and its extension.
+    :param path: the path, e.g. `entries.tar.gz`
+    :return: the stem and the extension, e.g. `('entries', '.tar.gz')`
+    """
+    for extension in BUNDLE_EXTENSIONS:
+        if path.lower().endswith(extension):
+            return path[: -len(extension)], path[-len(extension) :]
+    raise ValueError(
+        f'Unsupported bundle {path}, use one of {", ".join(BUNDLE_EXTENSIONS)}.'
+    )
+
+
+def is_bundle_path(path: str) -> bool:
+    return path.lower().endswith(BUNDLE_EXTENSIONS)
+
+
+def numbered_path(path: str, number: int) -> str:
+    """
+    Returns the path of a numbered part of a bundle, e.g. `entries-002.zip`.
+    """
+    stem, extension = split_bundle_path(path)
+    return f'{stem}-{number:03d}{extension}'
+
+
+class EntryBundle:
+    """
+    Writes files into a zip, tar or gzipped tar archive without creating them on disk.
+    If `max_part_size` is given, the archive is split into the parts
+    `<stem>-001<extension>`, `<stem>-002<extension>`, ... of at most this many bytes.
+    A single file larger than the limit gets a part of its own.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+        max_part_size: int | None = None,
+    ):
+        """
+        :param path: path of the bundle, the format follows from its extension
+        :param compression_level: zlib compression level from 0 to 9, not used for
+        `.tar`
+        :param max_part_size: maximum size of a part in bytes, not split if `None`
+        """
+        self.path = path
+        self.extension = split_bundle_path(path)[1].lower()
+        self.compression_level = compression_level
+        self.max_part_size = max_part_size
+        self.parts: list[str] = []
+        self._file = None
+        self._archive = None
+        self._entries = 0
+        self._pending_overhead = 0
+        self._mtime = time.time()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _open_part(self) -> None:
+        path = (
+            self.path
+            if self.max_part_size is None
+            else numbered_path(self.path, len(self.parts) + 1)
+        )
+        self._file = open(path, 'wb')
+        if self.extension == '.zip':
+            self._archive = zipfile.ZipFile(
+                self._file,
+                'w',
+                compression=zipfile.ZIP_DEFLATED,
+                compresslevel=self.compression_level,
+            )
+            self._pending_overhead = ZIP_END_OVERHEAD
+        elif self.extension == '.tar':
+            self._archive = tarfile.open(fileobj=self._file, mode='w')
+            self._pending_overhead = TAR_END_OVERHEAD
+        else:
+            self._archive = tarfile.open(
+                fileobj=self._file, mode='w:gz', compresslevel=self.compression_level
+            )
+            self._pending_overhead = TAR_END_OVERHEAD + GZIP_BUFFER_OVERHEAD
+        self.parts.append(path)
+        self._entries = 0
+
+    def _close_part(self) -> None:
+        self._archive.close()
+        self._file.close()
+        self._archive = self._file = None
+
+    def _max_entry_size(self, name: bytes, size: int) -> int:
+        """
+        An upper bound of the bytes a file adds to the current part.
+        """
+        if self.extension == '.zip':
+            # deflate adds at most 5 bytes per 16 KiB block to incompressible data
+            return ZIP_ENTRY_OVERHEAD + 2 * len(name) + size + 5 * (size // 16384 + 1)
+        blocks = -(-size // tarfile.BLOCKSIZE) + 1
+        return blocks * tarfile.BLOCKSIZE
+
+    def add(self, file_name: str, content: bytes) -> None:
+        """
+        Adds a file to the bundle.
+        :param file_name: the path of the file in the archive
+        :param content: the content of the file
+        """
+        entry_size = self._max_entry_size(file_name.encode(), len(content))
+        if (
+            self._archive is not None
+            and self.max_part_size is not None
+            and self._entries > 0
+            and self._file.tell() + self._pending_overhead + entry_size
+            > self.max_part_size
+        ):
+            self._close_part()
+        if self._archive is None:
+            self._open_part()
+
+        if self.extension == '.zip':
+            info = zipfile.ZipInfo(file_name, time.localtime(self._mtime)[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            self._archive.writestr(info, content, compresslevel=self.compression_level)
+            # the central directory record is written on close
+            self._pending_overhead += 46 + 32 + len(file_name.encode())
+        else:
+            info = tarfile.TarInfo(file_name)
+            info.size = len(content)
+            info.mtime = self._mtime
+            self._archive.addfile(info, io.BytesIO(content))
+        self._entries += 1
+
+    def close(self) -> list[str]:
+        """
+        Finishes the bundle.
+        :return: the paths of the written parts
+        """
+        if self._archive is not None:
+            self._close_part()
+        return self.parts
@@ -16,35 +16,283 @@
 # limitations under the License.
 #
 
+import argparse
+import hashlib
 import json
+import math
+import multiprocessing
 import os
-from collections import defaultdict
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime
+from functools import cache
+from itertools import compress
 
 import numpy
+import orjson
 import pandas as pd
+import pyarrow as pa
+from nomad import utils
+from pyarrow import feather, parquet
+
+from perovskite_solar_cell_database.data_tools.bundles import (
+    DEFAULT_COMPRESSION_LEVEL,
+    EntryBundle,
+    is_bundle_path,
+    numbered_path,
+    split_bundle_path,
+)
+
+# number of rows of the database read and converted at once
+DEFAULT_CHUNKSIZE = 1000
+ENTRY_M_DEF = 'perovskite_solar_cell_database.schema.PerovskiteSolarCell'
+ARCHIVE_SUFFIX = '.archive.json'
+MANIFEST_SUFFIX = '.manifest.json'
+ID_COLUMN = 'Ref_ID'
+# formats of the database besides csv by file extension
+COLUMNAR_FORMATS = {
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.arrow': 'arrow',
+    '.feather': 'arrow',
+    '.ipc': 'arrow',
+}
+
+
+def split_column(column: str) -> tuple[str, str]:
+    """
+    Splits a column name of the database into the section and the quantity name at
+    the first underscore, or at the second one for `Perovskite_deposition` columns.
+    Columns without an underscore are both.
+    :param column: the column name, e.g. `Ref_ID`
+    :return: the lower case section name and the quantity name, e.g. `('ref', 'ID')`
+    """
+    if 'Perovskite_deposition' in column:
+        section = '_'.join(column.split('_', 2)[:2])
+        quantity = '_'.join(column.split('_', 2)[2:])
+    elif '_' in column:
+        section, quantity = column.split('_', 1)
+    else:
+        section = quantity = column
+
+    return section.lower(), quantity
+
+
+def database_format(database_path: str) -> str:
+    """
+    Returns the format of the database from the extension of its file.
+    :param database_path: path of the database
+    :return: `parquet`, `arrow` for Arrow IPC or Feather files, or `csv`
+    """
+    extension = os.path.splitext(database_path)[1].lower()
+    return COLUMNAR_FORMATS.get(extension, 'csv')
+
+
+# values of the boolean columns besides booleans, compared in lower case
+BOOLEAN_VALUES = {
+    'true': True,
+    'false': False,
+    't': True,
+    'f': False,
+    'yes': True,
+    'no': False,
+    'y': True,
+    'n': False,
+    '1': True,
+    '0': False,
+    '1.0': True,
+    '0.0': False,
+}
+
+logger = utils.get_logger(__name__)
+
+
+def _pandas_dtype(standard_type: str) -> str | None:
+    if standard_type in {'str', 'enum'}:
+        return 'str'
+    if standard_type == 'bool':
+        return 'boolean'
+    if standard_type.startswith(('int', 'uint')):
+        return 'Int64'
+    if standard_type.startswith('float'):
+        return 'float64'
+    return None
+
+
+@cache
+def metainfo_schema(columns: tuple[str, ...]) -> tuple[dict[str, str], list[str]]:
+    """
+    Derives the dtypes of the columns of the database from the quantities of
+    `PerovskiteSolarCell`, instead of inferring them from the values of each chunk.
+    Integers and booleans get the nullable pandas dtypes, as most cells are empty.
+    Columns without a scalar quantity are still inferred.
+    :param columns: the column names
+    :return: the pandas dtype of each column and the names of the datetime columns
+    """
+    from perovskite_solar_cell_database.schema import PerovskiteSolarCell
+
+    sub_sections = PerovskiteSolarCell.m_def.all_sub_sections
+    dtypes = {}
+    dates = []
+    for column in columns:
+        section, quantity = split_column(column)
+        if section not in sub_sections:
+            continue
+        quantity_def = sub_sections[section].sub_section.all_quantities.get(quantity)
+        if quantity_def is None or quantity_def.shape:
+            continue
+        standard_type = quantity_def.type.standard_type()
+        if standard_type == 'datetime':
+            dates.append(column)
+        elif (dtype := _pandas_dtype(standard_type)) is not None:
+            dtypes[column] = dtype
+    return dtypes, dates
+
+
+def _to_boolean(values: pd.Series) -> pd.Series:
+    if pd.api.types.is_bool_dtype(values):
+        return values.astype('boolean')
+    return values.map(
+        lambda value: BOOLEAN_VALUES.get(str(value).strip().lower()),
+        na_action='ignore',
+    ).astype('boolean')
+
+
+def _cast_column(values: pd.Series, dtype: str) -> pd.Series:
+    if dtype == 'str':
+        # astype('str') turns missing values into 'nan' before pandas 3
+        return values.where(values.isna(), values.astype(str))
+    if dtype == 'boolean':
+        return _to_boolean(values)
+    numbers = pd.to_numeric(values, errors='coerce')
+    if dtype == 'Int64':
+        return numbers.where(numbers % 1 == 0).astype('Int64')
+    return numbers.astype(dtype)
+
+
+def apply_schema(
+    df: pd.DataFrame, dtypes: dict[str, str], dates: list[str]
+) -> pd.DataFrame:
+    """
+    Casts the columns of a chunk of the database to the dtypes of `metainfo_schema`.
+    Each column is cast on its own, cells that do not match the dtype of their
+    column, e.g. `foo` in an integer column, are left empty and logged with the
+    indices of their rows.
+    :param df: the chunk, indexed by the row index in the database
+    :param dtypes: the pandas dtype of each column
+    :param dates: the names of the datetime columns
+    :return: the chunk with the cast columns
+    """
+    columns = {}
+    for column, dtype in dtypes.items():
+        if column not in df.columns or df[column].dtype == dtype:
+            continue
+        if dtype == 'str' and pd.api.types.is_string_dtype(df[column].dtype):
+            continue
+        columns[column] = _cast_column(df[column], dtype)
+    for column in dates:
+        if column in df.columns and not pd.api.types.is_datetime64_any_dtype(
+            df[column]
+        ):
+            columns[column] = pd.to_datetime(df[column], errors='coerce')
+    for column, values in columns.items():
+        invalid = df[column].notna() & values.isna()
+        if invalid.any():
+            logger.warning(
+                'Invalid values of the database are left out.',
+                column=column,
+                dtype=dtypes.get(column, 'datetime'),
+                rows=df.index[invalid].tolist(),
+            )
+    if not columns:
+        return df
+    return df.assign(**columns)
+
+
+def _string_dtypes(dtypes: dict[str, str]) -> dict[str, str]:
+    return {column: dtype for column, dtype in dtypes.items() if dtype == 'str'}
 
 
 class PerovskiteEntryWriter:
-    def __init__(self, csv_database_path: str):
+    def __init__(
+        self,
+        database_path: str,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        sections: Iterable[str] | None = None,
+    ):
         """
         Init method for the PerovskiteDBReader class.
-        :param csv_database_path: path to the .csv file ocntaining the database
-        :param data_schema_path: path to the excel file ocntaining the database quantities,
-        db original data types, and quantities descriptions.
+        :param database_path: path to the .csv, .parquet or Arrow IPC (.arrow,
+        .feather) file containing the database
+        :param chunksize: number of rows that are read and converted at once
+        :param sections: lower case names of the sections to write, e.g. `ref` and
+        `jv`, all sections if `None`. The `Ref_ID` is always written.
+        """
+        self.database_path = database_path
+        self.database_format = database_format(database_path)
+        self.chunksize = chunksize
+        self.selected_sections = None if sections is None else sorted(set(sections))
+        self._df_db = None
 
+    @property
+    def df_db(self) -> pd.DataFrame:
         """
-        self.csv_database_path = csv_database_path
-        self.df_db = pd.read_csv(
-            self.csv_database_path, skiprows=0, parse_dates=['Ref_publication_date']
-        )
+        The whole database, only read if accessed. The entries are written from
+        chunks of rows.
+        """
+        if self._df_db is None:
+            columns = list(self.read_columns())
+            dtypes, dates = metainfo_schema(tuple(columns))
+            if self.database_format == 'csv':
+                df = pd.read_csv(
+                    self.database_path,
+                    usecols=columns,
+                    dtype=_string_dtypes(dtypes),
+                    parse_dates=dates,
+                )
+            else:
+                df = self._read_table(columns).to_pandas()
+            self._df_db = apply_schema(df, dtypes, dates)
+        return self._df_db
+
+    def _read_header(self) -> list[str]:
+        if self.database_format == 'parquet':
+            return parquet.read_schema(self.database_path).names
+        if self.database_format == 'arrow':
+            with pa.memory_map(self.database_path) as source:
+                return pa.ipc.open_file(source).schema.names
+        return list(pd.read_csv(self.database_path, nrows=0).columns)
+
+    def _read_table(self, columns: list[str]) -> pa.Table:
+        if self.database_format == 'parquet':
+            return parquet.read_table(self.database_path, columns=columns)
+        return feather.read_table(self.database_path, columns=columns, memory_map=True)
 
     def read_columns(self):
         """
-        Reading the column names of the csv perovskite database file.
+        Reading the column names of the perovskite database file, only those of the
+        `selected_sections`.
         """
 
-        self.column_names = self.df_db.columns
+        if self._df_db is not None:
+            self.column_names = self._df_db.columns
+            return self.column_names
+
+        columns = self._read_header()
+        if self.selected_sections is not None:
+            column_sections = [split_column(column)[0] for column in columns]
+            unknown = set(self.selected_sections) - set(column_sections)
+            if unknown:
+                raise ValueError(
+                    f'The database has no sections {", ".join(sorted(unknown))}.'
+                )
+            columns = [
+                column
+                for column, section in zip(columns, column_sections)
+                if section in self.selected_sections or column == ID_COLUMN
+            ]
+        self.column_names = pd.Index(columns)
         return self.column_names
 
     def collect_schema_items(self):
@@ -56,21 +304,9 @@ class PerovskiteEntryWriter:
         """
 
         self.column_names = self.read_columns()
-        self.quantities_list = []
-        self.sections = []
-
-        for column in self.column_names:
-            if 'Perovskite_deposition' in column:
-                self.quantities_list.append('_'.join(column.split('_', 2)[2:]))
-                self.sections.append('_'.join(column.split('_', 2)[:2]))
-            elif '_' in column:
-                self.quantities_list.append(column.split('_', 1)[1])
-                self.sections.append(column.split('_', 1)[0])
-            else:
-                self.quantities_list.append(column)
-                self.sections.append(column)
-
-        self.sections = [i.lower() for i in self.sections]
+        schema_items = [split_column(column) for column in self.column_names]
+        self.sections = [section for section, _ in schema_items]
+        self.quantities_list = [quantity for _, quantity in schema_items]
 
         return self.sections, self.quantities_list
 
@@ -99,37 +335,419 @@ class PerovskiteEntryWriter:
 
         return self.section, self.quantity
 
-    def entry_writer(self, target_dir):
+    def count_rows(self) -> int:
+        """
+        Counts the rows of the database without converting its values.
+        """
+        if self._df_db is not None:
+            return len(self._df_db)
+        if self.database_format == 'parquet':
+            return parquet.read_metadata(self.database_path).num_rows
+        if self.database_format == 'arrow':
+            return self._read_table([]).num_rows
+        return len(pd.read_csv(self.database_path, usecols=[0]))
+
+    def read_chunks(
+        self, start: int = 0, stop: int | None = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Reads the database in chunks of `chunksize` rows.
+        :param start: index of the first row
+        :param stop: index after the last row, all rows until the end if `None`
+        """
+        if self._df_db is not None:
+            stop = len(self._df_db) if stop is None else min(stop, len(self._df_db))
+            for chunk_start in range(start, stop, self.chunksize):
+                chunk_stop = min(chunk_start + self.chunksize, stop)
+                yield self._df_db.iloc[chunk_start:chunk_stop]
+            return
+
+        columns = list(self.read_columns())
+        dtypes, dates = metainfo_schema(tuple(columns))
+        if self.database_format != 'csv':
+            row = start
+            for batch in self._read_batches(columns, start, stop):
+                chunk = batch.to_pandas()
+                chunk.index = pd.RangeIndex(row, row + len(chunk))
+                row += len(chunk)
+                yield apply_schema(chunk, dtypes, dates)
+            return
+
+        # only the string columns are read with their dtype, which never fails,
+        # the other columns are cast leniently by `apply_schema`
+        with pd.read_csv(
+            self.database_path,
+            usecols=columns,
+            dtype=_string_dtypes(dtypes),
+            skiprows=range(1, start + 1),
+            nrows=None if stop is None else stop - start,
+            parse_dates=dates,
+            chunksize=self.chunksize,
+        ) as reader:
+            for chunk in reader:
+                chunk.index = chunk.index + start
+                yield apply_schema(chunk, dtypes, dates)
+
+    def _read_batches(
+        self, columns: list[str], start: int, stop: int | None
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Reads the rows from `start` to `stop` of the columns of a columnar database in
+        record batches of at most `chunksize` rows. Only the row groups of a Parquet
+        file that overlap the rows are read.
+        """
+        if self.database_format == 'parquet':
+            parquet_file = parquet.ParquetFile(self.database_path)
+            row_groups = []
+            offset = group_start = 0
+            for index in range(parquet_file.num_row_groups):
+                rows = parquet_file.metadata.row_group(index).num_rows
+                if group_start + rows > start and (stop is None or group_start < stop):
+                    if not row_groups:
+                        offset = group_start
+                    row_groups.append(index)
+                group_start += rows
+            if not row_groups:
+                return
+            batches = parquet_file.iter_batches(
+                batch_size=self.chunksize, row_groups=row_groups, columns=columns
+            )
+        else:
+            table = self._read_table(columns)
+            offset = start
+            batches = table.slice(
+                start, None if stop is None else max(stop - start, 0)
+            ).to_batches(max_chunksize=self.chunksize)
+
+        for batch in batches:
+            first = max(start - offset, 0)
+            end = batch.num_rows if stop is None else min(stop - offset, batch.num_rows)
+            offset += batch.num_rows
+            if first < end:
+                yield batch.slice(first, end - first)
+
+    def section_runs(self) -> list[tuple[str, int, int, list[str]]]:
+        """
+        Groups the columns of the database into runs of consecutive columns of the
+        same section.
+        :return: the section, the first and the end column index and the quantity names
+        of each run
+        """
+        sections, quantities = self.collect_schema_items()
+        runs = []
+        for index, section in enumerate(sections):
+            if runs and runs[-1][0] == section:
+                runs[-1][2] = index + 1
+            else:
+                runs.append([section, index, index + 1])
+        return [
+            (section, start, stop, quantities[start:stop])
+            for section, start, stop in runs
+        ]
+
+    def iter_entries(
+        self, start: int = 0, stop: int | None = None
+    ) -> Iterator[tuple[str, dict]]:
+        """
+        Converts the rows of the database into archive dicts. Empty cells are left
+        out.
+        :param start: index of the first row
+        :param stop: index after the last row, all rows until the end if `None`
+        :return: an iterator over the entry ids, i.e. the `Ref_ID`, and the archives
+        """
+        runs = self.section_runs()
+
+        for chunk in self.read_chunks(start, stop):
+            values = chunk.to_numpy(dtype=object)
+            not_null = chunk.notna().to_numpy().tolist()
+            for row, row_not_null in zip(values.tolist(), not_null):
+                data = {'m_def': ENTRY_M_DEF, 'ref': {}}
+                for section, first, end, quantities in runs:
+                    if not any(row_not_null[first:end]):
+                        continue
+                    items = compress(
+                        zip(quantities, row[first:end]), row_not_null[first:end]
+                    )
+                    if section in data:
+                        data[section].update(items)
+                    else:
+                        data[section] = dict(items)
+                yield str(data['ref'].get('ID')), {'data': data}
+
+    def shards(self, workers: int) -> list[tuple[int, int]]:
+        """
+        Splits the rows of the database into one row range per worker.
+        :param workers: number of worker processes
+        :return: the start and stop row index of each shard
+        """
+        rows = self.count_rows()
+        size = max(math.ceil(rows / workers), 1)
+        return [(start, min(start + size, rows)) for start in range(0, rows, size)]
+
+    def entry_writer(
+        self,
+        target_dir,
+        workers: int = 1,
+        manifest_path: str | None = None,
+        previous_manifest: str | None = None,
+    ) -> dict:
         """
         Writes archive entries of the perovskite database
         :param target_dir: path pointing to where to dump the ``archive.json`` files
+        :param workers: number of processes that each convert a range of rows
+        :param manifest_path: path of the manifest of the written files and the
+        timing of each shard, ``<target_dir>.manifest.json`` next to the target
+        directory by default, so that it does not become a file of the upload
+        :param previous_manifest: path of the manifest of a previous run, only the
+        entries that are new or changed since are written
+        :return: the manifest
         """
+        if manifest_path is None:
+            manifest_path = default_manifest_path(target_dir)
+        return self._write(target_dir, None, workers, manifest_path, previous_manifest)
 
-        self.sections, self.quantities_list = self.collect_schema_items()
-
-        def create_rec_dd():  # To create an infinite level recursive default dictionary
-            return defaultdict(create_rec_dd)
+    def bundle_writer(  # noqa: PLR0913
+        self,
+        bundle_path: str,
+        workers: int = 1,
+        manifest_path: str | None = None,
+        *,
+        compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+        max_part_size: int | None = None,
+        previous_manifest: str | None = None,
+    ) -> dict:
+        """
+        Writes the archive entries of the perovskite database into zip or tar
+        bundles that can be uploaded to NOMAD, without creating the entry files on
+        disk. With several workers, each shard is written to its own bundle
+        ``<stem>-001<extension>``, ... See `EntryBundle` for the parts of a bundle.
+        :param bundle_path: path of the bundle, ending with ``.zip``, ``.tar``,
+        ``.tar.gz`` or ``.tgz``
+        :param workers: number of processes that each convert a range of rows
+        :param manifest_path: path of the manifest of the written files and the
+        timing of each shard, ``<stem>.manifest.json`` next to the bundle by default
+        :param compression_level: zlib compression level from 0 to 9
+        :param max_part_size: maximum size of a bundle in bytes, not split if `None`
+        :param previous_manifest: path of the manifest of a previous run, only the
+        entries that are new or changed since are written
+        :return: the manifest
+        """
+        split_bundle_path(bundle_path)
+        if manifest_path is None:
+            manifest_path = default_manifest_path(bundle_path)
+        bundle_options = {
+            'compression_level': compression_level,
+            'max_part_size': max_part_size,
+        }
+        return self._write(
+            bundle_path, bundle_options, workers, manifest_path, previous_manifest
+        )
 
-        for row in range(self.df_db.shape[0]):
-            target_dict = create_rec_dd()
-            for column in range(len(self.quantities_list)):
-                # target_dict
-                target_dict['data']
-                # old m_ef in the source code:
-                #  target_dict["data"]["m_def"] = "nomad.datamodel.metainfo.eln.perovskite_solar_cell_database.PerovskiteSolarCell"
-                target_dict['data']['m_def'] = (
-                    'perovskite_solar_cell_database.schema.PerovskiteSolarCell'
+    def _write(  # noqa: PLR0913
+        self,
+        output_path: str,
+        bundle_options: dict | None,
+        workers: int,
+        manifest_path: str,
+        previous_manifest: str | None,
+    ) -> dict:
+        started = time.perf_counter()
+        previous_hashes = (
+            None if previous_manifest is None else load_hashes(previous_manifest)
+        )
+        if workers > 1:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context('spawn')
+            ) as pool:
+                futures = [
+                    pool.submit(
+                        write_shard,
+                        self.database_path,
+                        output_path
+                        if bundle_options is None
+                        else numbered_path(output_path, index + 1),
+                        rows,
+                        chunksize=self.chunksize,
+                        bundle_options=bundle_options,
+                        previous_hashes=previous_hashes,
+                        sections=self.selected_sections,
+                    )
+                    for index, rows in enumerate(self.shards(workers))
+                ]
+                shards = [future.result() for future in futures]
+        else:
+            shards = [
+                _write_entries(
+                    self, output_path, (0, None), bundle_options, previous_hashes
                 )
-                if not pd.isnull(self.df_db.iloc[row][column]):
-                    target_dict['data'][self.sections[column]][
-                        self.quantities_list[column]
-                    ] = self.df_db.iloc[row][column]
-                target_dict = dict(target_dict)
-                id = target_dict['data']['ref']['ID']
-                sufix = '.archive.json'
-            save_path = os.path.join(target_dir, str(id) + sufix)
-            with open(save_path, 'w') as fp:
-                json.dump(target_dict, fp, cls=MyEncoder)
+            ]
+
+        # the hashes of all entries of this run, the previous manifest of the next
+        hashes = {}
+        for shard in shards:
+            hashes.update(shard.pop('hashes'))
+        manifest = {
+            'source': self.database_path,
+            'sections': self.selected_sections,
+            'workers': workers,
+            'seconds': time.perf_counter() - started,
+            'entries': sum(len(shard['files']) for shard in shards),
+            'unchanged': sum(shard['unchanged'] for shard in shards),
+            'shards': shards,
+        }
+        if previous_hashes is not None:
+            manifest['previous_manifest'] = previous_manifest
+            manifest['deleted'] = [
+                entry_id + ARCHIVE_SUFFIX
+                for entry_id in sorted(previous_hashes.keys() - hashes.keys())
+            ]
+        manifest['hashes'] = hashes
+        with open(manifest_path, 'w') as fp:
+            json.dump(manifest, fp, indent=2)
+
+        return manifest
+
+
+def _json_default(obj):
+    if isinstance(obj, datetime | date):
+        return obj.isoformat()
+    elif isinstance(obj, numpy.ndarray):
+        return obj.tolist()
+    raise TypeError(f'Type is not JSON serializable: {type(obj).__name__}')
+
+
+def dump_archive(archive: dict) -> bytes:
+    """
+    Serializes an archive dict with orjson, which handles numpy scalars and
+    datetimes natively.
+    """
+    return orjson.dumps(
+        archive, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY
+    )
+
+
+def _canonical(value):
+    if isinstance(value, dict):
+        return {key: _canonical(item) for key, item in value.items()}
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def entry_hash(archive: dict) -> str:
+    """
+    Returns the SHA-256 hash of the canonical form of an archive dict. Its keys are
+    sorted and integral floats are integers, so that the hash neither depends on the
+    order of the columns nor on the dtypes pandas infers for a chunk of rows.
+    """
+    content = orjson.dumps(
+        _canonical(archive),
+        default=_json_default,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_SORT_KEYS,
+    )
+    return hashlib.sha256(content).hexdigest()
+
+
+def default_manifest_path(output_path: str) -> str:
+    """
+    Returns the default path of the manifest of a run, next to its output.
+    :param output_path: the target directory or the path of the bundle
+    :return: ``<target_dir>.manifest.json`` or ``<stem>.manifest.json``
+    """
+    if is_bundle_path(output_path):
+        stem, _ = split_bundle_path(output_path)
+    else:
+        stem = os.path.normpath(output_path)
+    return stem + MANIFEST_SUFFIX
+
+
+def load_hashes(manifest_path: str) -> dict[str, str]:
+    """
+    Reads the entry hashes of the manifest of a previous run.
+    :param manifest_path: path of the manifest
+    :return: the hash of each entry by its `Ref_ID`
+    """
+    with open(manifest_path) as fp:
+        manifest = json.load(fp)
+    if 'hashes' not in manifest:
+        raise ValueError(f'The manifest {manifest_path} has no entry hashes.')
+    return manifest['hashes']
+
+
+def _write_entries(
+    writer: PerovskiteEntryWriter,
+    output_path: str,
+    rows: tuple[int, int | None] = (0, None),
+    bundle_options: dict | None = None,
+    previous_hashes: dict[str, str] | None = None,
+) -> dict:
+    started = time.perf_counter()
+    start, stop = rows
+    bundle = (
+        None if bundle_options is None else EntryBundle(output_path, **bundle_options)
+    )
+    files = []
+    hashes = {}
+    converted = 0
+    try:
+        for entry_id, archive in writer.iter_entries(start, stop):
+            converted += 1
+            digest = hashes[entry_id] = entry_hash(archive)
+            if previous_hashes is not None and previous_hashes.get(entry_id) == digest:
+                continue
+            file_name = entry_id + ARCHIVE_SUFFIX
+            content = dump_archive(archive)
+            if bundle is None:
+                with open(os.path.join(output_path, file_name), 'wb') as fp:
+                    fp.write(content)
+            else:
+                bundle.add(file_name, content)
+            files.append(file_name)
+    finally:
+        if bundle is not None:
+            bundle.close()
+
+    shard = {
+        'start': start,
+        'stop': start + converted,
+        'seconds': time.perf_counter() - started,
+        'files': files,
+        'unchanged': converted - len(files),
+        'hashes': hashes,
+    }
+    if bundle is not None:
+        shard['bundles'] = bundle.parts
+    return shard
+
+
+def write_shard(  # noqa: PLR0913
+    database_path: str,
+    output_path: str,
+    rows: tuple[int, int],
+    *,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    bundle_options: dict | None = None,
+    previous_hashes: dict[str, str] | None = None,
+    sections: list[str] | None = None,
+) -> dict:
+    """
+    Writes the archive entries of a range of rows of the database, run in the worker
+    processes of `PerovskiteEntryWriter.entry_writer` and `bundle_writer`.
+    :param database_path: path to the file containing the database
+    :param output_path: the directory of the ``archive.json`` files or the bundle
+    :param rows: the index of the first row and the index after the last row
+    :param chunksize: number of rows that are read and converted at once
+    :param bundle_options: the arguments of `EntryBundle` to write a bundle
+    :param previous_hashes: the entry hashes of a previous run, entries with the same
+    hash are not written
+    :param sections: the sections to write, all sections if `None`
+    :return: the rows, the written files and bundles, the entry hashes and the time
+    in seconds of the shard
+    """
+    writer = PerovskiteEntryWriter(
+        database_path, chunksize=chunksize, sections=sections
+    )
+    return _write_entries(writer, output_path, rows, bundle_options, previous_hashes)
 
 
 class MyEncoder(json.JSONEncoder):
@@ -149,3 +767,106 @@ class MyEncoder(json.JSONEncoder):
             return obj.isoformat()
         else:
             return super(MyEncoder, self).default(obj)
+
+
+def parse_size(size: str) -> int:
+    """
+    Parses a size in bytes with an optional binary unit, e.g. `500M` or `32G`.
+    """
+    units = {'K': 1024, 'M': 1024**2, 'G': 1024**3}
+    size = size.strip().upper().removesuffix('B')
+    if size[-1:] in units:
+        return int(float(size[:-1]) * units[size[-1]])
+    return int(size)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description='Writes the archive entries of the perovskite database.'
+    )
+    parser.add_argument(
+        'database_path',
+        help='the .csv, .parquet or Arrow IPC (.arrow, .feather) file of the database',
+    )
+    parser.add_argument(
+        'target',
+        help=(
+            'the directory of the archive files, or a .zip, .tar, .tar.gz or .tgz '
+            'bundle the archive files are written into'
+        ),
+    )
+    parser.add_argument(
+        '--workers', type=int, default=1, help='number of worker processes'
+    )
+    parser.add_argument(
+        '--chunksize',
+        type=int,
+        default=DEFAULT_CHUNKSIZE,
+        help='number of rows read at once',
+    )
+    parser.add_argument(
+        '--sections',
+        nargs='+',
+        default=None,
+        help='only write these sections, e.g. ref cell perovskite jv',
+    )
+    parser.add_argument(
+        '--manifest',
+        default=None,
+        help='path of the manifest of the written files, next to the target by default',
+    )
+    parser.add_argument(
+        '--compression-level',
+        type=int,
+        default=DEFAULT_COMPRESSION_LEVEL,
+        help='zlib compression level of the bundle',
+    )
+    parser.add_argument(
+        '--max-part-size',
+        type=parse_size,
+        default=None,
+        help='split the bundle into parts of at most this size, e.g. 32G',
+    )
+    parser.add_argument(
+        '--previous-manifest',
+        default=None,
+        help='manifest of a previous run, only new or changed entries are written',
+    )
+    args = parser.parse_args(argv)
+
+    writer = PerovskiteEntryWriter(
+        args.database_path, chunksize=args.chunksize, sections=args.sections
+    )
+    if is_bundle_path(args.target):
+        target_dir = os.path.dirname(args.target)
+        if target_dir:
+            os.makedirs(target_dir, exist_ok=True)
+        manifest = writer.bundle_writer(
+            args.target,
+            workers=args.workers,
+            manifest_path=args.manifest,
+            compression_level=args.compression_level,
+            max_part_size=args.max_part_size,
+            previous_manifest=args.previous_manifest,
+        )
+    else:
+        os.makedirs(args.target, exist_ok=True)
+        manifest = writer.entry_writer(
+            args.target,
+            workers=args.workers,
+            manifest_path=args.manifest,
+            previous_manifest=args.previous_manifest,
+        )
+    print(
+        f'{manifest["entries"]} entries written to {args.target} '
+        f'in {manifest["seconds"]:.1f} s'
+    )
+    if args.previous_manifest is not None:
+        print(
+            f'{manifest["unchanged"]} entries unchanged, '
+            f'{len(manifest["deleted"])} deleted'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Deferred network enrichment.
+
+With `network_enrichment: false` on one of the entry points of this package (or in
+offline mode), normalization does not query Crossref, PubChem or the search index.
+Entries that missed a lookup are tagged with `pending_enrichment` in
+`results.eln.tags`. A separate batch job, `enrich_archives`, completes them later:
+it selects the processed archives with the tag, fetches their DOIs concurrently,
+normalizes them again with network access and writes them back without the tag.
+"""
+
+import asyncio
+import json
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from perovskite_solar_cell_database.network import offline_mode
+
+if TYPE_CHECKING:
+    from nomad.datamodel.datamodel import EntryArchive
+    from structlog.stdlib import BoundLogger
+
+PENDING_ENRICHMENT_TAG = 'pending_enrichment'
+
+
+def mark_pending_enrichment(archive: 'EntryArchive') -> None:
+    """
+    Tags an entry whose network enrichment was skipped.
+    """
+    if archive is None:
+        return
+    eln = archive.m_setdefault('results.eln')
+    if eln.tags is None:
+        eln.tags = []
+    if PENDING_ENRICHMENT_TAG not in eln.tags:
+        eln.tags.append(PENDING_ENRICHMENT_TAG)
+
+
+def is_pending_enrichment(archive: 'EntryArchive') -> bool:
+    eln = archive.results.eln if archive.results else None
+    return eln is not None and PENDING_ENRICHMENT_TAG in (eln.tags or [])
+
+
+def is_pending_enrichment_dict(archive: dict) -> bool:
+    """
+    Like `is_pending_enrichment` for the dict of a processed archive, e.g. read from
+    an `.archive.json` file.
+    """
+    eln = (archive.get('results') or {}).get('eln') or {}
+    return PENDING_ENRICHMENT_TAG in (eln.get('tags') or [])
+
+
+def enrich_archives(paths: Iterable[str], logger: 'BoundLogger' = None) -> list[str]:
+    """
+    Completes the deferred enrichment of processed entries in one batch.
+
+    The archives are read from `.archive.json` files including their `results`, e.g.
+    downloaded from the API for the query `results.eln.tags: pending_enrichment`.
+    Only the entries tagged as pending are enriched. The DOIs of all of them are
+    fetched concurrently first, then every entry is normalized again with network
+    access, its `results` and tags are derived anew from its data, and the archive
+    is written back to its file. An entry whose DOI still can not be resolved keeps
+    the tag for the next run.
+
+    Args:
+        paths (Iterable[str]): The paths of the processed `.archive.json` files.
+        logger (BoundLogger): A structlog logger.
+
+    Returns:
+        list[str]: The paths of the entries that are no longer pending.
+    """
+    from nomad.client import normalize_all, parse
+
+    from perovskite_solar_cell_database.crossref import (
+        find_dois,
+        get_cached_crossref_metadata,
+        prefetch_crossref_metadata,
+    )
+
+    pending = {}
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            archive = json.load(f)
+        if is_pending_enrichment_dict(archive):
+            pending[path] = find_dois(archive)
+
+    enriched = []
+    with offline_mode(False):
+        asyncio.run(
+            prefetch_crossref_metadata(
+                [doi for dois in pending.values() for doi in dois], logger
+            )
+        )
+        for path, dois in pending.items():
+            archive = parse(path, logger=logger)[0]
+            # the results with the pending tag are derived again from the data
+            archive.results = None
+            normalize_all(archive, logger=logger)
+            if any(get_cached_crossref_metadata(doi) is None for doi in dois):
+                mark_pending_enrichment(archive)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(archive.m_to_dict(), f)
+            if not is_pending_enrichment(archive):
+                enriched.append(path)
+    return enriched
@@ -0,0 +1,161 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Memoized `nomad.atomutils.Formula`.
+
+Parsing a formula and deriving its Hill, IUPAC, reduced and anonymous forms and the
+elemental masses is done once per formula string by `get_formula`. Populating a
+section from the returned `CachedFormula` only assigns the stored values.
+"""
+
+from functools import lru_cache
+
+from nomad.atomutils import Formula
+from nomad.datamodel.results import Material, System
+
+# number of distinct formulas whose derived values are kept in memory
+FORMULA_CACHE_SIZE = 4096
+
+FORMULA_FORMATS = ('hill', 'reduced', 'iupac', 'anonymous', 'descriptive')
+
+POPULATED_QUANTITIES = (
+    'elements',
+    'elemental_composition',
+    'chemical_formula_hill',
+    'chemical_formula_reduced',
+    'chemical_formula_iupac',
+    'chemical_formula_anonymous',
+    'chemical_formula_descriptive',
+)
+
+
+class CachedFormula:
+    """
+    The values `Formula` derives from a formula string, computed once. Provides the
+    `format`, `elements`, `elemental_composition` and `populate` methods of
+    `Formula`.
+    """
+
+    def __init__(self, formula: str):
+        from ase.data import atomic_numbers
+        from nomad.atomutils import atomic_masses, valid_elements
+
+        parsed = Formula(formula)
+        self.original = formula
+        self._formats = {fmt: parsed.format(fmt) for fmt in FORMULA_FORMATS}
+        self._formats['original'] = parsed.format('original')
+        self._elements = parsed.elements()
+        self.atomic_fractions = parsed.atomic_fractions()
+        self.mass_fractions = parsed.mass_fractions()
+        self._masses = {
+            element: atomic_masses[atomic_numbers[element]]
+            for element in self.atomic_fractions
+            if element in valid_elements
+        }
+
+    def format(self, fmt: str) -> str:
+        """
+        Returns the formula in one of the formats of `Formula.format`.
+        """
+        if fmt not in self._formats:
+            raise ValueError(f'Invalid format option "{fmt}"')
+        return self._formats[fmt]
+
+    def elements(self) -> list[str]:
+        return list(self._elements)
+
+    def elemental_composition(self) -> list:
+        """
+        Returns new `results.ElementalComposition` sections like
+        `Formula.elemental_composition`.
+        """
+        from nomad.datamodel.results import ElementalComposition
+
+        return [
+            ElementalComposition(
+                element=element,
+                atomic_fraction=self.atomic_fractions[element],
+                mass_fraction=self.mass_fractions[element],
+                mass=mass,
+            )
+            for element, mass in self._masses.items()
+        ]
+
+    def system_elemental_composition(self) -> list:
+        """
+        Returns new `basesections.ElementalComposition` sections like
+        `elemental_composition_from_formula`.
+        """
+        from nomad.datamodel.metainfo.basesections import ElementalComposition
+
+        return [
+            ElementalComposition(
+                element=element,
+                atomic_fraction=fraction,
+                mass_fraction=self.mass_fractions[element],
+            )
+            for element, fraction in self.atomic_fractions.items()
+        ]
+
+    def populate(
+        self,
+        section: Material | System,
+        descriptive_format: str | None = 'original',
+        overwrite: bool = False,
+    ) -> None:
+        """
+        Populates a section with the elements, the elemental composition and the
+        formulas like `Formula.populate`.
+
+        Args:
+            section: The section to be populated with elements and formulae.
+            descriptive_format: The format of the descriptive formula, not set if
+                `None`.
+            overwrite: Allow the populated metadata to be overwritten.
+
+        Raises:
+            ValueError: If any of the quantities is already set and `overwrite` is
+            false.
+        """
+        if not overwrite:
+            for quantity in POPULATED_QUANTITIES:
+                if getattr(section, quantity):
+                    raise ValueError(
+                        'Could not populate compositional data '
+                        f'as "{quantity}" is already defined.'
+                    )
+
+        section.elements = self.elements()
+        section.elemental_composition = self.elemental_composition()
+        section.chemical_formula_hill = self._formats['hill']
+        section.chemical_formula_reduced = self._formats['reduced']
+        section.chemical_formula_iupac = self._formats['iupac']
+        section.chemical_formula_anonymous = self._formats['anonymous']
+        if descriptive_format:
+            section.chemical_formula_descriptive = self.format(descriptive_format)
+
+
+@lru_cache(maxsize=FORMULA_CACHE_SIZE)
+def get_formula(formula: str) -> CachedFormula:
+    """
+    Returns the memoized formula of a formula string.
+
+    Raises:
+        ValueError: If the formula can not be parsed by `Formula`.
+    """
+    return CachedFormula(formula)
@@ -0,0 +1,160 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+OFFLINE_ENV = 'PEROVSKITE_DATABASE_OFFLINE'
+PACKAGE = 'perovskite_solar_cell_database'
+# seconds to wait for a connection and for a response of an external API
+EXTERNAL_API_TIMEOUT = (5, 30)
+
+_offline: bool | None = None
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def set_offline_mode(offline: bool | None) -> None:
+    """
+    Switches offline mode on or off. `None` falls back to the environment variable
+    and the `network_enrichment` setting of the entry points. In offline
+    mode, external APIs are not queried.
+    """
+    global _offline  # noqa: PLW0603
+    _offline = offline
+
+
+@contextmanager
+def offline_mode(offline: bool | None):
+    """
+    Switches offline mode on or off within a `with` block.
+    """
+    global _offline  # noqa: PLW0603
+    previous = _offline
+    _offline = offline
+    try:
+        yield
+    finally:
+        _offline = previous
+
+
+@cache
+def _network_enrichment_configured() -> bool:
+    """
+    `network_enrichment` is one switch for the whole package: network enrichment is
+    disabled in the process if any entry point of this package with the setting, i.e.
+    the `perovskite_solar_cell` schema package or the `ion_parser`, disables it.
+    """
+    try:
+        from nomad.config import config
+
+        entry_points = config.plugins.entry_points.options
+    except Exception:
+        return True
+    return all(
+        getattr(entry_point, 'network_enrichment', True)
+        for entry_point_id, entry_point in entry_points.items()
+        if entry_point_id.split(':')[0].split('.')[0] == PACKAGE
+    )
+
+
+def is_offline() -> bool:
+    if _offline is not None:
+        return _offline
+    if OFFLINE_ENV in os.environ:
+        return os.environ[OFFLINE_ENV].lower() in ('1', 'true', 'yes')
+    return not _network_enrichment_configured()
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket rate limiter. Tokens are refilled at `rate` per second
+    up to `capacity`, and `acquire` blocks until enough tokens are available.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def create_session(
+    retries: int = 3,
+    backoff_factor: float = 0.5,
+    pool_maxsize: int = 10,
+) -> requests.Session:
+    """
+    Creates a `requests.Session` that reuses its connections and retries failed
+    requests with an exponential backoff. Responses with a retryable status are
+    returned after the last retry instead of raising.
+
+    Args:
+        retries (int): The maximum number of retries per request.
+        backoff_factor (float): The backoff factor between retries in seconds.
+        pool_maxsize (int): The number of connections kept per host.
+
+    Returns:
+        requests.Session: The session.
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=('GET',),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        max_retries=retry, pool_connections=pool_maxsize, pool_maxsize=pool_maxsize
+    )
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Returns the session shared by all external API clients of this process.
+    """
+    global _session  # noqa: PLW0603
+    with _session_lock:
+        if _session is None:
+            _session = create_session()
+        return _session
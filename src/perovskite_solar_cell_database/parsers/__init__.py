@@ -1,4 +1,5 @@
 from nomad.config.models.plugins import ParserEntryPoint
+from pydantic import Field
 
 
 class TandemXLSParserEntryPoint(ParserEntryPoint):
@@ -51,6 +52,15 @@ tandem_json_parser = TandemJSONParserEntryPoint(
 
 
 class IonParserEntryPoint(ParserEntryPoint):
+    network_enrichment: bool = Field(
+        True,
+        description=(
+            'Resolve the parsed ions with PubChem. If disabled, network enrichment is '
+            'disabled for the whole package, see the `perovskite_solar_cell` schema '
+            'package.'
+        ),
+    )
+
     def load(self):
         from perovskite_solar_cell_database.parsers.ion_parser import IonParser
 
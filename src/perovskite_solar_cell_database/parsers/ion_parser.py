@@ -1,5 +1,3 @@
-import time
-
 import numpy as np
 import pandas as pd
 from nomad.datamodel import EntryArchive
@@ -10,8 +8,15 @@ from perovskite_solar_cell_database.composition import (
     PerovskiteBIon,
     PerovskiteXIon,
 )
+from perovskite_solar_cell_database.pubchem import prefetch_pub_chem_sections
 from perovskite_solar_cell_database.utils import create_archive
 
+ION_CLASSES = {
+    'A': PerovskiteAIon,
+    'B': PerovskiteBIon,
+    'X': PerovskiteXIon,
+}
+
 
 class IonParser(MatchingParser):
     def parse(
@@ -22,15 +27,12 @@ class IonParser(MatchingParser):
         child_archives: dict[str, EntryArchive] = None,
     ) -> None:
         df = pd.read_excel(mainfile).replace(np.nan, None)
-        for index, row in df.iterrows():
-            if row['perovskite_site'] == 'A':
-                ion = PerovskiteAIon()
-            elif row['perovskite_site'] == 'B':
-                ion = PerovskiteBIon()
-            elif row['perovskite_site'] == 'X':
-                ion = PerovskiteXIon()
-            else:
+        ions = []
+        for row in df.to_dict('records'):
+            ion_class = ION_CLASSES.get(row['perovskite_site'])
+            if ion_class is None:
                 raise ValueError(f'Unknown ion type {row["perovskite_site"]}')
+            ion = ion_class()
             ion.abbreviation = row['abbreviation']
             ion.molecular_formula = row['molecular_formula']
             ion.smiles = row['smiles']
@@ -40,7 +42,15 @@ class IonParser(MatchingParser):
             ion.source_compound_iupac_name = row['source_compound_iupac_name']
             ion.source_compound_smiles = row['source_compound_smiles']
             ion.source_compound_cas_number = row['source_compound_cas_number']
-            time.sleep(1)  # Waiting to avoid rate limiting
+            ions.append(ion)
+
+        # Resolve every distinct substance under the PubChem rate limit, so that the
+        # ion entries are normalized from the cache.
+        prefetch_pub_chem_sections(
+            (section for ion in ions for section in ion.pub_chem_sections()),
+            logger=logger,
+        )
+        for ion in ions:
             create_archive(
-                ion, archive, f'{row["abbreviation"]}_perovskite_ion.archive.json'
+                ion, archive, f'{ion.abbreviation}_perovskite_ion.archive.json'
             )
@@ -0,0 +1,360 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Cache for the PubChem lookups of `PubChemPureSubstanceSection`.
+
+Resolved substances are kept in memory and in a persistent store, keyed by the
+identifiers the section was given (name, IUPAC name, formula, SMILES, CAS number and
+CID). In offline mode, PubChem is never queried, substances are completed from the
+cache and the packaged ion tables only and the entry is tagged as pending enrichment.
+Offline mode is switched on with the `PEROVSKITE_DATABASE_OFFLINE` environment
+variable, the `network_enrichment` setting of the entry points or `set_offline_mode`.
+
+Bulk imports fill the cache up front with `prefetch_pub_chem_sections`, which
+resolves the distinct substances concurrently under the PubChem rate limit.
+"""
+
+import json
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+from urllib.parse import quote
+
+from nomad.datamodel.metainfo.basesections import (
+    PubChemPureSubstanceSection,
+    PureSubstanceSection,
+)
+
+from perovskite_solar_cell_database.cache import LRUCache, PersistentCache
+from perovskite_solar_cell_database.enrichment import mark_pending_enrichment
+from perovskite_solar_cell_database.network import (  # noqa: F401
+    EXTERNAL_API_TIMEOUT,
+    OFFLINE_ENV,
+    TokenBucket,
+    get_session,
+    is_offline,
+    set_offline_mode,
+)
+
+if TYPE_CHECKING:
+    from nomad.datamodel.datamodel import EntryArchive
+    from structlog.stdlib import BoundLogger
+
+PUBCHEM_CACHE_TTL = 90 * 24 * 3600
+PUB_CHEM_PUG_PATH = 'https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound'
+# PubChem allows at most 5 requests per second
+PUBCHEM_RATE = 5
+PUBCHEM_WORKERS = 4
+
+# Quantities filled by the PubChem lookup
+PUBCHEM_QUANTITIES = [
+    'pub_chem_cid',
+    'pub_chem_link',
+    'name',
+    'iupac_name',
+    'molecular_formula',
+    'molecular_mass',
+    'molar_mass',
+    'monoisotopic_mass',
+    'inchi',
+    'inchi_key',
+    'smile',
+    'canonical_smile',
+    'cas_number',
+]
+
+_memory_cache = LRUCache(maxsize=2048)
+_disk_cache = PersistentCache('pubchem', ttl=PUBCHEM_CACHE_TTL)
+_rate_limiter = TokenBucket(PUBCHEM_RATE)
+
+
+def pub_chem_cache_key(section: PubChemPureSubstanceSection) -> str:
+    return json.dumps(
+        [
+            section.name,
+            section.iupac_name,
+            section.molecular_formula,
+            section.smile,
+            section.cas_number,
+            section.pub_chem_cid,
+        ]
+    )
+
+
+def _get_values(section: PubChemPureSubstanceSection) -> dict:
+    values = {}
+    for quantity in PUBCHEM_QUANTITIES:
+        value = getattr(section, quantity)
+        if value is None:
+            continue
+        values[quantity] = getattr(value, 'magnitude', value)
+    return values
+
+
+def _set_values(section: PubChemPureSubstanceSection, values: dict) -> None:
+    for quantity, value in values.items():
+        if getattr(section, quantity) is None:
+            setattr(section, quantity, value)
+
+
+def get_cached_pub_chem_values(key: str) -> dict | None:
+    values = _memory_cache.get(key)
+    if values is None:
+        values = _disk_cache.get(key)
+        if values is not None:
+            _memory_cache.set(key, values)
+    return values
+
+
+def set_cached_pub_chem_values(values_by_key: dict[str, dict]) -> None:
+    for key, values in values_by_key.items():
+        _memory_cache.set(key, values)
+    _disk_cache.set_many(values_by_key)
+
+
+def _complete_from_ion_tables(section: PubChemPureSubstanceSection) -> None:
+    from perovskite_solar_cell_database.schema_sections.ions.ion import (
+        get_ion_catalog,
+    )
+
+    ion = get_ion_catalog().find_by_smiles(section.smile)
+    if ion is None:
+        return
+    _set_values(
+        section,
+        {
+            quantity: value
+            for quantity, value in (
+                ('name', ion.common_name),
+                ('iupac_name', ion.iupac_name),
+                ('molecular_formula', ion.molecular_formula),
+                ('cas_number', ion.cas_number),
+            )
+            if value is not None
+        },
+    )
+
+
+def normalize_pub_chem_section(
+    section: PubChemPureSubstanceSection,
+    archive: 'EntryArchive',
+    logger: 'BoundLogger',
+    normalize: Callable | None = None,
+) -> None:
+    """
+    Normalizes a `PubChemPureSubstanceSection` through the cache.
+
+    On a cache hit the section is completed with the cached values and PubChem is not
+    queried. On a miss the section is normalized as usual and the result is cached if
+    a PubChem CID was found. In offline mode a miss is completed from the ion tables
+    and the entry is tagged as pending enrichment.
+
+    Args:
+        section (PubChemPureSubstanceSection): The section to normalize.
+        archive (EntryArchive): The archive containing the section.
+        logger (BoundLogger): A structlog logger.
+        normalize (Callable): The uncached normalizer, `section.normalize` by default.
+            Needed if this is called from the `normalize` of a subclass.
+    """
+    key = pub_chem_cache_key(section)
+    values = get_cached_pub_chem_values(key)
+    if values is not None:
+        _set_values(section, values)
+        PureSubstanceSection.normalize(section, archive, logger)
+        return
+    if is_offline():
+        mark_pending_enrichment(archive)
+        _complete_from_ion_tables(section)
+        PureSubstanceSection.normalize(section, archive, logger)
+        return
+    if normalize is None:
+        normalize = section.normalize
+    normalize(archive, logger)
+    if section.pub_chem_cid is not None:
+        set_cached_pub_chem_values({key: _get_values(section)})
+
+
+# PubChem property names and the quantities and types they fill, see
+# `PubChemPureSubstanceSection._populate_from_cid`
+PUBCHEM_PROPERTIES = {
+    'Title': ('name', str),
+    'IUPACName': ('iupac_name', str),
+    'MolecularFormula': ('molecular_formula', str),
+    'ExactMass': ('molecular_mass', float),
+    'MolecularWeight': ('molar_mass', float),
+    'MonoisotopicMass': ('monoisotopic_mass', float),
+    'InChI': ('inchi', str),
+    'InChIKey': ('inchi_key', str),
+    'SMILES': ('smile', str),
+}
+
+
+class PubChemResolver:
+    """
+    Resolves `PubChemPureSubstanceSection`s like their `normalize` does, but through a
+    pooled session and a shared token bucket instead of a random pause before every
+    request. It is safe to use from several threads.
+    """
+
+    def __init__(self, session=None, rate_limiter: TokenBucket | None = None):
+        self.session = session or get_session()
+        self.rate_limiter = rate_limiter or _rate_limiter
+
+    def _get(self, url: str):
+        self.rate_limiter.acquire()
+        return self.session.get(url, timeout=EXTERNAL_API_TIMEOUT)
+
+    def _search(self, path: str, search: str, logger) -> int | None:
+        safe_search = quote(search, safe='')
+        if path in ('smiles', 'inchi'):
+            url = f'{PUB_CHEM_PUG_PATH}/{path}/cids/JSON?{path}={safe_search}'
+        else:
+            url = f'{PUB_CHEM_PUG_PATH}/{path}/{safe_search}/cids/JSON'
+        response = self._get(url)
+        if response.status_code == 404:
+            return None
+        if not response.ok:
+            logger.warning(
+                f'PubChem search for {path}="{search}" failed with '
+                f'{response.status_code} {response.reason}: {response.url}'
+            )
+            return None
+        try:
+            cids = response.json()['IdentifierList']['CID']
+        except (KeyError, ValueError):
+            return None
+        return cids[0] if cids else None
+
+    def _populate(self, section: PubChemPureSubstanceSection, logger) -> None:
+        from nomad.datamodel.metainfo.basesections.v1 import is_cas_rn
+
+        cid = section.pub_chem_cid
+        response = self._get(
+            f'{PUB_CHEM_PUG_PATH}/cid/{cid}/property/'
+            f'{",".join(PUBCHEM_PROPERTIES)}/JSON'
+        )
+        if not response.ok:
+            logger.warning(
+                f'Property request to PubChem failed with '
+                f'{response.status_code} {response.reason}: {response.url}'
+            )
+            return
+        section.pub_chem_link = f'https://pubchem.ncbi.nlm.nih.gov/compound/{cid}'
+        try:
+            property_values = response.json()['PropertyTable']['Properties'][0]
+        except (KeyError, IndexError, ValueError):
+            property_values = {}
+        for property_name, (quantity, type_) in PUBCHEM_PROPERTIES.items():
+            if getattr(section, quantity) is not None:
+                continue
+            try:
+                setattr(section, quantity, type_(property_values[property_name]))
+            except (KeyError, ValueError):
+                continue
+        if section.cas_number is not None:
+            return
+        response = self._get(f'{PUB_CHEM_PUG_PATH}/cid/{cid}/synonyms/JSON')
+        if not response.ok:
+            return
+        try:
+            synonyms = response.json()['InformationList']['Information'][0]['Synonym']
+        except (KeyError, IndexError, ValueError):
+            synonyms = []
+        for synonym in synonyms:
+            if is_cas_rn(synonym):
+                section.cas_number = synonym
+                break
+
+    def resolve(self, section: PubChemPureSubstanceSection, logger) -> None:
+        """
+        Finds the PubChem CID of the section in the order of
+        `PubChemPureSubstanceSection._find_cid` and fills the unset quantities.
+        """
+        if section.pub_chem_cid is None:
+            for search, path in (
+                (section.smile, 'smiles'),
+                (section.canonical_smile, 'smiles'),
+                (section.inchi_key, 'inchikey'),
+                (section.iupac_name, 'name'),
+                (section.name, 'name'),
+                (section.molecular_formula, 'fastformula'),
+                (section.name, 'fastformula'),
+                (section.cas_number, 'name'),
+            ):
+                if search:
+                    section.pub_chem_cid = self._search(path, search, logger)
+                    if section.pub_chem_cid is not None:
+                        break
+            else:
+                return
+        self._populate(section, logger)
+
+
+def prefetch_pub_chem_sections(
+    sections: Iterable[PubChemPureSubstanceSection],
+    logger: 'BoundLogger' = None,
+    max_workers: int = PUBCHEM_WORKERS,
+    resolver: PubChemResolver | None = None,
+) -> int:
+    """
+    Resolves the distinct substances of several sections concurrently and stores
+    them in the cache, so that normalizing the sections afterwards does not query
+    PubChem. The sections themselves are not modified.
+
+    Args:
+        sections (Iterable[PubChemPureSubstanceSection]): The unnormalized sections.
+        logger (BoundLogger): A structlog logger.
+        max_workers (int): The number of concurrent requests.
+        resolver (PubChemResolver): The resolver, a shared default if not given.
+
+    Returns:
+        int: The number of substances that were resolved.
+    """
+    if is_offline():
+        return 0
+    if logger is None:
+        from nomad import utils
+
+        logger = utils.get_logger(__name__)
+
+    pending = {}
+    for section in sections:
+        key = pub_chem_cache_key(section)
+        if key in pending or get_cached_pub_chem_values(key) is not None:
+            continue
+        pending[key] = section.m_copy()
+    if not pending:
+        return 0
+    if resolver is None:
+        resolver = PubChemResolver()
+
+    def resolve(section):
+        try:
+            resolver.resolve(section, logger)
+        except Exception as e:
+            logger.warning(f'PubChem lookup failed: {e}')
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(resolve, pending.values()))
+    resolved = {
+        key: _get_values(section)
+        for key, section in pending.items()
+        if section.pub_chem_cid is not None
+    }
+    set_cached_pub_chem_values(resolved)
+    return len(resolved)
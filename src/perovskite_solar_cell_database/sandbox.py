@@ -0,0 +1,42 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Imports that pass through the temporalio workflow sandbox.
+
+When the cpu-worker starts, the sandbox imports the workflows of `actions` again,
+together with their parent packages and thereby the entry points of this plugin. Their
+imports of NOMAD have to be passed through the sandbox. Entry points are also loaded
+by every other NOMAD process, so temporalio is not imported for this. It is only
+looked up if it is loaded already, i.e. in a worker, and stays a dependency of the
+workflows and activities in `actions`.
+"""
+
+import sys
+from contextlib import AbstractContextManager, nullcontext
+
+
+def imports_passed_through() -> AbstractContextManager:
+    """
+    Returns `temporalio.workflow.unsafe.imports_passed_through()` if temporalio is
+    loaded and a context manager that does nothing otherwise.
+    """
+    # in the sandbox, modules of the host are passed through on lookup
+    workflow = sys.modules.get('temporalio.workflow')
+    if workflow is None:
+        return nullcontext()
+    return workflow.unsafe.imports_passed_through()
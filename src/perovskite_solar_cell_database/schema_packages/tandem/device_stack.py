@@ -12,6 +12,7 @@ from nomad.metainfo import Datetime, MEnum, Quantity, Section, SubSection
 from nomad.metainfo.metainfo import SchemaPackage
 
 from perovskite_solar_cell_database.composition import PerovskiteCompositionSection
+from perovskite_solar_cell_database.pubchem import normalize_pub_chem_section
 
 m_package = SchemaPackage()
 
@@ -103,7 +104,7 @@ class ChemicalComponentIdentity(PubChemPureSubstanceSection):
     def normalize(self, archive, logger):
         # Fix for non-defined molecular_formula in PureSubstance v2.py
         # self.molecular_formula = self.formula
-        super().normalize(archive, logger)
+        normalize_pub_chem_section(self, archive, logger, normalize=super().normalize)
 
 
 class ChemicalComponentAmount(ArchiveSection):
@@ -3,9 +3,6 @@ from typing import (
     TYPE_CHECKING,
 )
 
-from nomad.atomutils import (
-    Formula,
-)
 from nomad.datamodel.metainfo.common import ProvenanceTracker
 from nomad.datamodel.results import (
     BandGap,
@@ -22,6 +19,8 @@ from nomad.datamodel.results import (
 from nomad.normalizing.topology import add_system, add_system_info
 
 from perovskite_solar_cell_database.composition import PerovskiteIonComponent
+from perovskite_solar_cell_database.conformers import optimize_molecules
+from perovskite_solar_cell_database.formula import get_formula
 
 if TYPE_CHECKING:
     from nomad.datamodel.datamodel import EntryArchive
@@ -204,11 +203,9 @@ class PerovskiteTandemSolarCell(Schema, PlotSection):
             description=f'{layer_name} layer in the tandem solar cell.',
         )
         if layer_formula != '':
-            formula = Formula(layer_formula)
-            formula.populate(system, overwrite=True)
+            get_formula(layer_formula).populate(system, overwrite=True)
         elif hasattr(layer, 'molecular_formula') and layer.molecular_formula:
-            formula = Formula(layer.molecular_formula)
-            formula.populate(system, overwrite=True)
+            get_formula(layer.molecular_formula).populate(system, overwrite=True)
         else:
             logger.warn(
                 f'Could not find chemical formula for {layer_name} layer {layer.layer_index}.'
@@ -411,21 +408,23 @@ class PerovskiteTandemSolarCell(Schema, PlotSection):
                 isinstance(layer, Photoabsorber_Perovskite)
                 and layer.composition is not None
             ):
-                system = layer.composition.to_topology_system(logger=logger)
+                system = layer.composition.get_topology_system(logger=logger)
                 system.label = 'Perovskite Layer'
                 system.description = 'A perovskite layer in the tandem solar cell.'
                 system.dimensionality = layer.composition.dimensionality
                 add_system(system, topology, parent=tandem_system)
-                add_system_info(system, topology)
                 ions: list[PerovskiteIonComponent] = (
                     layer.composition.ions_a_site
                     + layer.composition.ions_b_site
                     + layer.composition.ions_x_site
                 )
+                optimize_molecules(
+                    [ion.smiles for ion in ions if ion.smiles is not None],
+                    logger=logger,
+                )
                 for ion in ions:
-                    child_system = ion.to_topology_system()
+                    child_system = ion.get_topology_system(logger=logger)
                     add_system(child_system, topology, system)
-                    add_system_info(child_system, topology)
 
             elif isinstance(layer, Photoabsorber_Silicon):
                 system = self.create_system_from_layer(
@@ -4,7 +4,7 @@ from .cell import Cell
 from .encapsulation import Encapsulation
 from .eqe import EQE
 from .etl import ETL
-from .formula_normalizer import PerovskiteFormulaNormalizer
+from .formula_normalizer import PerovskiteFormulaNormalizer, normalize_formulas
 from .htl import HTL
 from .ions.ion import Ion
 from .jv import JV, JVcurve
@@ -1,6 +1,7 @@
 from nomad.datamodel.data import ArchiveSection
 from nomad.metainfo import Quantity
 
+from perovskite_solar_cell_database.schema_sections.suggestions import get_suggestions
 from perovskite_solar_cell_database.schema_sections.utils import add_solar_cell
 
 
@@ -30,299 +31,7 @@ MoO3 | Ag
                     """,
         a_eln=dict(
             component='EnumEditQuantity',
-            props=dict(
-                suggestions=[
-                    'Au | ITO',
-                    'rGO | Au',
-                    'MoO3 | Ag | WO3',
-                    'Carbon; WO3-np',
-                    'ITO | MgF2',
-                    'Al | Al2O3',
-                    'Ag | Alq3',
-                    'AgAu',
-                    'MoOx | Ag',
-                    'Carbon-nt; PCBM-60',
-                    'ITO',
-                    'AgAl',
-                    'Cr | Cu',
-                    'AgZn | Al',
-                    'Mo | Ag',
-                    'Cu-CFN',
-                    "Field's metal",
-                    'Al | Ag',
-                    'Ag-nw | ZnO-np',
-                    'Carbon; NiS',
-                    'PEDOT:PSS | PDMS',
-                    'Carbon; Graphite; PANI',
-                    'MoOx | Au',
-                    'Ni-grid',
-                    'GaIn',
-                    'Cu',
-                    'Ag | MoO3',
-                    'CNTs',
-                    'none',
-                    'MoOx | Al',
-                    'MWCNTs; ONC1',
-                    'Cu | Au',
-                    'Cr | Au',
-                    'MoOx | Au | Cu | MoOx',
-                    'Pt-sheet',
-                    'MoO3 | Ag',
-                    'Carbon | IPA',
-                    'KIPIG',
-                    'T-MWCNTs',
-                    'AZO',
-                    'CSCNT@SnO2',
-                    'B-MWCNTs',
-                    'Carbon black | Carbon',
-                    'Ag | SiO2 | ZnS | Ag | ZnS',
-                    'Carbon-nt | PMMA',
-                    'MoO3 | Ag | MoO3',
-                    'PEDOT:PSS | Graphene',
-                    'Pb',
-                    'ITO | SLG',
-                    'Carbon; NiO:rGO',
-                    'Carbon; NiO',
-                    'NiO',
-                    'Cu; Cu2O',
-                    'Graphene | PDMS',
-                    'Carbon black; Graphite',
-                    'N-Graphene',
-                    'CuPc | Carbon',
-                    'Carbon',
-                    'Carbon-paper',
-                    'Au | Al',
-                    'Carbon; WO2-np',
-                    'FTO',
-                    'CNTs | Mxene',
-                    'Graphite | Cu-tape',
-                    'H2PtCl6',
-                    'PTAA | FTO | SLG',
-                    'PEI | PEDOT:PSS | PDMS',
-                    'Bi2Te3',
-                    'Pt',
-                    'Carbon-nw',
-                    'Cu | Ag | MoO3',
-                    'MoO2 | ITO',
-                    'Ca | Al',
-                    'AZO | Ni | Al | Ni',
-                    'MoOx | Cu',
-                    'Carbon-tape',
-                    'Carbon | Au',
-                    'Carbon | CuSCN',
-                    'PEDOT:PSS | Al',
-                    'TFSA-Graphene | PET | Ag',
-                    'ITO | Ag-grid',
-                    'Ca',
-                    'Mo2O3 | Ag',
-                    'SnO2-c | Ag | SnO2-c',
-                    'Candle soot | FTO | SLG',
-                    'MoOx | IZO',
-                    'Au | Ag-nw',
-                    'Au',
-                    'TETA-Graphene | PET',
-                    'W',
-                    'Transparent Conductive Adhesive | PET:Ni mesh',
-                    'Graphene | PMMA | PDMS',
-                    'MoO3 | Au | MoO3',
-                    'Au | LiF',
-                    'MoO3 ∣ ITO',
-                    'Au-np',
-                    'Mg | Al',
-                    'Carbon | Ag',
-                    'TETA-Graphene | PET | Ag',
-                    'Graphite | Cu',
-                    'Ag-nw',
-                    'Ni',
-                    'Na@Carbon-nanowalls',
-                    'Carbon black',
-                    'Au | Organosilicate',
-                    'AZO-c',
-                    'Carbon; NiO-np',
-                    'Ag',
-                    'Ag | FTO',
-                    'IZTO',
-                    'ITO | MWCNTs',
-                    'Ag-nw | PCBM-60',
-                    'PEDOT:PSS | PEDOT:PSS | PDMS',
-                    'Carbon | FTO | SLG',
-                    'SWCNTs',
-                    'Cr',
-                    'IZO | Ag',
-                    'FTO | SLG',
-                    'Graphite | FTO',
-                    'AZO | Ni | Al',
-                    'Pd',
-                    'Carbon | FAAc',
-                    'Carbon black; Carbon-nt; Graphite',
-                    'Carbon black; Graphite | MWCNTs',
-                    'TeO2 | Ag',
-                    'Au | MoO3',
-                    'AZO | NiAl',
-                    'Bi | Au',
-                    'Carbon; MAI | Carbon',
-                    'NiO | Ag | NiO',
-                    'MoO3 | ITO | MgF2',
-                    'PH 1000',
-                    'Ag | ITO | Ag',
-                    'ITO | LiF',
-                    'Ag | IZO',
-                    'LiF | Al',
-                    'H:MoO3-nanobelts',
-                    'Carbon | CNTs',
-                    'Ti | Au',
-                    'Carbon | Al',
-                    'MoOx | Au | MoOx',
-                    'Ag-sheet',
-                    'TFSA-Graphene | PET',
-                    'Graphene | PET',
-                    'Graphene | PEDOT',
-                    'MoOx | Ag | MoOx',
-                    'MoO3 | AuAg | MoO3',
-                    'Carbon | Carbon-fibre',
-                    'MoO3 | Au | Ag',
-                    'Ba | Ag',
-                    'Graphen',
-                    'Mg | Ag',
-                    'Carbon | MAAc',
-                    'MoO3 | Au',
-                    'MoOx | ITO',
-                    'Graphite | Pt',
-                    'MWCNTs; ONC2',
-                    'IZO',
-                    'Ag | Ni',
-                    'PANI | FTO | SLG',
-                    'Al | Au',
-                    'MoO3 ∣ Au ∣ Ag ∣ MoO3 | Alq3',
-                    'PEDOT:PSS | Ag-nw | PDMS',
-                    'MWCNTs',
-                    'Cr | Pt | FTO',
-                    'SnO2-c | Ag',
-                    'Carbon | Sn',
-                    'Unknown',
-                    'Carbon; PEMA',
-                    'Carbon | Graphite',
-                    'MoP3 | Ag',
-                    'Ag | Ta2O3',
-                    'Cr2O3:Cr',
-                    'Graphene | Au',
-                    'PEDOT:PSS | FTO | SLG',
-                    'Carbon | CNTs | Mxene',
-                    'AlAg',
-                    'AZO | Au',
-                    'AV-Carbon; MAI',
-                    'Graphite; Carbon black@5:1',
-                    'NiO | Ag | NiO | NaYF4 | Ag',
-                    'AV-carbon; MAI',
-                    'SWCNTs | PMMA',
-                    'Ba | Al',
-                    'Pt-Carbon-nt',
-                    'Sb',
-                    'Carbon-epoxy | Ag',
-                    'ITO | Ni | Al',
-                    'Ni | Al',
-                    'Ag | V2O5',
-                    'Pt | FTO | SLG',
-                    'PEDOT:PSS | ITO | SLG',
-                    'Graphene',
-                    'Cu | Au | BCP',
-                    'IZO | Au',
-                    'Au | Ni',
-                    'Au | ITO | Au',
-                    'MoO3 | AZO | AlNi-grid',
-                    'WO3 | Ag',
-                    'Au | Ag',
-                    'SnO2-c | Cu | SnO2-c',
-                    'Carbon | FTO',
-                    'CSCNT@Al2O3-c | CSCNT@SnO2',
-                    'Ti',
-                    'Carbon-nt',
-                    'AZO-np | Ag',
-                    'Carbon; NiPt-nw',
-                    'D-Sorbito; PEDOT:PSSl | Ag-nw | PET',
-                    'Carbon; LPP',
-                    'MoOx | Cu | MoOx',
-                    'PEDOT:PSS | ITO | PET',
-                    'In',
-                    'Carbon-nanowalls',
-                    'NiS | Cr | Pt | FTO | SLG',
-                    'Ag | ITO',
-                    'Ca | Ag',
-                    'Ag-nw | C60',
-                    'MoOx | Ag | ZnS',
-                    'Au | FTO',
-                    'Pt | Si',
-                    'Al',
-                    'Ag@Au-np',
-                    'Graphite',
-                    'PEDOT:PSS:PSA',
-                    'MnO3 | Ag',
-                    'AgAu-mp',
-                    'ITO | Al',
-                    'Ag | SnO2-c',
-                    'ICO',
-                    'Ti-grid',
-                    'ITO | Au',
-                    'MoO3 | Au | Ag | MoO3 | Alq3',
-                    'Au-np; NiO',
-                    'Carbon-nt | Carbon',
-                    'MoOx | ITO | Au',
-                    'PEDOT:PSS; Sorbitol | Ag-grid | PET',
-                    'MoO3 | ITO',
-                    'Pt | FTO',
-                    'MoOx | IO | ITO | Au',
-                    'Carbon | Galinstan',
-                    'P3HT | FTO | SLG',
-                    'ITO | Ag',
-                    'Ni | Au',
-                    'Ag | Au',
-                    'SWCNTs | Ag',
-                    'Ag | Al',
-                    'MoOx | IAI',
-                    'Cu | Ag',
-                    'Perovskite | PEDOT:PSS | ITO | SLG',
-                    'Graphene oxide | Carbon',
-                    'Ag-nanocubes | Ag | MoO3',
-                    'MoO3 | IZO',
-                    'Carbon-mp',
-                    'MoOx | ITO | MgF2',
-                    'NbS2',
-                    'MoO3 | Al',
-                    'Ti3C2',
-                    'MWCNTs; ONC3',
-                    'Carbon | PEDOT:PSS | FTO | SLG',
-                    'MoOx | IZO | Au',
-                    'LiF | Ag',
-                    'ITO | Au-grid',
-                    'PEDOT:PSS',
-                    '3D potassium-ion preintercalated graphene (KIPIG)',
-                    'PEI | PH 1000',
-                    "Filed's metal",
-                    'Ti | Cu',
-                    'Au | Au-wire',
-                    'AlNi-grid',
-                    'Carbon-nt | PMMA | Au',
-                    'ITO | PEN',
-                    'Carbon black; MWCNTs',
-                    'Carbon | Silica gel electrolyte | Carbon',
-                    'CSCNT@Al2O3-c | CSCNT',
-                    'Ag-np | ITO',
-                    'Carbon; MAI',
-                    'PTCBI | Ag | WO3 | PTCBI | Ag',
-                    'Carbon | KAc',
-                    'Ag | CsF',
-                    'Liq | Al',
-                    'Graphite | FTO | SLG',
-                    'Cu-ribbon',
-                    'ITO | Cu',
-                    'Mo',
-                    'Metal',
-                    'AZO | Ag | AZO',
-                    'Graphite ribbon',
-                    'Pt-np | FTO | SLG',
-                    'Carbon | CsAc',
-                ]
-            ),
+            props=dict(suggestions=get_suggestions('backcontact', 'stack_sequence')),
         ),
     )
 
@@ -343,395 +52,7 @@ nan | 100
                     """,
         a_eln=dict(
             component='EnumEditQuantity',
-            props=dict(
-                suggestions=[
-                    '',
-                    '89.0',
-                    '90.0',
-                    '40.0 | 11.0',
-                    '5.0 | 130.0',
-                    '50.0',
-                    '70.0 | 10.0 | 10.0',
-                    '220.0',
-                    '230.0 | 100.0',
-                    '81.0',
-                    '180.0',
-                    '45.0',
-                    '15.0 | 80.0',
-                    '14000.0',
-                    '50.0 | 4000.0',
-                    '7.0 | 80.0',
-                    '24.0 | 15.0 | 20.0 | 480.0 | 8.0',
-                    '10.0 | 100.0 | 200.0',
-                    '203.0',
-                    '10.0 | 120.0 | 70.0',
-                    '11.0 | 30.0',
-                    '1.0 | 200.0',
-                    '30.0 | 120.0 | nan',
-                    '60.9',
-                    '11000.0 | nan',
-                    '1.3 | 100.0',
-                    '300.0 | 250.0',
-                    '2.0 | 1.0 | 7.0 | 5.0 | 50.0',
-                    '15.0 | 150.0',
-                    '60.4',
-                    '35.0 | 103.0 | 35.0',
-                    '2.5 | 154.0',
-                    '6.0 | 11.0 | 20.0',
-                    '1800.0',
-                    '22000.0',
-                    '11.0 | 50.0',
-                    '60.5',
-                    '95.0',
-                    '20.0 | 10.0 | 20.0',
-                    '10.0 | 110.0',
-                    '20.0 | 14.0',
-                    '87.0',
-                    '10.0 | 90.0',
-                    '70.0',
-                    '12.0 | 40.0',
-                    '21.0 | 250.0',
-                    '11.0',
-                    '500.0',
-                    '2000.0 | nan',
-                    '5.0 | nan',
-                    '53150.0',
-                    '2000.0',
-                    '20.0 | 15.0 | 20.0 | 480.0 | 8.0',
-                    '10.0 | 80.0',
-                    '1.0 | 7.0 | 40.0',
-                    '21.0 | 15.0 | 20.0 | 480.0 | 8.0',
-                    '8.0 | 120.0',
-                    '5.0 | 150.0',
-                    'nan | 6.0 | nan',
-                    '61210.0',
-                    '260.0',
-                    '201.0',
-                    '3.0 | 1.0 | 7.0 | 5.0 | 50.0',
-                    '2.0 | 100.0',
-                    '7.0 | 60.0',
-                    '100.0 | 1000.0',
-                    '16500.0 | nan',
-                    '10.0 | 15.0 | 30.0',
-                    '240.0',
-                    '7.2 | 70.0',
-                    '50.0 | 50.0',
-                    '11.0 | nan',
-                    '9.0 | nan',
-                    '35.0 | 95.0 | 35.0',
-                    '330.0',
-                    '10.0 | 30000.0',
-                    '60.3',
-                    '85.0',
-                    '60.1',
-                    '130.0 | 100.0',
-                    '2.5 | 154.0 | 50.0',
-                    'nan | 150.0',
-                    '15.0 | 12.0',
-                    '10.0 | 70.0',
-                    '9.0',
-                    '15.0 | 12.0 | 60.0',
-                    '150.0 | 500.0',
-                    '8.0',
-                    '0.5 | 60.0',
-                    '10.0 | 200.0',
-                    '13.0',
-                    '7.0 | 12.0 | 30.0',
-                    '820.0',
-                    '1.0 | 6.0',
-                    'nan | 80.0',
-                    '13.0 | 80.0',
-                    '25.0 | 15.0 | 20.0 | 480.0 | 8.0',
-                    '2.0 | 250.0',
-                    '93.2',
-                    '500.0 | 150.0',
-                    '5000.0',
-                    '20.0',
-                    '52.0',
-                    '7.0 | 18.0 | 30.0',
-                    '21.0 | 7.0 | 20.0',
-                    '60.11',
-                    '82.0',
-                    '15.0 | 12.0 | 20.0',
-                    '6.0 | 1.5 | 9.5 | 20.0',
-                    '7870.0',
-                    '8.0 | 20.0 | 115.0 | 8.0 | 20.0',
-                    '30.0 | 120.0',
-                    '30.0 | 80.0',
-                    '10.0 | 20.0',
-                    '14.0',
-                    '8.0 | 20.0 | 65.0 | 8.0 | 20.0',
-                    '80.0 | 10.0',
-                    '2001.0 | nan',
-                    'nan | 100.0',
-                    '250.0',
-                    '10.0 | 10.0',
-                    'nan | 220.0',
-                    '65.0',
-                    '150.0',
-                    '15.0 | 50.0',
-                    '4000000000.0',
-                    '15.0 | 200.0',
-                    '46530.0',
-                    'nan | 70.0',
-                    '23.0 | 15.0 | 20.0 | 480.0 | 8.0',
-                    '35.0 | 10.0 | 35.0',
-                    '100000.0 | nan',
-                    '88.0 | 700.0',
-                    '5.0 | 12.0 | 40.0',
-                    '1.0 | 250.0',
-                    '8000.0 | nan',
-                    '60.8',
-                    '12000.0',
-                    '15.0 | nan',
-                    '60.7',
-                    'nan | 25000.0',
-                    '1.0 | 100.0',
-                    '30.0 | 70.0',
-                    '50000.0',
-                    '30.0 | 135.0',
-                    '8.0 | 200.0',
-                    '35.0',
-                    '180.0 | 50.0',
-                    '30.0 | 7.0 | 80.0',
-                    '750.0',
-                    '32000.0',
-                    '1.0 | nan',
-                    '5.0 | 90.0',
-                    '8.0 | 80.0',
-                    '150.0 | 4900.0',
-                    '90.0 | 200.0',
-                    '51.0',
-                    '22.0 | 15.0 | 20.0 | 480.0 | 8.0',
-                    '4500.0',
-                    '16000.0',
-                    '24000.0',
-                    '30000.0',
-                    '10.0 | 60.0',
-                    '12.0 | 100.0',
-                    '7.0 | 120.0',
-                    '9.0 | 100.0',
-                    '6.7 | 100.0',
-                    '154.0 | 50.0',
-                    '25.0',
-                    '10.0 | 202.0',
-                    '20.0 | 10.0 | 35.0',
-                    '80.0 | 20.0',
-                    '40.0',
-                    '65.0 | nan',
-                    '83.0',
-                    '11200.0',
-                    '8.0 | 90.0',
-                    '20.0 | 7.0 | 20.0',
-                    '230.0',
-                    '75.0',
-                    '8.0 | 60.0',
-                    '190.0',
-                    '6.0 | 100.0',
-                    '7.0 | 1.0',
-                    '3.0 | nan',
-                    '15000.0',
-                    '35.0 | 84.0 | 35.0',
-                    '60.6',
-                    '9.0 | 80.0',
-                    'nan | 400.0 | 500.0',
-                    '10.0 | 40.0',
-                    '145.0',
-                    'nan | 50.0 | 4000.0',
-                    '1500.0',
-                    '100.0 | 125.0',
-                    '2.0 | 200.0',
-                    '28.0 | 15.0 | 20.0 | 480.0 | 8.0',
-                    '7.0 | 70.0',
-                    '60.0',
-                    '125.0',
-                    '5.0',
-                    '40000.0',
-                    '45.0 | nan',
-                    '35.0 | 76.0 | 35.0',
-                    '900.0',
-                    '400.0',
-                    '105.0 | 90.0',
-                    '25000.0',
-                    '8.0 | 30.0 | 100.0',
-                    '180.0 | 100.0',
-                    '2.0',
-                    '20.0 | nan',
-                    '80.0 | 150.0',
-                    '30.0 | 100.0',
-                    '11.0 | 10.0',
-                    '5.0 | 120.0',
-                    '4.0',
-                    '1.0 | 10.0 | 20.0',
-                    '14.0 | 20.0',
-                    '15.0 | 40.0',
-                    '40.0 | 120.0',
-                    '20.0 | 250.0',
-                    '600.0',
-                    'nan | 200.0',
-                    '12.0',
-                    '12000.0 | nan',
-                    '6.0 | nan',
-                    '100.0',
-                    '105.0',
-                    '8.0 | 110.0',
-                    '15.0 | 120.0',
-                    '37500.0',
-                    '23000.0 | nan',
-                    '5.0 | 10.0 | 35.0',
-                    '10.0 | 40.0 | nan',
-                    '80.0 | 50.0',
-                    '10000.0 | nan',
-                    '8.0 | 20.0 | 85.0 | 8.0 | 20.0',
-                    '28000.0',
-                    '21000.0',
-                    '48.0',
-                    '9.0 | 25.0',
-                    '4.0 | 80.0',
-                    '15.0 | 100.0',
-                    '96.0',
-                    '3.0 | 80.0',
-                    '200.0',
-                    '70.0 | 10.0',
-                    '4000.0 | nan',
-                    '150.0 | nan',
-                    '80.0 | 8.0',
-                    '350.0',
-                    '110.0 | 120.0',
-                    '1.0 | 10.0 | 35.0',
-                    '90.0 | 100.0',
-                    '50.0 | 100.0',
-                    '80000.0',
-                    '10.0 | 120.0',
-                    '202.0',
-                    '200000.0',
-                    '8000.0',
-                    '35.0 | 120.0 | 70.0',
-                    '160.0',
-                    '10.0 | 55.0',
-                    '3.5 | 100.0',
-                    '2000.0 | 100.0 | nan',
-                    '10.0 | 150.0',
-                    '25.0 | 100.0',
-                    '12.0 | 80.0',
-                    '5.0 | 10.0 | 40.0',
-                    '170.0',
-                    '35.0 | 64.0 | 35.0',
-                    '1500-2000',
-                    '55.0',
-                    '9000.0',
-                    '6.0',
-                    '4900.0',
-                    '10.0 | 100.0 | 10.0 | 100.0',
-                    '100.0 | 20.0',
-                    '20.0 | 100.0',
-                    '7.0 | nan',
-                    '34.0 | 20.0 | 25.0 | nan | 8.0',
-                    '3333.0',
-                    '2.5 | 80.0',
-                    '20.0 | 80.0',
-                    '18.0 | 10.0 | 19.0',
-                    '150.0 | 100.0',
-                    '5.0 | 60.0',
-                    '6.0 | 10.0 | 35.0',
-                    '3500.0',
-                    '550.0',
-                    '15.0',
-                    '12500.0',
-                    '35.0 | 120.0',
-                    '8.0 | 100.0',
-                    '7.0 | 24.0 | 30.0',
-                    '300.0',
-                    '11.0 | 80.0',
-                    '50.0 | 101.0',
-                    '185.0',
-                    '71600.0',
-                    '77.0 | nan',
-                    '5.0 | 100.0',
-                    '120.0',
-                    '88.0',
-                    '130.0',
-                    '3000.0',
-                    '110.0',
-                    '20.0 | 15.0',
-                    '120000.0',
-                    '300000.0',
-                    '10.0 | 100.0',
-                    '26.0 | 15.0 | 20.0 | 480.0 | 8.0',
-                    '11000.0',
-                    '6500.0',
-                    '1000.0',
-                    '5.0 | 10.0 | 5.0',
-                    '10.0 | 1.0 | 10.0 | 40.0',
-                    '34.0 | 20.0 | 55.0 | nan | 15.0',
-                    '6.3 | 70.0',
-                    '60000.0',
-                    '100.0 | 100.0',
-                    '10.0 | 35.0',
-                    '1200.0',
-                    '60.2',
-                    '390.0',
-                    '10.0',
-                    '11.0 | 20.0',
-                    '25800.0',
-                    '35.0 | 160.0',
-                    '35.0 | 53.0 | 35.0',
-                    '30.0 | nan',
-                    '1.0 | 120.0',
-                    '120.0 | 70.0',
-                    '20000.0',
-                    '5.0 | 20.0 | 35.0',
-                    '210.0',
-                    '2500.0',
-                    '5.0 | 300.0',
-                    '5.0 | 80.0',
-                    '10.0 | 10.0 | 35.0',
-                    '800.0',
-                    '1.9 | 70.0',
-                    '1.45 | nan',
-                    '9.0 | 110.0',
-                    '40.0 | 4000.0',
-                    '3.0 | 100.0',
-                    '20.0 | 14.0 | 20.0',
-                    '15.0 | 350.0',
-                    '53.0',
-                    '70.0 | 30.0',
-                    '250.0 | 50.0 | 1000.0',
-                    '86.0',
-                    '1600.0',
-                    '3.0 | 200.0',
-                    '7000.0',
-                    '97.0',
-                    '30.0',
-                    '6.0 | 60.0',
-                    '7.0 | 100.0',
-                    '3.0 | 150.0',
-                    '10.0 | nan | nan',
-                    '10.0 | 75.0',
-                    '10.0 | 50.0',
-                    '70000.0',
-                    '9600.0',
-                    '140.0',
-                    '50.0 | 120.0',
-                    '100.0 | nan',
-                    '80.0',
-                    'nan | 5.0',
-                    '27.0 | 15.0 | 20.0 | 480.0 | 8.0',
-                    '80.0 | 80.0',
-                    '6.0 | 80.0',
-                    '13000.0',
-                    '35.0 | 88.0 | 35.0',
-                    '4000.0',
-                    '100000.0',
-                    '60.0 | 40.0',
-                    '84.0',
-                    '16.0',
-                    '10.0 | 201.0',
-                    '10000.0',
-                    '34.0 | 20.0 | 75.0 | nan | 35.0',
-                    '10.0 | 8.5 | 10.0',
-                ]
-            ),
+            props=dict(suggestions=get_suggestions('backcontact', 'thickness_list')),
         ),
     )
 
@@ -844,121 +165,7 @@ Sandwiching
         a_eln=dict(
             component='EnumEditQuantity',
             props=dict(
-                suggestions=[
-                    'Evaporation | Evaporation | Evaporation | Evaporation',
-                    'Doctor blading | Doctor blading | Doctor blading',
-                    'Pressed',
-                    'Spray-coating | Spray-coating',
-                    'Spin-coating | Spin-coating',
-                    'Electropolymerisation | Sandwiching',
-                    'Brush painting',
-                    'Evaporation | DC Sputtering',
-                    'Screen printing | Lamination',
-                    'Spin-coating | Evaporation',
-                    'Sputtering | Sputtering | Sputtering',
-                    'Evaporation | Spin-coating',
-                    'Sputtering',
-                    'Screen printing | Spray-coating',
-                    'DC Sputtering',
-                    'Evaporation | Sputtering | Sputtering',
-                    'Evaporation | RF sputtering | E-beam evaporation',
-                    'Doctor blading | Spin-coating',
-                    'Dropp casting',
-                    'Lamination | Lamination',
-                    'RF sputtering | Evaporation | Evaporation',
-                    'Evaporation | ALD',
-                    'Inkjet printing',
-                    'RF sputtering',
-                    'E-beam evaporation | E-beam evaporation | E-beam evaporation | PVD | Evaporation',
-                    'Sputtering | Spray-coating',
-                    'Candle burning | Sandwiching',
-                    'Brush painting | Brush painting',
-                    'Evaporation | Evaporation',
-                    'E-beam evaporation | E-beam evaporation | E-beam evaporation',
-                    'CVD | Spin-coating >> reactive ion etching',
-                    'Evaporation | Activated reactive evaporation',
-                    'Spin-coating | Doctor blading',
-                    'Sputtering | Sputtering',
-                    'Drop coated',
-                    'Sandwithcing',
-                    'CVD >> Lamination',
-                    'Unknown | Ultrasonic  welding',
-                    'Sputtering | Evaporation | Evaporation | Evaporation',
-                    'Evaporation | Magnetron sputtering',
-                    'Candel burning >> Sandwiching | Unknown | Unknown',
-                    'Evaporation | RF magnetron sputtering',
-                    'Candle burning | Lamination',
-                    'ALD | Evaporation | ALD',
-                    'Spray-pyrolys | Sandwiching',
-                    'Spin-coating | Screen printing',
-                    'Lamination | Spin-coating',
-                    'Evaporation | DC Magnetron Sputtering',
-                    'Lamination | Painting',
-                    'Lamination',
-                    'Doctor blading | Ultrasonic  welding',
-                    'Evaporation | Evaporation | Evaporation',
-                    'Brush painting | Unknown',
-                    'Evaporation | Sputtering',
-                    'PVD',
-                    'Dipp-coating',
-                    'Screen printing >> Lamination',
-                    'Springkling | Sandwiching',
-                    'Magnetron sputtering | Magnetron sputtering',
-                    'Sputtering | Lamination',
-                    'Spin-coating | Sandwiching',
-                    'Evaporation',
-                    'Unknown',
-                    'Unknown | Doctor blading',
-                    'Evaporation | Magnetron sputtering | E-beam evaporation',
-                    'Lamination | Evaporation',
-                    'CVD',
-                    'Lamination >> Isostatic pressing',
-                    'ALD | Evaporation',
-                    'Screen printing',
-                    'Evaporation | Sputtering | Evaporation',
-                    'Unknown | Evaporation',
-                    'Evaporation | Sputtering | Sputtering | Evaporation',
-                    'Doctor blading',
-                    'Magnetron sputtering',
-                    'Evaporation | Evaporation | Evaporation | Evaporation | Evaporation',
-                    'RF Magnetron Sputtering',
-                    'DC Sputtering | Evaporation',
-                    'Candle burning >> Sandwiching',
-                    'Dropcasting | Lamination',
-                    'Lamination | Dropcasting',
-                    'Electrospinning',
-                    'Suttering',
-                    'E-beam evaporation',
-                    'Candle burning >> Lamination',
-                    'Screen printing | Painting',
-                    'Evaporation >> Evaporation >> Oxidation',
-                    'Evaporation | E-beam evaporation | E-beam evaporation | E-beam evaporation | E-beam evaporation',
-                    'DC Magnetron Sputtering | Evaporation',
-                    'Sputtering >> Lamination',
-                    'Evaporation | Sandwiching',
-                    'Dropcasting',
-                    'Pulsed laser deposition',
-                    'DC Magnetron Sputtering',
-                    'Screen printing | Unknown',
-                    'E-beam evaporation | E-beam evaporation',
-                    'Sputtering | Evaporation',
-                    'Lamination | Spin-coating | Evaporation',
-                    'Brush painting | Sandwiching',
-                    'Spin-coating',
-                    'Sputtering | E-beam evaporation | E-beam evaporation',
-                    'Doctor blading | Doctor blading',
-                    'Spray-coating',
-                    'Spin-coating | Evaporation | Evaporation',
-                    'Doctor blading | Sandwhiching',
-                    'Sandwiching',
-                    'Painting',
-                    'Mechanical clipping',
-                    'Evaporation | Spray-coating',
-                    'Candel burning | Sandwiching',
-                    'Doctor blading | Lamination',
-                    'Screen printing | Screen printing',
-                    'Evaporation | DC Magnetron Sputtering | E-beam evaporation',
-                ]
+                suggestions=get_suggestions('backcontact', 'deposition_procedure')
             ),
         ),
     )
@@ -3,10 +3,9 @@ from nomad.datamodel.data import ArchiveSection
 from nomad.datamodel.results import Properties
 from nomad.metainfo import Quantity
 
+from perovskite_solar_cell_database.schema_sections.suggestions import get_suggestions
 from perovskite_solar_cell_database.schema_sections.utils import add_solar_cell
 
-from .vars import cell_enum_edit_quantity_suggestions
-
 
 class Cell(ArchiveSection):
     """
@@ -47,7 +46,7 @@ SLG | ITO | NiO-c | Perovskite | PCBM-60 | BCP | Ag
                     """,
         a_eln=dict(
             component='EnumEditQuantity',
-            props=dict(suggestions=sorted(cell_enum_edit_quantity_suggestions)),
+            props=dict(suggestions=get_suggestions('cell', 'stack_sequence')),
         ),
     )
     area_total = Quantity(
@@ -2,6 +2,8 @@ import numpy as np
 from nomad.datamodel.data import ArchiveSection
 from nomad.metainfo import Quantity
 
+from perovskite_solar_cell_database.schema_sections.suggestions import get_suggestions
+
 
 class Encapsulation(ArchiveSection):
     """A section to describe information about the encapsulation of the device."""
@@ -32,128 +34,7 @@ PMMA
                     """,
         a_eln=dict(
             component='EnumEditQuantity',
-            props=dict(
-                suggestions=[
-                    'Parylene | SLG',
-                    'Plastic tape',
-                    'Parylene-C',
-                    'UV-curated glue | SLG',
-                    'SLG | Ossila E131 epoxy resin',
-                    "Field's metal",
-                    'Scribbling UV-glue',
-                    'Kapton tape | Glue',
-                    'UV-curable epoxy',
-                    'UV-glue | SLG',
-                    'Surlyn | SLG',
-                    'Epoxy',
-                    'Eu(TTA)2(Phen)MAA',
-                    'Cover glass-QDs; Epoxy',
-                    'Al2O3 | SLG',
-                    'Pattex silicon',
-                    'UV-glue (NOA 68, Norland products)',
-                    'Kapton PI tape with Silicone adhesive',
-                    'Polymer | SLG',
-                    'Ossila E131 Epoxy Resin',
-                    'Viewbarrier (mitsibushi plastic, inc)',
-                    'Cavity glass',
-                    'Epoxy (3124L(MS), Three Bond)',
-                    'Polymer',
-                    'SLG',
-                    'FTO',
-                    'UV curable glue',
-                    'Surlyn',
-                    'UV-glue (ThreeBond)',
-                    'Epoxy | SLG',
-                    'Cyanoacrylate',
-                    'UV-curated epoxy | SLG',
-                    'Parylene-film',
-                    'UV-curable epoxy | Cover glass-QDs',
-                    'EVOH | S5 | UV | G1',
-                    'Face-sealing adhesive sheets',
-                    'Polystyrene microgel particles',
-                    'Cover glass-QDs | UV-curable epoxy',
-                    'Polyolefin',
-                    'Paraffin',
-                    'PDMS',
-                    'SiO2 | Desiccant | SLG',
-                    'UV-glue',
-                    'Barrier foil',
-                    'EVA',
-                    'Polyisobutylene',
-                    'SiO2 | AB epoxy glue (Super Glue Corp.) | Desiccant | SLG',
-                    'UVCA (3035B)',
-                    'SLG; UV-selant',
-                    'UV epoxy',
-                    'SLG | Epoxy',
-                    'Glass cyclindrical tube',
-                    'Norland Optical Adhesive (NOA) layers on (PET) | micropatterned NOA',
-                    'LDPE | PP',
-                    'Thermoplastic sealant',
-                    'PVP | UV-Epoxy | SLG',
-                    'Fluoropolymeric layer',
-                    '3M acrylic elastomer (3M VHB 4905)',
-                    'SLG | LT-U001',
-                    'Cover glass-QDs',
-                    'UV curing epoxy',
-                    'UV-cured epoxy; Cavity glass',
-                    'UHPBF',
-                    'UV filter glass and light curable epoxy',
-                    'Polyvinyl pyrrolidone | Epoxy resin | SLG',
-                    'SnO2-c',
-                    'UV Epoxy',
-                    'Surlyn | Gover glass',
-                    'Unknown',
-                    'SL; Unknown:UV cured adhesive',
-                    'UV epoxy | SLG',
-                    'Glass (Ossila E131)',
-                    'UV-glue (ThreeBond, 3052)',
-                    'UV-curable epoxy | SLG',
-                    'PCL',
-                    'Graphene',
-                    'Al2O3 | PET',
-                    'PDMS-nanocone',
-                    'Hot melt polymer foil (Oxford PV) | Cover glass-QDs',
-                    'Norland Optical Adhesive (NOA) layers on (PET)',
-                    'Carbon-nt',
-                    'PET',
-                    'Cover glass-QDs; Water-absorbent sealant (HD-S051414W-40, Dynic)',
-                    'Desiccant | SLG',
-                    'Graphene oxide | Desiccant | SLG',
-                    'Ossila E132 resin',
-                    'Kapton tape',
-                    'Kapton tape | SLG',
-                    'UV curable resin',
-                    'UV-glue (3035B, ThreeBond Holdings)',
-                    'Al2O3 | pV3D3',
-                    'Surlyn | FTO',
-                    'Cover glass with ultraviolet-curable adhesive',
-                    'Polyisobutene',
-                    'Cover glass-QDs; Expoxy',
-                    'SLG | FTO',
-                    'polyisobutylene | SLG',
-                    'PMMA; PU',
-                    'UVCA (3035B) | Paraffin',
-                    'Ag; Carbon-epoxy',
-                    'UV sealant | Surlyn | SLG',
-                    'PEN',
-                    'Self-mixing epoxy',
-                    'Teflon',
-                    'Al2O3',
-                    'UV glue',
-                    'Kapton | Ligh-curated glue | SLG',
-                    'Adhesive glue 3025 B (Three Bond Holding Co. Ltd)',
-                    'ITO | PEN',
-                    'Ethylene-vinyl acetate',
-                    'EVA | SLG',
-                    'PCPD2FBT:BCF',
-                    'PMMA',
-                    'Desiccant',
-                    'SiO2',
-                    'Scotch tape',
-                    'Meltronix',
-                    'Al2O3 | O-Al-CH3 | Al2O3',
-                ]
-            ),
+            props=dict(suggestions=get_suggestions('encapsulation', 'stack_sequence')),
         ),
     )
 
@@ -16,8 +16,14 @@
 # limitations under the License.
 
 import re
+from functools import lru_cache
 
-from pymatgen.core import Composition
+from perovskite_solar_cell_database.schema_sections.formula_reducer import (
+    reduce_formula,
+)
+
+# number of distinct formulas whose normalization is kept in memory
+CLEAN_FORMULA_CACHE_SIZE = 8192
 
 preprocess_rules = {'FAPbI': 'FAPbI3', 'MAPbI': 'MAPbI3'}
 
@@ -149,6 +155,76 @@ cation_dict_miss = {
 }
 
 
+class AbbreviationTable:
+    """
+    The abbreviations of `cation_dict` and `cation_dict_miss` compiled into single
+    regular expressions.
+
+    The keys of `cation_dict` are applied as regular expressions one after the
+    other, longest key first, so the parentheses of a key only form a group and the
+    key matches its bare abbreviation. A single alternation of the bare abbreviations
+    in the same order gives the same result in one pass, unless a lower priority
+    abbreviation starts inside the text before an overlapping higher priority one,
+    e.g. `BDA` and `(DAP)` in `BDAP`. Such inputs are detected with `hazards` and
+    expanded key by key as before.
+    """
+
+    def __init__(self, replacements: dict[str, str], misses: dict[str, str]):
+        self.ordered = sorted(
+            replacements.items(), key=lambda x: len(x[0]), reverse=True
+        )
+        self.misses = (
+            re.compile('|'.join(re.escape(key) for key in misses)) if misses else None
+        )
+
+        self.literals: dict[str, str] = {}
+        for key, value in self.ordered:
+            self.literals.setdefault(key.replace('(', '').replace(')', ''), value)
+        # The single pass is only equivalent if no replacement contains an
+        # abbreviation that is applied after it.
+        literals = list(self.literals)
+        self.compiled = all(
+            re.fullmatch(r'[A-Za-z0-9-]+', literal) for literal in literals
+        ) and not any(
+            '\\' in value or any(low in value for low in literals[i + 1 :])
+            for i, value in enumerate(self.literals.values())
+        )
+        if not self.compiled:
+            return
+        self.pattern = re.compile('|'.join(map(re.escape, literals)))
+
+        hazards = set()
+        for i, high in enumerate(literals):
+            for low in literals[i + 1 :]:
+                for offset in range(1, len(low)):
+                    tail = low[offset:]
+                    if high.startswith(tail):
+                        hazards.add(low[:offset] + high)
+                    elif tail.startswith(high):
+                        hazards.add(low)
+        self.hazards = (
+            re.compile('|'.join(map(re.escape, sorted(hazards)))) if hazards else None
+        )
+
+    def has_miss(self, formula: str) -> bool:
+        return self.misses is not None and self.misses.search(formula) is not None
+
+    def expand(self, formula: str) -> str:
+        """
+        Replaces the abbreviations in a formula with their full formula.
+        """
+        if not self.compiled or (
+            self.hazards is not None and self.hazards.search(formula)
+        ):
+            for word, replacement in self.ordered:
+                formula = re.sub(word, replacement, formula)
+            return formula
+        return self.pattern.sub(lambda m: self.literals[m.group()], formula)
+
+
+abbreviation_table = AbbreviationTable(cation_dict, cation_dict_miss)
+
+
 class PerovskiteFormulaNormalizer:
     def __init__(self, input_formula: str):
         """ """
@@ -174,49 +250,85 @@ class PerovskiteFormulaNormalizer:
             str: The formula with all abbreviations replaced.
         """
         item = self.input_formula
-        if any(key in item for key in self.cation_dict_miss.keys()):
+        if (
+            self.cation_dict is cation_dict
+            and self.cation_dict_miss is cation_dict_miss
+        ):
+            table = abbreviation_table
+        else:
+            table = AbbreviationTable(self.cation_dict, self.cation_dict_miss)
+        if table.has_miss(item):
             print("""
                   The given perovskite composition contains an undefined abbreviation.
                   The composition could not be parsed.
                   """)
         else:
-            for word, replacement in sorted(
-                self.cation_dict.items(), key=lambda x: len(x[0]), reverse=True
-            ):
-                item = re.sub(word, replacement, item)
-            output_formula = item
+            output_formula = table.expand(item)
             return output_formula
 
+    def _clean_formula(self):
+        replaced_formula = self.replace_formula()
+        if replaced_formula is not None:
+            try:
+                return reduce_formula(replaced_formula)
+            except ValueError:
+                print(
+                    'Perovskite formula with a cation abbreviation could not be parsed'
+                )
+
+        return None, None
+
     def clean_formula(self):
         """
-        Takes a formula and formats it into a nomad `chemical_formula_reduced`
+        Takes a formula and formats it into a nomad `chemical_formula_reduced`.
+        Results for the default abbreviations are memoized per formula.
 
         Returns:
             chemical_formula_reduced: A string of the formatted *reduced* formula
             elements: A list of the elements in the formula
         """
         self.pre_process_formula()
-        replaced_formula = self.replace_formula()
-        if replaced_formula is not None:
-            try:
-                composition = Composition(replaced_formula)
-                int_formula = composition.get_integer_formula_and_factor()[0]
-                composition_final = Composition(int_formula)
-                clean_formulas_no_brackets = (
-                    composition_final.get_reduced_composition_and_factor()[0]
-                )
-                composition_final_int = Composition(clean_formulas_no_brackets)
-                reduced_formula = (
-                    composition_final_int.get_reduced_composition_and_factor()[
-                        0
-                    ].to_pretty_string()
-                )
-                elements = composition_final_int.chemical_system.split('-')
-                return reduced_formula, elements
+        if (
+            self.cation_dict is not cation_dict
+            or self.cation_dict_miss is not cation_dict_miss
+        ):
+            return self._clean_formula()
+        reduced_formula, elements = _cached_clean_formula(self.input_formula)
+        return reduced_formula, None if elements is None else list(elements)
 
-            except ValueError:
-                print(
-                    'Perovskite formula with a cation abbreviation could not be parsed'
-                )
 
-        return None, None
+@lru_cache(maxsize=CLEAN_FORMULA_CACHE_SIZE)
+def _cached_clean_formula(formula: str) -> tuple[str | None, tuple[str] | None]:
+    reduced_formula, elements = PerovskiteFormulaNormalizer(formula)._clean_formula()
+    return reduced_formula, None if elements is None else tuple(elements)
+
+
+def normalize_formulas(formulas):
+    """
+    Normalizes many formulas, e.g. the `composition_long_form` column of the
+    database. Every distinct formula is only normalized once.
+
+    Args:
+        formulas (list[str] | pandas.Series): The formulas. Values that are not
+            strings give `(None, None)`.
+
+    Returns:
+        list[tuple] | pandas.DataFrame: The results of `clean_formula` in the order
+        of the input. For a Series, a DataFrame with the columns `reduced_formula` and
+        `elements` and the index of the input.
+    """
+    import pandas as pd
+
+    values = formulas.tolist() if isinstance(formulas, pd.Series) else list(formulas)
+    results = {}
+    for value in values:
+        if isinstance(value, str) and value not in results:
+            results[value] = PerovskiteFormulaNormalizer(value).clean_formula()
+    cleaned = [
+        results[value] if isinstance(value, str) else (None, None) for value in values
+    ]
+    if isinstance(formulas, pd.Series):
+        return pd.DataFrame(
+            cleaned, index=formulas.index, columns=['reduced_formula', 'elements']
+        )
+    return cleaned
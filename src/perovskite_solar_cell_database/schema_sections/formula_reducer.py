@@ -0,0 +1,305 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Reduction of chemical formulas to integer formulas without pymatgen.
+
+`reduce_formula` follows the chain of pymatgen `Composition` calls the formula
+normalizer used before: the formula is expanded, scaled to integers with a
+greatest common divisor down to a tolerance of 1e-4, reduced and written with the
+elements ordered by electronegativity. Amounts are kept as exact fractions.
+
+The result is the same as pymatgen's for the formulas of the database, except for
+some amounts with four decimals. It can differ for amounts with more decimals,
+e.g. the products of fractional multipliers of nested parentheses in
+`(Cl0.33)0.167((K1.5)2SBr)0.95`. There the greatest common divisor is only
+approximate, and pymatgen's result depends on the floating point errors of the
+amounts, while the result here depends only on the formula. The proportions of
+the elements agree in both cases.
+"""
+
+import math
+import re
+from fractions import Fraction
+
+# Pauling electronegativities as used by pymatgen for the element order, `None` if
+# not defined
+ELECTRONEGATIVITIES = {
+    'H': 2.2,
+    'He': None,
+    'Li': 0.98,
+    'Be': 1.57,
+    'B': 2.04,
+    'C': 2.55,
+    'N': 3.04,
+    'O': 3.44,
+    'F': 3.98,
+    'Ne': None,
+    'Na': 0.93,
+    'Mg': 1.31,
+    'Al': 1.61,
+    'Si': 1.9,
+    'P': 2.19,
+    'S': 2.58,
+    'Cl': 3.16,
+    'Ar': None,
+    'K': 0.82,
+    'Ca': 1,
+    'Sc': 1.36,
+    'Ti': 1.54,
+    'V': 1.63,
+    'Cr': 1.66,
+    'Mn': 1.55,
+    'Fe': 1.83,
+    'Co': 1.88,
+    'Ni': 1.91,
+    'Cu': 1.9,
+    'Zn': 1.65,
+    'Ga': 1.81,
+    'Ge': 2.01,
+    'As': 2.18,
+    'Se': 2.55,
+    'Br': 2.96,
+    'Kr': 3,
+    'Rb': 0.82,
+    'Sr': 0.95,
+    'Y': 1.22,
+    'Zr': 1.33,
+    'Nb': 1.6,
+    'Mo': 2.16,
+    'Tc': 1.9,
+    'Ru': 2.2,
+    'Rh': 2.28,
+    'Pd': 2.2,
+    'Ag': 1.93,
+    'Cd': 1.69,
+    'In': 1.78,
+    'Sn': 1.96,
+    'Sb': 2.05,
+    'Te': 2.1,
+    'I': 2.66,
+    'Xe': 2.6,
+    'Cs': 0.79,
+    'Ba': 0.89,
+    'La': 1.1,
+    'Ce': 1.12,
+    'Pr': 1.13,
+    'Nd': 1.14,
+    'Pm': 1.13,
+    'Sm': 1.17,
+    'Eu': 1.2,
+    'Gd': 1.2,
+    'Tb': 1.1,
+    'Dy': 1.22,
+    'Ho': 1.23,
+    'Er': 1.24,
+    'Tm': 1.25,
+    'Yb': 1.1,
+    'Lu': 1.27,
+    'Hf': 1.3,
+    'Ta': 1.5,
+    'W': 2.36,
+    'Re': 1.9,
+    'Os': 2.2,
+    'Ir': 2.2,
+    'Pt': 2.28,
+    'Au': 2.54,
+    'Hg': 2,
+    'Tl': 1.62,
+    'Pb': 2.33,
+    'Bi': 2.02,
+    'Po': 2,
+    'At': 2.2,
+    'Rn': 2.2,
+    'Fr': 0.7,
+    'Ra': 0.9,
+    'Ac': 1.1,
+    'Th': 1.3,
+    'Pa': 1.5,
+    'U': 1.38,
+    'Np': 1.36,
+    'Pu': 1.28,
+    'Am': 1.3,
+    'Cm': 1.3,
+    'Bk': 1.3,
+    'Cf': 1.3,
+    'Es': 1.3,
+    'Fm': 1.3,
+    'Md': 1.3,
+    'No': 1.3,
+    'Lr': 1.3,
+    'Rf': None,
+    'Db': None,
+    'Sg': None,
+    'Bh': None,
+    'Hs': None,
+    'Mt': None,
+    'Ds': None,
+    'Rg': None,
+    'Cn': None,
+    'Nh': None,
+    'Fl': None,
+    'Mc': None,
+    'Lv': None,
+    'Ts': None,
+    'Og': None,
+}
+
+# isotopes that are counted as their element
+ELEMENT_ALIASES = {'D': 'H', 'T': 'H'}
+
+# formulas that are not reduced further, see pymatgen `Composition.special_formulas`
+SPECIAL_FORMULAS = {
+    'LiO': 'Li2O2',
+    'NaO': 'Na2O2',
+    'KO': 'K2O2',
+    'HO': 'H2O2',
+    'CsO': 'Cs2O2',
+    'RbO': 'Rb2O2',
+    'O': 'O2',
+    'N': 'N2',
+    'F': 'F2',
+    'Cl': 'Cl2',
+    'H': 'H2',
+}
+
+AMOUNT_TOLERANCE = Fraction(1, 10**8)
+GCD_TOLERANCE = Fraction(1, 10000)
+
+_INVALID_RE = re.compile(r'[\s\d.*/]*$')
+_TOKEN_RE = re.compile(
+    r'(?P<open>\()'
+    r'|\)\s*(?P<factor>[\.e\d]*)'
+    r'|(?P<symbol>[A-Z][a-z]*)\s*(?P<amount>[-*\.e\d]*)'
+    r'|(?P<space>\s+)'
+)
+
+
+def _to_fraction(text: str) -> Fraction:
+    if text == '':
+        return Fraction(1)
+    try:
+        return Fraction(text)
+    except (ValueError, ZeroDivisionError) as e:
+        raise ValueError(f'{text} is an invalid amount!') from e
+
+
+def parse_formula(formula: str) -> dict[str, Fraction]:
+    """
+    Parses a formula with nested parentheses and fractional amounts, e.g.
+    `Cs0.05(CH3NH3)0.95Pb(I0.8Br0.2)3`.
+
+    Args:
+        formula (str): The formula.
+
+    Returns:
+        dict[str, Fraction]: The amount of each element in the order of the first
+        occurrence. Isotopes are counted as their element.
+
+    Raises:
+        ValueError: If the formula can not be parsed or contains unknown elements.
+    """
+    if _INVALID_RE.match(formula):
+        raise ValueError(f'Invalid formula={formula!r}')
+    formula = formula.replace('@', '').translate(str.maketrans('[]{}', '()()'))
+
+    stack: list[dict[str, Fraction]] = [{}]
+    position = 0
+    while position < len(formula):
+        match = _TOKEN_RE.match(formula, position)
+        if match is None:
+            raise ValueError(f'{formula} is an invalid formula!')
+        position = match.end()
+        if match['open'] is not None:
+            stack.append({})
+        elif match['symbol'] is not None:
+            symbol = ELEMENT_ALIASES.get(match['symbol'], match['symbol'])
+            if symbol not in ELECTRONEGATIVITIES:
+                raise ValueError(f'{match["symbol"]} is an invalid element!')
+            amounts = stack[-1]
+            amounts[symbol] = amounts.get(symbol, 0) + _to_fraction(match['amount'])
+        elif match['space'] is None:
+            # empty parentheses are not a group
+            if len(stack) == 1 or formula[match.start() - 1] == '(':
+                raise ValueError(f'{formula} is an invalid formula!')
+            factor = _to_fraction(match['factor'])
+            group = stack.pop()
+            amounts = stack[-1]
+            for symbol, amount in group.items():
+                amounts[symbol] = amounts.get(symbol, 0) + amount * factor
+    if len(stack) != 1:
+        raise ValueError(f'{formula} is an invalid formula!')
+
+    amounts = {}
+    for symbol, amount in stack[0].items():
+        if amount < -AMOUNT_TOLERANCE:
+            raise ValueError('Amounts in Composition cannot be negative!')
+        if abs(amount) >= AMOUNT_TOLERANCE:
+            amounts[symbol] = amount
+    return amounts
+
+
+def _gcd(amounts: list[Fraction], tolerance: Fraction = GCD_TOLERANCE) -> Fraction:
+    # Euclid's algorithm down to the tolerance like pymatgen's `gcd_float`, but a
+    # remainder equal to the tolerance is kept, so amounts with four decimals are
+    # scaled exactly instead of depending on the floating point error
+    gcd = amounts[0]
+    for amount in amounts[1:]:
+        a, b = gcd, amount
+        while b >= tolerance:
+            a, b = b, a % b
+        gcd = a
+    return gcd
+
+
+def _sort_key(symbol: str) -> tuple[float, str]:
+    electronegativity = ELECTRONEGATIVITIES[symbol]
+    return (math.inf if electronegativity is None else electronegativity, symbol)
+
+
+def reduce_formula(formula: str) -> tuple[str, list[str]]:
+    """
+    Reduces a formula to the smallest integer formula, e.g. `Cs0.1FA0.9PbI3` after
+    the abbreviations are expanded.
+
+    Args:
+        formula (str): The formula.
+
+    Returns:
+        tuple[str, list[str]]: The reduced formula with the elements ordered by
+        electronegativity and all amounts written out, e.g. `Cs1Pb1I3`, and the
+        alphabetically sorted elements.
+
+    Raises:
+        ValueError: If the formula can not be parsed or contains no elements.
+    """
+    amounts = parse_formula(formula)
+    if not amounts:
+        raise ValueError(f'{formula} contains no elements!')
+    gcd = _gcd(list(amounts.values()))
+    counts = {symbol: round(amount / gcd) for symbol, amount in amounts.items()}
+    counts = {symbol: count for symbol, count in counts.items() if count != 0}
+    divisor = math.gcd(*counts.values())
+    symbols = sorted(counts, key=_sort_key)
+    counts = {symbol: counts[symbol] // divisor for symbol in symbols}
+
+    short_formula = ''.join(
+        f'{symbol}{"" if count == 1 else count}' for symbol, count in counts.items()
+    )
+    if short_formula in SPECIAL_FORMULAS:
+        counts = {symbol: 2 * count for symbol, count in counts.items()}
+    reduced_formula = ''.join(f'{symbol}{count}' for symbol, count in counts.items())
+    return reduced_formula, sorted(counts)
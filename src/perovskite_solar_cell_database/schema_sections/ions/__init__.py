@@ -1,4 +1,4 @@
-from .ion import Ion
+from .ion import Ion, IonCatalog, get_ion_catalog
 from .ion_vars import (
     ion_a,
     ion_a_coefficients,
@@ -1,10 +1,19 @@
-import os
+import threading
+from collections.abc import Iterable
 
-import openpyxl
-from ase import Atoms
 from nomad.datamodel.metainfo.basesections import PureSubstanceSection
 from nomad.metainfo import Quantity
 
+from perovskite_solar_cell_database.conformers import (
+    convert_rdkit_mol_to_ase_atoms,
+    optimize_molecule,
+)
+from perovskite_solar_cell_database.schema_sections.ions.ion_tables import (
+    ION_TYPES,
+    load_ion_tables,
+    read_ion_rows_from_xlsx,
+)
+
 
 class Ion(PureSubstanceSection):
     """
@@ -55,67 +64,250 @@ class Ion(PureSubstanceSection):
     def normalize(self, archive, logger: None) -> None:
         super().normalize(archive, logger)
 
-        ions = read_ions_from_xlsx(self.ion_type)
-        ion_match = find_ion_by_name(self.name, ions)
+        ion_match = get_ion_catalog().find(self.name, self.ion_type)
         if ion_match is not None:
-            self.name = ion_match.name
-            self.iupac_name = ion_match.iupac_name
-            self.molecular_formula = ion_match.molecular_formula
-            self.smile = ion_match.smile
-            self.cas_number = ion_match.cas_number
-            self.alternative_names = ion_match.alternative_names
-            self.common_source_compound = ion_match.common_source_compound
-            self.source_compound_cas = ion_match.source_compound_cas
-            self.source_compound_formula = ion_match.source_compound_formula
+            for quantity in ION_MATCH_QUANTITIES:
+                setattr(self, quantity, getattr(ion_match, quantity))
+
+
+# quantities copied from the matching ion of the tables
+ION_MATCH_QUANTITIES = (
+    'name',
+    'iupac_name',
+    'molecular_formula',
+    'smile',
+    'cas_number',
+    'alternative_names',
+    'common_source_compound',
+    'source_compound_cas',
+    'source_compound_formula',
+)
+# the perovskite sites of `Perovskite`, the X site is called C there
+ION_SITES = ('A', 'B', 'C')
+
+
+def ion_from_row(row: dict) -> Ion:
+    """
+    Creates an `Ion` from a row of the ion tables, see `ion_tables.ION_TABLE_COLUMNS`.
+    """
+    # todo: parent_* are not used.
+    ion_candidate = Ion()
+    ion_candidate.name = row['abbreviation']
+    if row['alternative_abbreviations'] is not None:
+        ion_candidate.alternative_names = [
+            el.strip() for el in row['alternative_abbreviations'].split(',')
+        ]
+    else:
+        ion_candidate.alternative_names = []
+    ion_candidate.molecular_formula = row['molecular_formula']
+    ion_candidate.smile = row['smile']
+    ion_candidate.common_name = row['common_name']
+    ion_candidate.iupac_name = row['iupac_name']
+    ion_candidate.cas_number = row['cas']
+    ion_candidate.common_source_compound = row['common_source_compound']
+    ion_candidate.source_compound_cas = row['source_compound_cas']
+    return ion_candidate
 
 
 def read_ions_from_xlsx(ion_type):
-    ions_candidates = []
-    file_name = f'{ion_type}-ion_data.xlsx'
-    current_dir = os.path.dirname(os.path.realpath(__file__))
-
-    workbook = openpyxl.load_workbook(os.path.join(current_dir, file_name))
-    worksheet = workbook.active
-
-    for row in worksheet.iter_rows(min_row=2, values_only=True):
-        (
-            _,
-            abbreviation,
-            alternative_abbreviations,
-            molecular_formula,
-            smile,
-            common_name,
-            iupac_name,
-            cas,
-            parent_iupac,
-            parent_smile,
-            parent_cas,
-            common_source_compound,
-            source_compound_cas,
-            _,
-            _,
-        ) = row[:15]
-
-        # todo: parent_* are not used.
-        ion_candidate = Ion()
-        ion_candidate.name = abbreviation
-        if alternative_abbreviations is not None:
-            ion_candidate.alternative_names = [
-                el.strip() for el in alternative_abbreviations.split(',')
-            ]
-        else:
-            ion_candidate.alternative_names = []
-        ion_candidate.molecular_formula = molecular_formula
-        ion_candidate.smile = smile
-        ion_candidate.common_name = common_name
-        ion_candidate.iupac_name = iupac_name
-        ion_candidate.cas_number = cas
-        ion_candidate.common_source_compound = common_source_compound
-        ion_candidate.source_compound_cas = source_compound_cas
-
-        ions_candidates.append(ion_candidate)
-
-    return ions_candidates
+    return [ion_from_row(row) for row in read_ion_rows_from_xlsx(ion_type)]
+
+
+def normalize_ion_name(ion_name: str) -> str:
+    """
+    Strips surrounding whitespace and one pair of enclosing parentheses from an ion
+    name, e.g. `(PEA)` -> `PEA`.
+    """
+    ion_name = ion_name.strip()
+    if len(ion_name) > 1 and ion_name[0] == '(' and ion_name[-1] == ')':
+        return ion_name[1:-1]
+    return ion_name
+
+
+class IonCatalog:
+    """
+    Process-wide index of the ions listed in the `<ion_type>-ion_data.xlsx` tables.
+
+    The tables are read once, on first use, from the compiled Arrow file (see
+    `ion_tables`) or from the workbooks if it is stale. Each table is indexed in a
+    hash map by abbreviation and by every alternative abbreviation. Lookups try an
+    exact match first and fall back to a case-insensitive match. If several ions
+    share a name, the first one in the table wins, as in `find_ion_by_name`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ions: dict[str, list[Ion]] = {}
+        self._exact: dict[str, dict[str, Ion]] = {}
+        self._folded: dict[str, dict[str, Ion]] = {}
+        self._by_smiles: dict[str, Ion] = {}
+
+    def _load(self) -> None:
+        with self._lock:
+            if self._ions:
+                return
+            for table_type, rows in load_ion_tables().items():
+                ions = [ion_from_row(row) for row in rows]
+                exact = {}
+                folded = {}
+                for ion in ions:
+                    for name in [ion.name, *(ion.alternative_names or [])]:
+                        if not name:
+                            continue
+                        exact.setdefault(name, ion)
+                        folded.setdefault(name.casefold(), ion)
+                    if ion.smile:
+                        self._by_smiles.setdefault(ion.smile.strip(), ion)
+                self._exact[table_type] = exact
+                self._folded[table_type] = folded
+                self._ions[table_type] = ions
+
+    def ions(self, ion_type: str) -> list[Ion]:
+        """
+        Returns all ions of the given type in table order.
+        """
+        if ion_type not in ION_TYPES:
+            raise ValueError(f'Unknown ion type {ion_type}.')
+        if not self._ions:
+            self._load()
+        return self._ions[ion_type]
+
+    def find(self, ion_name: str, ion_type: str) -> Ion | None:
+        """
+        Finds an ion of the given type by its abbreviation or alternative
+        abbreviation.
+
+        Args:
+            ion_name (str): The name to look up, optionally enclosed in parentheses.
+            ion_type (str): The perovskite site of the ion, i.e. `A`, `B` or `C`.
+
+        Returns:
+            Ion | None: The matching ion from the table or `None`.
+        """
+        if not ion_name:
+            return None
+        if ion_type not in ION_TYPES:
+            raise ValueError(f'Unknown ion type {ion_type}.')
+        if not self._ions:
+            self._load()
+        exact = self._exact[ion_type]
+        folded = self._folded[ion_type]
+        candidates = [normalize_ion_name(ion_name), ion_name.strip()]
+        for name in candidates:
+            if name in exact:
+                return exact[name]
+        for name in candidates:
+            if name.casefold() in folded:
+                return folded[name.casefold()]
+        return None
+
+    def find_many(self, ion_names: Iterable[str], ion_type: str) -> list[Ion | None]:
+        """
+        Finds several ions of the given type like `find`, looking up every distinct
+        name once.
+        """
+        matches = {}
+        results = []
+        for ion_name in ion_names:
+            if ion_name not in matches:
+                matches[ion_name] = self.find(ion_name, ion_type)
+            results.append(matches[ion_name])
+        return results
+
+    def find_by_smiles(self, smiles: str) -> Ion | None:
+        """
+        Finds an ion of any type by its SMILES string as given in the tables.
+        """
+        if not smiles:
+            return None
+        if not self._ions:
+            self._load()
+        return self._by_smiles.get(smiles.strip())
+
+    def warmup(self) -> None:
+        """
+        Loads and indexes all ion tables.
+        """
+        for ion_type in ION_TYPES:
+            self.ions(ion_type)
+
+
+_ion_catalog = IonCatalog()
+
+
+def get_ion_catalog() -> IonCatalog:
+    """
+    Returns the process-wide `IonCatalog`.
+    """
+    return _ion_catalog
+
+
+def parse_ion_site(
+    names: str | None, coefficients: str | None, ion_type: str, logger
+) -> list[tuple[str, float | None]]:
+    """
+    Splits the `'; '` separated ion names and coefficients of a perovskite site.
+    Coefficients that are not numbers are logged and kept as `None`.
+
+    Args:
+        names (str): The ion names, e.g. `Cs; FA; MA`.
+        coefficients (str): The coefficients, e.g. `0.05; 0.79; 0.16`.
+        ion_type (str): The perovskite site, i.e. `A`, `B` or `C`.
+        logger (BoundLogger): A structlog logger.
+
+    Returns:
+        list[tuple[str, float | None]]: The names and coefficients, empty if the
+        numbers of names and coefficients differ.
+    """
+    values = []
+    if coefficients is not None:
+        for coefficient in coefficients.split('; '):
+            try:
+                values.append(float(coefficient))
+            except ValueError:
+                logger.warn(
+                    f'Could not convert {ion_type}-ion coefficient {coefficient} to '
+                    'float.'
+                )
+                values.append(None)
+    if names is None:
+        return []
+    names = names.split('; ')
+    if len(names) != len(values):
+        return []
+    return list(zip(names, values))
+
+
+def resolve_ion_sites(
+    sites: dict[str, tuple[str | None, str | None]], logger
+) -> list[Ion]:
+    """
+    Creates the `Ion` sections of all perovskite sites. The names of each site are
+    looked up in the ion tables in one batch, and matching ions are completed with
+    the values from the tables like in `Ion.normalize`.
+
+    Args:
+        sites (dict[str, tuple[str | None, str | None]]): The `'; '` separated names
+            and coefficients by site, i.e. `A`, `B` and `C`.
+        logger (BoundLogger): A structlog logger.
+
+    Returns:
+        list[Ion]: The ions of all sites in site order.
+    """
+    catalog = get_ion_catalog()
+    ions = []
+    for ion_type in ION_SITES:
+        if ion_type not in sites:
+            continue
+        site = parse_ion_site(*sites[ion_type], ion_type, logger)
+        matches = catalog.find_many((name for name, _ in site), ion_type)
+        for (name, coefficient), match in zip(site, matches):
+            ion = Ion(name=name, coefficients=coefficient, ion_type=ion_type)
+            if match is not None:
+                for quantity in ION_MATCH_QUANTITIES:
+                    setattr(ion, quantity, getattr(match, quantity))
+            ions.append(ion)
+    return ions
 
 
 def find_ion_by_name(ion_name, ions_candidates):
@@ -138,39 +330,3 @@ def get_all_ions_names(ions):
             ion_names.extend(ion.alternative_names)
 
     return ion_names
-
-
-def convert_rdkit_mol_to_ase_atoms(rdkit_mol):
-    """
-    Convert an RDKit molecule to an ASE atoms object.
-
-    Args:
-        rdkit_mol (rdkit.Chem.Mol): RDKit molecule object.
-
-    Returns:
-        ase.Atoms: ASE atoms object.
-    """
-    positions = rdkit_mol.GetConformer().GetPositions()
-    atomic_numbers = [atom.GetAtomicNum() for atom in rdkit_mol.GetAtoms()]
-    ase_atoms = Atoms(numbers=atomic_numbers, positions=positions)
-    return ase_atoms
-
-
-def optimize_molecule(smiles):
-    from rdkit import Chem
-    from rdkit.Chem import AllChem
-
-    try:
-        m = Chem.MolFromSmiles(smiles)
-        m = Chem.AddHs(m)
-
-        AllChem.EmbedMolecule(m)
-        AllChem.MMFFOptimizeMolecule(m)
-
-        ase_atoms = convert_rdkit_mol_to_ase_atoms(m)
-
-        # Further processing
-        # ...
-        return ase_atoms
-    except Exception as e:
-        print(f'An error occurred: {e}')
@@ -0,0 +1,165 @@
+"""
+Compiled ion reference tables.
+
+The `<ion_type>-ion_data.xlsx` workbooks are the editable source of truth. Reading
+them with openpyxl is slow, so they are compiled into a single Arrow IPC file
+(`ion_data.arrow`) that is memory-mapped at runtime. Recompile after editing a
+workbook with:
+
+    python -m perovskite_solar_cell_database.schema_sections.ions.ion_tables
+"""
+
+import hashlib
+import os
+
+ION_TYPES = ('A', 'B', 'C')
+
+# Column names of the compiled table, in the order of the xlsx columns they are
+# read from. `ion_type` is added as an extra column.
+ION_TABLE_COLUMNS = {
+    'abbreviation': 1,
+    'alternative_abbreviations': 2,
+    'molecular_formula': 3,
+    'smile': 4,
+    'common_name': 5,
+    'iupac_name': 6,
+    'cas': 7,
+    'common_source_compound': 11,
+    'source_compound_cas': 12,
+}
+
+IONS_DIR = os.path.dirname(os.path.realpath(__file__))
+COMPILED_ION_TABLES = os.path.join(IONS_DIR, 'ion_data.arrow')
+
+
+def get_xlsx_path(ion_type: str) -> str:
+    return os.path.join(IONS_DIR, f'{ion_type}-ion_data.xlsx')
+
+
+def _file_digest(path: str) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def read_ion_rows_from_xlsx(ion_type: str) -> list[dict]:
+    """
+    Reads the rows of an ion workbook.
+
+    Args:
+        ion_type (str): The perovskite site of the ions, i.e. `A`, `B` or `C`.
+
+    Returns:
+        list[dict]: One dict per row with the keys of `ION_TABLE_COLUMNS`.
+    """
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(get_xlsx_path(ion_type))
+    worksheet = workbook.active
+    rows = []
+    for row in worksheet.iter_rows(min_row=2, values_only=True):
+        rows.append(
+            {
+                column: None if row[index] is None else str(row[index])
+                for column, index in ION_TABLE_COLUMNS.items()
+            }
+        )
+    return rows
+
+
+def compile_ion_tables(target: str = COMPILED_ION_TABLES) -> str:
+    """
+    Compiles the ion workbooks into a single Arrow IPC file. The digests of the
+    source workbooks are stored in the schema metadata for the staleness check.
+
+    Args:
+        target (str): Path of the compiled file.
+
+    Returns:
+        str: Path of the compiled file.
+    """
+    import pyarrow as pa
+
+    columns = {'ion_type': [], **{column: [] for column in ION_TABLE_COLUMNS}}
+    for ion_type in ION_TYPES:
+        for row in read_ion_rows_from_xlsx(ion_type):
+            columns['ion_type'].append(ion_type)
+            for column in ION_TABLE_COLUMNS:
+                columns[column].append(row[column])
+
+    metadata = {
+        f'{ion_type}-ion_data.xlsx': _file_digest(get_xlsx_path(ion_type))
+        for ion_type in ION_TYPES
+    }
+    table = pa.table(
+        {
+            column: pa.array(values, type=pa.string())
+            for column, values in columns.items()
+        }
+    ).replace_schema_metadata(metadata)
+    with pa.OSFile(target, 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    return target
+
+
+def is_compiled_ion_tables_stale(path: str = COMPILED_ION_TABLES) -> bool:
+    """
+    Checks if the compiled tables are missing or older than the workbooks. If the
+    modification times disagree, e.g. after a fresh checkout, the digests stored at
+    compile time decide.
+    """
+    if not os.path.exists(path):
+        return True
+    compiled_mtime = os.path.getmtime(path)
+    if all(
+        os.path.getmtime(get_xlsx_path(ion_type)) <= compiled_mtime
+        for ion_type in ION_TYPES
+    ):
+        return False
+
+    import pyarrow as pa
+
+    with pa.memory_map(path) as source:
+        metadata = pa.ipc.open_file(source).schema.metadata or {}
+    return any(
+        metadata.get(f'{ion_type}-ion_data.xlsx'.encode())
+        != _file_digest(get_xlsx_path(ion_type)).encode()
+        for ion_type in ION_TYPES
+    )
+
+
+def read_compiled_ion_tables(path: str = COMPILED_ION_TABLES) -> dict[str, list[dict]]:
+    """
+    Memory-maps the compiled tables.
+
+    Returns:
+        dict[str, list[dict]]: The rows of each ion type.
+    """
+    import pyarrow as pa
+
+    with pa.memory_map(path) as source:
+        table = pa.ipc.open_file(source).read_all()
+    rows = {ion_type: [] for ion_type in ION_TYPES}
+    for row in table.to_pylist():
+        rows[row.pop('ion_type')].append(row)
+    return rows
+
+
+def load_ion_tables() -> dict[str, list[dict]]:
+    """
+    Loads the rows of all ion tables, from the compiled file if it is up to date and
+    from the workbooks otherwise.
+
+    Returns:
+        dict[str, list[dict]]: The rows of each ion type.
+    """
+    if not is_compiled_ion_tables_stale():
+        try:
+            return read_compiled_ion_tables()
+        except (ImportError, OSError):
+            pass
+    return {ion_type: read_ion_rows_from_xlsx(ion_type) for ion_type in ION_TYPES}
+
+
+if __name__ == '__main__':
+    print(f'Compiled ion tables written to {compile_ion_tables()}')
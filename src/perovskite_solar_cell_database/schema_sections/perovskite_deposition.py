@@ -2,6 +2,7 @@ import numpy as np
 from nomad.datamodel.data import ArchiveSection
 from nomad.metainfo import Quantity
 
+from .suggestions import get_suggestions
 from .utils import add_solar_cell
 
 
@@ -94,206 +95,7 @@ Spray-coating
         a_eln=dict(
             component='EnumEditQuantity',
             props=dict(
-                suggestions=[
-                    'Spin-coating | Spin-coating >> Spin-coating',
-                    'Gas-assisted fast crystallisation',
-                    'Electrospraying >> Dropcasting',
-                    'Slot-die coating >> Doctor blading',
-                    'Spin-coating >> Spin-coating',
-                    'Spin-coating >> Evaporation',
-                    'Roller-coating >> Roller-coating',
-                    'Spin-coating >> Drop-infiltration >> Recrystallization',
-                    'Co-evaporation >> Evaporation >> Spin-coating',
-                    'Evaporation >> Evaporation >> Evaporation',
-                    'Spin-coating >> Vapour annealing >> CBD',
-                    'Spin-coating >> CBD >> Spin-coating >> Spin-coating',
-                    'Evaporation >> Gas reaction >> Washing',
-                    'Spin-coating >> Diffusion-gas reaction',
-                    'Spin-coating | Spin-coating',
-                    'Spin-coating >> Gas reaction >> Ion exchange',
-                    'Spin-coating >> Spin-coating >> Rinsing >> Spin-coating',
-                    'Slot-die coating >> Dipp-coating',
-                    'Spin-coating >> Spin-coating >> Gas reaction',
-                    'Spin-coating >> Dipp-coating >> Rinsing',
-                    'Spin-coating >> Spin-coating | Spin-coating',
-                    'Evaporation >> Evaporation >> Gas reaction >> Dipp-coating',
-                    'Slot-die coating',
-                    'Brush painting',
-                    'Ultrasonic spray >> Gas reaction',
-                    'Spin-coating >> CBD',
-                    'Co-evaporation >> Gas reaction >> Spin-coating',
-                    'Evaporation >> Flash evaporation >> Evaporation >> Flash evaporation',
-                    'Spin-coating >> Spray-coating',
-                    'Ultrasonic spray',
-                    'Spin-coating | Evaporation',
-                    'Spin-coating >> CBD >> Spray-coating',
-                    'Space-limited inverse temperature crystallization',
-                    'Evaporation | Spin-coating',
-                    'Spin-coating | Dripping',
-                    'Meniscus coating',
-                    'Spin-coating | Spin-coating >> IPA washing',
-                    'Evaporation >> Sandwiching >> Rinsing',
-                    'Co-evaporation',
-                    'Evaporation >> CBD >> CBD',
-                    'Co-evaporation >> Diffusion-gas reaction',
-                    'Ultrasonic spray >> Ultrasonic spray',
-                    'Spin-coating >> CBD >> Gas reaction',
-                    'Evaporation >> Diffusion-gas reaction',
-                    'Sputtering >> Gas reaction',
-                    'Spin-coating >> CVD',
-                    'Sputtering >> Sulfurization',
-                    'Spin-coating >> Air brush spray >> Air brush spray',
-                    'Spray-coating >> Gas reaction',
-                    'Spin-coating >> Recrystallization',
-                    'Inkjet printing',
-                    'Spin-coating >> Spin-coating >> Spin-coating',
-                    'Evaporation >> Spin-coating',
-                    'Spin-coating >> Gas reaction >> Solvent annealing >> Recrystallization',
-                    'Pulsed laser deposition >> Gas reaction',
-                    'Dipp-coating >> Dipp-coating',
-                    'Spin-coating >> CBD >> CBD',
-                    'Spin-coating >> Closed space sublimation',
-                    'Evaporation >> Evaporation >> Evaporation >> Evaporation >> Evaporation >> Evaporation',
-                    'Co-evaporation >> Spin-coating',
-                    'Air brush spray',
-                    'Spin-coating | Spray-coating',
-                    'Flash evaporation >> CBD',
-                    'Doctor blading >> Doctor blading',
-                    'Dropcasting >> Spin-coating',
-                    'Spray-coating >> Spin-coating',
-                    'Ultrasonic spray >> CBD',
-                    'Spin-coating >> Dipp-coating',
-                    'Single-source thermal evaporation',
-                    'Inverse temperture crysilization >> Lamination',
-                    'LT-SCD >> LT-SCD',
-                    'Evaporation >> Gas reaction >> Gas reaction',
-                    'Spin-coating >> Dropcasting >> Spin-coating',
-                    'Vacuum flash evaporation',
-                    'Drop-infiltration >> Recrystallization',
-                    'Spray-coating >> Spray-coating',
-                    'Evaporation >> Ultrasonic spray',
-                    'Electrodeposition >> Spin-coating',
-                    'Spin-coating >> Dipp-coating >> Spin-coating',
-                    'Evaporation >> Spin-coating >> Spin-coating',
-                    'Spin-coating >> Dropcasting',
-                    'Dropcasting >> CBD',
-                    'Spin-coating >> Evaporation >> Ultrasonic spray',
-                    'Solvent evaporation crystallization',
-                    'GC-LCG',
-                    'Drop-infiltration >> Drop-infiltration',
-                    'Dropcasting >> Pneumatic pressure',
-                    'spin-coatng',
-                    'Spin-coating >> Spin-coating >> Diffusion',
-                    'Evaporation >> Evaporation >> Gas reaction',
-                    'Evaporation >> Gas reaction',
-                    'Spin-coating >> Spin-coating >> Spin-coating >> Spin-coating >> Dropcasting >> Rinsing',
-                    'Doctor blading >> CBD',
-                    'Spin-coating >> CBD >> Washing',
-                    'PVD',
-                    'Dipp-coating >> CBD',
-                    'Spin-coating >> Inkjet printing',
-                    'Spin-coating >> CBD >> Rinsing',
-                    'Dipp-coating',
-                    'Spin-coating >> Air brush spray',
-                    'Hot-casting',
-                    'Spin-coating >> Spin-coating >> Ion exchange',
-                    'Springkling >> Recrystallization',
-                    'Spin-coating >> Spin-coating >> Spin-coating >> Spin-coating >> Spin-coating >> Dropcasting >> Rinsing',
-                    'Electrodeposition >> Dipp-coating >> CBD',
-                    'Evaporation >> CBD >> CBD >> CBD',
-                    'Drop-infiltration >> CBD',
-                    'Spin-coating | Gas reaction',
-                    'Spin-coating >> Spin-coating >> Air brush spray',
-                    'Electrospraying >> Gas reaction',
-                    'Spin-coating >> Diffusion',
-                    'Evaporation',
-                    'Spin-coating >> Evaporation >> Spray-coating',
-                    'Electrodeposition >> Gas reaction >> CBD',
-                    'Electrospraying',
-                    'Unknown',
-                    'Spray-pyrolys',
-                    'Evaporation >> Inkjet printing',
-                    'CBD',
-                    'Drop-infiltration',
-                    'Spin-coating >> CBD >> Ion exchange',
-                    'Spin-coating >> Evaporation >> CBD',
-                    'CVD',
-                    'Roller-coating',
-                    'Co-evaporation >> Co-evaporation',
-                    'Spin-coating >> Spin-coating >> Spin-coating >> Spin-coating >> Spin-coating >> Spin-coating',
-                    'Unknown >> Unknown',
-                    'Spin-coating >> Sandwiching',
-                    'Spin-coating >> Spin-coating >> CBD',
-                    'Electrodeposition >> CBD',
-                    'Spin-coating >> Co-evaporation',
-                    'Doctor blading',
-                    'Spin-coating >> Printing',
-                    'Magnetron sputtering',
-                    'Evaporation >> Evaporation',
-                    'Spin-coating >> Drop-infiltration',
-                    'Spin-coating >> Ligand exchange >> Dipp-coating',
-                    'Soft-cover deposition',
-                    'Spin-coating >> Spin-coating >> Dipp-coating >> Dipp-coating >> Spin-coating >> Dipp-coating >> Dipp-coating >> Spin-coating >> Dipp-coating >> Dipp-coating',
-                    'Slot-die coating >> Spin-coating',
-                    'Evaporation >> Electrodeposition',
-                    'Spin-coating >> Dipp-coating >> Dipp-coating >> Spin-coating >> Dipp-coating >> Dipp-coating >> Spin-coating >> Dipp-coating >> Dipp-coating',
-                    'Spin-coating >> Evaporation >> Evaporation',
-                    'Spin-coating >> Gas reaction',
-                    'Space-confined single crystal formation',
-                    'Electrospinning',
-                    'Spin-coating >> CBD >> Spin-coating',
-                    'Electrodeposition >> Gas reaction >> Spin-coating',
-                    'Closed space sublimation',
-                    'Spin-coating >> Spin-coating >> Spray-coating',
-                    'Spin-coating >> CBD >> Recrystallization',
-                    'Spin-coating | Spin-coating >> IPA washing | Spin-coating >> IPA washing | Spin-coating >> IPA washing',
-                    'Spin-coating >> Spin-coating >> Evaporation',
-                    'Co-evaporation >> Co-evaporation >> Co-evaporation',
-                    'Spin-coating >> CBD >> Spin-coating >> Gas reaction',
-                    'Spin-coating | Dropcasting',
-                    'CBD >> Spin-coating >> Gas reaction',
-                    'Substrate vibration assisted dropcasting >> Substrate vibration assisted dropcasting',
-                    'Roller-coating >> Spin-coating',
-                    'Spray-coating >> CBD',
-                    'Spin-coating >> Gas reaction >> Gas reaction >> Gas reaction',
-                    'Spin-coating >> Spin-coating >> Dropcasting >> Rinsing',
-                    'Spin-coating | CBD',
-                    'Dropcasting',
-                    'Spin-coating >> Spin-coating >> Spin-coating >> Spin-coating',
-                    'Sputtering >> Spin-coating',
-                    'Pulsed laser deposition',
-                    'Single crystal growth',
-                    'Evaporation >> Diffusion',
-                    'Spin-coating >> Electrospraying',
-                    'Blow-drying',
-                    'Spin-coating >> Spin-coating >> Close space sublimation',
-                    'Dipp-coating >> Spin-coating',
-                    'Spin-coating | Spin-coating >> IPA washing | Spin-coating >> IPA washing',
-                    'Inkjet printing >> Diffusion-gas reaction',
-                    'Spin-coating >> Ion exchange',
-                    'Drop-infiltration >> Spin-coating',
-                    'Spin-coating >> Spin-coating >> Recrystallization',
-                    'Flash evaporation',
-                    'Spin-coating',
-                    'Spin-coating >> Gas reaction >> Spin-coating',
-                    'Electrodeposition >> CBD >> CBD',
-                    'Crystallization >> Recrystallization',
-                    'Slot-die coating >> CBD',
-                    'Hot-pressed',
-                    'Dipp-coating >> Gas reaction',
-                    'Spray-coating',
-                    'Spin-coating >> Spin-coating >> Spin-coating >> Dropcasting >> Rinsing',
-                    'Air brush spray >> Air brush spray',
-                    'Electrodeposition >> Electrodeposition',
-                    'Sputtering >> CBD',
-                    'Spin-coating >> Ultrasonic spray',
-                    'Evaporation >> CBD',
-                    'Spin-coating >> Dipp-coating >> Dipp-coating',
-                    'Evaporation >> Evaporation >> Evaporation >> Evaporation',
-                    'Slot-die coating >> Slot-die coating',
-                    'Spin-coating >> Gas reaction >> Gas reaction',
-                    'Spin-coating >> Condensation >> CBD',
-                ]
+                suggestions=get_suggestions('perovskite_deposition', 'procedure')
             ),
         ),
     )
@@ -386,194 +188,9 @@ Vacuum
         a_eln=dict(
             component='EnumEditQuantity',
             props=dict(
-                suggestions=[
-                    'N2 | Vacuum',
-                    'Inert',
-                    'DMSO; N2 >> N2',
-                    'Air >> MAI; N2',
-                    'FAI >> Unknown',
-                    'FABr',
-                    'FAI >> FABr @ 75 >> 25',
-                    'Methylamin; N2',
-                    'Vacuum >> MAI; toluene',
-                    'Ar; MAI; Pbl2',
-                    'N2 >> N2; TBP',
-                    'Air >> Ar',
-                    'Ar; MAI; PbI2',
-                    'Methylamin; N2 >> Methylamin; N2',
-                    'Acetone; N2 >> N2',
-                    'FAI; N2; Vacuum',
-                    'N2 >> Vacuum',
-                    'Air >> MAI; NH4Cl; Vacuum',
-                    'Vacuum >> MAI; Vacuum >> Vacuum; BAI',
-                    'Unknown >> Air',
-                    'Air >> Ar; Methylamin',
-                    'Vacuum >> FAI',
-                    'N2 >> Air; Methylamin; HI',
-                    'Vacuum >> Vacuum >> IPA',
-                    'N2 >> MABr >> MAI',
-                    'Air >> MAI; Vacuum',
-                    'Unknown >> Vacuum',
-                    'Unknown >> Br2',
-                    'O2',
-                    'Unknown >> Unknown >> Air',
-                    'Air >> MACl >> MAI',
-                    'N2 >> MAI; N2',
-                    'Unknown >> Methylamin',
-                    'N2 >> N2; IPA >> N2',
-                    'N2 >> Dry air',
-                    'N2 >> N2 >> N2 >> N2 >> N2 >> N2 >> N2 >> N2 >> N2',
-                    'Vacuum >> N2',
-                    'N2 >> Air; Methylamin >> Air; HI',
-                    'N2 >> Chlorobenzene; N2 >> N2',
-                    'Dry air | Dry air',
-                    'N2 >> N2 >> N2 >> N2',
-                    'Vacuum >> FAI; Vacuum',
-                    'N2; Vacuum',
-                    'Vacuum >> Vacuum',
-                    'Dry air >> MAI',
-                    'Vacuum >> Vacuum >> N2',
-                    'Ar',
-                    'Unknown >> MAI; Vacuum',
-                    'Air >> Air; I2 >> N2',
-                    'Air >> N2 >> Air',
-                    'N2',
-                    'Ar; MAI; PbCl2',
-                    'Vacuum >> Air; MAI',
-                    'N2 >> FAI; MAI; Vacuum',
-                    'N2 | N2 | N2 | N2',
-                    'Vacuum >> IPA; MAI',
-                    'Vacuum >> TiBr4',
-                    'Air >> Air >> Air',
-                    'FAI',
-                    'N2 >> FA-Ac',
-                    'Air >> MaBr',
-                    'N2 >> N2 >> FAI; Vacuum',
-                    'Vacuum >> Ar; MAI',
-                    'N2 >> MAI',
-                    'Vacuum >> Vacuum >> Unknown',
-                    'N2 | N2 | N2',
-                    'Liquid Air',
-                    'N2 >> MACl',
-                    'Vacuum >> N2; MAI',
-                    'N2 >> N2; Toluene >> N2',
-                    'Air >> Vacuum >> N2',
-                    'Ambient >> Air; MAI',
-                    'N2 >> FAI; Vacuum >> N2',
-                    'Vacuum >> FAI; N2',
-                    'Ar >> MABr',
-                    'Unknown >> Unknown >> Vacuum',
-                    'Unknown >> Unknown >> Methylamin',
-                    'Air >> Vacuum >> Air',
-                    'Vacuum >> Chlorobenzene; MAI',
-                    'Air >> Air; MABr',
-                    'Ambient >> Ambient',
-                    'Air >> MAI; MACl; MABr; Vacuum',
-                    'N2 >> Air; Methylamin',
-                    'Dry air',
-                    'Vacuum >> Vacuum >> Vacuum >> Vacuum >> Vacuum >> Vacuum',
-                    'Unknown >> N2; MAI',
-                    'Unknown >> MAI',
-                    'Vacuum >> Vacuum >> FAI; N2',
-                    'Unknown >> FAI',
-                    'N2 >> Air; DMSO >> Air; DMSO >> Air; Methylamin',
-                    'Vacuum >> N2 >> N2 >> N2',
-                    'Dry air >> Dry air >> Dry air',
-                    'Chlorobenzene; N2',
-                    'DMF; N2 >> N2',
-                    'N2 >> Vacuum >> N2',
-                    'Unknown >> Unknown >> MAI',
-                    'Inert >> Inert',
-                    'Air >> Air >> Pyridine',
-                    'Unknown >> Vacuum >> Air',
-                    'Unknown >> Air; Methylamin',
-                    'Vacuum >> Ar',
-                    'FAI; FABr >> Unknown',
-                    'Air >> Air | Air',
-                    'Unknown >> MABr',
-                    'Vacuum >> Unknown',
-                    'N2 >> N2 >> N2',
-                    'Unknown',
-                    'Ar >> Ar >> Ar',
-                    'Air >> Br2',
-                    'N2 >> N2',
-                    'N2 >> Methylamin; N2',
-                    'N2 >> N2 >> MAI; N2',
-                    'Unknown >> Unknown >> Unknown',
-                    'Dry air >> Dry air',
-                    'Unknown >> Pyridine',
-                    'N2 >> Air; MAI',
-                    'Air >> Air; MAI',
-                    'N2 >> FA',
-                    'Hydrazine; N2',
-                    'N2 >> Ambient',
-                    'Vacuum >> Vacuum >> Vacuum',
-                    'FAI >> FABr @ 25 >> 75',
-                    'Vacuum >> MAI',
-                    'Ambient',
-                    'Unknown >> Unknown',
-                    'N2 >> Vacuum >> Vacuum',
-                    'Air >> Air; MACl',
-                    'Unknown >> MACl',
-                    'Air >> Air; Methylamin',
-                    'Air >> Methyl amine',
-                    'FAI >> FABr @ 50 >> 50',
-                    'Air >> MAI',
-                    'Vacuum >> MAI; Vacuum; FAI >> N2',
-                    'Ait >> Air; MAI',
-                    'Air',
-                    'N2 >> MAI >> MABr',
-                    'Vacuum',
-                    'Air >> FAI; FABr; MACl; Vacuum',
-                    'Dry air >> Air; MAI',
-                    'Vacuum >> Vacuum >> Vacuum >> Vacuum',
-                    'Unknown >> N2; MAI >> Unknown',
-                    'Air >> Air',
-                    'N2 >> Air; DMSO; HBr >> Air; DMSO >> Air; Methylamin',
-                    'N2 >> Air',
-                    'Air >> Air; HI >> Air; Methylamin >> Air; Hi',
-                    'Vacuum >> MAI; N2',
-                    'Vacuum >> Vacuum >> I2; N2 >> N2',
-                    'Vacuum >> Air',
-                    'N2 >> MAI; N2; O2',
-                    'Vacuum >> Vacuum >> FAI; Vacuum',
-                    'Air >> FAI; Vacuum',
-                    'Glovebox',
-                    'Air >> Air >> N2',
-                    'Air >> Methylamine',
-                    'Air >> N2',
-                    'Vacuum >> FAI; N2; Vacuum',
-                    'Air >> Methylamin; Vacuum',
-                    'Unknown >> Unknown >> Unknown >> MAI',
-                    'N2 >> N2 >> N2 >> N2 >> N2 >> N2 >> N2 >> N2 >> N2 >> N2',
-                    'N2 >> MAI; Vacuum',
-                    'Air | Ari; MAI',
-                    'Air >> MAI; NH4Cl',
-                    'N2 >> FAI; FACl; Vacuum',
-                    'N2 >> N2 >> Vacuum',
-                    'N2 | N2',
-                    'N2 >> FAI; Vacuum',
-                    'Air >> Air >> Air >> Air',
-                    'N2 >> Methylamin',
-                    'N2 >> BEAI2; N2',
-                    'Dry air >> Dry air; Methylamin',
-                    'Air >> Air >> Air >> Air >> Air >> Air',
-                    'N2 >> DMSO; N2 >> N2',
-                    'Air | Air',
-                    'IPA; N2 >> N2',
-                    'Ar >> Ar',
-                    'N2 >> Methylamin; Vacuum',
-                    'Air; O2',
-                    'Air >> Vacuum',
-                    'Vacuum >> N2 >> N2',
-                    'N2 >> Ar; MAI',
-                    'N2 >> FAI; MABr; MACl; N2; Vacuum',
-                    'Ar >> Vacuum',
-                    'Vacuum >> MAI; Vacuum',
-                    'N2 >> MABr',
-                    'Unknown >> Air >> Air',
-                    'N2 >> N2; 1,2-dichlorobenzene >> N2',
-                ]
+                suggestions=get_suggestions(
+                    'perovskite_deposition', 'synthesis_atmosphere'
+                )
             ),
         ),
     )
@@ -761,350 +378,7 @@ DMF; DMSO >> IPA
         a_eln=dict(
             component='EnumEditQuantity',
             props=dict(
-                suggestions=[
-                    'DMF; DMSO >> H2O; Methanol',
-                    'DMF >> none >> Unknown',
-                    'Diiodoctane, DMF',
-                    'Unknown >> none',
-                    'n-methyl-2-pyrrolidone',
-                    'acetonitrile; DMF; DMSO >> IPA',
-                    'DMF',
-                    'Octane >> Methyl acetate >> Ethyl acetate',
-                    'DMSO; GBL >> DMF; IPA',
-                    'DMSO | 1-pentanol',
-                    'Ethanol',
-                    'GBL; DMSO; n-butanol',
-                    'DMF; DMSO >> Octane >> IPA',
-                    'DMF; Furfural',
-                    'Octane >> Methyl acetate',
-                    'DMF; DMSO >> H2O; IPA',
-                    'DMF; DMSO >> IPA >> IPA >> IPA',
-                    'Octane >> IPA',
-                    'none; DMF >> IPA',
-                    'DMF >> Methanol',
-                    'acetonitrile',
-                    'acetonitrile; DMF',
-                    'DMSO; N-methyl-2-pyrrolidone',
-                    'DMF; DMSO >> IPA',
-                    'GBL; N-methyl-2-pyrrolidinone',
-                    'DMF; DMSO >> DMF; IPA',
-                    'GBL; Ethanol',
-                    'DMF; DMSO; NMP',
-                    'none >> 2-methoxyethanol; Ethanol',
-                    'DMF >> IPA >> IPA >> IPA',
-                    'DMF >> H2O; IPA >> Unknown',
-                    'DMSO; GBL >> IPA',
-                    'DMF >> Ethyl acetate',
-                    'DMF >> IPA >> Anisole',
-                    'Diethyl ether; DMF; DMSO',
-                    'DMF; Benzaldehyde',
-                    'DMF; g-Valerolacetone',
-                    '1-Ethyl-2-pyrrolidone >> none',
-                    'DMF >> DMSO >> IPA',
-                    'Ethanol; Methylamine',
-                    'DMSO; acetonitrile >> IPA',
-                    'BA; Ethanol >> none',
-                    'acetonitrile; NMP',
-                    'Unknown >> Unknown',
-                    'DMF >> n-hexyl alchohol',
-                    'DMSO >> Hexane; Toluene',
-                    'NMP',
-                    'Dimethylacetamide; DMSO',
-                    'Ethanol; H2O',
-                    'DMF; DMSO >> n-butanol',
-                    'DMF >> DMSO; IPA',
-                    'DMSO >> 1-butanol',
-                    'DMF; DMSO >> GBL; IPA',
-                    'DMF >> Cyclohexene; IPA',
-                    'Heptane; Hexane',
-                    'GBL >> DMF',
-                    'GBL',
-                    'DMF; Methylfomramid',
-                    'none >> none >> none >> none >> none >> none',
-                    'DMF; GBL; IPA',
-                    '1-Octadecene; n-Heptane >> none',
-                    'Octane >> Octane >> Octane >> Octane',
-                    'Ethyl acetate',
-                    'DMF; DMSO; GBL; NMP',
-                    'DMF >> DMF >> Cyclohexene; IPA',
-                    'Toluene',
-                    'DMSO; NMP',
-                    'DMF; DMSO >> IPA; o-dichlorobenzene',
-                    'Acetic acid; GBL',
-                    'DMF >> IPA; NMP',
-                    'DMF; DMSO >> Methanol',
-                    'DMF >> none >> none',
-                    'N,N-dimethylacetamide',
-                    'DMSO >> Methanol',
-                    'DMF >> IPA; n-hexane',
-                    'Chlorobenzene >> none',
-                    'DMF >> Octane >> Methyl acetate >> Methyl acetate',
-                    'Toluene >> IPA',
-                    'DMAc; NMP',
-                    'DMF >> Octane >> Octane >> Octane >> Octane >> Methyl acetate >> Methyl acetate',
-                    'none',
-                    'DMF >> Toluene',
-                    'DMF; NMP >> IPA',
-                    'acetonitrile; DMF >> IPA',
-                    'DMF; GLB',
-                    'Chlorobenzene',
-                    'methylamine formate; IPA',
-                    'DMF; THF',
-                    'Ethyl amine; HCl',
-                    'DMF; GBL',
-                    'DMF >> H2O',
-                    '2-Methoxy-ethanol',
-                    '2‐butoxyethano; DMSO',
-                    'DMF; Tetrahydrothiophene-1-oxide',
-                    '2-methoxyethanol; DMSO',
-                    'Cyclohexyl-2-pyrrolidone; DMF',
-                    'DMF; Benzylamine',
-                    'DMSO; NMP >> IPA',
-                    'DMF; DMSO >> Hexane',
-                    'DMF >> IPA >> DMF; IPA',
-                    'DMF >> Methanol | Cyclohexane',
-                    'DMF; Tetrahydrothiophene 1-oxid',
-                    'Cl-Cyclohexane; DMF',
-                    'DMSO >> DMSO >> DMSO',
-                    'DMF; NMP',
-                    'DMF; Me-Cyclohexane',
-                    'DMSO >> IPA >> Toluene',
-                    'none >> none',
-                    'DMSO; GBL @ 3; 7 >> IPA',
-                    'DMF; DMSO >> Chloroform',
-                    'DMF | IPA | H2O | Ethanol',
-                    'DMSO; GBL @ 3; 7 >> DMSO; GBL @ 3; 7',
-                    'DMF; DMSO',
-                    'DMF; TBP >> IPA',
-                    'DMSO >> IPA >> Toluene >> none',
-                    'DMF >> IPA >> Chlorobenzene; DMF',
-                    'DMF >> Unknown',
-                    'Ethanol; H2O >> Chlorobenzene; Tert-butanol',
-                    'DMF >> Chex; IPA',
-                    'Unknown >> none >> none',
-                    'acetonitrile; DMF; Methoxyactonitrile',
-                    'none >> Methanol; Ethanol',
-                    'DMSO >> Octane',
-                    'Chlorobenzene >> Methylacetate',
-                    'DMF; GBL; IPA >> IPA',
-                    'Methylammonium acetate',
-                    'DMSO; o-xylene',
-                    'DMSO | Propanetriol',
-                    'Ocatane >> MeOAc',
-                    'DMSO >> IPA',
-                    'DMF; HCl >> IPA',
-                    'DMSO >> Ethanol',
-                    '2-methoxyethanol; acetonitrile',
-                    'IPA >> DMF',
-                    'DMF >> Pentan-1-ol >> Unknown',
-                    'none >> IPA',
-                    'DMF; HCl',
-                    'DMF; DMSO >> Cyclohexane; IPA',
-                    'DMF >> Cyclohexane; IPA',
-                    'DMF; DMSO >> Chlorobenzene; IPA',
-                    'DMF; o-DCB',
-                    'DMF >> Methanol >> Methanol',
-                    'Unknown >> IPA >> none',
-                    '2-methoxyethanol',
-                    'H2O >> none',
-                    'DMF >> IPA >> DMF >> IPA >> DMF >> IPA',
-                    'n-propylamine',
-                    'DMF >> none >> none >> none',
-                    'THF',
-                    'DMSO >> Toluene',
-                    'DMF >> tert-butanol; Chlorobenzene',
-                    'DMF; Glycerol >> DMF >> IPA',
-                    'Butylamine',
-                    'DMF; o-xylene',
-                    'DMF; DMSO >> none >> none >> none',
-                    'Ethanol; H2O >> IPA',
-                    'IPA',
-                    'DMF; DMSO >> Toluene',
-                    'DMF >> Ethanol; IPA',
-                    'acetonitrile; Ethanol; Methylamine',
-                    'DMSO >> none',
-                    'Hexane; Octane',
-                    'H2O >> IPA',
-                    'NMP >> IPA',
-                    'Octane',
-                    'DMF >> IPA >> Toluene',
-                    'Dimethylacetamide; DMSO; NMP',
-                    'H2O >> none >> IPA',
-                    'DMSO; GBL',
-                    'Dimetyletanamid',
-                    'Dimethylacetamide; DMF',
-                    'DMF; DMSO; HAc >> IPA',
-                    'Diiodomethane; DMF; DMSO',
-                    'DMF; DMSO | IPA',
-                    'DMF; DMSO; HCl >> IPA',
-                    'DMF >> Methanol >> Methanol >> Methanol',
-                    'H2O >> H2O; HI >> IPA',
-                    'DMSO; GBL >> none',
-                    'Methylacetate',
-                    'DMF >> IPA >> DMF >> IPA',
-                    'Methanol; THF',
-                    'IPA >> DMF >> IPA',
-                    'Acetic acid; Ethanol; Water',
-                    'DMF; DMSO; Formamide',
-                    'GBL >> IPA',
-                    'DMF; H2O',
-                    'DMF; DMSO >> Ethanol',
-                    '2-methoxyethanol; DMSO; GBL',
-                    'Butylamine; DMF; DMSO >> Butanol',
-                    'Octane >> Pb(OAc)2 satured ethyl acetate solution >> Ethyl acetate >> Octane >> Pb(OAc)2 satured ethyl acetate solution >> Ethyl acetate >> Octane >> Pb(OAc)2 satured ethyl acetate solution >> Ethyl acetate',
-                    'DMF; DMSO >> Methyl acetate',
-                    'DMF; DMSO | IPA >> IPA',
-                    'DMF; THF >> IPA',
-                    'DMF >> Chlorobenzene; IPA',
-                    'DMF; DMSO >> IPA >> DMSO; IPA',
-                    'DMF; NNP',
-                    'DMSO; GBL @ 4; 7 >> IPA',
-                    'GBL; NMP',
-                    'DMF >> IPA >> Methybenene',
-                    'GBL; DMSO',
-                    'Octane >> Ethyl acetate',
-                    'IPA >> IPA',
-                    'Unknown',
-                    'Water >> Ethanol >> IPA',
-                    'H2O; HI; Methylamine',
-                    'DMF; DMA >> IPA',
-                    'Hexane >> Octane',
-                    'DMSO; GBL; IPA',
-                    'IPA >> Ethanol',
-                    'none | IPA',
-                    'Octane >> Octane >> Octane >> Octane >> Octane >> Methyl acetate',
-                    'Terpineol',
-                    'Unknown >> IPA',
-                    'DMF; Acetophenone',
-                    'DMF; N-Methyl-2-pyrrolidone',
-                    'GBL >> GBL',
-                    'none >> IPA >> IPA',
-                    'DMF; DMSO; H2O',
-                    'Hexane',
-                    'DMF | IPA',
-                    'DMF >> DMF; IPA',
-                    'Dimethylacetamide',
-                    'DMF >> IPA; Toluene',
-                    'DMSO; Hac >> IPA',
-                    'DMF >> Ethanol >> Ethanol',
-                    'none >> Ethanol',
-                    'DMSO >> H2O; IPA',
-                    'DMF >> PA',
-                    'Ethyl acetate >> Ethyl acetate',
-                    'DMF >> Ethanol',
-                    'DMF >> DMF',
-                    'DMSO; H2O >> IPA',
-                    'none >> none >> none >> IPA',
-                    'DMF >> n-butyl alchohol',
-                    'DMF; HMPA >> IPA',
-                    'DMF >> IPA; Propanol',
-                    'DMF | DMF; IPA',
-                    'none >> none >> none',
-                    'DMF; DMSO @ 9; 1 >> IPA',
-                    'DMF; IPA',
-                    'Methylamine >> Methylamine',
-                    'Methyl acetate >> Ethyl acetate',
-                    'none >> Hydrophosphorous acid; IPA',
-                    'DMF >> n-amyl alcohol',
-                    'DMF >> IPA; TBP',
-                    'DMSO; GBL; NMP',
-                    'DMSO; BL',
-                    'Aceton; DMF >> IPA',
-                    'DMSO | Butanol; IPA',
-                    'none >> IPA >> IPA >> IPA',
-                    'DMF; DMSO >> Chlorobenzene',
-                    'DMF >> Cyclohexanol; IPA',
-                    'DMF; DMSO >> none',
-                    'DMF >> DMF >> Ethanol',
-                    'Water >> none',
-                    'Octane >> Methyl acetate >> Methyl acetate',
-                    'DMF; DMSO; Pyridin',
-                    'DMF; DMSO; Methanol',
-                    'DMF >> IPA >> none',
-                    'DMF >> Octane >> Pb(OAc)2 satured ethyl acetate solution >> Ethyl acetate >> Octane >> Pb(OAc)2 satured ethyl acetate solution >> Ethyl acetate >> Octane >> Pb(OAc)2 satured ethyl acetate solution >> Ethyl acetate',
-                    'DMF >> Octane >> Octane >> Octane >> Methyl acetate >> Methyl acetate',
-                    'DMF; DMSO >> Chlorobenzene; DMF',
-                    'DMF; DMSO >> DMF; DMSO >> DMSO >> DMSO | IPA',
-                    'none >> Ethanol; Methoxyethanol',
-                    'DMF; Tetraline',
-                    'Dimethylacetamide >> IPA',
-                    'Acetic acid; GBL; Propanol',
-                    'DMF | none',
-                    'DMF; DMSO; N-cyclohexyl-2pyrrolidone',
-                    'DMF; DMSO >> IPA >> IPA',
-                    'DMF; DMSO; Formarmid',
-                    'DMF; NMP >> Ethanol',
-                    'DMF; DMSO >> Ethanol; IPA',
-                    'DMF; DMSO >> IPA >> none',
-                    'DMF >> DMF >> IPA',
-                    'IPA >> DMF >> none',
-                    'Butanol; GBL',
-                    'DMF >> none >> IPA',
-                    '1-Octane',
-                    'DMF; DMSO; GBL',
-                    'DMSO >> Octane >> Octane',
-                    'DMF; DMSO >> DMSO; IPA',
-                    'GBL; Polyethylene glycol >> H2O',
-                    'DMF; DMSO; Thiourea',
-                    'DMF >> IPA >> DMF',
-                    'DMF; DMI >> Ethanol',
-                    'Acetic acid; Ethanol; GBL',
-                    'none >> none >> none >> none',
-                    'DMF; n-butanol >> IPA',
-                    'DMF; DMSO; GBL >> IPA',
-                    'Dimethylacetamide; NMP',
-                    'n-butylamine',
-                    'Diiodooctane; DMF',
-                    'acetonitrile; DMF; DMSO',
-                    'DMSO; Formamide',
-                    'DMF | IPA | H2O',
-                    'DMF >> IPA >> IPA',
-                    'DMF; DMSO; n-butyl amine >> n-butanol',
-                    'DMF; HPA',
-                    'GBL >> none',
-                    'acetonitrile; Methylamine',
-                    'acetonitrile; DMSO >> IPA',
-                    'DMF; DMI >> IPA',
-                    'Hexame >> Methyl acetate >> Ethyl acetate',
-                    'DMF >> Octane >> Octane >> Methyl acetate >> Methyl acetate',
-                    'none >> none >> IPA',
-                    'DMF; DMSO >> IPA; H2O',
-                    'DMF >> Acetonitrile, Methylamine',
-                    'IPA >> DMF; DMSO',
-                    'acetonitrile; Methylamine >> IPA',
-                    'DMF; TBP',
-                    'Ethanol; GBL',
-                    'H2O >> none >> none',
-                    'DMF >> TBA',
-                    'DMF >> IPA >> Chlorobenzene; GBL',
-                    'DMSO >> IPA >> IPA',
-                    'DMSO | IPA',
-                    'DMF; Tetramethylene sulfoxide',
-                    'DMSO >> DMF; DMSO',
-                    'DMF >> none',
-                    'DMF >> IPA >> Chlorobenzene',
-                    'DMF; DMSO >> DMF; DMSO >> IPA',
-                    'Methanol; Water',
-                    'DMF >> IPA',
-                    'DMF; DMSO >> none >> IPA',
-                    'DMF; Glycerol >> DMF; DMSO',
-                    'DMF >> Methyl acetate',
-                    'DMSO >> Hexane',
-                    'DMSO',
-                    'DMF >> DMF >> none',
-                    'DMF; HI',
-                    'DMF >> Methanol >> Toluene',
-                    'DMF; DMSO >> IPA | IPA',
-                    'DMF >> IPA >> Chlorobenzene; DMSO',
-                    'DMF >> IPA >> Unknown',
-                    'DMF; DMSO >> DMF; DMSO',
-                    'DMF >> Terpineol',
-                    'DMSO | butanol',
-                    'DMF; DMSO >> DMSO; Methanol',
-                    'DMF; DMSO; Hac >> IPA',
-                    'H2O >> Hexane; IPA',
-                    'acetonitrile; MA(MeOH)',
-                ]
+                suggestions=get_suggestions('perovskite_deposition', 'solvents')
             ),
         ),
     )
@@ -1269,219 +543,9 @@ PbBr2; PbI2 >> FAI; MAI >> none
         a_eln=dict(
             component='EnumEditQuantity',
             props=dict(
-                suggestions=[
-                    '',
-                    'nan >> PEAI',
-                    'FAPbI3; MABr >> PEAI; PbI2',
-                    'CsI; FAI; MABr; PbBr2; PbI2 >> Cs-oleate; PbBr2; PbBI2',
-                    'PEAI; PbI2; MABr >> PEAI; PbI2; MABr',
-                    'CsBr; FAI; PbI2 >> PEAI',
-                    'CsI; MABr; PbBr2; FAI; PbI2',
-                    'PbBr2, MgBr2 >> CsBr',
-                    'MAI; PbI2; TPAI',
-                    'MAI; PbI2 >> MAI',
-                    'SnI2; FASnI',
-                    'SnI2; FAI; SnF2; ethylenediamine; PbI2; MAI; MABr',
-                    'SnI2; FAI; SnF2; ethylenediamine; PbI2; MAI',
-                    'nan >> n-butyl amine',
-                    '1,8-octanedithiol; CsI; FAI; PbI2',
-                    'MAI; PbI2; NiI2',
-                    'F5PEAI, PEAI; PbI2',
-                    'SnI2; FAI',
-                    'MAI; PbI2; SnI2',
-                    'MAI; BA; PbI2',
-                    'PbCl2; PbI2 >> MAI',
-                    'SnI2; FAI; SnF2; PbI2; MAI',
-                    'MAI; PbSCN2; PbI2; FAI',
-                    'CsI; CsBr; PbI2; PbBr2',
-                    'PbCl2; PbI2 >> MAI; PMMA',
-                    'CsBr; PbI2 >> CsPbI3-QDs >> Pb(OAc)2 >> nan >> CsPbI3-QDs >> Pb(OAc)2 >> nan >> CsPbI3-QDs >> Pb(OAc)2 >> nan',
-                    'MAI; PbI2; FeI2',
-                    'PbI2; PbBr2; FAI; MABr; g-C3N4',
-                    'CsI; PbBr2 >> CsI',
-                    'CsI; FAI; MABr; PbBr2; PbI2',
-                    'nan >> Guanidinium iodide',
-                    'nan >> Cs2CO3',
-                    'CsI; FAI; PbI2; PbBr2',
-                    'FAI; MAI; PbBr2; PbI2',
-                    'PbI2 >> MAI; MAPbI3-QDs',
-                    'PbI2; FAI; MACl; MABr; PbBr2',
-                    'FAI; MABr; MACl; PbI2; PbBr2',
-                    'CsAc; HPbBr3; PEABr',
-                    'nan >> nan >> nan',
-                    'PbI2 >> MAI >> nan',
-                    'MACl; MAI; PbI2',
-                    'NH4I; PbI2 >> MA',
-                    'MAI; PbI2 >> MAI >> 4-DA',
-                    'CsBr; PbBr2',
-                    'MAI; PbCl2; PbI2',
-                    'FAI; MABr; PbI2; PbBr2 >> CsI',
-                    'MACl; SnCl2',
-                    'MAI; PbI2; CoI2',
-                    'MAI; PbI2 >> nan',
-                    'nan >> CsNO3',
-                    'PbI2; PbBr2; CsI',
-                    'MAI; BDAI; PbI2',
-                    'CsI; PbI2',
-                    'MAI; MnI2',
-                    'nan >> FAI',
-                    'FAI; MABr; PbBr2; PbI2',
-                    'CsAc; HPbBr3',
-                    'PEAI, PbI2',
-                    'MAI; PbCl2 >> IPFB',
-                    'CsI; FAI; MABr; PbBr2; PbI2; RbI >> FABr',
-                    'FAI; PbI2; ThMAI',
-                    'PbI2 >> MAI',
-                    'CsBr; FAI; PbI2',
-                    'PbI2 >> MACl; MAI',
-                    'nan >> MABr',
-                    'CsBr >> PbBr | PQD',
-                    'nan >> GuBr',
-                    'HPbI3; CsI',
-                    'PbI2; PbBr2; FAI; MABr; C3N5',
-                    'nan >> nan >> nan >> Pb(NO3)2',
-                    'PbI2 >> MAI; MACl',
-                    'MAI; MTEACl; PbI2',
-                    'CsI; SnI2',
-                    '1,8-diiodooctane; MAI; PbCl2',
-                    'MAI; PbI2; PEAI',
-                    'nan >> ETB; NaI',
-                    'nan >> NH3I(CH2)4NH3I',
-                    'AgI; Bi3',
-                    'CsAc; HPbI3',
-                    'MAI; PbI2',
-                    'MAI; PBI2; SbBr3',
-                    'nan >> FaBr',
-                    'PbBr2, SrBr2 >> CsBr',
-                    'F5PEAI; CsI; FAI; MABr; PbI2; PbBr2; Pb(SCN)2; PEAI',
-                    'CsI; CsBr; PbI2',
-                    'MAI; PbI2 >> PbI2',
-                    'F5PEAI; CsI; FAI; MABr; PbI2; PbBr2; Pb(SCN)2',
-                    'nan >> NH3I(CH2)8NH3I',
-                    'PbI2 >> FAI; MACl',
-                    'F5PEAI, PbI2',
-                    'MAI; PbCl2; Pb(OAc)2.3H2O',
-                    'PbI2 >> 5-AVAI; MAI',
-                    'CsBr; FAI; PbI2 >> PMAI',
-                    'PbCl2 >> MAI',
-                    'MABr; PbBr2',
-                    'CsI; PbBr2; PbI2; FAI >> FAI',
-                    'CsI; FAI; HI; PbI2 >> FA(PF6)',
-                    'CsI; FAI; MABr; PbI2; PbBr2',
-                    'CsBr; CsI; PbI2',
-                    'SnI2; FABr',
-                    'nan >> Eu-pyP',
-                    'PbCl2; PbI2 >> FAI; MAI',
-                    'nan >> CsI',
-                    'PbBr2, CaBr2 >> CsBr',
-                    'MAI; PbCl2; PbI2; Phenol',
-                    'MAI; PbCl2; PbI2; FAI',
-                    'MAI; PbI2 >> MAI; PbI2',
-                    'Cs2CO3; oleic acid; 1-octadecene; PbBr2; oleylamine',
-                    'CsI; PbI2 >> FAI; MABr',
-                    'MAI; PbCl2',
-                    'nan >> Octylammonium iodide',
-                    'MAI; NMA; PbI2',
-                    'C3H5CsO2; HPbBr3; HPbI3',
-                    'CsBr; PbI2 >> CsPbI3-QDs >> Pb(OAc)2 >> nan >> CsPbI3-QDs >> Pb(OAc)2 >> nan >> CsPbI3-QDs >> Pb(OAc)2 >> nan >> nan',
-                    'CsBr; FAI; PbI2 >> PAI',
-                    'nan >> Pb(NO3)2',
-                    'nan >> Ethylammonium Iodide',
-                    'nan >> GAI',
-                    'CsI; FAI; MAI; PbBr2; PbI2',
-                    'MAI; PbI2 >> MAPbI3-QDs',
-                    'CsAc; HPbBr3; HPbI3; PEABr; PEAI',
-                    'nan >> CsAc',
-                    'MAI; PbAc',
-                    'CsI; PbBr2; PbI2; FAI >> FABr',
-                    'MAI; PbCl2; PbI2 >> MAPbI3-QDs',
-                    'nan >> NH3I(CH2)2O(CH2)2O(CH2)2NH3I',
-                    'PbI2 >> FAI; MABr; MACl',
-                    'AuBr3; MABr',
-                    'nan >> MAI',
-                    'MAI; PbI2; MnI2',
-                    'nan >> CsBr',
-                    'CsI; FAI; PbBr2; PbI2',
-                    'CsI; FAI; MABr; MACl; PbI2; PbBr2',
-                    'Pb(NO3)2 >> MACl; MAI',
-                    'PbI2 >> FAI; MAI; MACl',
-                    'CsI; FAI; MABr; PbBr2; PbI2 >> PFPAI',
-                    'CsBr; PbI2',
-                    'FAI; MAI; PbI2',
-                    '5-AVAI; MAI; PbI2',
-                    'MAI; PBI2',
-                    'PbI2 >> 5-AVAI; MAI; MACl',
-                    'MAI; 5-AVAI; PbI2',
-                    'PbCl2 >> MAI >> nan',
-                    'AgBr; BiBr3; CsBr',
-                    'MABr; PbBr2; PbI2; FAI',
-                    'CsI; FAI; GaAA3; PbI2',
-                    'CsAc; HPbI3; PEAI',
-                    'CsI; FAI; MAI; PbBr2; PbI2 >> 10%mol TBAI-doped PTzDPPBTz',
-                    'CsPbI3-QDs >> Pb(OAc)2 >> nan >> CsPbI3-QDs >> Pb(OAc)2 >> nan >> CsPbI3-QDs >> Pb(OAc)2 >> nan',
-                    'MAI; PbI2; PbCl2',
-                    'CsAc; HPbBr3; HPbI3',
-                    'PbI2 >> nan >> MAI',
-                    'HPbI3 >> MA',
-                    'C2H3CsO2; HPbBr3; HPbI3',
-                    'CsBr >> PbBr',
-                    'CsI; PbBr2; PbI2',
-                    '(BDA)I2; CsI; PbI2; PbBr2',
-                    'CsI; FAI; MABr; PbI2',
-                    'MAI; Pb(OAc)2',
-                    'FAI; MAI; PbI2; Pb(SCN)2',
-                    'HCOOCs; HPbBr3; HPbI3',
-                    'FAI; SnI2',
-                    'MAI; Pb (OAc)2.3H2O',
-                    'PbI2; HI; MA; ethanol; diethyl ether',
-                    'Pb(NO3)2 >> MAI',
-                    'CsI; PbBr2',
-                    'PbI2; FAI; MACl',
-                    'FAI; MAI; PbI2; Pb(SCN)2 >> PMMA',
-                    'KI; FAI; MABr; PbBr2; PbI2',
-                    'SnI2; MASnI',
-                    'PbI2; HI; MA; diethyl ether',
-                    'FAPbI2Br >> MAPbI2Br >> CsPbI2Br >> RbI | BABr',
-                    'CsI; FAI; MAI; PbBr2; PbI2 >> PTABr',
-                    'FAI; PbI2',
-                    'CsI; PbBr2; PbI2; FAI >> FAI; FABr',
-                    'CsBr; HI; PbF2; PbI2',
-                    'nan >> Imidazolium iodide',
-                    'nan >> GABr',
-                    'nan >> MACl',
-                    'PbI2; MAI',
-                    'CsI; FAI; HI; PbI2',
-                    'PbBr2; MAI',
-                    'PbBr2 >> CsBr',
-                    'FAI; MAI; PbBr2; PbI2; Pb(SCN)2 >> PMMA',
-                    'CsI; PbI2 >> FAI; MABr; MACl',
-                    'PbCl2; MAI',
-                    'CsI; FAI; MAI; PbI2',
-                    'nan >> FABr',
-                    'DOI; MABr; PbBr2',
-                    'MAI: PbI2',
-                    'MAI; PbI2 >> BEAI2',
-                    'nan >> nan >> FAI',
-                    'CsBr; HI; PbI2',
-                    'MAPbI3-xClx',
-                    'CsI; FAI; MABr; PbI2; PbBr2; Pb(SCN)2; PEAI; nan',
-                    'CsPbI3 >> Pb(NO3)2 >> FAI',
-                    'CsI; FAI; MAI; PbI2; RbI',
-                    'CsI; FAI; PbI2',
-                    'MAI; BAI; PbI2',
-                    'nan >> EDBE',
-                    'DOI; MAI; PbCl2',
-                    'DMAI; PbI2',
-                    'RbI; CsI; FAI; MABr; PbI2; PbBr2',
-                    'FAI, MABr; PbI2; PbBr2',
-                    'FAI; MACl; MABr; PbI2',
-                    'PbI2; PbCl2; MAI',
-                    'MAI; SnF2; SnI2 >> nan',
-                    'nan >> Pb(NO3)2 >> nan',
-                    'CsI; PbI2 >> MACl; MABr; FAI; MAI',
-                    'PbI2 >> MAI >> TSA',
-                    'nan >> ITIC',
-                ]
+                suggestions=get_suggestions(
+                    'perovskite_deposition', 'reaction_solutions_compounds'
+                )
             ),
         ),
     )
@@ -1711,337 +775,9 @@ Example
         a_eln=dict(
             component='EnumEditQuantity',
             props=dict(
-                suggestions=[
-                    '',
-                    '1 M >> 40 mg/ml',
-                    '0.4 M; 0.6 M; 0.8 M',
-                    '0.18 M; 1.02 M; 1.2 M',
-                    '0.75; 0.788; 0.713',
-                    '600 mg/ml >> 1 mg/ml',
-                    '1 M >> 0.07 M | nan',
-                    '50 wt%',
-                    '0.024 M; 1.176 M >> 8 mg/ml',
-                    '461 mg/ml; 57 wt%; 33 wt%; nan; nan',
-                    '0.063 M; 1.14 M; 1.14 M; 1.25 M; 1.25 M',
-                    '0.2 M; 0.06',
-                    '1 vol%; 0.05 M; 0.95 M; 1 M',
-                    '46.8 mg/ml; 226.9 mg/ml; 0.05 vol%; 608.5 mg/ml >> 1 mg/ml',
-                    '0.5 M; 0.5 M',
-                    '1 M; 30 mg/ml',
-                    '0.442 molal; 1.07 molal; 0.173 molal; 1.36 molal; 13.6 mg/ml >> 1 mg/ml',
-                    '1.125 M; 0.75 M',
-                    '548.6 mg/ml >> 50 mg/ml',
-                    '462 mg/ml >> 35 mg/ml',
-                    'nan; 1 M; 0.2 M; 0.2 M; 1.1 M >> 1000 mM',
-                    '1.26 M; 0.14 M; 1.4 M',
-                    'nan; 1 M; 0.2 M; 0.2 M; 1.1 M >> 200 mM',
-                    '600 mg/ml >> 10 mg/ml',
-                    '1 M >> 0.0031 M; 0.0598 M',
-                    '1 M; 1.05 M',
-                    '0.5 M >> 20 mg/ml',
-                    '573.3 mg/ml; 197.7 mg/ml',
-                    '0.1426 M; 1.56 M; 1.74 M >> 4 mM',
-                    '1 M >> 10 mg/ml >> 5 mM',
-                    '2 wt%; 163.33 mg/ml; 535.2 mg/ml',
-                    '0.75; 0.75; 0.75',
-                    '0.1426 M; 1.56 M; 1.74 M >> 10 mM',
-                    '1 M >> 7 mg/ml',
-                    '0.75 M; 0.50 M; 1 M',
-                    '1 M >> 8 mg/ml',
-                    '0.5 M >> 38 mg/ml',
-                    '553 mg/ml; 190 mg/ml',
-                    '0.5 M; 0.5 M; 0.6 M; 0.3 M',
-                    '1 M >> 10 mg/ml >> 10 mM',
-                    '1 M; 1.06 M',
-                    'nan >> 2 mg/ml',
-                    '1.25 M; 1.25 M >> nan',
-                    '1.5 M; nan',
-                    '462 mg/ml >> nan >> 10 mg/ml',
-                    '1.4 M; 1.4 M',
-                    '1.08 M; 1.08 M; 0.12 M',
-                    '1.2 M >> 1.6 mol%',
-                    'nan >> 5 mg/ml',
-                    '500 mg/ml >> 10 mg/ml >> nan',
-                    '1 M >> 0.07 M',
-                    'nan >> 3 mg/ml',
-                    '46.8 mg/ml; 226.9 mg/ml; 0.05 vol%; 608.5 mg/ml >> 7 mg/ml',
-                    '0.3 M; 0.06',
-                    '1.5 M >> 62.3 M',
-                    '3 vol%; 0.05 M; 0.95 M; 1 M',
-                    '1 M; 0.2 M; 1 M; 1.1 M',
-                    '1.3 M; 1.3 M; 1.3 M; 1.3 M | 1 mg/ml',
-                    '1.5 M; 1.5 M',
-                    '1.5 M >> 23.5 mM; 70.8 mM',
-                    '0.1426 M; 1.56 M; 1.74 M >> 2 mM',
-                    '1.35 M; 1.35 M',
-                    '1.25 M; 1.3 M',
-                    '440 mg/ml; 180 mg/ml',
-                    '1.1 M; 0.2 M; 1.15 M; 0.2 M',
-                    '50 mg/ml >> nan >> nan >> 50 mg/ml >> nan >> nan >> 50 mg/ml >> nan >> nan',
-                    '1.2 M',
-                    '400 mg/ml >> 10 mg/ml',
-                    '1.0 M; 1.1 M',
-                    '462 mg/ml >> 10 mg/ml >> nan',
-                    '52.6 mg/ml; 197.4 mg/ml; 622.4 mg/ml',
-                    '1 M >> 10 mg/ml >> 2.5 mM',
-                    '0.85 M; 0.15 M; 0.15 M; 0.85 M',
-                    '0.8 M; 0.3 vol%; 0.12 M; 0.68 M',
-                    '0.05 M; 1.1 M; 0.2 M; 0.2 M; 1.25 M',
-                    '0.5 M; 0.5 M >> 20 mg/ml',
-                    '0.90 M; 0.90 M; 0.10 M',
-                    '1.3 M; 0.14 M; 1.26 M; 50 mg/ml',
-                    'nan; 1 M; 0.2 M; 0.2 M; 1.1 M',
-                    '0.5 M; 1 M; 1 M',
-                    '1.4 M >> 10 mg/ml; nan',
-                    '1.8 M; 1.8 M >> nan',
-                    '1 M; 0.07 M',
-                    '2; 1',
-                    '450 mg/ml >> 5 mg/ml; 50 mg/ml',
-                    '1 M >> nan',
-                    '1 :3molarratio',
-                    '2 wt%; 2.43 M; 0.81 M',
-                    '0.8 M; 0.3 vol%; 0.28 M; 0.52 M',
-                    '0.11 M; 0.91 M; 0.18 M; 0.186 M; 1.014 M',
-                    '2.44 M; 2.44 M; 0.9 M',
-                    '1.3 M; 1.3 M',
-                    '1 M; 57 wt%; 33 wt%; nan; nan',
-                    '13.7 mg/ml; 197.5 mg/ml; 573 mg/ml',
-                    '0.98 M; 1 M',
-                    '70 mg/ml',
-                    '1.02 M; 0.18 M; 0.18 M; 1.02 M',
-                    '1 mM; 1 mM >> 30 mg/ml',
-                    'nan; 10 mg/ml',
-                    '1 M >> 50 mg/ml',
-                    '0.95 M; 0.05 M; 0.05 M; 0.95 M',
-                    '461 mg/ml; 159 mg/ml',
-                    '691.5 mg/ml >> nan; nan',
-                    '0.5 M >> 36 mg/ml',
-                    '0.4 M; 0.8 M; 0.8 M',
-                    '1 M; 50 mM',
-                    '0.75 M; 0.75 M',
-                    '367 mg/ml',
-                    '1.125; 0.75; 0.75',
-                    '0.2 M; 0.22 M; 1.1 M; 1 M',
-                    '0.5 M >> 50 mg/ml',
-                    '45 wt%',
-                    '636.4 mg/ml; 90 mg/ml; 89.79 wt%; 8.97 wt%',
-                    '33.8 mg/ml; 599 mg/ml >> 60 mg/ml; 6 mg/ml; 6 mg/ml',
-                    '1.2 M; 0.28 M',
-                    '0.18 M; 1.02 M; 1.2 M; 0.1 M',
-                    '1.2 mM',
-                    '0.5 M >> 34 mg/ml',
-                    '1 M; 0.2 M; 1.1 M; 0.2 M',
-                    '66 mg/ml; 187 mg/ml; 12 mg/ml; 80 mg/ml; 568 mg/ml; nan',
-                    '0.3 M; 1.2 M >> 40 mg/ml',
-                    '0.5 M >> 32 mg/ml',
-                    '1.5; 0.75; 0.75',
-                    '1.3 M; 0.14 M; 1.26 M',
-                    '2.7 M; 0.9 M',
-                    '0 M; 0.8 M; 0.8 M',
-                    '0.5 M >> 30 mg/ml',
-                    '227.14 mg/ml; 80 mg/ml; 527.14 mg/ml',
-                    '510 mg/ml >> 8.5 mg/ml >> nan',
-                    '0.15 M; 0.85 M; 1 M',
-                    '1 M; 1 M; 1 M',
-                    'nan >> 0.5 mg/ml',
-                    '0.5 M; 0.5 M; 1 M; 0.2 M',
-                    '1.8 M; 0.45 M; 0.45 M',
-                    '1 M >> 10 mg/ml',
-                    '2.4 M; 0.8 M',
-                    '0.6 M; 0.6 M >> 50 mg/ml >> nan >> nan >> 50 mg/ml >> nan >> nan >> 50 mg/ml >> nan >> nan',
-                    '1 mol/L; 1 mol/L',
-                    '0.7 M; 0.7 M',
-                    '50.87 mg/ml; 147.5 mg/ml',
-                    '1.42 M; 1.42 M',
-                    '0.18 M; 1.32 M; 1.5 M',
-                    '0.4 M',
-                    '1.25 M; 1 M',
-                    '0.05 M; 1.0 M; 0.2 M; 0.2 M; 1.1 M',
-                    '450 mg/ml >> 50 mg/ml',
-                    '1 M >> 0.0031 M; 0.0126 M; 0.0472 M',
-                    '0.06 M; 0.96 M; 0.18 M; 0.186 M; 1.014 M',
-                    '1.02 M; 0.18 M; 0.186 M; 1.014 M',
-                    '0.375; 0.75; 0.75',
-                    '0.5 M >> 40 mg/ml',
-                    '159 mg/ml; 461 mg/ml >> 461 mg/ml',
-                    '1.467; 1.6',
-                    '0.6 M; 0.6 M',
-                    '0.05 M; 1 M; 0.2 M; 0.2 M; 1.1 M',
-                    '1.59 mol/kg; 1.59 mol/kg',
-                    '0.11 M; 1.07 M; 0.19 M; 0.19 M; 1.23 M',
-                    '197.6 mg/ml; 787 mg/ml',
-                    '0.15 M; 0.75 M; 0.1 M; 1 M',
-                    '1.467; 1.6; 2 mol%',
-                    '206.2 mg/ml; 597.8 mg/ml',
-                    '1.5 M; 0.75 M',
-                    '1.53 M; 1.4 M; 0.5 M; 0.0122 M; 0.0122 M',
-                    '5 wt%; 1.4 M >> 60 mg/ml; 6 mg/ml',
-                    '2.25 M; 0.75 M',
-                    'nan >> 0.16 ml/ml; 9.04 mg/ml; 23.04 mg/ml',
-                    '0.8 M; 0.3 vol%; 0.2 M; 0.6 M',
-                    '1 M; 1 M',
-                    '1.6 M',
-                    '9 wt%; 26 wt%',
-                    '1.2 M; 1.2 M',
-                    '397 mg/ml >> 9 mg/ml',
-                    '1.6 mol%; 1.2 M; 1.2 M >> 1.6 mol%; 1.2 M; 1.2 M',
-                    '1 wt%; 2.43 M; 0.81 M',
-                    '75 mg/ml >> 1 mg/ml >> 1 mg/ml',
-                    '0.9 M; 0.3 M; 1.0 M; 0.3 M',
-                    '0.14 M; 1.4 M >> 70 mg/ml',
-                    '1.3 M; 0.14 M; 1.26 M; 75 mg/ml',
-                    '0.5 M; 0.5 M >> 20 mg/ml; 0.005 mg/ml',
-                    '6.4 wt%; 33.6 wt%',
-                    '1.05 M; nan',
-                    '0.9 M; 0.9 M',
-                    '636.4 mg/ml; 90 mg/ml; 89.79 wt%; 8.97 wt%; 4 wt%',
-                    '1 M; 0.2 M; 0.22 M; 1.1 M',
-                    '1.1 M; 10 mg/ml',
-                    '1.4 M; 1.45 M',
-                    '0.17 M; 0.83 M; 0.5 M; 0.5 M',
-                    '0.172 mg/ml; 0.022 mg/ml; 0.507 mg/ml; 0.08 mg/ml >> 1.5 M',
-                    '0.072 M; 1.11 M; 0.21 M; 0.21 M; 1.2 M',
-                    '0.5 M; 1.2 M; 1 M; 0.2 M',
-                    '330 mg/ml >> 10 mg/ml',
-                    '1.4 M',
-                    '1.3 M; 1 M',
-                    '0.05 M; 0.95 M; 1 M',
-                    '3 M; 1 M',
-                    '450 mg/ml >> 50 mg/ml; 10 mg/ml',
-                    '2.1 M; 0.7 M',
-                    '596 mg/ml; 200 mg/ml',
-                    'nan >> nan',
-                    '159 mg/ml; 461 mg/ml',
-                    '0.4 M; 0.4 M; 0.8 M',
-                    '1.3 M; 1.35 M',
-                    '0.6 M; 0.6 M >> 50 mg/ml >> nan >> nan >> 50 mg/ml >> nan >> nan >> 50 mg/ml >> nan >> nan >> nan',
-                    '0.2 M; 0.8 M >> 15 mg/ml',
-                    '2.55 M; 0.85 M',
-                    '1.3 M; 0.14 M; 1.26 M; 5 mg/ml',
-                    '26 mg/ml; 172 mg/ml; 22.4 mg/ml; 16.7 mg/m; 507 mg/ml; 73.4 mg/ml',
-                    '0.1426 M; 1.56 M; 1.74 M >> 6 mM',
-                    '0.88 M; 1.1 M; 0.44 M',
-                    '460 mg/ml >> 10 mg/ml',
-                    '199 mg/ml; 605.5 mg/ml',
-                    '1 M; 10 mg/ml',
-                    '20 mg/ml; 172 mg/ml; 22.4 mg/ml; 507.2 mg/ml; 73.4 mg/ml',
-                    '1.1 M; 1.1 M',
-                    '0.1125 M; 1.1375 M; 1.25 M',
-                    '46.8 mg/ml; 226.9 mg/ml; 0.05 vol%; 608.5 mg/ml >> 28 mg/ml',
-                    '1 M; 0.5 M; 0.5 M',
-                    '163.33 mg/ml; 535.2 mg/ml',
-                    '190 mg/ml; 0.0176 mg/ml; 530 mg/ml',
-                    '1.4 M >> 10 mg/ml',
-                    '0.54 M; 0.54 M; 0.06 M',
-                    '0.2 M; 0.2 M; 1.1 M; 1 M',
-                    '470 mg/ml >> 50 mg/ml; 5 mg/ml',
-                    '0.196 mg/mLPbI2; 1.5 M',
-                    '28 wt%',
-                    '20 mg/ml; 1.6 M; 1.6 M; 20 mg/ml',
-                    '1.0 M',
-                    '0.5 M; 0.75 M; 1 M',
-                    '1.4 M; 0.1 M; 0.01 M; 1.4 M; 0.1 M',
-                    '40 wt%',
-                    '0.214 mg/mLPbI2; 1.5 M',
-                    '1 wt%; 163.33 mg/ml; 535.2 mg/ml',
-                    '1.875 M; 0.75 M',
-                    '1.3 M | 1.3 M',
-                    '4 M; 1 M',
-                    '5 vol%; 0.05 M; 0.95 M; 1 M',
-                    '1.3 M >> 60 mg/ml; 6 mg/ml; 6 mg/ml',
-                    '1.2 M; 1.2 M >> nan',
-                    '238.5 mg/ml; 726 mg/ml',
-                    '1.8 M >> nan',
-                    '0.5 M; 0.5 M; 0.4 M',
-                    '0.21 M; 0.81 M; 0.18 M; 0.186 M; 1.014 M',
-                    '687 mg/ml; 237 mg/ml',
-                    'nan; nan',
-                    '1.2 M >> 8 mg/ml',
-                    '691.5 mg/ml >> 70 mg/ml',
-                    'nan >> 7 mg/ml',
-                    '1.25 M; 1.25 M',
-                    '60 mg/ml >> 1.3 M',
-                    '0.348 mg/ml; 0.922 mg/ml',
-                    '0.075 M; 1 M; 0.2 M; 1 M; 1.1 M',
-                    '254.4 mg/ml; 737.6 mg/ml',
-                    '1 :1mol%',
-                    '0.1 M; 0.06',
-                    '20 wt%',
-                    '1.24 M',
-                    '1; 0.2; 1; 1.1',
-                    '0.1426 M; 1.56 M; 1.74 M',
-                    '0.8 M; 0.3 vol%; 0.18 M; 0.62 M',
-                    '1 M >> 0.0126 M; 0.0503 M',
-                    '1.4 M >> 70 mg/ml',
-                    '0.9 M; 0.1 M; 0.1 M; 0.9 M',
-                    '1.35 M; 0.14 M; 1.26 M',
-                    '0.70 M; 0.17 M; 0.10 M; 1.30 M',
-                    '0.18 M; 1.02 M; 1.5 mg/ml; 1.2 M',
-                    '1 M; 0.33 M; 0.66 M',
-                    '1 M; 1 M >> nan',
-                    '46.8 mg/ml; 226.9 mg/ml; 0.05 vol%; 608.5 mg/ml',
-                    '21.25 wt%; 21.25 wt%',
-                    '3.75 M; 1.25 M',
-                    '100 mg/ml; 300 mg/ml',
-                    '0.375 M; 0.75 M',
-                    '19.4 mg/ml; 172 mg/ml; 22.4 mg/ml; 73.4 mg/ml; 507 mg/ml; nan',
-                    '2.2 M; 2 M',
-                    '112 mg/ml; 38 mg/ml',
-                    'nan; 1 M; 0.2 M; 0.2 M; 1.1 M >> 100 mM',
-                    '0.063 M; 1.25 M; 1.25 M; 1.14 M; 1.14 M',
-                    '1.2 M; 0.3 M; 0.3 M',
-                    '400 mg/ml >> nan',
-                    '7 mg/ml; 1.2 M; 0.2 M',
-                    '1.3 M; 0.14 M; 1.26 M; 20 mg/ml',
-                    '0.12 M; 1.08 M >> 8 mg/ml',
-                    'nan; 1 M; 0.2 M; 0.2 M; 1.1 M >> 50 mM',
-                    '0.24 M; 1.36 M >> 30 mg/ml; 70 mg/ml',
-                    '1.467; 1.6; 4 mol%',
-                    '0.06 M; 1.14 M >> 8 mg/ml',
-                    '1.2 M; 8 mg/ml',
-                    '190.8 mg/ml; 553 mg/ml',
-                    '197.6 mg/ml; 787 mg/ml; 19.1 mg/ml',
-                    '46.8 mg/ml; 226.9 mg/ml; 0.05 vol%; 608.5 mg/ml >> 14 mg/ml',
-                    '0.3 M; 0.3 M',
-                    '32 wt%',
-                    '16.89 mg/ml; 600 mg/ml >> 1 mg/ml; 10.75 mg/ml',
-                    '198 mg/ml; 577 mg/ml',
-                    '0.3 M; 0.3 M; 0.6 M',
-                    '1.10 M; 0.20 M; 0.20 M; 1.15 M',
-                    '0.8 M; 0.2 M; 0.2 M; 0.8 M',
-                    '1.8 M; 0.45 M; 0.45 M >> nan',
-                    '0.72 M; 0.72 M; 0.08 M',
-                    '0.06 M; 0.95 M; 0.19 M; 0.2 M; 1 M',
-                    '4.07 mg/ml; 9.66 vol%; 48.85 vol%; 6.9 mg/ml; 10 vol%',
-                    '0.07 M; 1.4 M >> 70 mg/ml',
-                    '1 vol%; 1.1 M; 1.1 M',
-                    '0.22 M; 0.66 M',
-                    'nan; 1 M; 0.2 M; 0.22 M; 1.1 M',
-                    '462 mg/ml >> 20 mg/ml',
-                    '1.2 M >> 45 mg/ml',
-                    'nan; 1 M; 0.2 M; 0.2 M; 1.1 M >> 500 mM',
-                    '460 mg/ml >> 0.15 M',
-                    '1.38 M; 1.38 M',
-                    '0.8 M; 0.3 vol%; 0.8 M',
-                    '460 mg/ml >> nan; nan',
-                    '0.039 M; 0.091 M; 1.1 M; 0.2 M; 1.2 M; 0.2 M',
-                    '39.5 mg/ml; 115.7 mg/ml',
-                    '0.442 molal; 1.07 molal; 1.48 molal; 13.6 mg/ml',
-                    '6.4 wt%; 33.6 wt% >> nan',
-                    '0.1426 M; 1.56 M; 1.74 M >> 8 mM',
-                    '0.3 M; 1.2 M >> 40 mg/ml >> 2 mg/ml',
-                    '0.442 molal; 1.07 molal; 1.48 molal; 13.6 mg/ml >> 1 mg/ml',
-                    '1 M.0.03M; 0.07 M',
-                    'nan >> 1 mg/ml',
-                    '2.43 M; 0.81 M',
-                    '0.8 M; 10 mg/ml',
-                    '1 M; 0.952 M; 0.048 M',
-                    '1 M >> 30 mg/ml',
-                    '460 mg/ml >> 8.3 mg/ml >> nan',
-                    '2 M; 1 M',
-                    '0.06 M; 1 M; 0.2 M; 0.2 M; 1.1 M',
-                    '0.8 M; 0.8 M',
-                ]
+                suggestions=get_suggestions(
+                    'perovskite_deposition', 'reaction_solutions_concentrations'
+                )
             ),
         ),
     )
@@ -2743,878 +1479,9 @@ Example
         a_eln=dict(
             component='EnumEditQuantity',
             props=dict(
-                suggestions=[
-                    '70.0 >> 70.0; 90',
-                    '70; 100 >> 150',
-                    '320; 200',
-                    '105.0 >> 105.0 >> Unknown',
-                    '90.0',
-                    '170.0 >> 100.0',
-                    '65 | 130',
-                    '45; 105',
-                    'Unknown >> 105',
-                    '325.0',
-                    'Unknown >> 25.0',
-                    '85',
-                    '50.0',
-                    'Unknown >> 280.0',
-                    '70.0 >> 165.0',
-                    '100.0 >> Unknown',
-                    '220.0',
-                    '70.0 >> 100.0',
-                    '70.0 >> 85.0',
-                    '45; 100 >> 100',
-                    '100; 125',
-                    '150.0 >> 150',
-                    'Unknown >> 100',
-                    '180.0',
-                    '65.0; 150',
-                    '60.0; 80.0',
-                    '45.0',
-                    '320; 250',
-                    '100 >> 165.0',
-                    '240; 105',
-                    '120.0 | Unknown',
-                    '25 >> 130',
-                    '70 | Unknown',
-                    '90; 25 >> 25 >> 150',
-                    '150.0 >> 100',
-                    '85.0 >> 105.0',
-                    '40 >> 180',
-                    'Unknown | 100.0',
-                    'Unknown >> 90.0',
-                    '85; 100',
-                    '30; 160',
-                    '65; 100 >> Unknown',
-                    '95',
-                    'Unknown >> 115',
-                    '150; 100',
-                    '70.0 >> 110.0',
-                    '70.0 | 140.0',
-                    'Unknown >> Unknown >> 100',
-                    '135',
-                    '105.0 >> 105',
-                    '40.0; 100 >> 90.0',
-                    '65.0; 135.0',
-                    '200; 105',
-                    '70.0 >> 70.0; 70.0',
-                    '100.0 >> 135.0',
-                    '50 >> 260',
-                    '45; 65; 100',
-                    '75 >> 75; 70',
-                    '25.0; 280.0',
-                    '100.0 >> 185.0',
-                    '400.0 >> 400.0',
-                    '70 | 130',
-                    '100; 120',
-                    '80 >> 110',
-                    '70.0 >> 70',
-                    '115; 100',
-                    '80.0 >> 135.0',
-                    'Unknown >> 350',
-                    '100.0 >> 75.0; 100',
-                    'Unknown >> 130',
-                    '90.0 >> 250.0 >> 250.0 >> 250.0',
-                    'Unknown >> 50; 100',
-                    '95.0',
-                    '25; 300',
-                    '90.0 >> Unknown',
-                    '70.0 >> 80.0',
-                    '40; 100 >> 40; 100',
-                    '140.0 >> Unknown',
-                    '40; 100 >> 100',
-                    '40.0 >> 150.0',
-                    '70.0',
-                    '100 >> 150',
-                    '140.0 >> 145.0',
-                    '60.0; 80.0; 100.0',
-                    '42.0; 160.0',
-                    '160; 100',
-                    '70; 90 >> 250',
-                    '500.0',
-                    '70 >> 100.0',
-                    '90 >> 250',
-                    '60.0 >> 90.0',
-                    '90.0 >> 90.0',
-                    '0 >> 100',
-                    'Unknown >> 60',
-                    '70 >> Unknown',
-                    '145 >> 100',
-                    '100.0 >> 100.0 >> 100.0',
-                    '130.0 >> Unknown >> 100.0',
-                    '70.0; 100 >> 100.0',
-                    '60; 85',
-                    '150.0 >> 100.0',
-                    '120; 100',
-                    '80 >> 100',
-                    '260.0',
-                    '75; 105',
-                    '80.0 >> 110.0',
-                    '85.0 >> 90.0',
-                    '175.0',
-                    '100.0 >> 100',
-                    'Unknown >> 275.0',
-                    '160.0 >> 160.0',
-                    'Unknown >> 150.0',
-                    '40 >> 180 >> 130',
-                    '20.0; 70.0; 100.0; 120.0',
-                    '90 >> 250 | 85',
-                    'Unknown >> 320.0',
-                    '20; 70',
-                    '45 >> 160',
-                    '90; 25 >> 25 >> 90',
-                    '65; 135',
-                    '240.0',
-                    'Unknown >> 70',
-                    '38.0; 160.0',
-                    '110.0 >> 250.0',
-                    '70 >> 25 >> Unknown',
-                    '70.0; 100 >> 90',
-                    '25 >> 25 >> 25 >> 25 >> 25 >> 25 >> 25 >> 25 >> 25 >> Unknown',
-                    '60.0 >> 60.0 >> Unknown',
-                    '90',
-                    'Unknown >> Unknown',
-                    '130 >> 70',
-                    '120.0 >> 100.0',
-                    'Unknown >> 325.0',
-                    '330.0',
-                    'Unknown >> Unknown >> 120',
-                    '40; 60; 70; 100',
-                    '75.0 >> 250.0',
-                    '70.0; 90.0 >> 90.0',
-                    '70 >> 100',
-                    'Unknown >> 85',
-                    '120 >> 80',
-                    '100; 100',
-                    '90 >> 95',
-                    '25.0 >> 100.0',
-                    '55; 240',
-                    '85.0',
-                    '40 | 100 | 100',
-                    '40.0; 95.0',
-                    '25; 50; 75; 100',
-                    '260.0 >> Unknown >> Unknown',
-                    '70.0 >> 90.0',
-                    '90.0 >> 250.0',
-                    '100 >> 70; 100',
-                    '90.0; 125.0',
-                    '20; 100',
-                    '100.0 >> 55.0',
-                    '70; 250',
-                    'Unknown >> 40; 100; 130',
-                    '120.0 >> 80.0',
-                    'Unknown >> 70.0; 150',
-                    '60 >> 250',
-                    '280',
-                    '25.0 >> 170.0 >> 170.0 >> 170.0',
-                    '80; 120; 180',
-                    '60.0 >> 100.0',
-                    '27.0 >> 100.0',
-                    '52; 105',
-                    '150.0; 100.0',
-                    '70.0 | 120.0',
-                    '80.0 >> 140.0',
-                    '100 >> 70',
-                    '65; 105',
-                    '90.0 >> 60.0',
-                    'Unknown >> Unknown >> 70.0',
-                    '25; 90',
-                    '25; 95',
-                    '180 >> 280',
-                    '70 >> 120',
-                    '110.0 | 25.0 | 25.0 | 110.0',
-                    'Unknown >> 120.0',
-                    'Unknown | 150',
-                    '60; 80; 100 >> Unknown',
-                    'Unknown >> 104.0',
-                    '70; 300',
-                    '160; 230',
-                    '45.0; 160.0',
-                    '80.0; 120.0',
-                    '20.0',
-                    '25; 100',
-                    '165.0',
-                    '50',
-                    '20.0 >> 100.0',
-                    '50; 100 >> 100',
-                    '125.0 >> 100.0',
-                    '70.0 >> 130.0',
-                    '110; 70',
-                    '60; 140',
-                    '100 >> 65',
-                    '110.0 >> 70.0',
-                    '92.0',
-                    '70 >> 60; 100',
-                    '25; 60',
-                    '150 >> 150 >> 150 >> 150',
-                    '105.0 >> 105.0',
-                    '80 >> 80',
-                    '0.0; 60.0; 70.0; 80.0; 90.0',
-                    '60; 80',
-                    '180',
-                    '70; 110; 150',
-                    '100.0 >> 250.0',
-                    '40; 90 >> 95',
-                    '100; 330',
-                    '100.0; 100',
-                    '130; 150',
-                    '70.0 >> 75.0',
-                    '50.0 >> Unknown',
-                    '72.0 >> 140.0',
-                    '70.0; 100.0 >> 100.0',
-                    '25 >> 90.0',
-                    '100; 110; 120',
-                    '300.0 >> Unknown',
-                    '90; 250 >> 250',
-                    '20; 90',
-                    '65',
-                    '250.0',
-                    '20; 70; 100; 120',
-                    '60 >> 100',
-                    '70.0 >> 145.0',
-                    '100.0 >> 100.0 >> 175.0',
-                    '65.0',
-                    '50; 150; 270',
-                    '71.0 >> 70.0',
-                    '200; 150',
-                    '150.0',
-                    '35; 120 >> 120',
-                    '60.0; 70.0; 80.0; 90.0',
-                    '90 >> 25 >> 90',
-                    '85.0 >> 85.0',
-                    '28.0 >> 100.0',
-                    '60; 60; 90',
-                    '110.0 >> 150.0',
-                    '240 >> 120',
-                    '70; 95 >> 100 >> 100',
-                    '60; 100 >> 150',
-                    '90.0 >> 150.0',
-                    'Unknown >> 70.0',
-                    '25 >> 70 | Unknown',
-                    '60; 70; 80; 90; 100; 100',
-                    '105',
-                    '180.0 >> 180.0',
-                    '110 >> 70; 100',
-                    '60.0; 100',
-                    '150.0 >> 150.0',
-                    '67.0; 100.0',
-                    '25; 50; 60',
-                    'Unknown >> 80.0',
-                    'Unknown >> 210.0',
-                    '150; 100 >> 100',
-                    '65.0 >> 100 >> Unknown',
-                    '110 >> 150',
-                    '50.0 >> 50.0 >> Unknown',
-                    '120 >> 100',
-                    'Unknown >> Unknown >> Unknown >> 120.0',
-                    '90.0; 120.0',
-                    '70.0 >> 125.0',
-                    '60.0; 85',
-                    'Unknown >> 170',
-                    '60.0 >> 60.0',
-                    '25; 90; 120',
-                    '70.0 >> 100.0 >> 100.0',
-                    'Unknown >> 160',
-                    '40; 100 >> 150',
-                    '100.0 >> 100.0 >> 1000 >> Unknown',
-                    '60; 70; 80; 90; 100',
-                    'Unknown >> 60; 80; 100',
-                    '100.0 >> 100.0',
-                    '26.0 >> 100.0',
-                    '70; 100 >> 70; 100',
-                    'Unknown >> Unknown >> 105.0',
-                    '100 >> 120; 100',
-                    '50.0; 100.0',
-                    '70; 100 >> 145',
-                    '125.0; 100.0',
-                    'Unknown >> 50.0',
-                    'Unknown >> 140.0',
-                    '110.0 >> 105.0',
-                    '20; 80',
-                    '175',
-                    '90.0 >> 250.0 >> 250.0',
-                    '160; 105',
-                    '35.0',
-                    '75 >> 150',
-                    '140; 180',
-                    '120 >> 150',
-                    '90 >> 85',
-                    '135.0',
-                    '80.0 >> 110.0 >> 110',
-                    '250',
-                    '70 | 145',
-                    '40; 160',
-                    'Unknown >> Unknown >> Unknown >> 130.0',
-                    '90 >> 250.0',
-                    '75.0 >> 100.0',
-                    '100.0 >> 100.0 >> Unknown',
-                    '33.0',
-                    '100 >> Unknown >> Unknown >> 100',
-                    '320',
-                    '140; 100',
-                    '75 >> 250',
-                    '25.0 >> Unknown',
-                    'Unknown >> 70.0 >> 70.0',
-                    '70.0; 110',
-                    '60.0; 120',
-                    '66.0; 100.0',
-                    '100.0 >> 25.0 >> 100.0',
-                    '51.0 >> 70.0',
-                    '30; 40; 50; 60; 70; 80; 90; 100',
-                    '70 >> 108',
-                    '60; 100',
-                    'Unknown >> Unknown >> 60.0 >> 60',
-                    '100 >> 80; 100',
-                    '75.0 >> 135.0',
-                    '70.0 >> 120.0',
-                    '40',
-                    '70 >> 90 >> 90',
-                    '70 >> 100 >> 100',
-                    '100 >> Unknown',
-                    '40; 60; 80; 100',
-                    '60; 150',
-                    '100 | 100',
-                    '70.0 >> 70.0 >> 80.0',
-                    '80 >> 40; 140',
-                    '90.0 >> 100.0',
-                    '50; 160',
-                    '70.0 | 135.0',
-                    '110; 25 >> 110',
-                    '80.0 >> 170.0',
-                    '100.0 >> Unknown >> Unknown >> Unknown',
-                    '80.0 >> 80.0 >> 80.0 >> Unknown',
-                    '90.0 >> 80.0',
-                    'Unknown >> Unknown >> Unknown >> 350.0',
-                    '70.0 >> 200.0',
-                    '285.0',
-                    '70 >> 70',
-                    '120.0 >> 85.0',
-                    '25.0',
-                    '80.0 >> 120.0',
-                    '130.0 >> 130.0',
-                    'Unknown >> 175',
-                    '115',
-                    '60; 70 >> 70; 115',
-                    '35; 120',
-                    '70 >> 85',
-                    '80.0 >> 250.0',
-                    '70 >> 150',
-                    'Unknown >> 35.0',
-                    '40.0',
-                    '25 >> 115',
-                    '60.0; 100 >> 100; 140',
-                    '300',
-                    '70; 130',
-                    '80.0 >> 90.0',
-                    '70 >> 145',
-                    'Unknown >> Unknown >> 150.0',
-                    'Unknown >> 150',
-                    '70.0 >> 50.0',
-                    '70; 100; 120',
-                    '100; 120; 140',
-                    '100 | 65',
-                    '75.0',
-                    '110',
-                    'Unknown >> 60.0',
-                    '60.0; 100 >> Unknown >> 100.0',
-                    '70.0 >> 105.0',
-                    '25.0 >> 250.0',
-                    '50; 100 | 50; 100',
-                    '35; 280',
-                    '40 | 105',
-                    '190 >> 330.0',
-                    'Unknown >> 100.0 >> 70.0',
-                    '120; 130',
-                    '70; 130 >> 145',
-                    '25; 70 >> 85',
-                    '25 >> 100 >> 70',
-                    '160.0 >> 100.0',
-                    '150.0 >> 110.0',
-                    '130; 160',
-                    '60; 25; 100',
-                    '80; 150',
-                    '190.0',
-                    '25; 60; 65',
-                    '70.0 | Unknown | 130.0',
-                    '90.0; 100.0',
-                    '90 | 150',
-                    '100 >> 100',
-                    '330',
-                    '40; 55; 75; 100',
-                    'Unknown >> 110.0; 120',
-                    '70 >> 140',
-                    'Unknown >> 90',
-                    'Unknown >> Unknown >> 130.0',
-                    '70 >> 75',
-                    '150.0 >> 90.0',
-                    '170; 100',
-                    '65.0 >> 70.0',
-                    '93.0',
-                    '60; 80; 100',
-                    '155.0',
-                    '100.0 >> 130.0',
-                    '25.0 >> 25.0',
-                    '70.0 | 70.0',
-                    '25; 130',
-                    '25 >> 150',
-                    '145.0',
-                    '45; 160',
-                    '65.0 >> 125.0',
-                    'Unknown >> 130.0',
-                    '120; 40',
-                    '90.0 >> 85.0; 160',
-                    '180.0 >> 150.0',
-                    'Unknown >> 90.0 >> 90.0',
-                    '110.0; 100.0',
-                    '70 >> 70.0',
-                    '25',
-                    '70.0 >> 160.0',
-                    '120.0 >> 150.0',
-                    '100.0 >> 150.0',
-                    '140.0 >> 140.0',
-                    '35; 120; 165',
-                    '280.0',
-                    'Unknown >> 60; 70; 80; 90; 100',
-                    '60.0',
-                    '125.0',
-                    '100 >> 90',
-                    '80.0 >> 60.0',
-                    '120.0 >> Unknown',
-                    '70.0 >> Unknown',
-                    'Unknown >> 180; 150',
-                    '130',
-                    '70.0 >> 95.0',
-                    'Unknown >> 250',
-                    'Unknown >> Unknown >> 350.0',
-                    '100.0 >> 75.0 >> Unknown',
-                    '60.0; 100 >> 100.0',
-                    'Unknown >> 150.0; 100',
-                    '400.0',
-                    '70 | 150',
-                    '75 >> 75',
-                    'Unknown >> 180.0',
-                    '80; 25 >> 80',
-                    'Unknown >> 100.0',
-                    'Unknown | 100',
-                    '50.0; 100 >> 150.0',
-                    '90.0 >> 110.0',
-                    '40.0 >> 250.0',
-                    '65; 125',
-                    '50; 85',
-                    'Unknown >> 75.0',
-                    '50; 120',
-                    '115.0',
-                    '70.0 >> 140.0',
-                    'Unknown >> Unknown >> 160',
-                    '50.0; 150.0',
-                    '25; 70; 100; 120',
-                    'Unknown >> 140',
-                    '90 >> Unknown',
-                    '100.0 >> 70.0 >> 130.0',
-                    '90 >> 90',
-                    '60.0; 85.0',
-                    '265.0 >> 100.0',
-                    '80.0 | 150.0',
-                    '100; 180',
-                    '42; 160',
-                    '75; 90',
-                    'Unknown >> 100.0; 140.0',
-                    '140',
-                    '100.0 >> 70',
-                    '70.0 >> 170.0',
-                    '70; 275',
-                    '80 >> 280',
-                    '285',
-                    '55; 250',
-                    '65 >> 100',
-                    '110; 115',
-                    '130.0 >> 120.0',
-                    '150.0 >> 170.0 >> 170.0 >> 170.0',
-                    '80.0 >> 350.0',
-                    'Unknown >> 150; 120',
-                    'Unknown >> 170.0 >> 170.0 >> 170.0',
-                    '550',
-                    '40 >> 180 >> 150',
-                    '120; 200',
-                    '40; 55; 70; 100',
-                    'Unknown >> 150 >> 100',
-                    '25.0; 90.0',
-                    'Unknown >> 160.0 >> 160.0',
-                    'Unknown >> 135.0',
-                    '100 >> 280',
-                    '60 >> 200',
-                    '70 >> 70 >> Unknown',
-                    'Unknown >> 20.0',
-                    '100.0 >> 165.0',
-                    '100',
-                    '75 >> 180',
-                    '100.0',
-                    '105.0',
-                    '40; 70 >> 40; 100',
-                    '65; 185',
-                    '70 >> 100; 120',
-                    '200; 130',
-                    '75 >> 200',
-                    '300.0 >> 150.0',
-                    '50 >> 200; 150',
-                    '80.0 >> Unknown',
-                    '70; 25 >> 25 >> 70',
-                    '60.0; 80',
-                    '60.0 >> 110.0',
-                    '90 >> 160',
-                    '70; 120',
-                    '80 >> 250',
-                    '25; 280',
-                    'Unknown >> Unknown >> 135',
-                    '75; 125',
-                    '50; 100 >> 50; 100',
-                    'Unknown >> Unknown >> 100.0',
-                    '70 >> 150 >> 100',
-                    '70.0 >> 100.0 >> 100',
-                    '300.0 >> 150',
-                    '80 | 80',
-                    '150 >> 25',
-                    '60.0 >> 150.0',
-                    '90.0 >> 70.0',
-                    '70; 100 | 100',
-                    '300 >> Unknown',
-                    '120.0 >> 90.0',
-                    '90.0 >> 250.0 >> Unknown',
-                    '100.0 >> 120.0',
-                    '200.0',
-                    '70.0; 100 >> Unknown',
-                    '300 >> 25 >> 25 >> 25 >> 25 >> 25 >> 25 >> 25 >> 25 >> 25 >> Unknown',
-                    '70.0; 90.0; 100.0',
-                    'Unknown >> 50.0; 80',
-                    '95; 120',
-                    '350.0',
-                    '40; 120',
-                    '72.0 >> Unknown >> 140.0',
-                    '90.0; 120',
-                    '60; 125',
-                    'Unknown',
-                    '70 >> 70; 100; 120',
-                    '90.0 >> 90.0 >> 90.0',
-                    '60; 90',
-                    '90; 100',
-                    '150 >> 280',
-                    '50; 150',
-                    '50; 130',
-                    '40.0; 100.0 >> 40.0; 100.0',
-                    '50; 100',
-                    '110.0; 130.0',
-                    '75 >> 130',
-                    '70.0 >> 115.0',
-                    '100; 140',
-                    '75.0 >> 70.0',
-                    '100.0 >> Unknown >> Unknown >> Unknown >> Unknown',
-                    '100; 85',
-                    '130; 170',
-                    '105.0 >> 110.0',
-                    '25 >> 25',
-                    '25 >> 135',
-                    '60 >> 100.0',
-                    '340.0',
-                    'Unknown >> 170.0',
-                    '70.0 >> 25.0',
-                    '120.0 >> 120',
-                    '101.0 >> 100.0',
-                    '70; 175',
-                    'Unknown >> 125.0',
-                    'Unknown >> 160.0',
-                    '110.0 >> 100.0',
-                    '85.0 >> 150.0',
-                    '80 >> 90',
-                    '160.0',
-                    '40 >> 100',
-                    '70 | 100',
-                    '25; 80; 85; 90',
-                    '60.0 >> 105.0',
-                    '110.0 >> 75.0',
-                    '100; 130',
-                    '50; 140',
-                    '90; 150',
-                    '270.0',
-                    '50; 75; 100',
-                    '70; 100',
-                    '25 >> 25 >> 100',
-                    '170.0',
-                    'Unknown >> 110.0',
-                    '75; 100',
-                    '120.0 >> 90.0 >> 80.0',
-                    '100.0 >> 70.0',
-                    '150 >> 150 >> 150',
-                    '150.0 >> 70',
-                    '80 >> 150',
-                    '25; 85',
-                    '170',
-                    '200',
-                    '70 >> 130',
-                    '320; 300',
-                    '25; 60; 100',
-                    'Unknown >> 115.0; 100',
-                    '70; 70 >> 145',
-                    '100; 300 >> 100',
-                    '55.0',
-                    '65.0; 100.0',
-                    'Unknown | 115.0',
-                    '90 | Unknown',
-                    '77',
-                    '60; 105',
-                    '105.0 >> Unknown',
-                    '130; 130',
-                    '50; 250',
-                    '100.0 >> 140.0',
-                    '25; 75 >> 135',
-                    '340',
-                    '50; 60; 70; 100',
-                    '22.5; 70; 180',
-                    '100.0; 120.0',
-                    '70.0 >> 70.0',
-                    '100 >> 250',
-                    '180; 105',
-                    '95.0 >> 60.0',
-                    '40; 110 >> 110',
-                    '60.0 >> 60.0 >> 60.0 >> Unknown',
-                    '110.0 >> 145.0',
-                    '65.0; 100',
-                    '145',
-                    '80.0 >> 150.0',
-                    'Unknown >> 280',
-                    '100; 500 >> 110',
-                    '70 >> Unknown >> 150',
-                    '25; 150',
-                    '80.0 >> 100.0',
-                    '25; 100.0',
-                    '25; 120',
-                    '44.0',
-                    '110.0 >> 120.0',
-                    'Unknown >> 100.0; 150',
-                    '90.0 >> 70.0; 100.0',
-                    '100.0 >> 280.0',
-                    '80; 100',
-                    '90; 120',
-                    'Unknown >> 65; 100',
-                    '50; 100; 160',
-                    '35; 85',
-                    'Unknown >> 170.0 >> Unknown',
-                    '550.0',
-                    '100 >> 25; 25',
-                    '70; 150 >> 100',
-                    '300.0',
-                    '120.0 >> 135.0',
-                    'Unknown >> 40.0; 100',
-                    '185.0',
-                    '3; 5 >> 5',
-                    '90; 120 >> 100',
-                    '120.0',
-                    '0.0; 90.0',
-                    '110.0 >> 110.0',
-                    '450.0',
-                    '90.0 >> 120.0',
-                    '40.0; 100 >> 90.0 >> Unknown',
-                    '25 >> 25 >> 70',
-                    '150 >> 150',
-                    '70; 150 >> 400',
-                    '70 >> 90',
-                    'Unknown >> 90.0; 120.0; 150.0',
-                    '130.0',
-                    '70.0 >> 150.0',
-                    'Unknown >> 95.0',
-                    '40.0 >> 100.0',
-                    '100.0; 100.0',
-                    '60.0; 100.0',
-                    '50.0 >> 50.0 >> 50.0 >> Unknown',
-                    '25.0 >> 110.0',
-                    '75',
-                    '110.0',
-                    '70.0; 100.0',
-                    '310.0',
-                    '25.0; 100.0',
-                    '100.0; 150.0',
-                    '220',
-                    '25 >> 70',
-                    '70.0 >> 95.0 >> 95.0',
-                    '25.0 >> 150.0',
-                    'Unknown >> 200.0',
-                    '100; 25 >> 25 >> 25',
-                    '345.0',
-                    '50.0; 85.0',
-                    'Unknown >> 105.0',
-                    '60.0; 100 >> 60; 100',
-                    '110; 130; 150',
-                    'Unknown >> 250.0',
-                    '100.0; 280.0',
-                    '170; 330',
-                    '100.0 >> 150',
-                    '225.0',
-                    '60.0; 100 >> Unknown',
-                    '70; 90 >> 70.0',
-                    '160',
-                    '80.0; 100.0',
-                    'Unknown >> 120.0 >> 145.0',
-                    '60.0 >> 70.0',
-                    '25 >> 85',
-                    '170; 150',
-                    '100.0 | 100.0',
-                    '70 >> 125',
-                    '40.0; 160.0',
-                    '40.0 >> 40.0',
-                    '56; 240',
-                    '100 >> 110; 100',
-                    '100 | 100 >> 100',
-                    '70 >> 75; 70',
-                    '40 >> 100 >> 100',
-                    '100.0 >> 155.0 >> 150.0',
-                    '70; 100 >> 100',
-                    '310.0 >> 150.0',
-                    '100 >> 100; 100',
-                    'Unknown >> 265.0',
-                    '100 >> 110',
-                    '10.0',
-                    '70',
-                    '140.0 >> 160.0',
-                    '110.0 | 150.0',
-                    '220; 105',
-                    '70 >> 70.0 >> 70',
-                    '42.0',
-                    '150; 25 >> 100',
-                    '70.0 >> 70.0 >> 70.0',
-                    '150 >> 100',
-                    '70 | 70',
-                    '200.0 >> 80.0 >> 80.0',
-                    'Unknown >> 120',
-                    '250 | 100',
-                    '60; 120',
-                    '210.0',
-                    'Unknown >> 100.0 >> Unknown',
-                    '85.0 >> 100.0',
-                    '75 >> 135',
-                    '130.0 >> Unknown',
-                    '43 >> 160',
-                    '60; 110',
-                    '90.0 >> 115.0',
-                    '80.0 >> 80.0',
-                    '70; 100 >> 135',
-                    '120.0; 150.0',
-                    'Unknown >> 85.0',
-                    '50.0 >> 70.0',
-                    '70.0 >> 100.0; 150.0',
-                    '95.0 >> 100.0',
-                    '350',
-                    '75.0 >> 75.0',
-                    '100.0 >> Unknown >> Unknown',
-                    '32.0',
-                    '100.0 >> 50.0; 250',
-                    '40.0 >> Unknown',
-                    '100.0 >> 155.0',
-                    '60; 250',
-                    '100; 160',
-                    '90; 125',
-                    '60.0 >> 60.0 >> 60.0 >> 60.0',
-                    '25.0 >> 70.0',
-                    'Unknown >> 85.0 >> 85.0',
-                    '70.0 >> 135.0',
-                    '110; 25',
-                    '130; 100',
-                    'Unknown >> 110',
-                    '70.0 >> 70.0 >> Unknown',
-                    '100.0 >> 140',
-                    'Unknown >> 150.12',
-                    'Unknown >> 380.0',
-                    '25; 90; 100; 130',
-                    'Unknown >> 350.0',
-                    '45; 55; 75; 100',
-                    '60; 130',
-                    '60; 80; 140',
-                    '25 >> 120',
-                    '100.0 >> 25.0 >> 25.0',
-                    '5; 95.0',
-                    '80; 150; 350',
-                    '80; 140; 160',
-                    '265.0 >> 200.0',
-                    '200; 170',
-                    '150',
-                    '45.0 >> 100.0; 150',
-                    '90 >> 100',
-                    'Unknown | 125',
-                    '160.0; 100',
-                    '260.0 >> Unknown',
-                    '250.0 >> 80.0',
-                    '80.0 >> 50.0; 120',
-                    '65; 100',
-                    '85.0 >> 250.0',
-                    '150.0 >> Unknown',
-                    '50; 100; 120 >> 25',
-                    '30.0',
-                    '55',
-                    'Unknown >> 80',
-                    '80; 90; 100; 110',
-                    '60.0 >> 140.0',
-                    'Unknown >> 175.0',
-                    '100 >> Unknown >> Unknown',
-                    '100; 150',
-                    '70; 150',
-                    '50; 60; 70; 80; 90; 100',
-                    '25; 70',
-                    '70.0 | 150.0',
-                    '40; 100',
-                    '25 >> 140',
-                    '100.0 >> 110',
-                    '70.0 >> 110.0 >> 40.0',
-                    '25 >> 100',
-                    '100 >> 75',
-                    '335.0',
-                    '95.0 >> Unknown',
-                    'Unknown >> 145.0',
-                    '70.0 >> 175.0',
-                    '125.0 >> 160.0',
-                    '80; 120',
-                    'Unknown >> 115.0',
-                    'Unknown >> 300.0',
-                    '65.0 >> 100',
-                    '25; 280 >> Unknown',
-                    '120.0 >> 250.0',
-                    '150 | 100',
-                    '70.0; Unknown',
-                    '90; 25 >> 25 >> 120',
-                    '55.0; 60.0; 100.0',
-                    '100 >> 100 >> 100',
-                    '158.0',
-                    '60 >> 150',
-                    '50.0; 100 >> 100.0',
-                    '80',
-                    '75.0; 150.0',
-                    '50 >> 280',
-                    '120',
-                    '1000.0 >> Unknown',
-                    '100.0; 150',
-                    '60; 100 >> 100',
-                    '140.0',
-                    '65; 75; 85; 95',
-                    '25; 100; 25 >> 100',
-                    '80.0',
-                    '60',
-                    '320.0',
-                    '70 >> 150 >> 70',
-                    '150.0 >> 120.0',
-                    '120.0 >> 120.0',
-                    '80.0 >> 70.0',
-                    'Unknown >> 100.0 >> 100.0',
-                    '60 >> 60 >> 60.0',
-                    '70.0 >> 70.0 >> 70.0 >> Unknown',
-                    '125.0 >> 125.0',
-                    '100 >> 25',
-                    '100.0 >> 100.0 >> 100',
-                    '130; 140',
-                    '130; 120',
-                    'Unknown >> 60.0; 100',
-                    '70.0 >> 250.0',
-                    '100.0; 140.0',
-                    '310',
-                    '45; 120',
-                    '60.0 >> Unknown',
-                ]
+                suggestions=get_suggestions(
+                    'perovskite_deposition', 'thermal_annealing_temperature'
+                )
             ),
         ),
     )
@@ -3638,774 +1505,9 @@ Example
         a_eln=dict(
             component='EnumEditQuantity',
             props=dict(
-                suggestions=[
-                    '90.0',
-                    'Unknown >> Unknown >> 60.0',
-                    '45.0 >> 5.0',
-                    '5.0; 20.0',
-                    'Unknown >> 25.0',
-                    '50.0',
-                    '3.0 >> 3.0; 35.0',
-                    '5.0 >> 5.0 >> 10.0',
-                    '600.0 >> 30.0',
-                    '1.0; 1.0; 10.0',
-                    '180.0',
-                    '45.0',
-                    '10.0 >> 70.0',
-                    '0.083',
-                    '0.0; 5.0',
-                    '5.0; 5.0; 5.0; 5.0',
-                    '0.133',
-                    '3.0; 10.0 >> 3.0; 10.0',
-                    '1.0; 2.0',
-                    'Unknown >> Unknown >> 20.0',
-                    '60.0 >> 60.0; 10.0',
-                    '2880.0 >> 1.0 >> 1.0 >> 15.0',
-                    'Unknown >> 90.0',
-                    '30.0 >> 60.0 >> 30.0',
-                    '2.0; 28.0',
-                    '720.0 >> 3.0',
-                    '1.0 >> 1.0',
-                    '10.0; 10.0 >> 30.0',
-                    '4.0; 1.0',
-                    'Unknown >> 720.0',
-                    '0.1666',
-                    '60.0 >> 2.0 >> Unknown',
-                    '3.0 >> 2.0',
-                    '5.0; 10.0 >> 10.0',
-                    '15.0; 50.0',
-                    '20.0 >> 40.0',
-                    '30.0; Unknown >> Unknown >> 30.0',
-                    '5.0 >> Unknown >> Unknown',
-                    '0.0',
-                    '0.066',
-                    '5760.0',
-                    '15.0 >> 15.0 >> 15.0',
-                    '60.0 >> 5.0 >> 5.0 >> 5.0',
-                    '15.0; 10.0 >> Unknown',
-                    '10.0 >> 10.0 >> 30.0',
-                    '0.07',
-                    'Unknown >> 15.0; 60.0',
-                    '0.0 >> 0.0 >> 0.0 >> 0.0 >> 0.0 >> 0.0 >> 0.0 >> 0.0 >> 0.0',
-                    '0.33; 60.0',
-                    '120.0 >> 30.0',
-                    '3.0; 20.0',
-                    '8.0 >> 120.0',
-                    '4.0 >> 30.0',
-                    '2.0; 30.0',
-                    '30.0; 5.0',
-                    '60.0; 10.0 >> 10.0',
-                    '1.0 >> 25.0',
-                    '5.0 >> 40.0',
-                    '95.0',
-                    '0.05',
-                    '3.0; 5.0 >> 3.0; 5.0',
-                    'Unknown >> 600.0; 10.0',
-                    'Unknown >> 3.0; 15.0',
-                    'Unknown >> 3.0; 30.0',
-                    '5.0 >> 30.0 >> 30.0',
-                    '3.0 >> 5.0',
-                    '70.0',
-                    '10.0 >> 30.0',
-                    '10.0 >> 60.0 >> Unknown',
-                    'Unknown >> 10.0; 20.0',
-                    'Unknown; Unknown; Unknown; 30.0',
-                    '2.0; 20.0',
-                    '11.0',
-                    '45.0 >> 45.0',
-                    '1.5; 2.0',
-                    '1.3 >> 10.0 >> 8.0',
-                    '15.0; 10.0; 60.0',
-                    '15.0 >> 5.0',
-                    '60.0 >> 90.0 >> 90.0',
-                    '3.0; 10.0 >> 3.0; 30.0',
-                    '0.0 >> 40.0',
-                    '10.0; 5.0; 2.0; 3.0; 50.0',
-                    '5.0; 10.0; 5.0',
-                    '0.016 >> 5.0',
-                    '1.0',
-                    '10.0; 20.0; 10.0',
-                    '60.0 >> 90.0',
-                    '10.0; 50.0',
-                    '1.0 >> 10.0',
-                    '60.0; 60.0',
-                    '15.0; 25.0; 5.0',
-                    '600.0 >> Unknown',
-                    '60.0; 35.0',
-                    '45.0 >> 10.0',
-                    '25.0; 60.0',
-                    '2.0 >> 2.0 >> 45.0',
-                    '1.5 | 20.0',
-                    '10.0 >> 0.5',
-                    '5.0; 15.0',
-                    '10.0 >> 15.0; 30.0',
-                    '30.0 >> 60.0',
-                    '10.0; 2.0',
-                    'Unknown >> Unknown >> 15.0 >> 15.0',
-                    '15.0 >> 60.0',
-                    '0.05; 30.0',
-                    '10.0 >> Unknown >> Unknown',
-                    'Unknown >> 15.0',
-                    '15.0 >> 4.0',
-                    '15.0; 15.0; 15.0; 15.0',
-                    '5.0; 30.0',
-                    'Unknown >> 150.0',
-                    '0.5 >> 40.0',
-                    '3.0 >> 120.0',
-                    'Unknown >> 320.0',
-                    '240.0',
-                    '5.0; 5.0',
-                    '10.0; 10.0; 10.0; 10.0; 10.0; 50.0',
-                    '5.0 >> 10.0 >> 10.0',
-                    'Unknown >> 10.0; 40.0',
-                    '10.0 >> 30.0 >> 30.0',
-                    '10.0; 85.0; 10.0 >> Unknown',
-                    '15.0; Unknown',
-                    'Unknown >> Unknown',
-                    'Unknown >> 6.0 >> Unknown',
-                    '160.0; 17.0',
-                    '15.0; 3.0',
-                    '0.5; 30.0',
-                    '15.0 | Unknown',
-                    '2.0; 60.0',
-                    '2.0; 3.0',
-                    '10.0 >> 5.0',
-                    '20.0 >> 15.0 >> 1.0',
-                    '5.0 | Unknown | Unknown | 60.0',
-                    'Unknown >> 240.0',
-                    '15.0; 30.0',
-                    'Unknown >> 5.0 >> 100.0',
-                    '5.0; 5.0; 30.0',
-                    'Unknown >> 30.0 >> 30.0',
-                    '1.0 >> 1.0 >> 1.0 >> 2.0',
-                    '3.0; 30.0',
-                    '60.0 >> 120.0',
-                    '1.0; 15.0',
-                    '1.0; 10.0 >> Unknown',
-                    '15.0 >> Unknown',
-                    '30.0 >> 60.0 >> Unknown',
-                    '10.0 >> 2.0',
-                    'Unknown >> 6.0',
-                    '9.0',
-                    '1.0; 4.0',
-                    '50.0 >> 5.0',
-                    '30.0 >> 2.0',
-                    '1.0; 80.0',
-                    'Unknown >> 2.0 >> 2.0',
-                    '10.0; 1.0',
-                    '0.5; 30.0 >> 0.5',
-                    '30.0 >> 30.0; 0.0',
-                    '8.0',
-                    '10.0; 10.0 >> 90.0',
-                    '2.0; 25.0',
-                    '40.0; 10.0; 10.0; 20.0',
-                    '5.0 >> 150.0',
-                    '60.0 >> 16.0 >> Unknown >> 60.0',
-                    '13.0',
-                    '0.0 >> 30.0',
-                    '0.33 >> 20.0',
-                    '1.0; 1.0',
-                    '30.0 >> 480.0',
-                    '3.0 | 5.0 | 5.0',
-                    'Unknown >> 120.0',
-                    'Unknown >> 30.0',
-                    '20.0 >> 45.0',
-                    '30.0 >> 65.0',
-                    '10.0 >> 10.0 >> 60.0',
-                    'Unknown >> 45.0',
-                    '20.0',
-                    '30.0; 2.0',
-                    '15.0; 5.0',
-                    '10.0; 10.0 >> 180.0',
-                    '60.0 >> 1.0 >> 1.0 >> 15.0',
-                    '20.0 >> 120.0',
-                    '2.0 >> 540.0',
-                    '15.0; 90.0; 15.0',
-                    '90.0; 10.0',
-                    '15.0 >> 2.0',
-                    '30.0; 30.0; 10.0',
-                    '40.0 >> 10.0',
-                    '0.5 >> 5.0',
-                    '25.0 | 30.0',
-                    '5.0; 120.0; 100.0; 130.0',
-                    '2.0 >> 15.0',
-                    '25.0 >> 30.0',
-                    '30.0 >> Unknown',
-                    '5.0; 2.0',
-                    '30.0 >> 5.0',
-                    '5.0; 10.0',
-                    '20.0 >> 10.0',
-                    '4.0; 20.0',
-                    '45.0; 50.0',
-                    '0.0; 20.0',
-                    '3.0; 5.0; 10.0',
-                    '60.0 >> 30.0 >> 5.0',
-                    'Unknown; 2.0',
-                    '50.0 >> Unknown',
-                    '10.0 >> 90.0',
-                    '10.0 | 20.0',
-                    '14.0',
-                    '0.5 >> 30.0',
-                    '0.0 >> 30.0 >> 10.0',
-                    '10.0 >> 10.0 >> 90.0',
-                    '10.0; 10.0 >> 150.0',
-                    '50.0 >> 50.0',
-                    '90.0 >> 10.0',
-                    '30.0 >> 11.5',
-                    '20.0; 10.0',
-                    '0.5; 0.5',
-                    '360.0 >> 30.0',
-                    '5.0 >> 25.0',
-                    'Unknown >> 10.0',
-                    '3.0; 5.0 >> 10.0',
-                    '10.0 | 10.0',
-                    '45.0 | 5.0',
-                    '30.0; 30.0',
-                    '65.0',
-                    '20.0 >> 30.0',
-                    'Unknown; 5.0',
-                    '20.0 >> Unknown',
-                    '150.0',
-                    '10.0; 15.0',
-                    '1.0; 60.0',
-                    '0.0 >> 60.0',
-                    '7.0 >> 30.0',
-                    'Unknown >> 420.0',
-                    '3.0; 12.0',
-                    '45.0 >> 60.0',
-                    'Unknown >> 70.0',
-                    'Unknown >> 5.0',
-                    'Unknown >> 5.0; 60.0',
-                    '60.0; 150.0; 15.0',
-                    '4.0; 30.0',
-                    '30.0; 180.0',
-                    'Unknown >> 80.0',
-                    '150.0; 20.0',
-                    '0.3; 50.0',
-                    '2.0; 5.0',
-                    '3.0 >> 40.0',
-                    '0.08; 15.0',
-                    '30.0 | 30.0',
-                    'Unknown >> Unknown >> Unknown >> 120.0',
-                    '10.0; 10.0; 10.0; 30.0',
-                    '5.0 >> 65.0',
-                    '10.0; 600.0; 90.0',
-                    '60.0 >> 60.0',
-                    'Unknown >> 40.0',
-                    '10.0; 5.0',
-                    '0.0 | 15.0',
-                    '150.0; 15.0 >> 30.0',
-                    '1.5; 25.0',
-                    '0.16; 14.0',
-                    '10.0; 10.0 >> Unknown >> 10.0',
-                    '5.0; 10.0 >> 5.0; 10.0',
-                    '0.3',
-                    '10.0; 10.0 >> 60.0',
-                    'Unknown >> 50.0',
-                    '0.12',
-                    '10.0 >> 60.0',
-                    'Unknown >> 140.0',
-                    '5.0; 5.0 >> 5.0; 5.0',
-                    '35.0',
-                    '20.0; 20.0',
-                    '15.0; 60.0',
-                    'Unknown >> Unknown >> 30.0',
-                    '120.0 >> 20.0',
-                    '5.0 >> 15.0 >> 15.0',
-                    '4.0 >> 20.0',
-                    '30.0 >> 45.0',
-                    '1.0 >> 40.0',
-                    '30.0 | 10.0',
-                    '30.0 >> 90.0',
-                    '10.0 >> 0.17',
-                    '30.0; 60.0',
-                    '5.0; 15.0 >> 90.0 >> 5.0',
-                    '90.0; 5.0',
-                    '30.0 >> 30.0 >> 30.0',
-                    '0.0 >> 10.0',
-                    '30.0 >> 40.0',
-                    '2.0; 2.0; 2.0; 60.0',
-                    '33.0',
-                    '7200.0',
-                    '60.0; 10.0',
-                    '1.0 >> 7.0',
-                    '2.5',
-                    '2.0 >> 20.0',
-                    '15.0 >> 12.0',
-                    'Unknown >> 1.0; 20.0',
-                    'Unknown >> 10.0 >> 15.0',
-                    '15.0; 10.0',
-                    '0.25; 5.0',
-                    '10.0 >> 1.0 >> 30.0',
-                    'Unknown | 30.0',
-                    '2.0 | 20.0',
-                    'Unknown >> Unknown >> 10.0',
-                    '20.0 | 20.0',
-                    '10.0 >> 150.0',
-                    'Unknown >> 600.0',
-                    '5.0; 5.0; 5.0; 30.0',
-                    '10.0 >> 50.0',
-                    '181.0 >> 30.0',
-                    '0.5; 10.0',
-                    '60.0 >> 15.0 >> 10.0',
-                    '23.0',
-                    '30.0 >> Unknown >> Unknown',
-                    '15.0; Unknown >> 15.0',
-                    '10.0 | 60.0',
-                    '5.0; 2.0; 3.0; 50.0',
-                    '0.25',
-                    '2.0 >> 10.0',
-                    '15.0 >> 120.0',
-                    '10.0; 10.0 >> 5.0',
-                    '1.0 >> 3.0',
-                    '10.0 >> 1.0',
-                    '5.0; Unknown >> Unknown >> 90.0',
-                    '30.0 | Unknown',
-                    '25.0',
-                    '30.0; 150.0',
-                    '1.3 >> 10.0 >> 10.0',
-                    '5.0 >> 1.0',
-                    '1.0 | 20.0',
-                    '15.0 >> 20.0',
-                    'Unknown >> 0.5',
-                    '10.0 >> 5.0 >> Unknown',
-                    '15.0 >> 6.0',
-                    '1.0 >> 120.0',
-                    '80.0 >> 250.0',
-                    '0.0 >> 20.0',
-                    'Unknown >> 35.0',
-                    '1.0 >> 20.0',
-                    '40.0',
-                    '1.0 >> 70.0',
-                    '20.0; 40.0',
-                    '30.0 | 20.0',
-                    '2.0 >> 25.0',
-                    '5.0 >> 0.0',
-                    '120.0 >> 60.0',
-                    '144.0',
-                    'Unknown >> Unknown >> 120.0',
-                    '2.0; 10.0',
-                    'Unknown >> Unknown; Unknown',
-                    'Unknown >> Unknown >> 150.0',
-                    'Unknown | 20.0',
-                    '0.08; 30.0',
-                    'Unknown >> Unknown >> 180.0',
-                    '10.0 >> 1.7',
-                    '0.33 >> 10.0',
-                    '10.0 >> 8.0',
-                    '10.0; 20.0; 5.0; 30.0',
-                    '2.0 >> 5.0',
-                    '75.0',
-                    'Unknown >> 60.0',
-                    '30.0 >> 50.0; 30.0',
-                    '60.0 >> 30.0',
-                    '250.0 >> 30.0',
-                    '60.0 >> 20.0',
-                    '50.0 >> 20.0',
-                    '20.0 >> 120.0; 2.0',
-                    '480.0',
-                    '90.0; 70.0; 45.0',
-                    '60.0 >> 15.0',
-                    '3.0; 5.0; 10.0 >> Unknown',
-                    '30.0 >> 15.0',
-                    '2.0 >> 390.0',
-                    '60.0; 90.0',
-                    '25.0 >> 25.0',
-                    '10.0; 30.0',
-                    '75.0; 15.0 >> 5.0',
-                    '15.0 >> 0.0',
-                    '11.0 >> 30.0',
-                    '30.0 >> 150.0',
-                    '720.0 >> 15.0',
-                    'Unknown; 0.5; 3.0',
-                    '30.0; Unknown',
-                    '15.0 >> 15.0',
-                    '31.0 >> 30.0',
-                    '10.0 >> 10.0 >> 5.0',
-                    '10.0; 420.0; 90.0',
-                    '50.0; 30.0',
-                    '20.0 >> 20.0',
-                    '60.0; 2880.0',
-                    '45.0 >> 10.0; 30.0',
-                    '10.0 >> Unknown',
-                    '5.0 >> 60.0',
-                    '5.0; 5.0 | 5.0; 5.0',
-                    '60.0',
-                    '5.0',
-                    '0.6',
-                    '45.0; 70.0',
-                    '7.0',
-                    '120.0 >> Unknown',
-                    '70.0 >> Unknown',
-                    '0.07 >> 0.07',
-                    '30.0; 30.0; 30.0',
-                    '3.0; 60.0',
-                    '3.0; 5.0',
-                    '122.0',
-                    '60.0 >> 10.0 >> 10.0',
-                    '5.0 >> 390.0',
-                    'Unknown >> 180.0',
-                    'Unknown >> 100.0',
-                    '15.0 >> 600.0',
-                    '20.0; 20.0; 20.0; 40.0',
-                    '1.5',
-                    'Unknown >> 75.0',
-                    '3.0; 2.0',
-                    '3.0 >> Unknown',
-                    '2.0',
-                    'Unknown >> 10.0; 10.0; 10.0; 10.0; 40.0',
-                    '5.0 >> 10.0',
-                    '10.0; 10.0; 50.0',
-                    '20.0; 5.0',
-                    '10.0 >> 10.0 >> 180.0',
-                    '1.0; 8.0',
-                    '10.0 >> Unknown >> Unknown >> Unknown',
-                    '10.0 >> 80.0',
-                    '5.0 >> 5.0; 80.0',
-                    '10.0 >> 75.0',
-                    '5.0 >> 30.0',
-                    '0.66',
-                    '5.0 >> 20.0',
-                    '4.0',
-                    '120.0; 20.0',
-                    'Unknown >> 0.333333333',
-                    '121.0',
-                    '1.0 | Unknown',
-                    '12.0 >> 60.0',
-                    '5.0 >> 5.0; 10.0; 10.0',
-                    '180.0 >> 30.0',
-                    '60.0 >> 5.0 >> Unknown',
-                    '10.0; 4.0',
-                    '30.0; 90.0',
-                    '100.0; 20.0',
-                    '15.0 >> 30.0',
-                    '6.0 >> 30.0',
-                    '10.0 | 1.4',
-                    '60.0; 25.0',
-                    '600.0',
-                    '12.0',
-                    '5.0 >> 2.0',
-                    'Unknown | 120.0',
-                    '5.0; 5.0 | Unknown',
-                    'Unknown >> 20.0',
-                    '16.0 >> 30.0',
-                    '100.0',
-                    'Unknown >> 5.0 >> 20.0',
-                    '105.0',
-                    '10.0 >> 10.0 >> 10.0',
-                    '2.0 >> Unknown',
-                    '15.0 >> 45.0',
-                    '13.0 >> 60.0',
-                    '720.0',
-                    '10.0 >> 10.0',
-                    'Unknown >> 45.0 >> Unknown',
-                    '30.0; Unknown >> 30.0',
-                    '10.0; 10.0 >> 120.0',
-                    '3.0; 10.0',
-                    '3.0; 5.0 >> 30.0',
-                    'Unknown >> Unknown >> 90.0',
-                    'Unknown; Unknown',
-                    '10.0 >> 15.0',
-                    '20.0 >> 30.0 >> Unknown',
-                    '100.0 >> 2.0',
-                    '5.0 >> 10.0; 10.0',
-                    '15.0; 0.17 >> 4.0',
-                    '0.5',
-                    '0.3; 2.0',
-                    '10.0 >> Unknown >> Unknown >> Unknown >> Unknown',
-                    '2.0; 5.0 >> Unknown',
-                    'Unknown >> 5.0; 5.0; 5.0',
-                    '0.83; 0.83',
-                    '2.0 >> 60.0',
-                    '3.0 >> 5.0 >> 5.0',
-                    '1.0; 2.0 >> Unknown',
-                    '60.0 >> 5.0',
-                    'Unknown >> Unknown >> 5.0',
-                    '5.0; 2.0; 5.0',
-                    '5.0; 5.0 >> 5.0',
-                    '10.0 >> 0.0 >> 0.0 >> 0.0 >> 0.0 >> 0.0 >> 0.0 >> 0.0 >> 0.0 >> 0.0',
-                    '90.0; 15.0',
-                    'Unknown >> Unknown >> Unknown >> 1.0',
-                    '200.0',
-                    '5.0 >> 150.0 >> 20.0',
-                    '20.0 >> 5.0',
-                    'Unknown; 10.0',
-                    '10.0; 20.0; 0.0',
-                    '10.0 >> 20.0; 60.0',
-                    '15.0; 15.0; 90.0',
-                    '1.2',
-                    '30.0; 60.0 >> 60.0',
-                    '15.0 | 60.0',
-                    '3.0; 50.0',
-                    '60.0; 1440.0',
-                    '3.0',
-                    '1.0 >> 2.0',
-                    '10.0; 90.0',
-                    '5.0; Unknown >> Unknown >> 10.0',
-                    'Unknown',
-                    '10.0 | 30.0',
-                    '10.0 >> 40.0',
-                    'Unknown >> 260.0',
-                    '2.0 >> 100.0',
-                    'Unknown >> 0.0',
-                    '0.16 >> 15.0',
-                    '60.0; 720.0',
-                    '5.0; 60.0',
-                    '60.0; 10.0 >> 5.0; 10.0',
-                    '2.0; 6.0 >> 8.0',
-                    '10.0 >> 4.0',
-                    '1.0 | 10.0',
-                    '10.0 | 120.0',
-                    '1.0; 7.0',
-                    '15.0 >> 150.0',
-                    'Unknown >> Unknown >> Unknown >> 20.0',
-                    '7.0; 1.0 >> 10.0',
-                    '45.0; 45.0',
-                    'Unknown >> 10.0 >> 10.0',
-                    'Unknown >> 40.0; 100.0; 130.0',
-                    '5.0; Unknown >> Unknown >> 30.0',
-                    '2.0 >> 0.17',
-                    '60.0; 15.0',
-                    '15.0; 15.0 >> 15.0',
-                    '10.0; 10.0; 0.0',
-                    '30.0 >> 30.0',
-                    '30.0; 150.0; 15.0',
-                    '15.0; 15.0',
-                    '20.0; 30.0',
-                    '2.0; 30.0 >> 2.0; 30.0',
-                    '10.0; 45.0',
-                    '1.0 >> 30.0',
-                    '0.17; 12.0',
-                    '4.0 >> 4.0',
-                    '15.0 >> 30.0 >> 10.0',
-                    '0.17; 75.0',
-                    '38.0',
-                    '120.0 >> 1.0 >> 1.0 >> 15.0',
-                    '10.0 >> 10.0 >> Unknown',
-                    '30.0 >> 10.0 >> 10.0 >> 6.0',
-                    '270.0',
-                    '0.33; 2.0',
-                    'Unknown >> 10.0; 60.0',
-                    '15.0; 90.0; 60.0',
-                    'Unknown >> 4.0',
-                    '5.0; 30.0; 5.0; 30.0',
-                    '3.0 >> 30.0',
-                    '4.0; 10.0',
-                    '3.0; 5.0 >> 15.0 >> Unknown',
-                    '10.0 >> 20.0',
-                    '15.0; 15.0; 120.0; 15.0',
-                    '10.0 >> 110.0',
-                    '4.0 >> 45.0',
-                    '55.0',
-                    '1.0 | 15.0',
-                    '10.0; 60.0; 90.0',
-                    '60.0; 30.0',
-                    '10.0 >> 3.0',
-                    '1.3 >> 10.0',
-                    '50.0 | 10.0 >> 10.0',
-                    '0.33 >> 15.0',
-                    'Unknown >> 360.0; 10.0',
-                    '6.0',
-                    '30.0; 20.0',
-                    '5.0; 60.0; 10.0',
-                    '30.0 >> 18.5',
-                    'Unknown >> 12.0',
-                    '30.0; 30.0 >> 30.0',
-                    '60.0 >> 10.0',
-                    '10.0 >> 10.0 >> 120.0',
-                    '30.0 >> 120.0',
-                    '3.0 >> 10.0',
-                    '15.0 >> 90.0',
-                    '30.0 >> 20.0',
-                    '3.0 >> 2.0; 20.0',
-                    '15.0 >> 10.0',
-                    '5.0 | 12.0',
-                    '5.0 | 60.0',
-                    '30.0 >> 0.0 >> 120.0',
-                    '2.0; 2.0',
-                    'Unknown; 20.0 >> 20.0',
-                    '3.0; 6.0 >> 10.0',
-                    '0.33; 10.0',
-                    'Unknown >> 0.8541666666666666',
-                    '2.0; 15.0',
-                    '1.0 >> 1.0 >> 2.0',
-                    '1.0 >> 15.0',
-                    '15.0',
-                    '1.0 >> 60.0',
-                    '10.0 >> 10.0; 15.0',
-                    '45.0 >> 30.0',
-                    '30.0 >> 1.0',
-                    'Unknown | 10.0',
-                    '0.58 >> 5.0',
-                    'Unknown >> 2.0 >> 3.0',
-                    '45.0 >> Unknown',
-                    '300.0',
-                    '40.0; 100.0 >> 100.0',
-                    'Unknown >> 60.0 >> Unknown',
-                    '2.0; 6.0',
-                    '120.0 >> 20.0 >> 5.0',
-                    '10.0; 20.0; 20.0; 20.0',
-                    '20.0 >> 15.0',
-                    '15.0; Unknown >> 25.0 >> Unknown',
-                    '120.0',
-                    '0.5; 60.0',
-                    '0.4305555555555556',
-                    '20.0; 20.0; 20.0',
-                    'Unknown >> Unknown >> 15.0',
-                    'Unknown >> 10.0; 10.0; 10.0',
-                    '5.0; 10.0 >> 30.0',
-                    '40.0 >> 120.0',
-                    '0.5; 15.0',
-                    '1.0; 3.0',
-                    '12.0; 10.0',
-                    '5.0; Unknown >> Unknown >> 60.0',
-                    '2.0; 5.0; 10.0',
-                    '2.0 | Unknown',
-                    '0.17',
-                    '110.0',
-                    '5.0 >> 12.0',
-                    '20.0 | 15.0',
-                    '1.0; 5.0',
-                    '120.0 >> Unknown >> Unknown',
-                    '1.0; 10.0',
-                    '10.0 >> 10.0 >> 240.0',
-                    'Unknown; Unknown >> 30.0',
-                    '10.0 >> 10.0; 20.0',
-                    '2.0 >> 2.0',
-                    '5.0; 0.0',
-                    'Unknown >> 10.0; 120.0',
-                    '1.0 >> 16.0',
-                    '5.0 >> 95.0',
-                    '15.0; 120.0; 15.0',
-                    '10.0 >> 0.0',
-                    '15.0 >> 10.0 >> 10.0',
-                    'Unknown >> 200.0',
-                    '5.0 >> 312.0',
-                    'Unknown >> 105.0',
-                    '3.0 | 10.0',
-                    '3.0 >> 5.0 >> 90.0',
-                    '2.0; 4.0',
-                    '50.0; 5.0 >> 5.0',
-                    'Unknown >> 10.0 >> 60.0',
-                    '0.1',
-                    '10.0; 300.0; 90.0',
-                    '15.0; 15.0; 90.0; 10.0',
-                    '15.0 | 15.0',
-                    '3.0; 5.0; 60.0',
-                    '2.0 >> 45.0',
-                    '0.13',
-                    '2.0 >> 30.0',
-                    'Unknown >> 1.0',
-                    '7.0 >> 1.0',
-                    '15.0; 45.0',
-                    '2.0 >> 120.0',
-                    '40.0 >> 40.0',
-                    '10.0 >> 10.0 >> 10.0 >> 10.0',
-                    '10.0',
-                    '10.0; 40.0',
-                    '10.0; 10.0; 10.0; 10.0; 40.0',
-                    'Unknown >> 18.0',
-                    '5.0 >> 15.0',
-                    '5.0 >> 780.0',
-                    '30.0; 15.0',
-                    'Unknown >> 2.0',
-                    '6.0; 10.0',
-                    '3.0; 5.0 >> 15.0',
-                    '0.5; 20.0',
-                    '0.5; 5.0',
-                    '2.0 >> 240.0',
-                    '15.0; 0.05 >> 4.0',
-                    '210.0',
-                    '10.0; 10.0; 10.0',
-                    'Unknown >> 7.0',
-                    '0.5 >> 5.0 | 5.0',
-                    '15.0; 20.0',
-                    '120.0 >> 10.0',
-                    '30.0 >> 600.0',
-                    '150.0; 15.0',
-                    'Unknown >> 8.0',
-                    '10.0; 5.0; Unknown >> 5.0',
-                    '40.0; 120.0; 100.0; 130.0',
-                    '1.0; 9.0',
-                    'Unknown >> 15.0 >> Unknown',
-                    '1.0; 25.0',
-                    '10.0 >> 120.0',
-                    '1.45; 60.0',
-                    '40.0 >> Unknown',
-                    '15.0; 60.0 >> 5.0',
-                    '10.0; 150.0; 90.0',
-                    '5.0 | 10.0',
-                    '5.0; 30.0; 2.0',
-                    '30.0; 3.0 >> 15.0',
-                    'Unknown | 5.0',
-                    '1.0; 20.0',
-                    '2.0 >> 4.0',
-                    'Unknown >> 30.0; 30.0',
-                    '24.0',
-                    '5.0 >> 5.0',
-                    '0.5; 2.0',
-                    '30.0 >> 30.0; 30.0',
-                    '30.0; 80.0',
-                    '30.0 >> 30.0; 5.0',
-                    '4320.0',
-                    '10.0 >> 1.0 >> 10.0',
-                    '8.0; 5.0',
-                    'Unknown >> 65.0',
-                    '100.0; 10.0',
-                    '30.0',
-                    '40.0; 10.0',
-                    '2.0; 58.0',
-                    '2.0 >> 5.0; 60.0',
-                    'Unknown >> 3.0',
-                    '1.0 >> 5.0',
-                    '16.0 >> 10.0',
-                    'Unknown >> 10.0; 100.0',
-                    '1.6',
-                    '15.0 >> Unknown >> Unknown',
-                    '360.0',
-                    '60.0; 20.0',
-                    '10.0; 10.0',
-                    'Unknown >> 10.4',
-                    '10.0; 10.0; 10.0; 10.0; 10.0; 10.0',
-                    'Unknown >> 1.0 >> 1.0 >> 15.0',
-                    '3.0; 10.0 >> 0.25',
-                    '10.0; 30.0; 90.0',
-                    '600.0 >> 5.0',
-                    '30.0 | 5.0',
-                    '1.0; 2.0 >> 2.0; 4.0',
-                    '20.0 >> 60.0',
-                    '0.25; 60.0',
-                    '1440.0',
-                    '4.0 >> 15.0',
-                    '5.0 >> 5.0 | Unknown',
-                    '5.0; 5.0; 5.0; 10.0; 10.0; 10.0; 10.0; 90.0',
-                    '30.0 | Unknown | 150.0',
-                    '5.0 >> Unknown',
-                    '4.0; 60.0',
-                    '140.0',
-                    '120.0; 10.0',
-                    '3.0; 7.0',
-                    '80.0',
-                    '40.0 >> 30.0',
-                    '120.0 >> 120.0',
-                    'Unknown >> 15.0 >> 10.0',
-                    '5.0 >> 15.0; 75.0',
-                    '11.0 >> 60.0',
-                    '5.0 >> 45.0',
-                    '3.0; 5.0 >> 5.0',
-                    '15.0; 0.08 >> 4.0',
-                    '60.0 >> 5.0 >> 5.0',
-                    '50.0 | 10.0',
-                    '10.0 >> 10.0; 60.0',
-                    '10.0; 60.0',
-                    '1.0; 30.0',
-                    '0.08; 20.0',
-                    'Unknown >> Unknown >> 1.0',
-                    '60.0; 60.0; 60.0',
-                    '30.0 >> 10.0',
-                    '180.0; 17.0',
-                    '60.0 >> Unknown',
-                ]
+                suggestions=get_suggestions(
+                    'perovskite_deposition', 'thermal_annealing_time'
+                )
             ),
         ),
     )
@@ -4713,112 +1815,9 @@ UV radiation
         a_eln=dict(
             component='EnumEditQuantity',
             props=dict(
-                suggestions=[
-                    '',
-                    'Washed with Ether',
-                    'Ultrasonic vibration treatment',
-                    'Washed with Toluene',
-                    'DABr',
-                    'Post annealing',
-                    'Dipped in Toluene',
-                    'Washed with DMSO',
-                    'Degradation in air under AM 1.5',
-                    'Magnetic field',
-                    'CF4 plasma treatment',
-                    'Deposition Nanocrystals of CsPbI3',
-                    'Deposition Nanocrystals of CsPbBr3',
-                    'Thermal radiation',
-                    'Washed with Ethyl acetate',
-                    'Washed with chloroform and Ether',
-                    'Spin coating GASCN',
-                    'Annealed under pulsed light',
-                    'Vacuum oven annealing',
-                    'Pressed with flat stamp',
-                    'Pulsed light',
-                    'Fast Cooling',
-                    'Washed with IPA',
-                    'Dipped in octadecene >> Washed with cyclohexane',
-                    'TETA vapour treatment',
-                    'Hot isostatic pressing',
-                    'Drying cabine',
-                    'Washed with IPA >> Thermal Annealing',
-                    'Poling',
-                    'Slow cooling',
-                    'Washed with DMF',
-                    'Photonic curing',
-                    'IPA:ACE @ 1:1 washing',
-                    'UV laser radiation',
-                    'Repeated Spin-coating',
-                    'Hot-pressing',
-                    'Dipped in Chlorobenzene',
-                    'Washed with acetylene black (15 mg/ml) solution in chlorobenzene',
-                    'Micro contact inprinting',
-                    'Spin coating@Guanidinium thiocyanate',
-                    'Gas pump treatment',
-                    'Spin coating GASCN; MACl',
-                    'IR radiation',
-                    'DCM:DEE @ 50:50 washing',
-                    'Vaccum drying',
-                    'fs laser polishing >> Washed with IPA >> Spin-coating solution of CsI, FAI, MABr in IPA >> annealed at 100',
-                    'Washed with ACE',
-                    'Degradation in air under dark',
-                    'H2O2 treatment',
-                    'Gradient thermal annealing',
-                    'Soaking in Isopropyl',
-                    'Washed with Acetone',
-                    'Washed with IPA >>  Spin-coating Dichloromethane',
-                    'Annealed under intense laser pulses',
-                    'Graphdiyne passivation treatment',
-                    'Ethylacetate washing',
-                    'Cold-roll pressing',
-                    'IPFB immersion',
-                    'Washed with GBL',
-                    'Dipped in Ethyl acetate',
-                    'Ultrasonic transducer',
-                    'Atmospheric-pressure dielectric barrier discharge',
-                    'Washed with IPA >> Drying in flow of N2',
-                    'Washed with Anisole',
-                    'Dissolving polystyren template in toluene',
-                    'Spin-coating Ethanol',
-                    'Cold isostatic pressing',
-                    'Pressed with dotted stamp',
-                    'Washed with IPA >> Washed with Dichloromethane',
-                    'Annealed in a perfluorodecalin bath',
-                    'Intense pulsed light annealing',
-                    'Inverted thermal annealing',
-                    'Washed with MABr solution in IPA',
-                    'Exposed to moist air',
-                    'Dried by N2 gas',
-                    'Intense light',
-                    'FABr treatment >> Rinse with 2-propanol >> Thermal annealing >> Slow cooling',
-                    'Washed with MAI solution in IPA',
-                    'Dried under flow of N2',
-                    'Spin coating GABr   >>   annealing',
-                    'Toluene washing',
-                    'Refrigerated',
-                    'Ultrapure water spray',
-                    'Moisture',
-                    'Spin-coating iodopentafluorobenzene',
-                    'Radiative thermal annealing',
-                    'Near Infrared radiation',
-                    'Light soaking',
-                    'Vacuum annealing',
-                    'UV radiation',
-                    'Washed with Chlorobenzene',
-                    'Microwave radiation',
-                    'Dipped in FAI containing ethyl acetate solution',
-                    'Heating >> Light exposure',
-                    'Dipped in Anisole',
-                    'Washed with Methyl acetate',
-                    'Annealed under light',
-                    'Spin-coating Pr-ITC; Ph-DTIC',
-                    'Pressed with hexagonal stamp',
-                    'Washed with IPA and drying with pressurized air',
-                    'IR laser radiation',
-                    'Stored at elavated temperature',
-                    'Laser annealing',
-                    'Dried under flow of clean air',
-                ]
+                suggestions=get_suggestions(
+                    'perovskite_deposition', 'after_treatment_of_formed_perovskite'
+                )
             ),
         ),
     )
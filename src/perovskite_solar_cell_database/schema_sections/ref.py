@@ -151,33 +151,35 @@ Unpublished
 
     def normalize(self, archive, logger):
         import dateutil.parser
-        import requests
         from nomad.datamodel.datamodel import EntryMetadata
 
+        from perovskite_solar_cell_database.crossref import (
+            fetch_crossref_metadata,
+            get_cached_crossref_metadata,
+            prefetch_upload_crossref_metadata,
+        )
+        from perovskite_solar_cell_database.enrichment import mark_pending_enrichment
+        from perovskite_solar_cell_database.network import is_offline
+
         # Parse journal name, lead author and publication date from crossref
         if self.DOI_number:
             if not self.ID_temp:
-                r = requests.get(f'https://api.crossref.org/works/{self.DOI_number}')
-                temp_dict = r.json()
+                if get_cached_crossref_metadata(self.DOI_number) is None:
+                    prefetch_upload_crossref_metadata(archive, logger)
+                metadata = fetch_crossref_metadata(self.DOI_number, logger)
                 # make sure the doi has the prefix https://doi.org/
                 if self.DOI_number.startswith('10.'):
                     self.DOI_number = 'https://doi.org/' + self.DOI_number
-                message = temp_dict.get('message', {})
-                given_name = message.get('author', [{}])[0].get('given', '')
-                family_name = message.get('author', [{}])[0].get('family', '')
-                self.journal = message.get('container-title', [None])[0]
-                self.publication_date = dateutil.parser.parse(
-                    message.get('created', {}).get('date-time', None)
-                )
-                self.lead_author = given_name + ' ' + family_name
-                self.authors = [
-                    Author(
-                        first_name=author.get('given', None),
-                        last_name=author.get('family', None),
-                        name=author.get('given', '') + ' ' + author.get('family', ''),
-                    )
-                    for author in message.get('author', [])
-                ]
+                if metadata is not None:
+                    self.journal = metadata['journal']
+                    if metadata['publication_date'] is not None:
+                        self.publication_date = dateutil.parser.parse(
+                            metadata['publication_date']
+                        )
+                    self.lead_author = metadata['lead_author']
+                    self.authors = [Author(**author) for author in metadata['authors']]
+                elif is_offline():
+                    mark_pending_enrichment(archive)
             if not archive.metadata:
                 archive.metadata = EntryMetadata()
             if not archive.metadata.references:
@@ -2,6 +2,7 @@ import numpy as np
 from nomad.datamodel.data import ArchiveSection
 from nomad.metainfo import Quantity
 
+from .suggestions import get_suggestions
 from .utils import add_solar_cell
 
 
@@ -31,206 +32,7 @@ PET | IZO
                     """,
         a_eln=dict(
             component='EnumEditQuantity',
-            props=dict(
-                suggestions=sorted(
-                    [
-                        'SLG | Ag-nw',
-                        'Textile | PEN | ITO',
-                        'PET | Ag',
-                        'PEN | Graphene',
-                        '42P2O5-22Li2O-22ZnO-12Sm2O3-2CeO2 | FTO',
-                        'SLG | Cu-BHT',
-                        'Mica | ITO',
-                        'NOA88 | PEI | Au',
-                        'Si | ITO',
-                        'PEN | Graphene | MoO3',
-                        'PET | Al2O3',
-                        'PES | Ti | Graphene',
-                        'SLG | Ag | Unknown',
-                        'PEN | Ag-nw',
-                        'Cu',
-                        'Transparent wood | ITO',
-                        'SLG | AZO',
-                        'none',
-                        'Ti-foil',
-                        'Cellulose paper | Carbon black',
-                        'SLG | FAZO',
-                        'PDMS | PET | Au-grid',
-                        'PEN | SWCNTs | MoO3',
-                        'SrTiO3 | Sr2RuO4',
-                        'SLG | In2O3:H',
-                        'Epoxy | ITO',
-                        'PES | ITO',
-                        'Polyimide | ITO',
-                        'Cellophane | TiO2 | Ag | TiO2',
-                        'SiO2-mp | SLG | ITO',
-                        'Polyimide | In2O3:H',
-                        'Polyester-satin textile',
-                        'NOA63 | Au',
-                        'SLG | PEDOT:PSS',
-                        'b-CNF | IZO',
-                        'SLG',
-                        'SLG | ITO:ATO',
-                        'SLG | PET',
-                        'Flexible | IZO',
-                        'PET | TCE',
-                        'SLG | AZO | Ag-nw | AZO',
-                        'PET | PEDOT:PSS',
-                        'Si',
-                        'Pt',
-                        'SLG | SU-8 | MoO3 | Au',
-                        'SLG-HAMC-patterned | FTO',
-                        'SLG | Cd2SnO4',
-                        'PDMS | Graphene',
-                        'PET | APTES; Graphene',
-                        'PDMS | PET',
-                        'SLG | Ni:Au-mesh',
-                        'PEN | AZO',
-                        'SLG | Ag-nw | Graphene oxide',
-                        'SLG | Graphene | MoO3',
-                        'Au | Ni | Al | Ti | GaN',
-                        'Quartz | TaN',
-                        'SLG | FTO | Au-grid',
-                        'PDMS',
-                        'PI | PEDOT:PSS',
-                        'SLG | ITO | Au-grid | ITO',
-                        'SLG | Au',
-                        'SLG | PEDOT:PSS | Ag | PEI',
-                        'Quartz | ITO',
-                        'SLG | ITO | Au-grid | AZO',
-                        'PEI | ITO',
-                        'PES | FTO',
-                        'PET | Ni-mesh:PH1000',
-                        'PET | IWO',
-                        'PI | Ag-np | PEDOT:PSS',
-                        'PET | Ag-nw | FZO',
-                        'SLG | WO3 | Ag | WO3',
-                        'Willow glass | Graphene | Ag-nw',
-                        'PAA-PEG | Ti',
-                        'SLG | Au-np; Graphene; TFSA',
-                        'PET | Ag-grid | PEDOT:PSS',
-                        'PI',
-                        'SLG | Ti',
-                        'SLG | AZO:F',
-                        'ITO | PET',
-                        'SLG | MPTMS-SMA | Ag | MUTAB-SAM',
-                        'PAA-PEG | Ti | PANI | Ti',
-                        'SLG | Ag-nw; Graphene oxide',
-                        'SLG | Graphene',
-                        'SLG | ITO',
-                        'Nb:SrTiO3',
-                        'SLG | SWCNTs-HNO3',
-                        'SiO2-hollow | SLG | ITO',
-                        'PI | Cu-grid | Graphene',
-                        'PEN | Graphene; MoO3',
-                        'PET | Ag-grid',
-                        'SLG | MSA-PEDOT:PSS',
-                        'SLG | Ag-nw | AZO',
-                        'NOA63 | MoO3 | Au',
-                        'NOA63',
-                        'PS',
-                        'PES | PEDOT:PSS | Ag',
-                        'Ag-nw; Graphene; Polycarbonate; Polystyrene',
-                        'NOA63 | ITO',
-                        'PET | ITO | Ag-nw',
-                        'SLG | IZO',
-                        'SLG | Graphene; TFSA',
-                        'SLG | TiO2-c | SnO2-c | TiO2-c | SnO2-c | TiO2-c | SnO2-c | TiO2-c | SnO2-c | TiO2-c | ITO',
-                        'SLNOA63 | CPI | Cr | Au-grid',
-                        'SLG | APTES; Graphene',
-                        'SLG | Au-np; Graphene',
-                        'PET | AZO',
-                        'Unknown',
-                        'SLG | AZO | Cu-nw | AZO',
-                        'Carbon-nt-yarn',
-                        'PDMS | SLG | ITO',
-                        'Cellophane | TiO2-c | Ag',
-                        'SLG | ITO | ITO',
-                        'PET | PEDOT:PSS | Ag-nw',
-                        'PET | Ag-mesh:PH1000',
-                        'PEN | Planarization | SiN | ITO',
-                        'PET | AuCl3; Graphene',
-                        'Silk | Ag-nw | PEDOT:PSS',
-                        'PET | Graphene',
-                        'PET | IZO',
-                        'PET | Ag-nw; PEDOT:PSS',
-                        'Quartz | Graphene',
-                        'HCLaminate | IZO',
-                        'Ti-wire',
-                        'SLG | ITO-HMDS Scaffold',
-                        'SLG | Cu-nw',
-                        'PET | Ag-nw; Graphene oxide',
-                        'PET | Ag-nw | Graphene',
-                        'SLG | ZrO2 | MPTMS-SMA | Ag | MUTAB-SAM',
-                        'PET | In2O3',
-                        'Ti',
-                        'PET',
-                        'Carbon-nt-fiber',
-                        'PEN | ITO',
-                        'SLG | TiO2-c | Ag',
-                        'Regenerated cellulose film | Ag-nw',
-                        'SLG | Ag',
-                        'PET | Graphene; TETA',
-                        'Si | SiO2',
-                        'SU-8 | Ca | Au',
-                        'PET | FTO',
-                        'PET | Ag-mesh | PH1000',
-                        'PES | AZO | CuNW | AZO',
-                        'Willow glas | Ti',
-                        'PET | WO3 | Ag | WO3',
-                        'SLG | Ni',
-                        'Graphite',
-                        'PET | Ag-nw',
-                        'FPA-PDMS',
-                        'Willow glass | ITO',
-                        'SLG | SWCNTs',
-                        'INVAR | ITO',
-                        'SLG | SnO2 | SiO2 | FTO',
-                        'PEG | ITO',
-                        'PETUG',
-                        'SLG | ZnO | ITO | Ag-nw | ITO',
-                        'Ti-sheet',
-                        'Unknown | ITO',
-                        'SLG | FTO',
-                        'PET | ITO',
-                        'PES | AZO | Ag-nw | AZO',
-                        'Willow glass | AZO',
-                        'SLG | ITO | Ni',
-                        'SLG | DWCNTs',
-                        'PET | Au',
-                        'Paper | Au',
-                        'Steel',
-                        'Nanopaper | TiO2 | Ag',
-                        'PET | Au-np; Graphene; TFSA',
-                        'PET | MSA-PEDOT:PSS',
-                        'SU-8 | MoO3 | Au',
-                        'SLG | PEI | Au',
-                        'SLG | resist | ITO',
-                        'PEN',
-                        'SLG | SWCNTs | MoO3',
-                        'SLG | WO3 | Ag',
-                        'ITO | PEN',
-                        'Ag-nw; GFRHybrimer; ITO',
-                        'SLG | Ag-nw | Graphene',
-                        'SLG | IWO',
-                        'SLG | rGO',
-                        'SLG | AZO | Au | AZO',
-                        'Stainless steel',
-                        'SLG | TCO',
-                        'SLG | Au-grid | AZO',
-                        'Willow glass | IZO',
-                        'PET | SWCNTs',
-                        'Cu-nw; GFRHybrimer; ITO',
-                        'PEN | FTO',
-                        'PEN | Ag-grid',
-                        'SLG | Cu',
-                        'SLG | FGZO',
-                        'PET | APTES | AuCl3; Graphene',
-                        'Foil | AZO',
-                        'PET | AZO | Ag | AZO',
-                    ]
-                )
-            ),
+            props=dict(suggestions=get_suggestions('substrate', 'stack_sequence')),
         ),
     )
 
@@ -492,141 +294,7 @@ Unknown
                     """,
         a_eln=dict(
             component='EnumEditQuantity',
-            props=dict(
-                suggestions=sorted(
-                    [
-                        'Water >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> heating >> UV-Ozone',
-                        'Soap >> Ultrasonic bath >> Water >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> Ethanol >> Ultrasonic bath',
-                        'Oxygen plasma',
-                        'Soap >> Water >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> IPA >> O2-plasma',
-                        'Soap >> Ultrasonic bath >> UV-Ozone',
-                        'Water >> Acetone >> Ethanol >> UV-Ozone',
-                        'De-ionized Water >> Ultrasonic bath >> Soap >> Ultrasonic bath >> IPA >> Ultrasonic bath',
-                        'Soap >> Water >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> IPA >> UV-Ozone',
-                        'Micro-90 detergent >> Ultrasonic bath >> DI Water >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> IPA >> Ultrasonic bath',
-                        'Soap >> Water >> Ethanol',
-                        'Helmanex >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> Acetone >> UV-Ozone',
-                        'UV-Ozone',
-                        'Soap >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> DI Water',
-                        'Soap >> Water >> Ultrasonic bath >> IPA >> O2-plasma',
-                        'Extran 300 >> Ultrasonic bath >> IPA',
-                        'DI Water >> Ethyl alcohol >> Acetone',
-                        'Soap >> Water >> Acetone >> IPA >> UV-Ozone',
-                        'Toluene >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> Water >> Ultrasonic bath',
-                        'Helmanex >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> IPA >> Ultrasonic bath',
-                        'Soap >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> Ethanol',
-                        'Soap >> Ultrasonic bath >> Water >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> UV-Ozone',
-                        'Helmanex >> Ultrasonic bath >> DI Water >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> IPA >> Ultrasonic bath >> UV-Ozone',
-                        'Water >> Acetone >> IPA',
-                        'detergent >> deionized water >> isopropanol >> acetone >> UV-Ozone',
-                        'Hellmanex >> solution >> DI >> water >> acetone >> IPA',
-                        'Acetone >> Ultrasonic bath >> IPA >> Ultrasonic bath >> Ethanol >> UV-Ozone',
-                        'Acetone >> Water >> IPA >> Nitrogen flow',
-                        'Detergent >> Ultrasonic bath >> DI-Water >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> UV-Ozone',
-                        'Helmanex >> Ultrasonic bath >> DI Water >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> IPA >> Ultrasonic bath >> O2 plasma',
-                        'Helmanex >> Ultrasonic bath >> Water >> IPA >> Ultrasonic bath >> Acetone >> microwave plasma',
-                        'Soap >> Ultrasonic bath >> Water >> Ultrasonic bath >> IPA >> UV-Ozone',
-                        'Water >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> UV-Ozone',
-                        'Water >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> Acetone',
-                        'Soap >> Water >> Ultrasonic bath >> Ethanol >> O2-plasma',
-                        'Soap >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> IPA >> Ultrasonic bath >> DI Water >> Ultrasonic bath >> Plasma',
-                        'Soap >> Water >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> IPA',
-                        'Soap >> Water >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> IPA >> UV-Ozone',
-                        'Detergent >> Ultrasonic bath >> alkali liquor >> Ultrasonic bath >> DI Water >> Ultrasonic bath >> Ethanol >> Ultrasonic bath',
-                        'Soap >> Water >> Ultrasonic bath >> Ethanol >> UV-Ozone',
-                        'Acetone >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> Water >> Ultrasonic bath',
-                        'Acetone >> Ultrasonic bath >> IPA >> Ultrasonic bath',
-                        'Mucasol >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> Water >> Ultrasonic bath',
-                        'Soap >> Water >> Ultrasonic bath >> Ethanol',
-                        'Acetone >> Ultrasonic bath >> Abs Ethanol >> Ultrasonic bath >> DI Water',
-                        'Soap >> Ultrasonic bath >> Water',
-                        'Soap >> Water >> Acetone >> Water',
-                        'Soap >> Water >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> Acetone >> UV-Ozone',
-                        'Helmanex >> Ultrasonic bath >> Water >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> UV-Ozone',
-                        'Acetone >> Ultrasonic bath >> IPA >> Ultrasonic bath >> Drying in oven >> UV-Ozone',
-                        'Unknown >> O2 plasma',
-                        'Water >> Ultrasonic bath >> IPA >> Ultrasonic bath >> O2-plasma',
-                        'Detergent >> Ultrasonic bath >> DI Water >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> UV-Ozone',
-                        'Water >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> IPA >> Ultrasonic bath >> UV-Ozone',
-                        'H2O2/HCl/H2O = 1:1:5 >> acetone >> isopropyl alcohol',
-                        'Soap >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> IPA >> Ultrasonic bath >> Water >> Ultrasonic bath >> O2-plasma',
-                        'Soap >> Water >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> Ethanol >> IPA >> UV-Ozone',
-                        'DI Water >> Ultrasonic bath >> Ethanol',
-                        'DI Water >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> UV-Ozone',
-                        'Unknown >> UV-Ozone',
-                        'Helmanex >> Ultrasonic bath >> DI Water >> Ultrasonic bath',
-                        'Mucasol >> Ultrasonic bath >> Water >> Ultrasonic bath >> Acetone >> IPA >> UV-Ozone',
-                        'Acetone >> Water >> IPA >> Nitrogen flow >> Corona Treatment 0.74 kW',
-                        'Soap >> Ultrasonic bath >> Water >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> Plasma',
-                        'DI Water >> Ultrasonic bath >> Helmanex >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> Methanol >> Ultrasonic bath >> DI Water >> Ultrasonic bath >> UV-Ozone',
-                        'Acetone >> Ultrasonic bath >> Methanol >> Ultrasonic bath',
-                        'Soap >> Water >> Ultrasonic bath >> Acetone; IPA; Ethanol >> UV-Ozone',
-                        'Soap >> Acetone >> Ultrasonic bath >> Water >> Ultrasonic bath >> Ethanol >> O2-plasma',
-                        'Acetone >> Ultrasonic bath >> IPA >> Ultrasonic bath >> Ethanol >> Ultrasonic bath',
-                        'Detergent >> Ultrasonic bath >> DI Water >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> Ethanol >> Ultrasonic bath',
-                        'Acetone >> Ultrasonic bath >> Methanol >> Ultrasonic bath >> DI Water',
-                        'Soap >> Ultrasonic bath >> Ethanol-HCl >> Ultrasonic bath >> Acetone >> Water >> Heating',
-                        'Unknown',
-                        'Water >> Ethanol >> IPA',
-                        'Helmanex >> Ultrasonic bath >> IPA >> Ultrasonic bath >> Acetone >> UV-Ozone',
-                        'Soap >> Ultrasonic bath >> Water >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> IPA >> Ultrasonic bath >> UV-Ozone',
-                        'DI Water >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> IPA >> Ultrasonic bath',
-                        'Helmanex >> Ultrasonic bath >> Ethanol >> Acetone',
-                        'Soap >> Water >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> lPA;Acetone; Water >> Ultrasonic bath >> UV Ozone',
-                        'Water >> Acetone >> IPA >> O2-plasma',
-                        'Soap >> Ultrasonic bath >> Water >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> IPA >> Ultrasonic bath >> Plasma',
-                        'Helmanex >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> Acetone >> DI Water',
-                        'NaOH >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> DI Water >> Acetone',
-                        'Acetone >> Ultrasonic bath >> IPA >> Ultrasonic bath >> O2-plasma',
-                        'Soap >> Ultrasonic bath >> Water >> Ultrasonic bath >> Ethano >> Ultrasonic bath >> UV-Ozone',
-                        'Soap >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> Acetone >> Plasma',
-                        'Acetone >> Ultrasonic bath >> Isopropyl alcohol >> Ultrasonic bath >> de-ionized Water',
-                        'Detergent >> Ultrasonic bath >> DI-Water >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> IPA >> Ultrasonic bath >> air plasma',
-                        'Helmanex >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> DI Water >> Ultrasonic bath >> UV-Ozone',
-                        'Soap >> peroxide/ammonia >> Ultrasonic bath >> Methanol >> Ultrasonic bath >> IPA >> UV-Ozone',
-                        'Soap >> DIWater >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> IPA >> Ultrasonic bath >> N2 blowing >> UV-Ozone',
-                        'Helmanex >> Ultrasonic bath >> Water >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> Acetone >> UV-Ozone',
-                        'alconox-detergent >> Ultrasonic bath >> deionized water >> Ultrasonic bath  >> acetone >> Ultrasonic bath >> isopropanol >> Ultrasonic bath',
-                        'Detergent >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >>  >> DI-Water >> Ultrasonic bath >> UV-Ozone',
-                        'Water >> Acetone >> Ethanol >> IPA',
-                        'Soap >> Water >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> Ethanol',
-                        'Helmanex >> Acetone >> IPA >> O2-plasma',
-                        'DIWater >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> IPA >> Ultrasonic bath >> UV-Ozone',
-                        'Soap >> Ultrasonic bath >> Water >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> O2-plasma',
-                        'Soap >> Water >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> lPA >>  >> Ethanol >> O2-plasma',
-                        'Soap >> Water >> Toluene >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> IPA >> O2-plasma',
-                        'detergent >> acetone >> isopropanol >> ethanol',
-                        'Helmanex >> Acetone >> Ultrasonic bath >> IPA >> Ultrasonic bath >> O2 plasma',
-                        'Acetone >> Ultrasonic bath >> Methanol >> Ultrasonic bath >> Water',
-                        'Soap >> Water >> Acetone >> IPA >> Ethanol >> Water >> UV-Ozone',
-                        'Soap >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> Acetone >> UV-Ozone',
-                        'Mucasol >> Ultrasonic bath >> Acetone >> Utrasonic bath >> Acetone >> Ultrasonic bath >> IPA >> Ultrasonic bath >> Ozone',
-                        'Acetone >> IPA >> O2 plasma',
-                        'Soap >> Water >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> Ethanol >> O2-plasma',
-                        'Soap >> Ultrasonic bath >> Water >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> IPA >> Ultrasonic bath >> O2-plasma',
-                        'Soap >> Ultrasonic bath >> Water >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> Water >> Ultrasonic bath >> Ethanol >> Utrasonic bath >> UV-Ozone',
-                        'Acetone >> Ultrasonic bath >> Methanol >> Ultrasonic bath >> Water >> Ultrasonic bath',
-                        'Acetone >> IPA >> Water',
-                        'Helmanex >> Ultrasonic bath >> DI Water >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> IPA >> Ultrasonic bath',
-                        'Water >> Acetone >> IPA >> UV-Ozone',
-                        'Helmanex >> Ultrasonic bath >> Water >> Ultrasonic bath >> Ethanol',
-                        'Soap >> Ultrasonic bath >> Water >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> IPA >> Ultrasonic bath',
-                        'Soap >> Acetone >> Ethanol >> Water >> UV-Ozone',
-                        'NaOH Ethanolic solution >> Water >> detergent >> Water >> Dry air',
-                        'Soap >> Ultrasonic bath >> Water >> Ultrasonic bath >> Ethanol >> UV-Ozone',
-                        'Soap >> Ultrasonic bath >> de-ionized Water >> Ultrasonic bath >> Acetone >> UV-Ozone >> Ethanol >> UV-Ozone',
-                        'Acetone >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> Water >> Ultrasonic bath >> UV-Ozone',
-                        'DI Water >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> IPA >> Ultrasonic bath >> UV-Ozone',
-                        '2.5 M NaOH >> Ultrasonic bath >> Water >> Detergent >> Milli-Q Water >> Annealed 30 min at 500℃',
-                        'DIWater >> Ultrasonic bath >> Ethanol >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> Oven drying >> UV-Ozone',
-                        'Helmanex >> Ultrasonic bath >> Water >> Ultrasonic bath >> Ethanol >> Ultrasonic bath',
-                        'Soap >> Water >> Ultrasonic bath >> Acetone >> Ethanol >> Ultrasonic bath >> IPA >> UV-Ozone',
-                        'Helmanex >> Ultrasonic bath >> DI Water >> Ethanol >> 2-propanol >> Ultrasonic bath',
-                        'Soap >> Water >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> IPA >> O2-plasma',
-                        'Soap >> Water >> Ultrasonic bath >> Acetone >> Ultrasonic bath >> IPA',
-                    ]
-                )
-            ),
+            props=dict(suggestions=get_suggestions('substrate', 'cleaning_procedure')),
         ),
     )
 
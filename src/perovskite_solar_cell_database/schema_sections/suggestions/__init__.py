@@ -0,0 +1,50 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Suggestions of the `EnumEditQuantity` ELN components.
+
+The long suggestion lists of the schema sections, e.g. the known stack sequences, are
+stored as one JSON resource per module, `<module>.json`, mapping quantity names to
+suggestions. A resource is read when the first quantity of its module asks for it.
+Short lists stay inline in the sections.
+"""
+
+import json
+from functools import cache
+from importlib.resources import files
+
+
+@cache
+def _load_suggestions(module: str) -> dict[str, list[str]]:
+    resource = files(__name__).joinpath(f'{module}.json')
+    with resource.open(encoding='utf-8') as f:
+        return json.load(f)
+
+
+def get_suggestions(module: str, quantity: str) -> list[str]:
+    """
+    Returns the suggestions of a quantity.
+
+    Args:
+        module (str): The name of the schema section module, e.g. `etl`.
+        quantity (str): The name of the quantity, e.g. `stack_sequence`.
+
+    Returns:
+        list[str]: The suggestions in the order they are shown.
+    """
+    return _load_suggestions(module)[quantity]
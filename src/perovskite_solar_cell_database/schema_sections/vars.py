@@ -1,6985 +0,0 @@
-etl_enum_edit_quantity_suggestions = [
-    '3TPYMB',
-    'PCBM-60; ICBA',
-    'SnO2 | C60',
-    'SnO2-np | MSAPBS',
-    'TiO2-c | TiO2-mp | PbS-QDs',
-    'ZTO | SnO2-c | C60',
-    'TmPyPB | C60 | TmPyPB',
-    'CeOx',
-    'TiO2-c | TiO2-np | TiO2-mp',
-    'TiO2-c | TiO2-mp | CsBr',
-    'PCBM-60 | CeOx',
-    'C60; PCBM-60 | BCP',
-    'ZTO | SnO2-c | PCBM-60',
-    'SnO2-c | C60',
-    'TiO2-c | TiO2-nw | CdS',
-    'TiO2-c | TiO2-mp | NH4I',
-    'SnO2-c | C60-5d',
-    'NDI-PhE',
-    'PCBM-60 | Zr(acac)4',
-    'PCBM-70 | C60 | AUH',
-    'SnO2',
-    '2PDI-0S | PEIE',
-    'PCBM-60 | TiO2-np',
-    'PCBM-60 | DEME-BF4',
-    'ZnO-np | p-(F)-PO-TAZ',
-    'TiO2-c | TiO2-mp | Sinapoyl malate',
-    'Cyptop | PCBM-60 | BCP',
-    'PCTDI',
-    'PCBM-60 | PPDIN6',
-    'FA-PDI2 | TiO2-c',
-    'SnO2-mp | TiO2-c',
-    'ZnO0.95Sn0.05O1.05',
-    'ZnO | PEIE',
-    'a-PTCDI',
-    'SnO2-np | TiO2-c',
-    'TiO2-c | SiO2-np; TiO2-mp',
-    'TiO2-c | TiO2-mp | NaYF2@SiO2-np',
-    'MoS2',
-    'PCBM-63',
-    'TiO2-c | Al2O3-c',
-    'SnO2-np | PbF2',
-    'PCBM-60 | DPO',
-    'PEG; SnO2-np',
-    'SnO2-np | BBA',
-    'ZnO0.9Sn0.1O1.1',
-    'PCBM-60 | BCP | AZO',
-    'TiO2-c | Ce2O-mp',
-    'S-acetylthiocholine chlorde | C60 | BCP',
-    'TiO2-c | TiO2-mp | D205',
-    'Ti(OiPr)4',
-    'PCB-C8',
-    'WO3',
-    'PCBM-60 | AZO-np | BCP',
-    'TiO2-c | In2O3',
-    'FDA | PCBM-70',
-    'AZO | ZnO-nw',
-    'PCBM-60 | BCP; TZ-1',
-    'SnO2-c | Au | SnO2-c | TiO2-mp',
-    'TiO2-c | TiO2-mp | BaTiO3',
-    'TiO2-c | TiO2-mp | Caproic acid',
-    'SnO2-np | EPA',
-    'SnO2-np | C60-SAM',
-    'PTAA',
-    'SnO2-np; ZnO-np',
-    'ICBA',
-    'TiO2-c | TiO2-mp | Sb2S3',
-    'TPE-ISO4 | C60 | BCP',
-    'NDI-ID (RS)',
-    'IDTT2FPDI',
-    'SrTiO3-c | SrTiO3-mp',
-    'ZnO | 1,2-ethanedithiol (10 mM)',
-    'C60; C70',
-    'PCBM-60 | Isopropanol-hydroquinolatolithium',
-    'TiO2-c | MgO | TiO2-nw',
-    'PN-F25',
-    'PbI2',
-    'TiO2-c | WOx',
-    'TiO2-c | BaSnO3-mp',
-    'TiO2-c | MPMIC60',
-    'ZnO0.75Sn0.25O1.25',
-    'SnO2-c | NPC60 OH',
-    'PCBM-60 | C3-CBL',
-    'TiO2-c | TiO2-mp | ZrO2@TiO2-mp',
-    'ICBA-tran3 | C60 | BCP',
-    'TiO2-c | H3PW12O4; TiO2-mp',
-    'LiF | C60 | TmPyPB',
-    'TiO2-c | SiO2',
-    'MgO | TiO2-mp',
-    'C60 | Rhodamine 101',
-    'PCBM-60; PDI-DA | BCP',
-    'ZTO | TiO2-mp | ZrO2-mp',
-    'PCBM-60 | PDINO',
-    'C60 | PCBM-60',
-    'TiO2-c | SnO2@TiO2-np',
-    'PDI-T | C60 | BCP',
-    'NDI-BTH1',
-    'PCBM-60 | Rodhamine 101',
-    'Ba(OH)2',
-    'KY7F22-np',
-    'F8TBT',
-    'PCBM-60 | CMB-vTA',
-    'TiO2-nt',
-    'PCBB-S-N | PCBM-60',
-    'TiO2-nanobundles',
-    'PCB-C12',
-    'TiO2-c | SnO2-c | TiO2-mp | ZrO2-mp',
-    'TiO2-c | ZnSe',
-    'SnO2-c | TiO2-np',
-    'ZnO-c | PCBM-70',
-    'TiO2-c | OTS',
-    'TiO2-mp | Z907',
-    'TiO2-c | CsCl',
-    'PSe-PDI',
-    'Zn2SnO4-c',
-    'PCBM-60 | PCBC',
-    'ITCPTC-Se | C60 | BCP',
-    'TiO2-nanoplatelets',
-    'PTEG-1',
-    'WOx | SnO2-np',
-    'IDTCN | C60 | BCP',
-    'Zn2SnO4',
-    'Mono-PCBOE | ZnO',
-    'TiO2-c | TiO2-nanocones',
-    'TiO2-c | PCBDAN',
-    'HATNAS3C7',
-    'F-PDI | ZnO-np',
-    'PCBM-60 | PCBDAN',
-    'PCBM-60; PEI',
-    'CdSe | LiF',
-    'TiO2-nw | CuInS2-QDs',
-    'PCBM-70',
-    'ZnO-nw | ZnO-c',
-    'TMTA | PCBM-60 | C60 | TPBi',
-    'PNDI-2T | PEIE',
-    'Graphene oxide; TiO2-np',
-    'TiO2-c | Benzoic acid',
-    '3TPYMB | C60 | TmPyPB',
-    'YVO4:Eu | TiO2-c | TiO2-mp',
-    'SnO2-np | PCBA',
-    'TiO2-c | ZnO-c | TiO2-mp',
-    'SnO2-c | PCBM-60-np',
-    'TiO2-c | WO3',
-    'TPE-DPP8 | C60 | BCP',
-    'C60-HPy | BCP',
-    'SnS2',
-    'TiO2-c | BaSnO3-np',
-    'IPH',
-    'C60 | BCP',
-    'TiO2-c | TiO2',
-    'SnO2-c | KCl',
-    'PCBM-70; PTB7-Th',
-    'TiO2-c | TiO2-nc',
-    'SnO2-np | PN4N',
-    'PCBM-60 | F-C60',
-    'PS | PCBM-60',
-    'SnO2-np | ImAcHcl',
-    'PCBM-60 | ZnMgO',
-    'Sn2O3-ns | PCBM-60 | Bphen',
-    'Au-np; TiO2-np | C-PCBOD',
-    'PCBM-60 | ZnO | PEI',
-    'PCBM-60 | Bphen; Ir(MDQ)2(acac)',
-    'PEIE | C60',
-    'ITCPTC-Se | Rhodamine 101 | LiF',
-    'SnO2-c | Ba(OH)2',
-    'TiO2-c | 2-OMe-SAM',
-    'TMPA-Cl | C60 | BCP',
-    'ZnO-np | NH4Cl',
-    'ETM',
-    'SnO2-c | Al2O3-mp | NiO-np',
-    'ZnO-np | PFS-FC',
-    'TiO2-c | Graphene',
-    'PC61BTh | BCP',
-    'TiO2-c | Zn2Ti3O8-mp',
-    'ZnO0.855Sn0.15O1.15',
-    'Nb2O5 | PCBM-60 | Bphen',
-    'SnO2-np | Sinapoyl malate',
-    'ZnOS',
-    'PCBM-60 | Rhodamine 101 | C60 | BCP | Rhodamine 101 | LiF',
-    'TiO2-c | TiO2-mp | BaTiO3-mp',
-    'Phenyltrichlorosilane | PCBM-60',
-    'ICPA | BCP',
-    'TiO2-c | ZnO-nanoflake',
-    'TiO2-c | TiO2-mp | PCBM-60; PS',
-    'TiO2-c | SiW11O39-POM',
-    'TiO2-c | SiO2-np | TiO2-c | SiO2-np | TiO2-c',
-    'TiO2-c | SiO2-np | TiO2-c',
-    'ZnO-c',
-    'TiO2-c | D35',
-    'SnO2-np | PCBA-60',
-    'ZnO-c | TiO2-mp',
-    'TiO2-c | TiO2-mp | PCBM-60; PTAA',
-    'SnO2-c | IDTT2FPDI',
-    'PCBM-60 | CMB',
-    'TiO2-c | SiO2-IO',
-    'TiO2-c | TiO2-mp | Graphene',
-    'ZnO-c | 4-methoxybenzoic acid',
-    'ZnO-c | CPTA',
-    'PCBM-60; Sb-Carbon-nw | BCP',
-    'ZnO-c | 1,2 ethanedithio',
-    'TiO2-c | TiO2-mp | 3-aminopropanoic acid-SAM',
-    'Ca',
-    'TPE-DPP6 | C60 | BCP',
-    'SnO2-nw | TiO2-c',
-    'PCBM-60 | TPPI',
-    'SnO2-np | KCl',
-    'P3HT',
-    'ZnO-c | ZnSO',
-    'CPTA-E',
-    'TiO2-c | TiO2-mp | PCBM-60; Poly(N-vinylcarbazole)',
-    'SnO2-nanosheets | C60',
-    'TiO2-c | CPTA',
-    'ZnO',
-    'ZnO-c | ZnO-mp | PEI',
-    'TiO2 | Al2O3-mp',
-    'TiO2-c | Dimethylbiguanide',
-    'PCBM-60 | AgAl-np | Au-np | LiF',
-    'TiO2-c | Graphene; SrTiO3',
-    'f-C70',
-    'Fe2O3-mp',
-    'TiO2-c | TiO2-mp | SnO2',
-    'IDT6CN-TM | BCP',
-    'PCBM-60 | PFN-P2',
-    'ZnO-np | EA',
-    'ZnO-np | ZnO-nanospheres',
-    'PCBM-60 | Ca(acac)2',
-    'PCBM-60 | Zn(acac)',
-    'TiO2-c | TiO2-mp | Carbo-QDs',
-    'ITO-nw | TiO2-np',
-    'IZO',
-    'TiO2-c | TiO2-mp | ZnO-mp',
-    'PPDIDTT | PCBM-60 | Bphen',
-    'PDIN',
-    'ZnSO4-c | ZnSO4-mp',
-    'TiO2-c | Fullerenol',
-    'PCBM-60; ICBA | BCP',
-    'PCBM-60-MCM',
-    'CMB-vTA | PCBM-60 | AZO',
-    'SrTiO3 | TiO2-mp',
-    'nTi-MOF | PCBM-60',
-    'COi8DFIC | BCP',
-    'ZnO-np | PEI',
-    'PEAI | PCBM-60 | BCP | SnO2-c',
-    'In2O3-c | PCBM-60',
-    'CeO2-c | TiO2-c',
-    'H-PDI',
-    'SnO2-c | TiO2-mp',
-    'ZnO-c | ZnO-nw | SnO2-c',
-    'MgO-c | SnO2-c',
-    'TiO2-c | TiBaO-nanosphere',
-    'PCBM-60 | TmPyPB',
-    'TiO2-c | KH560',
-    'ZnO | 1,2-ethanedithiol (5 mM)',
-    '4-acetylpyridine | PCBM-60 | BCP',
-    'TiO2-c | TiO2-mp | Trimethylamine oxide',
-    'DMEC-70 | LiF',
-    'TiO2-c | ZnO-nw | AZO-c',
-    'PEDOT:PSS',
-    'IT-4f | BCP',
-    'PCBM-60; PMMA',
-    'C70',
-    'PCBM-60 | ZnO-np | AZO',
-    'PCBM-60 | PCBC | LiF',
-    'WO3 | TiO2-c',
-    'TiO2-c | SWCNTs; TiO2-mp',
-    'LiF',
-    'TiO2-mp | MgO',
-    'ZnO-c; Graphene-np',
-    'Graphene | Al2O3-mp',
-    'PCMB-60:BCP',
-    'SnO2-np | C60',
-    'Graphene-QDs',
-    'ZnO-c | PVP',
-    '(RhCp*Cp)2 | PTCBI',
-    'SnO2-c | ABA-SAM',
-    'PCBM-70 | C60',
-    'TiO2-c | TiO2-nanofibers',
-    'AZO-np',
-    'IDT6CN | Rhodamine 101 | LiF',
-    'PCBM-60 | C70 | BCP',
-    'PCBM-60 | TOPD',
-    'TiO2-c | TiO2-mp | SbI3',
-    'SnO2-c | PMMA',
-    'PCBM-60 | Methanol-hydroquinolatolithium',
-    'LiF | C60 | PEIE | SnO2-c | ZTO',
-    'PCBM-60 | PDIN',
-    'ZnO-c | AZO-np',
-    'PCBM-60 | ZnO-np | BCP',
-    'TiO2-mp',
-    'B-DIPBI',
-    'NDI; SnO2-np',
-    'QCAPZ | LiF',
-    'ZnO-c | ZnO-nw',
-    'ZnO-c | C3-SAM',
-    'Carbon-nt | PFN-Br',
-    'TiO2-c | AAO',
-    'AgAu-np | TiO2-c',
-    'TiS2',
-    'pBTTz',
-    'PCBM-60-PCP',
-    'TiO2-c | PCBM-60 | WS-C60',
-    'TiO2-c | TiO2-mp | Cs2CO3',
-    'NDI-BTH2',
-    'SrTiO3 | Al2O3-mp',
-    'TiO2-c | Polystyrene-ns | TiO2-mp',
-    'SnO2-nanospheres',
-    'PCBM-60 | PCBDANI',
-    'ZnO-c | AZO-mp',
-    'ZnO-np | PCBM-60',
-    'NDI-PM',
-    'C60 | TmTyPB',
-    'Graphene-np; TiO2-mp',
-    'TiO2-c | TiO2-mp | Si-np',
-    'PCBM-62',
-    'PFPDI',
-    'PCBM-60 | TiO2',
-    'TiO2-c | TiO2; Al2O3-mp',
-    'TiO2-c | TiO2-hollow spheres; TiO2-mp',
-    'PFN | C60; PCBM-60',
-    'PCBM-60 | PN4N',
-    'PCBM-60 | [BMIM]BF4',
-    'PNVT-8 | ZnO',
-    'IT4H | s-Bphen',
-    'TiO2-c | Ba0.9Sr0.1SnO3-np',
-    'TiO2-c | TiO2-mp | ETPM',
-    'TiO2-c | TiO2-mp | MBA-SAM',
-    'SnO2-c | TiO2-c | TiO2-mp',
-    'PEDOT:PSS | PEI',
-    'IDTCN | Rhodamine 101 | LiF',
-    'Carbon-QDs; SnO2-c',
-    'Q10 | BCP',
-    'TiO2-mp | Pbs-QDs',
-    'PCBM-60 | ZnO',
-    'PDBS-PDI',
-    'PTTI-1',
-    'PCBM-70 | BCP',
-    'ZnO-c | PEI',
-    'C60 | C60-np',
-    'TiO2-c | TiO2-mp | Au@Ag',
-    'C70 | TmPyPB',
-    'TiO2-mp | MK2',
-    'TiO2-c | CSOE',
-    'PDI-V | C60 | BCP',
-    'PCBM-60 | BCB',
-    'ZnO | C60',
-    'TiO2-c | SiO2-nanocolumns | TiO2-nw',
-    'ZnO@rQD-np',
-    'Graphene; TiO2-c | Al2O3-mp',
-    'PEI | ICBA',
-    'TiO2-np | C60; PCBM-60',
-    'Polyimid | PCBM-60 | BCP',
-    'ZnO-c | ZnMgO-c | ZnO-nw | PCBM-60',
-    'P(NDI2DT-TTCN) | BCP',
-    'PFN-2TNDI',
-    'CeOx-np',
-    'TiO2-c | ZnO-np',
-    'CeO2-c',
-    'PCBM-70 | ZrO2',
-    'Aniline; rGO | CsCO3',
-    'IDT6CN-4F | BCP',
-    'TiO2-c | TiO2-mp | Au-np',
-    'PCBM-60 | TiO2 | BCP',
-    'SnO2-c | PA-SAM',
-    'BenMeIM-Cl',
-    'PEI',
-    'PCBB-S-N | C60 | BCP',
-    'TiO2-c | NaYF4:Yb:Er-np',
-    'PCBM-60 | Phosphoniumfluorene',
-    'ZnO-c | ZnO-nw | TiO2-np',
-    'Ti | C60',
-    'DS1',
-    'PCBM-60 | Bphen | Cs2CO3',
-    'TiO2-c | ZnO-nw | Al2O3-c',
-    'PCBM-60 | Rhodamine 101 | LiF',
-    'TiO2-c | TiO2; SiO2-IO',
-    'PCBM-60 | BCP; TZ-2',
-    'TiO2-c | TiO2-mp | n-dimethyloxamic acid',
-    'CPTA',
-    'ZnO-c | Ethyl acetate',
-    'TDTP | LiF',
-    'bis-C60',
-    'PCBM-60 | AZO-np',
-    'TiO2-c | TiO2-mp | Nb2O5',
-    'TiO2-mp | ZrO2-mp',
-    'PCBM-60',
-    'BPTI | C60 | BCP',
-    'CdS-np',
-    'f-C60 | C60',
-    'PCBM-60 | Bphen | Cs2CO3; MoO3',
-    'TiO2-c | TiO2-mp | Al2O3',
-    'SnO2-QDs | PCBM-60',
-    'PCBM-60 | Carbon-QDs',
-    'ZnO-c | Urea',
-    'PEIE | PCBM-60',
-    'TiO2-c | TiO2-mp | PCBM-60; PMMA | BAI',
-    'TiO2-c | TiO2-mp | Al203-c',
-    'Me4NBr | PCBM-60 | BCP',
-    'PCBM-derivative10',
-    'In2O3',
-    'TiO2-c | 60',
-    'TiO2-c | TiO2-nanowalls',
-    'PCBB-S-N',
-    'bis-PCBOE | ZnO',
-    'EG-PEDOT:PSS | Ti | SnO2-c | TiO2-c',
-    'TiO2-c | 3-OMe-SAM',
-    'TiO2-c | TiO2-np',
-    'PDPT',
-    'SnO2-c | NiCl2',
-    'PCBM-60 | FPI-PEIE',
-    'Zn2SnO4 | Zn2SnO4-nw',
-    'Carbon-mp | TiO2-mp',
-    'SnO2-c | C3-SAM',
-    'PCBM-60 | MoS2',
-    'TiO2-c | MoOx',
-    'Mg0.1Zn0.9O-np',
-    'ICBA; PCBM-60',
-    'TiO2-c | PCBM-60 | C60-SAM',
-    'Zn:SnO2',
-    'TiO2-c | TiO2-mp | PbTiO3',
-    'PCBM-60; F8BT | C60',
-    'TiO2-c | CsAc',
-    'Zn2SnO4-c | rGO; Zn2SnO4-fiber',
-    'PCBM-60 | C60SB:TBAI',
-    'SrSnO3',
-    'TPE-DPP16 | C60 | BCP',
-    '(DTYM-NDI-DTYA)2 | BCP',
-    'Polystyrene | C60 | BCP',
-    'TiO2-nw | TiO2-nw',
-    'Al2O3-mp',
-    'TiO2-c | Graphdiyne-QDs',
-    'Plastic foam | C60 | BCP',
-    'TiO2-c | TiO2-nanobeads',
-    'TiO2-c | PCBM-60 | PbI2',
-    'PCBM-60 | ZnO-np | ZnO-c',
-    'C60-N',
-    'NDI-P',
-    'Al:ITO-c',
-    'Al2O3-c | TiO2-c | TiO2-mp',
-    'PN-P',
-    'TiO2-c | ZnCdS',
-    'AZO-np | PCBM-60',
-    'PCBM-60 | BMIM-OTF',
-    'TiO2-c | TiO2-helices',
-    'f-C60',
-    'SnO2-c | Carbon-QDs',
-    'TiO2-c | TiO2-mp; YVO4:Eu:Bi-np',
-    'none',
-    'LiSPS | PCBM-60',
-    'ZnO-np | Graphene',
-    'N2200; PFN-Ox | bis-C60',
-    'ZnO@SnO2-np',
-    'MgO | SnO2-np | Ethanol amine',
-    'TiO2-c | TiO2-mp | 4‐Aminobenzoic acid',
-    'Cs2CO3',
-    'TiO2-c | Si-nw',
-    'Fullerene @ F2',
-    'PCBM-60; F8TBT',
-    'HAT-CN | BCP',
-    'TiO2-nanoleaves | MgO',
-    'TiO2-c | C60-BCT',
-    'TiO2 | SnO2-c | SnO2-np',
-    'TiO2-nanofibers',
-    'CdS-c | TiO2-mp',
-    'CdSe-QDs; PCBM-60 | Rhodamine 101 | LiF',
-    'ITCPTC-Th | Rhodamine 101 | LiF',
-    'PCBM-60 | Rhodamine 101 | C60 | Rhodamine 101 | LiF',
-    'S-acetylthiocholine chloride | C60 | BCP',
-    'PCBM-60 | AZO-np | SnO2-c',
-    'ZnO-c | ZnO-c',
-    'PCBM-60 | Polyethylimine',
-    'C60; PDI | BCP',
-    'BrTPA-PCBM | bis-C60',
-    'BaSnO3-np',
-    'TiO2-c | TiO2-mp | PhCOOH',
-    'IC60BA | bis-C60',
-    'Li4SiW12O40',
-    'Au@TiO2-np; TiO2-np',
-    'TiO2-np',
-    'TiO2-np | PCBM-60 | TiO2-c',
-    'TiO2-c | TiO2-mp | ZIF-8-40',
-    'TiO2-c | Al2O3-nt',
-    'TiO2-c | TiO2-mp | MXene',
-    'ZnO-np | Sinapoyl malate',
-    'ZnO-np | MgO-EA',
-    '2-HI-PVK | PCBM-60 | BCP',
-    'TiO2-c | 1-OMe-SAM',
-    'LiF | C60 | SnO2-c',
-    'TiO2-c | PCBB-2CN-2C8',
-    'TiO2-c | MCA',
-    'TiO2-c | TiO2-mp | Y2O3-c',
-    'PCBH',
-    'TiO2-np; Nb2O5',
-    'C60:PhIm | C60',
-    'TiO2-c | TiO2-mp | C60 | ZrO2-mp',
-    'PCBCB',
-    'Carbon | TiO2-mp',
-    'TiO2-np | PCBM-60',
-    'TiO2-c | Al2O3-mp',
-    'C60-SAM',
-    'TiO2-c | TiO2-nw | N-[3-(Trimethoxysilyl)propyl]ethylenediamine-SAM',
-    'ZnO-c | ZnO-nw | TiO2-c',
-    'PbS | PCBM-60',
-    'SnO2-np | DTPP',
-    'ZnO | 1,2-ethanedithiol (15 mM)',
-    'TiO2-c | [EMIM]PF6-IL',
-    'TTC | C60 | BCP',
-    'C60 | SnO2-np',
-    'TiO2-mp | TiO2-c',
-    'Au-nw | TiO2-c',
-    'ZnO-nanospheres',
-    'Nb2O5 | (EMIM)PF6',
-    'F-PDI',
-    'SnO2-c | C60-5a',
-    'TiO2-c | Ag-nw; TiO2-np',
-    'TPA-PCBM | bis-C60',
-    'SnO2-np | TPPO',
-    'PCBM-60 | PVP',
-    'SnO2-c | C60-5b',
-    'PyCEE',
-    'TiO2-c | TiO2-np | ZrO2-mp',
-    'TiO2-c | SrTiO3',
-    'TiO2-c | SrTiO3-mp',
-    'TiO2-c | ZnO-nw',
-    'ITIC; PCBM-60 | PEI',
-    'FSIP | C60 | BCP',
-    'PTCDA | PO-T2T',
-    'PCBM-60 | CIL',
-    'C60 | C60; Phlm',
-    'PMDPT',
-    'TiO2-c | TiO2-mp | PbSe',
-    'TPE-DPP4 | C60 | BCP',
-    'TiO2-c | PCBM-63',
-    'Acetyl acetate; I2; LiI',
-    'Au-np; TiO2-np | C-PCBSD',
-    'TiO2-c | NaYF4:Yb:Er-np; TiO2-mp',
-    'TiO2-c | TiO2-mp | HOOC-Ph-SH',
-    'CPTA | BACl',
-    'H-DIPBI',
-    'SnO2-c | C60-SAM',
-    'PCBM-60; CTAB',
-    'Zr(acac)4',
-    'TiO2-c | TiO2-nanoflowers',
-    'C5-NCMA | bis-C60',
-    'MC-43',
-    'TiO2-np | C70',
-    'TiO2-c | Au-np; TiO2-mp',
-    'C60 | C60',
-    'MoO3 | Au | SnO2-c | TiO2-mp',
-    'TiO2-c | IPH',
-    'PCBM-60 | ZnO-c',
-    'C60 | LiF | BCP',
-    'N2200 | bis-C60',
-    'Graphene | ZnO-QDs',
-    'ZnO-c | T2CA',
-    'PCBM-60 | PCBM-60',
-    'P(NDI2OD-TET)',
-    'TiO2-c | NiO',
-    'TiO2-c | TiO2-mp | D149',
-    'PCBM-60 | AZO',
-    'ZnO-c | ZnO-nanodisks',
-    'Fullerene-2a',
-    'Ru(acac)',
-    'PCBM-60 | Phen-NaDPO',
-    'PCBM-60 | bis-C70',
-    'PCBM-60; Graphene | BCP',
-    'TiO2-c | TiO2-mp | Aminocaproic acid; Caproic acid',
-    'Graphene nanoribbons hPDI2-Pyr-hPDI2',
-    'TiO2-c | TiO2-mp | 4‐Aminobutyric acid',
-    'BAFB | ZnO-np',
-    'SnO2-c | C60-5e',
-    '2PDI-3S | PEIE',
-    'PEIA | PCBM-60 | BCP',
-    'Graphene',
-    'Graphene; NDI; SnO2-np',
-    'PCBM-60 | CD',
-    'MATS | PCBM-60',
-    'PCBM-70 | C70 | BCP',
-    'MABr | PCBM-60 | BCP',
-    'PTEBS',
-    'PEDOT:PSS | PEI | PCBM-60',
-    'SnO2-mp',
-    'PMMA | PCBM-60',
-    '2PDI-4S | PEIE',
-    'TiO2-nw',
-    'Au-np; TiO2-np',
-    'C60 | Zr(AcAc)',
-    'PEAI | PCBM-60 | PEI',
-    'C60; Phlm',
-    'ZnO-mp | ZnO-np',
-    'PCBM-60 | PEOz',
-    'TiO2-c | TiO2-mp | ZIF-8-20',
-    'PFN-OX:ZnO',
-    'In2S3',
-    'ZnLiO',
-    'TiO2-c',
-    'C60 | TmPyPB',
-    'SnO2-np | SnO2-c',
-    'PTCDI | BCP',
-    'PCBM-60 | TBAI',
-    'SnO2-c | CBA-SAM',
-    'MAI | PCBM-60 | PEI',
-    'PEIE | SnO2-np | ITIC',
-    't-BPTI | C60 | BCP',
-    'Carbon-QDs; TiO2-c',
-    'P2',
-    'PEI | PCBM-60',
-    'PCBM-60 | FPI',
-    'Bphen',
-    'Au-np | TiO2-c',
-    'TiO2-fibres',
-    'TiO2-nanosphere',
-    'ZnO-c | 3, 4, 5- trimethoxybenzoic acid',
-    'C60-SAM | C60 | BCP',
-    'PCBM-derivative11',
-    'SnO2-nanosheets',
-    'TiO2-nw | N719',
-    'TiO2',
-    'TiO2-c | TiO2-mp | TiO2-c',
-    'CdS',
-    'PCBM-60 | Carbon-nt; PEI',
-    'C60; PCBM-60',
-    'C60 | B4PyMPM',
-    'SnO2-QDs',
-    'PCBM-60; Zn0.8Cd0.2S-np',
-    '(4AMP)I2 | PCBM-60 | BCP',
-    'C60; PCBM-60 | bis-C60',
-    'ZnO-c | ZnOS | TiO2-mp',
-    'SnO2-np | OTES:APTES-SAM',
-    'PDI | C60 | BCP',
-    'TiO2-c | (3-Aminopropyl)trimethoxysilane',
-    'SnO2-c | BA-SAM',
-    'IDTT2FPDI | PCBM-60 | Bphen',
-    'ZnO-np | BCP',
-    'ZnO-c | ZnO-nanofibers',
-    'GaN',
-    'CSCNT@Al2O3-c',
-    'PCBM-60 | C60',
-    'IT4M | s-Bphen',
-    'SnO2-np | B2Cat2',
-    'PCBM-60 | PFN-Br',
-    'Fe2O3-np',
-    'ICBA | bis-C60',
-    'ZnO-c | Graphene; ZnO-np',
-    'ZnS',
-    'Corrannulene-derivative',
-    'D-C60',
-    'PCPDT-PDI',
-    'TiO2-3D',
-    'TiO2-c | TiO2-mp | ZnS',
-    'PCBM-60 | FPyBr',
-    'DNDIF3',
-    'SnO2-np | ZnO-c',
-    'ZrO2-c | TiO2-c | Al2O3-mp',
-    'C60-lactone',
-    'IT4F | s-Bphen',
-    'Zn2SnO4-np',
-    'Ag-np; TiO2-c | TiO2-mp | ZrO2-mp',
-    'PCBM-60 | PFN; ZnO-np',
-    'ZnO-nanoflake',
-    'TiO2-c | TiO2-mp | Carbon-QDs',
-    'PCBM-60 | Ethanl-hydroquinolatolithium',
-    'Fullerene-2b',
-    'ITCPTC | C60 | BCP',
-    'PFN; ZnO',
-    'PCBM-60 | PrC60MAI',
-    'TiO2-c | TiO2-mp | Al2O3-mp | TiO2-c',
-    'PEG; ZnO-np',
-    '2,6-Py | PCBM-60 | PEI',
-    'TiO2-nanosphere | TiO2-mp',
-    'MoS2-nanosheets',
-    'BPTI | PDI-C4 | BCP',
-    'SnO2-np; ZnO-np | Al2O3-mp',
-    'MgO | SnO2-np',
-    'Nb2O5-c | TiO2-mp',
-    'TiO2-c | Au-np',
-    'FPI-PEIE',
-    'TiO2-np | C-PCBOD',
-    'LiF | C60 | SnO2-c | ZTO',
-    'TiO2-c | AgInS2-QDs; TiO2-c',
-    'ATO | TiO2-c | TiO2-mp',
-    'TiO2-c | CdS',
-    'Nb2O3 | Al2O3-mp',
-    'TiO2-c | TiO2-mp | MgO',
-    'PEIE | SnO2-np',
-    'Mg0.2Zn0.8O-np',
-    'N-PDI',
-    'Fe2O3-c',
-    'Graphene oxide; TiO2-c',
-    'F16CuPc | Bphen',
-    'TiO2-c | TiO2-nanosphere | ZrO2-mp',
-    'TiO2-c | TiO2-nw',
-    'SnO2-np',
-    'SnO2-np | Ethanol amine',
-    'PCBM-60 | C60/C70-N',
-    'Zn2SnO4-c | Zn2SnO4-mp',
-    'ZnO-np | TiO2-mp',
-    'Fullerene-2c',
-    'P(NDI2DT-T2)',
-    'WO3-c | WO3-nw | Cs2CO3 | PCBM-60',
-    'TiO2-c | Thiourea',
-    'TiO2-c | ZnO',
-    'SnO2-nw; Zn2SnO4-np',
-    'PCBM-60 | BCP | TiO2-c',
-    'TiO2-c | ZTO-mp',
-    'ITIC',
-    'TiO2-c | ZIF-8',
-    'PCBM-70; ZnO-np | TiO2-c',
-    'ZnO-c | 4-dimethoxybenzoic acid',
-    'PCBM-60 | Cs2CO3',
-    'ZnO-c | p-amino-benzoic acid',
-    'ZnO-c | SnO2; TiO2-mp',
-    'ZnO-c | ZnO-nanospheres',
-    '2PDI-2S | PEIE',
-    'TiO2-c | Ps',
-    'C60 | Bphen',
-    'ZnO-c | ZnO-mp | ZrO2-mp',
-    'SnO2-c | SnO2-np',
-    'WO3-c',
-    'IDT6CN-TM | C60 | BCP',
-    'C60; PCBM-60-DPM-OE',
-    'PSS | PCBM-60 | BCP',
-    'TiO2-c | SrTiO3-np',
-    'PCBM-60 | C60-ETA',
-    'TiO2-c | Al3O3-mp',
-    'TiO2-c | TiO2-mp | ZrO2-mp | Co3O4-mp',
-    'TiO2-c | PPDI-F3N',
-    'PDTP-DFBT:PCBM-60',
-    'PCBM-60 | Si-np',
-    'SnO2-c | C60-5g',
-    'TiO2-c @ {001} facet',
-    'PCBB',
-    'TiO2-c | PCBSD:GD',
-    'C3N5',
-    'PCBM-60; PDI-DA',
-    'nTi-MOF',
-    'PCBM-60 | pi-PFE3',
-    'PCBM-derivative12',
-    'C60 | PEI',
-    'PCBM-60 | ZrAcac',
-    'N2200 | PCBM-60',
-    'ZnO-np | MgO-EA | TiO2-mp',
-    'NbOH5',
-    'TiO2-c | TiO2-mp | N719',
-    'Boron subphthalocyanine chloride | PCBM-60',
-    'TiO2-c | CsBr',
-    'TCl-PDI',
-    'FNCA | C60 | BCP',
-    'P3',
-    'SnO2-c | APTES-SAM',
-    'TiO2-c | C60-BCT-Au-NP',
-    'PCBM-60 | Ppz',
-    'ZnO-c | JTCA',
-    'Ti',
-    'PCBM-60 | CMB-vTA | AZO',
-    'Nb2O5 | PCBM-60',
-    'PS | C60 | BCP',
-    'BaSnO3-mp',
-    'NDI3HU-DTYM2 | BCP',
-    'OCA | C60 | BCP',
-    'DS2',
-    'CuCrO2 | C60; PCBM-60',
-    'SnO2-np | PCBM-60',
-    'GDY-Tz-CH2(CH2)16CH3; PCBM-60 | C60',
-    'C60 | ZnO-c',
-    'C60-BPy | BCP',
-    'PCBM-60 | ZnO-np',
-    'Nb2O5 | PCBM-60 | (EMIM)PF6',
-    'PCBM-70 | C60 | BCP',
-    'TiO2 | ITIC',
-    'PCBM-60 | Phen-NaDPO:Sn(SCN)2',
-    'PCBM-60 | P3HT; PCBM-60',
-    'TiO2-c | TiO2-mp | Al2O3-c',
-    'HATNAS3C7-C3h',
-    'MgZnO',
-    'TiO2-c | SiO2-mp',
-    'PDI | PDI',
-    'ZnO-np | MgO | TiO2-mp',
-    'TiO2-c | TiO2-mp | ZrO2-mp | Silane-SAM',
-    'SrTiO3 | Graphene; Al2O3-mp',
-    'TiO2-c | SnO2-np',
-    'C60 | SnO2 | ZTO',
-    'SnO2-c | Cs4SnO4',
-    'ZnCsO',
-    'TiO2-c | Na2SO4',
-    'WOx',
-    'PCBM-60; TDPP-CN4 | BCP',
-    'TiO2-c | TiO2-mp | PABA-SAM',
-    'PFN | PCBM-60',
-    'TiO2-c | KH550',
-    'Teflon | C60 | BCP',
-    'a-DMEC70',
-    'EVA | PCBM-60 | BCP',
-    'SnO2-c | MgO-c',
-    'TiO2-c | Al2O3-mp | NiO-np',
-    'PTO',
-    'PCBM-60; TiO2-np',
-    'TiO2-c | Alq3',
-    'GO-Li | TiO2-c',
-    'ZnO-c | TiO2-c',
-    'CITP-SAM',
-    'NDI-Se',
-    'ZnO0.85Sn0.2O1.2',
-    'PCBM-70 | Fe2O3-np',
-    'TiO2-c | TiO2-mp | Poly(TA)',
-    'TEAI | PCBM-60 | PEI',
-    'ZnO-c | AZO-c',
-    'IPH | PFNBr',
-    'PC61BPy | BCP',
-    'Ag-np; TiO2-c | TiO2-mp',
-    'ICTA | C60 | BCP',
-    'Fulleropyrrolidinium Iodide',
-    'DMEC-60 | LiF',
-    'ZnO-np',
-    'TiO2-c | SiO2-np | TiO2-c | SiO2-np | TiO2-c | SiO2-np | TiO2-c',
-    '1,2-diaminoethane | C60 | BCP',
-    'TiO2-c | CoCr',
-    'ZnSO | TiO2-mp',
-    'SnO2-np | ZnO-np',
-    'TiO2-mp | D35',
-    'ZnO-c | PCBM-60',
-    'HATNASOC7-Cs',
-    'TiO2-c | TiO2-mp | PTDPQ',
-    'TiO2-c | Ba0.5Sr0.5SnO3-np',
-    'SnO2-c | SnO2-nw',
-    'Mg0.05Zn0.95O-np',
-    'PCBM-60 | TPBi',
-    'MPMIC60 | ZnO-np',
-    'TiO2-c | CdSe-tetrapod',
-    'IPB',
-    'TiO2-c | TiO2-mp | NaPTH',
-    'TiO2-mp | SAM1',
-    'PCBM-70 | Lif',
-    'TiO2-c | C60-NH2',
-    'PCBM-60 | P4N4',
-    'Ethyl acetate; I2; LiI; TBP; Urea',
-    'SnO2-np | Dompamin-SAM',
-    'Ti | Au',
-    'MgO-c | TiO2-mp',
-    'SnO2-np | TiO2-np',
-    'PN',
-    'ZnO-c | CdS',
-    'TiO2-c | PCBA',
-    'TiO2-c | In2O3-c',
-    'SnO2-c | SnO2-nw | TiO2-c',
-    'WO3-np',
-    'C60; C70 | BCP',
-    'Fe2O3',
-    'TiO2-c | Heparin-Na',
-    'WO3-np | Cs2CO3 | PCBM-60',
-    'PCBM-60 | EFGnPs-F',
-    'C60 | SnS',
-    'ZnO-mp',
-    'PCBM-60-np | PrC60MA | PEI',
-    'TiO2-c | TiO2-mp | PCBM-60; PVK',
-    'C60 | SnO2-c | ZTO',
-    'TiO2-np | C60',
-    'NDI-TriSe',
-    'TPA-3CN | BCP',
-    'TiO2-c | ZnO-nw | ZnO-c',
-    'PEIE | NDI-H',
-    'ITCP-M | BCP',
-    'Alq3; C60 | LiF',
-    'PDPP3T; PCBM-60',
-    'PCBM-60 | Ag-np | BCP',
-    'TiO2-c | STHNP',
-    'SrTiO3',
-    'B4PyMPM | C60 | TmPyPB',
-    'Ti3C2Tx',
-    'TiO2-c | graphite nanofibers',
-    'TiO2-c | TiO2-mp | Al2O3-c | ZrO2-mp',
-    'SnO2-c | SnO2-mp',
-    '[EMIM]PF6-IL',
-    'HATNAS3C4',
-    'TiP2-c | PCBM-60',
-    'Nb2O5-c',
-    'TiO2-c | SrTiO3-np; TiO2-nw',
-    'Poly(9-vinylcarbazole) | PCBM-60',
-    'TiO2-c | PNP',
-    'SnO2-c | Ag | SnO2-c | SnO2',
-    'ZnO | Au-nw',
-    'ZnSnO4-c | ZnSnO4-mp',
-    'PCBM-60 | PFN',
-    'SnO2-c | Al2O3-mp',
-    'PCBM-60 | C70',
-    'P1',
-    'PCBM-70 | AZO-np',
-    'TiO2-c | TiO2-mp | Al2O3-mp | NiO-mp',
-    'PCBM-60 | ZSO-np',
-    'ZnCsO | PCBA',
-    'ZnO-c | WPF‐6‐oxy‐F',
-    'Al2O3-c',
-    'Carbon',
-    'PCBM-60 | PCBDANI | LiF',
-    'TiO2-c | TiO2-mp | MTPS-SAM',
-    'IDT6CN-4F | C60 | BCP',
-    'TiO2-c | ZnO-c | C60',
-    'PCBM-60; PS-b-PEO',
-    'TiO2-c | TiO2-mp | Li-TFSI',
-    'PCBM-60 | P3TMAHT',
-    'PCBM-70 | TiO2',
-    'TiO2-c | TiO2-IO',
-    'AZO-c',
-    'PDI | BCP',
-    'TiO2-c | Au@SiO2-nw; TiO2-mp',
-    'PCBM-60 | C60-N',
-    'TiO2-c | TiO2-mp | In2O3',
-    'TiO2-c | CuI',
-    'PCBM-60 | BCP; TZ-3',
-    'ZnO-c | Al2O3-mp',
-    'TiO2-c | TiO2-nw | Al2O3',
-    'C60; PhIm',
-    'PCBM-60 | bis-C60',
-    'PEAI | PCBM-60 | BCP',
-    'pSNT',
-    'Bi2S3',
-    'SnO2-c',
-    'ZnO-c | CPTA; PbI2',
-    'ZnO-c | C-PCBSD',
-    'ZnO-c | Ag | TiO2-c',
-    'ZnO-c | ZnO-nw | Au-np',
-    'BaCoF4',
-    'Unknown',
-    'ZnO-c | C60',
-    'TiO2-c | TiO2-mp | PCBM-60',
-    'SnO2-c | 3-(1-pyridinio)-1-propanesulfonate',
-    'Graphitic carbon nitride | PCBM-60; Graphene | BCP',
-    'PCBM-60 | LiF',
-    'TiO2-c | TiO2-mp | 4PA-SAM',
-    'Graphene nanoribbons hPDI3-Pyr-hPDI3',
-    'TiO2-np | PCBM-70',
-    'PCBM-60 | TBAOH',
-    'PCBM-70 | ZnO-np',
-    'F8BT | C60',
-    'Carbon-nt',
-    'SnO2-c | TiS2',
-    'HPDT | PCBM-60 | Bphen',
-    'Nb2O5-c | Nb2O5-mp',
-    'Al2O3; TiO2-c',
-    'TiO2-c | Sr2CeO4:Eu',
-    'PEIE | TiO2-c | TiO2-mp',
-    '1-ethyl-3-methylimidazolium iodide | C60 | 1-ethyl-3-methylimidazolium iodide',
-    'ITIC | BCP',
-    'N2200',
-    'C60 | LiF',
-    'TiO2-c | Ag | TiO2-c',
-    'TEACl | PCBM-60 | PEI',
-    'ZnO | MgO | EA | TiO2-mp',
-    'ITCPTC | Rhodamine 101 | LiF',
-    'IDIC',
-    'PCBM-60 | PDI-Br',
-    'SFX-PDI4 | TiO2-c',
-    'In2O3-c',
-    'ZnO-nw',
-    'Graphene oxide',
-    'TiO2-c | 3-PA-SAM',
-    'ITIC | PEIE',
-    'ZnO-c | ZnO-nw | CdS-QDs',
-    'TiO2-c | TiO2-mp | Al2O3-mp',
-    'PCBM-60 | ZnO-np | DPO',
-    'TiO2-c | Ba0.8Sr0.2SnO3-np',
-    'C60 | PN4N',
-    'TiO2-c | TiO2-mp | ZrO2-mp | NiO-mp',
-    'TiO2-c | SnO2-c',
-    'PSS | PCBM-60 | ZnO-np',
-    'TiO2-c | TiO2-mp | La2O3',
-    'PCBM-60 | SnO2-c',
-    'PFN-OX',
-    'PVDF-TrFE | C60 | BCP',
-    'ZnO-np | ZnO-nanospheres | PEI',
-    'TPE-PDI4 | C60 | BCP',
-    'PEABr | PCBM-60 | BCP',
-    'PbZrTiO3',
-    'TiO2-c | TiO2-nanofibres',
-    'TiO2-c | SiO2-np',
-    'ICBM | bis-C60',
-    'Mix-DMEC70',
-    'N2200 | ZnO-np',
-    'TiO2-c | SnO2-np | BSO-mp',
-    'LiF | C60 | BCP',
-    'Fluorosilane | C60 | BCP',
-    'C60(OH)16 | C60',
-    'TiO2-c | TiO2-mp | MAI',
-    'ZnO-c | ZnO-nw | ZrO2-mp',
-    'SnO2-nw',
-    'B2F | C60 | BCP',
-    'PCBB-S-N | PCBM-60 | C60 | BCP',
-    'SnO2-np | Li-TFSI',
-    'PCBM-60 | pFN-Br',
-    'PCBM-60 | Cr2O3',
-    'TiO2-mp | TiO2-c | TiO2-nw',
-    'TiO2-nw | TiO2-c',
-    'PO-TAZ | ZnO-c',
-    'PCBB-3N-3I | PCBM-60',
-    'PCBM-60 | PN6',
-    'TiO2-c | TiO2-mp | Graphene oxide',
-    'SnO2-np | SnO2-mp',
-    'LiF | C60',
-    'PCBM-60; MAI',
-    'PCBM-60 | TiO2-c',
-    'PCBM-60 | Poly(2-ethyl-2-oxazoline)',
-    'N2200; PCBM-70; TT',
-    'Br-PDI | ZnO-np',
-    'MoS2; TiO2-np',
-    'TPE-PDI4 | Rhodamine 101 | LiF',
-    'TiO2-mp | N719 | LPP',
-    'IDT6CN | C60 | BCP',
-    'PCBM-60 | bis-C61',
-    '(RhCp*Cp)2 | C60',
-    'Br-PDI',
-    'C-PDTON | ZnO',
-    'SrGeO3',
-    'PCBM-60 | DEME-TFSI',
-    'Nb2O5 | TiO2-mp',
-    'ZnO-c | MgO | TiO2-mp',
-    'TiO2-c | TiO2-mp | SnO2-mp',
-    'P(NDI2OD-T2)',
-    'SnO2-np | PEG; SnO2-mp',
-    'PYPH | LiF',
-    '(2Z,2′Z)-3,3′-(5,5′-(2,7-dioctyl-1,3,6,8-tetraoxo-1,2,3,6,7,8-hexahydrobenzo[lmn][3,8] phenanthroline-4,9-diyl)bis(thiophene-5,2-diyl))bis(2-(3,5-bis (trifluoroomethyl)phenyl) acrylonitrile)',
-    'TiO2-nw | Sb2O3-np; SnO2-np',
-    'bis-PCBM',
-    'SnO2-c | BMIMBF4',
-    'ITIC-Th | Zn(acac)2',
-    'ITCPTC-Se | LiF',
-    'TiO2-c | SnO2-np | PCBM-60',
-    'In2S3 | TiO2-c | TiO2-mp',
-    'TiO2-c | C60',
-    'TiO2-mp | Ti:TiO2 | ZrO2-mp',
-    'Cs2SnI6',
-    'TiO2-c | KH570',
-    'TiO2-c | TiO2-mp; TiO2-nw',
-    'ZnO-np | C60',
-    'PNDI20D-TT | ZnO',
-    'PCBDAN',
-    'SnO2-QDs | C60',
-    'd-PCBM-60; PCBM-60',
-    'TiO2-c | Ag-nw',
-    'PEIE | TiO2-c',
-    'NDIF1',
-    'PCBM-60 | C60 | Rhodamine 101 | LiF',
-    'TPE-DPP12 | C60 | BCP',
-    'TiO2-nw | TiO2-np',
-    'ZrO2-c | PCBM-60',
-    'ZnO-np | ATTA',
-    'ZnO-c | CdSO',
-    'Black P-QDs',
-    'MSAPBS',
-    'SnO2-c | PCBM-60',
-    'TiO2-c | SAED',
-    'ZnO-np | ZnO-nw',
-    'TiO2-c | PCBM-62',
-    'TiO2-c | TiO2-mp | CBA-SAM',
-    'AZO',
-    'PCBM-60-mp',
-    'SnO2-c | SnO2-c',
-    'B2F | C60',
-    'BenMeIM-Cl | C60',
-    'PCBC6 | BCP',
-    'B2T | C60',
-    'TiO2-c | TiO2-mp | HOOC-C11H22-SH',
-    'c-HATNA | bis-C60',
-    'TiO2-np | TiO2-c',
-    'C60 | SnO2',
-    'TiO2-mp | N719',
-    'SnO2-np; TiO2-np; MXene',
-    'TiO2-c | NaYF4:Yb:Tm-np',
-    'CdS | PCBM-60',
-    'ZnO-np | TiO2-np',
-    'Fullerene @ F4',
-    'SnO2-np | PCBM-60; PCBA | C60',
-    'ZnO-c | SnO2-np',
-    'PCBM-60 | m-PYBrZnPor',
-    'ZnO-c | ZnO-nw | PCBM-60',
-    'TiO2-c | ZrO2-c | Al2O3-mp',
-    'PCBM-60 | DMAPA-C60',
-    'NDI-ID',
-    'MgO-c',
-    'PCBM-60 | BCP | AZO-c',
-    'TiO2-c | SnO2-QDs',
-    'TiO2-c | TiO2-mp | Bacteriorhodopsin',
-    '[EMIM]PF6-IL | C60',
-    'ZnO-c | 3-aminopropanioc acid-SAM',
-    'TiO2-c | TiO2-c',
-    'TiO2-c | PCBM-60',
-    'SnO2-c | TiO2-c',
-    'Graphene | TiO2-mp',
-    'TiO2-c | TiO2-mp | GABAHI',
-    'WO3-c | WO3-nw',
-    'pBTT',
-    'TiO2-c | TiO2-mp | ZrO2-mp | Carbon-mp',
-    'ZnSe',
-    'ADAHCl | C60 | BCP',
-    'C60',
-    'PCBM-60 | Zr(acac)4 | PEI',
-    'PCBM-60; PCBDAN',
-    'Poly-EDOT-C60',
-    'TiO2-c | TiO2-mp | NBA-SAM',
-    'C60/C70-N',
-    'PCBM-60 | Rhodamine 101',
-    '4-methoxythiophenol',
-    '4-HI-PVK | PCBM-60 | BCP',
-    'C60 | ZnSe',
-    'ZnO-c | EMIM-PF6',
-    'C60 | bis-C60',
-    'TiO2-c | TiO2-mp | Graphene-QDs',
-    'NDP-V | Rhodamine 101 | LiF',
-    'CYOP | PCBM-60 | PEIE',
-    'LiF | C60 | SnO2-c | ZnSnO2-c',
-    'CuInS2 | Al2O3-np',
-    'TiO2-c @ {101} facet',
-    'ZnO | MgZnO',
-    'EDTA',
-    'ZnO-np | SnO2-np | C60-SAM',
-    'Nb2O5',
-    'C60 | BCP | LiF',
-    'PCBM-60 | C60 | TPBi',
-    'TiO2-c | PDI2',
-    'TiO2-c | MgO-c | TiO2-mp',
-    'SiPc-Py-2 | PTCDA | PO-T2T',
-    'PCBB-3N | PCBM-60',
-    'TiO2-c | TiO2-mp | MgO-c',
-    'TiO2-c | TiO2-mp | Au-np | MgO',
-    'PCBM-70 | Rhodamine 101',
-    'TiO2-c | TiO2-mp | CdSe-QDs',
-    'In2O3-c | SnO2-c',
-    'SnO2-np | APTES-SAM',
-    'Ag-np | TiO2-c',
-    'SnO2-nt',
-    'CDIN',
-    'TIPD; ZnO-np',
-    'TiO2-c | TiO2-mp | 4-aminobenzoic acid-SAM',
-    'ZnO-c | ZnO-nanowells',
-    'TiO2-c | TiO2-mp | C60-SAM',
-    'TiO2-c | TiO2-mp | ZrO2-mp | PbTiO3',
-    'Fullerene-SAM',
-    'SnO2-c | 1‐butyl‐3‐methylimidazolium bromide',
-    'PCBM-60 | PPy',
-    'TiO2-c | TiO2-nanosphere',
-    'TiO2-c | CsPbBr3-QDs',
-    'TiO2-c | TiO2-mp | B2Pin2',
-    'TiO2-c | TiO2-mp; ZrO2-mp',
-    'TiO2-c | NAMF-Cl',
-    '4-DMABA | PCBM-60 | BCP',
-    'ZnO-c | ZTO | PCBM-60',
-    'TiO2-c | TiO2-mp | GO-Li',
-    'NiO-c',
-    'F8BT',
-    'TiO2-c | TiO2-mp | Cs2CO2',
-    'PCBM-60 | Bis-FITG',
-    'ZnO-c | Al2O3-c | TiO2-mp',
-    'MgO',
-    'TMAH',
-    'C60 | [EMIM]PF6-IL',
-    'Ca | C60',
-    'TiO2-c | C60-ETA',
-    'TiO2-c | C60-SAM | SiO2-np',
-    'TN-P',
-    'diPDI | TiO2',
-    'ZnO-c | Cs2CO3',
-    'Graphene oxide; ZnO-np',
-    'ZnO-np | PFS-FTEG',
-    'PCBM-60 | Et2PrNMe-CF3BF3',
-    'TiO2-c | TiO2-nt | ZrO2-mp',
-    'TiO2-c | TiO2-nt',
-    'TiO2-c | SnO2',
-    'SnO2 | PCBM-60',
-    'f-C70 | C60',
-    '1‐benzyl‐3‐methylimidazolium chloride',
-    'SnO2-c | PCBM-60; PMMA',
-    'PCBM-60 | CeOx-np',
-    'TiO2-macroporous',
-    'ICMA',
-    'TiO2-c | TiO2-mp | PcM-Cou',
-    'TiO2-c | SnO2-nanosheets',
-    'HATNASO2C7-Cs',
-    'P4',
-    'PV-PDI',
-    'PCBM-60 | PrCMA',
-    'TiO2-c | TiOZn-nanosphere',
-    'TiO2-c | TiO2-mp | TiN',
-    'TiO2-c | Ag@TiO2-nw',
-    'BCP',
-    'Choline chloride | C60 | BCP',
-    'ZnO-c | Al2O3-c',
-    'BaSnO3-nw',
-    'TDPP-CN4 | BCP',
-    'PCBM-60 | Bphen',
-    'Cr2O3',
-    'NDP-V | C60 | BCP',
-    'Carbon-np; SnO2-np',
-    'SnO2-np | DPC60',
-    'ZnO-np | MgO',
-    'TiO2-c | TiO2-mp | ZIF-8',
-    'BiFeO3',
-    'TiO2-c | PBCM-60',
-    'PCBM-60 | BCP | Ga2O3',
-    'TiO2-c | TiO2-nw | TiO2-np',
-    'CMB | AZO',
-    'C60-MPy | BCP',
-    'CdI2 | C60 | BCP',
-    'Me4NI | PCBM-60 | BCP',
-    'LiQ; PEIE | PCBM-60',
-    'C-PDTON | SnO',
-    'C60MC12 | AZO-np',
-    'SnO2-c | NaOH',
-    'TiO2-c | ZrO2-mp',
-    'TiO2-c | NaYF4-np; TiO2-mp',
-    'PCBM-60 | Bis-FIMG',
-    'SnO2-c | ZnTiO3-mp',
-    'TiO2-c | TiO2-mp | SQ2',
-    'TiO2-np | CsBr',
-    'TiO2-c | TiO2-mp | SiO2-mp',
-    'C60 | Al2O3-mp',
-    'PCBM-70 | TiO2-c',
-    'DPC60',
-    'PCBM-60 | MUTAB',
-    'FeO | PCBM-60',
-    'ZnO-np | SnO2-np',
-    'ZnO-c | APTES-SAM',
-    'SnO2-c; SWCNTs',
-    'PN-F50',
-    'NDI-BiSe',
-    'ZnO-c | ZnO-mp',
-    'TiO2-c | Ag-np | TiO2-c',
-    'SnO2-np | LiF',
-    'TiO2-c | bis-PCBM; DMC',
-    'PCBM-60 | AgAl-np | LiF',
-    'PCBM-60 | C60 | BCP',
-    'PCBM-60 | pi-PFE4',
-    'TiO2-c | TiO2-mp | Al2O3-np',
-    'TiO2-nanocones | TiO2-mp',
-    'TiO2-c | PCBM-60 | C60-ETA',
-    'PC61BEH',
-    'TiO2-c | TiO2-mp | ZIF-8-10',
-    'Mg0.25Zn0.75O-np',
-    'PCBB-OEG; PCBM-60 | C60 | BCP',
-    'NMPFP',
-    '2H-TaS2',
-    'ICBA | BCP',
-    'C70 | LiF',
-    'TiO2-c | TiO2-mp | PCBM-60; PMMA',
-    '1-ethyl-3-methylimidazolium iodide',
-    'TiO2-c | MgO | TiO2-mp | ZrO2-mp',
-    'SrTiO3 | TiO2-mp | Al2O3-mp',
-    'BaSnO3',
-    'CMB-vTA | AZO',
-    'TiO2-c | NiO-np',
-    'ITIC-Th | BCP',
-    'PCBM-70 | ZrO3',
-    'FPI-PEIE | PCBM-60',
-    'TiO2-c | PCBSD',
-    'ZnO-c | ZnO-nw | Al2O3-c',
-    'PCBM-60 | AZO | BCP',
-    'Zn2SnO4 | TiO2-mp',
-    'BCP | C60',
-    'ZnSO',
-    'TiO2-c | NAMF-H',
-    'CdZnSeS-QDs | C60 | BCP',
-    'TiO2-c | TiO2; CoCr-mp',
-    'IPH | PDINO',
-    'PCBM-60 | HDAC',
-    'C60 | SnO2-c',
-    'Ag-nanocube | TiO2-c',
-    'SnO2-c | C9',
-    'NbOx',
-    'IDIC | C60 | BCP',
-    'NiO-c | TiO2-c',
-    'ICBA | PrC60MAI',
-    'TiO2-c | TiO2-mp | CdS',
-    'AZO-c | ZnO-nw',
-    'Fullerene @ F3',
-    'SnO2-c | TiO2-mp | ZrO2-mp',
-    'CdS-nw',
-    'PCBM-60 | F-R-COOK',
-    'TiO2-c | 2-PA-SAM',
-    'TiO2 | C60',
-    'TiO2-nt | ZnO-c',
-    'SnO2-c | C60-5c',
-    'PT-PDI',
-    'NDI-ID (RR)',
-    'TEABr | PCBM-60 | PEI',
-    'FPDI',
-    'MgO | SrRuO3 | SrRuO3',
-    'PCBM-60 | TrNBr',
-    'TiO2-c | TiO2-mp | Au@SiO2-np',
-    'PCBM-60 | EFGnPs-H',
-    'TiO2-c | Sr2CeO4:Sm',
-    'TiO2-c | TiO2-mp',
-    'ZnO | PTFE',
-    'ZnO-c | TiO2-c | PCBM-60',
-    'C60 | 3TPYMB',
-    'PCBM-60 | Rodhamine 101 | C60 | Rodhamine 101 | LiF',
-    'PCBM-60; ZnO-np',
-    'PCBM-60 | TIPD',
-    'PCBM-60 | pi-PFE1',
-    'C60; PCBM-60 | Zr(acac)4',
-    'TiO2-c | TiO2-nw | SiO2-nanocolumns | TiO2-nw',
-    'PCBM-60 | F-C60; bis-C60',
-    'TiO2-c | BZnTPP',
-    'C60 | BenMeIM-Cl',
-    'Au-np; SnO2-np',
-    'ZnO-c | PCBA',
-    'PC61BBz | BCP',
-    'SnO2-np; TiO2-c',
-    'SiO2-c | ZnO-c',
-    'CdSe-QDs',
-    '(2Z,2′Z)-3,3′- (5,5′-(2,7-dioctyl-1,3,6,8-tetraoxo-1,2,3,6,7,8-hexahydrobenzo [lmn][3,8]phenanthroline-4,9-diyl)bis (thiophene-5,2-diyl))bis(2-(4-(trifluoromethyl)phenyl) acrylonitrile)',
-    'PDI-HE',
-    'PCBM-60 | SnO-c | SnZnO',
-    'ZSO-np | PCBM-60',
-    'SnO2-c | Al2O3-np',
-    'PCB-C4',
-    'PCBM-60 | Zr(Acac)',
-    'PEIE',
-    'PTTI-2',
-    'ZnO-c | Nb2O5',
-    'SnO2-np | CPTA',
-    'TiO2-c | SnO2-mp',
-    'TiO2-c | TiO2-nanoballs | SiO2',
-    'TiO2; WOx',
-    'PCBM-70 | LiF',
-    'TiO2-c | Zn2SnO4-mp',
-    'PCBM-60 | C60 | LiF',
-    'ITCPTC-Th | C60 | BCP',
-    'ZnO | 1,2-ethanedithiol',
-    'TiO2-c | NAMF-Br',
-    'TiO2-c | Au@SiO2-np; TiO2-mp',
-    'TiO2-c | CsPbCl3-QDs',
-    'WO3-c | Cs2CO3 | PCBM-60',
-    't-BPTI | PDI-C4 | BCP',
-    'TiO2-c | ZnO-c',
-    'TiO2-c | TiO2-mp | SnO2-c',
-    'SnO2-np | Graphene-QDs',
-    'SnO2-c | KOH',
-    'PCBM-60 | BCP',
-    'ZnO | ZnO-nw',
-    'TiO2-c | CsPbI3-QDs',
-    'HATNAS3C7-Cs',
-    'TiO2-c | Al2O3-mp; Ag@TiO2-np',
-    'TiO2-c | KY7F22-np',
-    'PCBM-60 | Carbon',
-    'ZnO-np | Mg-EA',
-    'SnO2-np | Choline Chloride',
-    'SnO2-np | TiO2-mp',
-    'TiO2-c | C60-SAM | Al2O3-np',
-    'ITIC | PCBM-60 | PEIE',
-    'Au@TiO2-nw; TiO2-np',
-    'TiO2-c | DMF',
-    'ICBA | C60 | BCP',
-    'CNTPA-PCBM | bis-C60',
-    'ZnTiO3-c',
-    'Mg0.15Zn0.85O-np',
-    'PCBM-70 | Bphen',
-    'PCBM-60 | PEI',
-    'PCBM-60 | DTAB',
-    'TiO2-c | ZnPtriazine(gly)2',
-    'ITCPTC-Th | LiF',
-    'PCBM-60; PCDTBT',
-    'PFN',
-    'H-PDI | ZnO-np',
-    'tris-PCBOE | ZnO',
-    'TiO2-c | TiO2-nw | TiO2-c',
-    'PCBM-60 | PEIE',
-    'TiO2-c | PS:TiO2-mp',
-    'Fullerene @ F1',
-    'TiO2-c | Au@TiO2-np; TiO2-mp',
-    'ZTO | SnO2-c',
-    'TiO2-c | Au@Ag | TiO2-mp',
-    'TiO2-c | TiO2-mp | CaTiO3-c',
-    'HfO2 | SnO2-np',
-    'DBP | PCBM-60 | Bphen',
-    'IBF-Ep',
-    'C60; PhIm | C60',
-    'PCBM-70 | AZO',
-    '1-ethyl-3-methylimidazolium iodide | C60',
-    'SnO2-c | Graphene',
-    'TiO2-c | rGO:TiO2-nanofibrse',
-    'TiO2-c | TiO2-mp | CaTiO3',
-    'TiO2-c | [BMIM]BF4',
-    'C70 | BCP',
-    'P(NDI2OD-T2); PCBM-60 | BCP',
-    'In2O3 | PCBM-60',
-    'CdS | TiO2-c',
-    'TiO2-c | TiO2-mp | ZrO2-mp',
-    'ZnO-c | Hexamethylenetetramine',
-    'TiO2-c | Graphene-QDs',
-    'BCP; PCBM-60',
-    'PCBM-60 | AZO-np | PEI',
-    'PCBM-60 | BCP | LiF',
-    'C60 | PCBM-60 | BCP',
-    'ITIC | Zn(acac)2',
-    'PCBM-60 | TIPD; ZnO-np',
-    'ZnO-c | ZnO-nanofibers | PEI',
-    'CeOx | PCBM-60',
-    'SnO2-c | PEIE | PCBM-60',
-    'C60 | PAA',
-    'ZnLiO | PCBA',
-    'GAN',
-    'TiO2-c | TiO2-mp | beta-Alanine-SAM',
-    'TiO2-c | Al2O3-c | TiO2-mp',
-    'TiO2-c | TiO2-mp | CsI',
-    'TiO2-c | C60-SAM',
-    'C60 | TiO2-c',
-    'PCBM-60 | ZnO-np | ACO-c',
-    '3-acetylpyridine | PCBM-60 | BCP',
-    'TiO2-c | TiO2-nanosphere | TiO2-mp',
-    'PCBM-60 | pi-PFE2',
-    'ZrO2-np',
-    'C60-SAM | SnO2-c | PCBM-60',
-    'PCBM-60 | BCP; TZ-4',
-    'BPB-M | LiF',
-    'SnO2-np | OEABS',
-    'PCBM-60 | Lif',
-    'NDIF2',
-    'ZnO-c | ZnO-c | Ba(OH)2',
-    'TiO2-c | TiO2-mp | Aminocaproic acid',
-    'C60 | Zr(acac)4',
-    'PCBM-60 | CTAB',
-    'HATNA-F6',
-    'PCBM-60 | ZnO-np | PEI',
-    '(RuCp*mes)2 | C60',
-    'PTCBI',
-    'PTCBI | BCP',
-    'PCBM-60 | EGME',
-    'TiO2-nanocones',
-    'IT-M | Zn(acac)2',
-    '2-acetylpyridine | PCBM-60 | BCP',
-    'C60 | C60; PhIm',
-    'SnO2-nw | SnO2-nw',
-    'Ti3C2',
-    'Al:ITO-c | SnO2-c',
-    'WOx | I-Ph-PA_C60-C6-PA',
-    'WOx | C60',
-    'SnO2-np | PFN-Br',
-    'PEIE | PCBM-60 | Bphen',
-    'TiO2-c | SrTiO3:TiO2-mp',
-    'TiZnO12-c',
-    'TiO2-c | Carbon-nt; TiO2-mp',
-    'PTCA',
-    'SnO2-c | SnO2-mp | TiO2-c',
-    'C60; Phlm | C60',
-    'PCBM-60 | ICL',
-    'PCBM-60 | Alq3',
-    'TiO2-c | TiO2-nanoballs',
-    'TiO2-nanoleaves',
-    'TiO2-c | TiO2-mp | ZrO2-mp | NiO-mp',
-]
-
-
-cell_enum_edit_quantity_suggestions = [
-    'SLG | ITO | PTAA | Perovskite-sc | C60 | BCP | Cu',
-    'SLG | FTO | Ag-nancubes | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'PET | ITO | NiO-c | Perovskite | TPA-3CN | BCP | Al',
-    'SLG | ITO | NiO-c | NiO-mp | Perovskite | ZnO-mp | ZnO-np | Ag',
-    'SLG | ITO | C60 | Perovskite | Spiro-MeOTAD | Cu',
-    'SLG | ITO | Graphene | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | V852 | Au',
-    'SLG | FTO | SnO2-np | PCBM-60 | Perovskite | M109 | Au',
-    'SLG | ITO | MoO3 | PEDOT:PSS | Perovskite | C60 | Bphen | Ag',
-    'SLG | FTO | SnO2-np | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | CuSCN | Perovskite | PCBM-60 | PEI | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Carbon-tape',
-    'SLG | FTO | TiO2-c | Perovskite | TTz-1 | Au',
-    'SLG | ITO | Perovskite | C60 | Bphen | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P3HT | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | CuSCN | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | SWCNTs | PEDOT:PSS | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | SnO2-np | Perovskite | YD2-o-C8 | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-np | ME2 | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | BMIM-OTF | ITO',
-    'SLG | ITO | SnO2-np | Perovskite | Theobromine | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-nc | Perovskite | Spiro-MeOTAD | Au',
-    'SLG  FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | ZnO-np | Perovskite | YT3 | MoO3 | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | EVA; MWCNTs | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | PbS-QDs | Perovskite | Carbon',
-    'SLG | ITO | PEDOT:PSS | Perovskite | ICBA | C60 | BCP | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 9,9’-di{6-[3-(2-(4-methylphenyl)vinyl)-9-carbazol9-yl]hexyl}-[3,3’]bicarbazole) | Au',
-    'SLG | ITO | ZnO-np | ZnO-nanospheres | PEI | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | Cu:NiO | Perovskite | PC(70)BM | AZO | Al',
-    'SLG | FTO | TiO2-c | SiO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | MgO-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PFN; TT | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | ZnO-c | Perovskite | P3HT | Au',
-    'PET | IZO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | WOx | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | ITIC | Au',
-    'SLG | FTO | SnO2-np | Perovskite | PBDT(T)(2F)T | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | H18 | Au',
-    'SLG | ITO | ZnO-np | SnO2-np | C60-SAM | Perovskite | P3HT | MoO3 | Ag',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PCBM-60 | C60 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Lif | Al',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60 | PN4N | Al',
-    'SLG | ITO | NiPcS4 | PEDOT:PSS | Perovskite | PCBM-60 | C60 | BCP | Ag',
-    'PEN | AZO | ZnO-c | C60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | SnO2-c | Perovskite | CS02 | Au',
-    'SLG | FTO | TiO2-c | SiO2-np | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | LiF | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SGT-407 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Q198 | Carbon',
-    'SLG | ITO | PTAA | MoS2 | Perovskite | PCBM-60 | PFN | Al',
-    'SLG | FTO | SnO2-c | Perovskite | V1061 | Au',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60 | [BMIM]BF4 | Ag',
-    'SLG | FTO | NiMgLiO-c | Perovskite | PCBM-60 | BCP | Bi | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TTA3 | Au',
-    'SLG | ITO | CuI; CuSCN | Perovskite | PCBM-60 | PEI | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | V859 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | MeO-DATPA | Au',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | Ca | Al',
-    'SLG | FTO | WOx | SnO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | pTPD | Perovskite | IPH | Ba | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | IBF-Ep | Ca | Al',
-    'SLG | ITO | Graphene oxide | PTFTS | Perovskite | PCBM-60 | BCP | Au',
-    'SLG | FTO | In2S3 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | PCBM-60 | Perosvkite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | PCBM-60; PMMA | Perovskite | PMMA | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-np | Perovskite | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | AZO-np | SnO2-c | Ag',
-    'PET | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PEI | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | X51 | Ag',
-    'SLG | ITO | ZnO | Perovskite | Spiro-MeOTAD | MoOx | Al',
-    'SLG | ITO | SnO2-np | Perovskite | CuGaO2-np | CuSCN | Au',
-    'SLG | FTO | NiO | Perovskite | PCBM-60:PS | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TCP-OC8 | Au',
-    'PEN | ITO | HfO2 | SnO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | PCBM-60 | Perovskite | P3HT | Au',
-    'PES | Ti | Graphene | NiO-c | Perovskite | PCBM-60 | AZO | Ag | AZO',
-    'SLG | ITO | TiO2-c | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | PEDOT:PSS | ZnO-c | Perovskite | Spiro-MeOTAD | PEDOT:PSS',
-    'SLG | ITO | PTAA | Perovskite | ICBA | bis-C60 | Ag',
-    'SLG | PEI | Au | PEDOT:PSS | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | NiO-np | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | TiO2-np | Perovskte | Spiro-MeOTAD | Au',
-    'SLG | FTO | MgO | SnO2-np | Ethanol amine | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | NP2 | Au',
-    'SLG | ITO | TiO2-c | Perovskite | C201 | Ag',
-    'SLG | ITO | ZnO-c | TiO2-c | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'PEN | ITO | PEDOT:PSS | Perovskite | C60 | BCP | LiF | Al',
-    'SLG | ITO | nTi-MOF | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PTAA | Perovskite | C60 | SnO2 | ITO | Ag-grid',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | ZnMgO | Al',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | BCP | TeO2 | Ag',
-    'NOA63 | PEDOT:PSS | Perovskite | PCBM-60 | GaIn',
-    'SLG | FTO | ZnO-c | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | F4-TCNQ | Spiro-MeOTAD | Au',
-    'PET | ITO | PEDOT:PSS | Perovskite | EVA | PCBM-60 | BCP | Ag',
-    'PET | Ag-grid | PEDOT:PSS | PEDOT:PSS | Perovskite | PCBM-60 | PEI | Ag',
-    'SLG | ITO | NiO | Perovskite | PCBPy | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | YKP03 | Ag',
-    'SLG | AZO | SnO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | PbS-QDs | Perovskite | P3HT | Au',
-    'SLG | ITO | SnO2-c | SnO2-mp | Perovskite | PTAA | Au',
-    'SLG | FTO | TiO2-c | Perovskite | P3HT | PEDOT:PSS | ITO',
-    'SLG | ITO | Graphene oxide; PEDOT:PSS | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Tetracene | Spiro-MeOTAD | Au',
-    'SLG | ITO | C60 | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TS-CuPc | Perovskite | PCBM-60 | Bphen | Ag',
-    'SLG | FTO | SnO2-c | C60-SAM | Perovskite | CZ-STA | Au',
-    'SLG | FTO | TiO2-c | TiO2-nw | CdS | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | D149 | Spiro-MeOTAD | Au',
-    'b-CNF | IZO | PEDOT:PSS | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | NiO-c | Perovskite | SnO2-c | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | WY-2 | Ag',
-    'SLG | ITO | ZnO-c | Perovskite | CuSCN | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | CuPc | Spiro-MeOTAD | Au',
-    'Cu-nw; GFRHybrimer; ITO | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | SnO2-np | CPTA | Perovskite | P3CT | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Th-PDI | Au',
-    'SLG | ITO | P3CT-K | Perovskite | PCBM-60 | C60 | Al',
-    'PET | ITO | PTAA | Perovskite | PCBM-60 | C60 | BCP | Cu',
-    'PEN | FTO | PEI | PCBM-60 | Perovskite | PTAA｜Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | C60 | Rhodamine 101 | LiF | Ag',
-    'SLG | ITO | TiO2-c | Perovskite | TPADPP-2 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | V1209 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | Ag',
-    'SLG | ITO | SnO2-c | BA-SAM | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | ZnO-c | C60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | Mg0.15Zn0.85O-np | Perovskite | P3HT | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | H-2,5 | Au',
-    'SLG | ITO | PEDOT:PSS | Graphene oxide | Perovskite | PCBM-60 | Bphen | Ag',
-    'SLG | ITO | Cu2O | PEDOT:PSS | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | NiO-np | Spiro-MeOTAD | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | rGO | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Dispiro-OMeTAD | Au',
-    'SLG | FTO | BiFeO3 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | NiPc | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DEH | Ag',
-    'SLG | ITO | m-MTDATA | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | 4-aminobenzoic acid-SAM | Perovskite | P3HT | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 1,3-disubstituted azulene | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | MoOx | Ag',
-    'SLG | FTO | PTAA | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovsite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | CO2CO3 | Perovskite | PolyTPD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | n-dimethyloxamic acid | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | NiO-c | Perovskite | C60; PCBM-60 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PFN | Al',
-    'SLG | ITO | TiO2-np | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | bis-C60 | BCP | Ag',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60 | PEIE | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P3HT | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 3,6-Ben | Au',
-    'SLG | ITO | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | TiO2-c | PDI2 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TBC | Au',
-    'SLG | ITO | PEDOT:PSS | X-OTPD | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | NiO-c | CuGaO2-mp | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | NiO-c | PTAA | Perovskite | PCBM-60 | Mg | Ag',
-    'SLG | FTO | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | MoO3 | TPTPA | Perovskite | C60 | TmPyPB | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PST1 | Au',
-    'SLG | FTO | TiO2-c | TiO2-nanocones | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-np | NiO-np | Perovskite | PCBM-60 | BCP | Au',
-    'SLG | FTO | TiO2-c | TiO2-nanofibers | Perovskite | PTAA | Au',
-    'SLG | ITO | WO3-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ZnPc-p-ZnPc 1 | Au',
-    'SLG | ITO | ZnO-np | Perovskite | Au',
-    'A.R.C. | SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-c | FAD | Perovskite | PCBM-70 | AgAl',
-    'SLG | ITO | NiO | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | SiO2-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | CsPbCl3-QDs | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | F6-TCNNQ; TaTm | Perovskite | C60 | C60; PhIm | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DIB; SeS2 | Au',
-    'PEN | ITO | SnO2-np | CPTA | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | LiF | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | NDI-BTH1 | Ag',
-    'SLG | FTO | TiO2-c | TiBaO-nanosphere | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-np | Perovskite | BMIMBF4 | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEIE | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | N-PDI | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | C60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | Ag-np; TiO2-c | TiO2-mp | Perovskite | Au',
-    'SLG | ITO | PEDOT:PSS | Pyrene | Perovskite | PCBM-70 | C60 | BCP | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | SnO2-c | Perovskite | BL40 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Ag-sheet',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | C60 | LiF | Al',
-    'SLG | FTO | TiO2-c | Heparin-Na | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | NiO-c | Al2O3-mp | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 2,8-bis-[2,2-bis(4-methoxyphenyl)ethenyl]-5,11-diethyl-5,11-dihidroindolo[3,2-b]carbazole | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | pi-PFE3 | Ag',
-    'SLG | FTO | TiO2-mp | Perovskite | HfO2 | Acetonitrile; I2; LiI; PMII; Propylene glycol; TBP | Graphite',
-    'PET | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-c | C60 | Perovskite | PPyra-TXA | MoO3 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60 | BCP | Ag | Alq3',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | Rhodamine 101 | Au | Al',
-    'SLG | FTO | TiO2-mp | Perovskite | Ag',
-    'SLG | ITO | 2,7-PCzTPA | Perovskite | PCBM-60 | C60 | BCP | Ag',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-70 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Ag | ITO',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | AZO-np | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | PVK | Ag',
-    'SLG | ITO | PTAA | Perovskite | ITIC-Th | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Au-np | MgO | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | NiO-c | Perovskite | HATNAS3C7-C3h | Ag',
-    'SLG | FTO | ZnO-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TFDIB | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | CuSCN | ITO',
-    'SLG | FTO | TiO2-nw | TiO2-c | Perovskite | Carbon',
-    'SLG | FTO | NiO-c | MoOx | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ZnPc-DPP-ZnPc | Au',
-    'SLG | PEDOT:PSS | NiO-c | Perovskite | C60 | bis-C60 | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | Spiro-MeOTAD | PEDOT:PSS | FTO | SLG',
-    'SLG | ITO | BTF4 | Perovskite | PCBM-60 | LiF | Ag',
-    'SLG | ITO | HTM-2 (bifluorenylidene-based) | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | NiO-nanowalls | Perovskite | PCBM-60 | Zr(acac)4 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | TAE3 | Au',
-    'SLG | ITO | TiO2-c | TiO2-mp | Perovskite | Oleic-acid | P3HT | Au',
-    'SLG | FTO | SnO2-c | PCBM-60 | Perovskite | XPP | MoO3 | Ag',
-    'PET | ITO | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | PEDOT:PSS | NiO-c | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | SnO2-c | KCl | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Perovskite | Al2O3-mp | Spiro-MeOTAD | Ag',
-    'SLG | ITO | CrO3 | Perovskite | PCBM-60 | Bphen | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60; ICBA | Ca | Al',
-    'SLG | FTO | TiO2-c | Al2O3-mp; Ag@TiO2-np | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | SnO2-np | Perovskite | Carbon',
-    'SLG | FTO | NiO-np | Perovskite | PCBM-60 | Au',
-    'SLG | ITO | PTAA | Perovskite | CMB-vTA | PCBM-60 | AZO | Ag',
-    'SLG | ITO | CuAlO2 | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60 | PN4N | Ag',
-    'SLG | ITO | PCBM-70 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | NiO-np | M2 | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | ITO | Ca | C60 | Perovskite | TPTPA | TPTPA; MoO3 | MoO3 | Ag',
-    'PEN | ITO | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | ZnO-c | PCBM-60 | Perovskite | LGC-D013 | MoO3 | Ag',
-    'SLG | FTO | ZnO-c | CdS | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | C60 | BCP | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | POZ10 | Au',
-    'SLG | ITO | PEDOS:PSS | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BTBDT | Ag',
-    'SLG | ITO | SnO2-np | OEABS | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | Bphen | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Cu2ZnSnS4 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TFB | Au',
-    'SLG | ITO | Nb2O5 | Perovskite | Spiro-MeOTAD | Au',
-    'PET | Zeocoat | Graphene | P3HT | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | H-PheDOT | Au',
-    'SLG | PET | Graphene oxide | PTFTS | Perovskite | PCBM-60 | BCP | Au',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | ZnO-np | ZnO-c | ITO | MgF2',
-    'SLG | FTO | TiO2-c | Perovskite | PTZ2 | Au',
-    'SLG | ITO | MC-43 | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | PT-DC | Ag',
-    'SLG | ITO | IrTiOx-c | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | PEDOT:PSS | Perovskite | PCBM-60 | C60 | LiF | Al',
-    'SLG | ITO | PTAA | Perovskite | PCB-C8 | AZO | Ag',
-    'SLG | ITO | NiO-c | NiO-mp | Perovskite | PCBM-60 | BCP | Al',
-    'HCLaminate | IZO | PEDOT:PSS | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | TiO2-c | C60 | Perovskite | PTAA | Au | Organosilicate',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | BCP | Au',
-    'SLG | FTO | TiO2-c | MoOx | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-c | Perovskite | C60 | BCP | Au',
-    'SLG | FTO | TiO2-c | Perovskite | TPE-W4 | Ag',
-    'PEN | Graphene | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | ZnO-c | PCBM-60 | Perovskite | P3HT | Au',
-    'SLG | ITO | Graphene oxide | Perovskite | C60 | Bphen | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TCP-OH | Au',
-    'SLG | ITO | ZnO-c | PCBM-60 | Perovskite | P3HT | MoO3 | Ag',
-    'A.R.C. | SLG | ITO | SnO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'PI | PEDOT:PSS | ZnO-c | Perovskite | Spiro-MeOTAD | PEDOT:PSS',
-    'SLG | ITO | ZnS | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PII2T8T | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | Carbon-nt | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | SP-01 | Au',
-    'SLG | ITO | Si-OMeTPA | Perovskite | PCBM-60 | C60 | BCP | Ag',
-    'SLG | FTO | SnO2-np | TiO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | NH-2,7 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Cu',
-    'CdSeS-QDs | SLG | ITO | NiO-c | Perovskite | ADAHCl | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | CsBr | Perovskite | Carbon',
-    'SLG | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | PEDOT:PSS | Al',
-    'SLG | ITO | PTAA | perovkite | PCBM-60 | Bphen | Cu',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TiS2-np | Au',
-    'SLG | FTO | TiO2-c | SnO2-np | Perovskite | Spiro-MeOTAD | Ag',
-    'PEN | ITO | SnO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PTCBI | Ag | WO3 | PTCBI | Ag',
-    'SLG | FTO | TiO2-c | Al2O3-nt | Perovskite | Spiro-MeOTAD | Au',
-    'PET | PEDOT:PSS | Perovskite | PCTDI | Cr | Au',
-    'SLG | ITO | TiO2-c | NAMF-Cl | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | NiPcS4 | Perovskite | PCBM-60 | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | PPDT2FBT | Au',
-    'SLG | ITO | SnO2-c | C60-5b | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P3HT | PEDOT:PSS',
-    'SLG | ITO | VOx | Perovskite | PCBM-60 | C60 | BCP | Al',
-    'PEI | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | V2Ox | PEDOT:PSS | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CS01 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Et2PrNMe-CF3BF3 | Al',
-    'SLG | FTO | ZnO-np | MgO | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | ZnO-nanoflake | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PFI-PEDOT:PSS | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | PrC60MAI | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | P(NDI2DT-TTCN) | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60 | BCP | Ag | Au',
-    'PET | ITO | N-PDI | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2 | Perovskite | P3HT | Au',
-    'SLG | FTO | TiO2-c | Perovskite | PCBM-60 | Spiro-MeOTAD | Au',
-    'PEN | ITO | X1 | Perovskite | PCBM-60 | C3-CBL | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Th-OMeTPA | Au',
-    'SLG | FTO | TiO2-c | ZrO2-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | PolyTPD | Perovskite | 3TPYMB | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 2TPA-2-DP | Au',
-    'SLG | ITO | NiO-np | PTAA | Perovskite | PCBM-60 | ZnO-np | ZnO | ITO | MgF2',
-    'SLG | ITO | PEDOT:PSS | Perovskite | GDY-Tz-CH2(CH2)16CH3; PCBM-60 | C60 | Al',
-    'PET | ITO | ZnO-c | TiO2-c | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | KM07 | MoO3 | Ag',
-    'SLG | ITO | MC6Cz-TPA | Perovskite | PCBM-60 | LiF | Al',
-    'SLG | ITO | NiO | Perovskite | PCBM-60 | bis-C60 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | PBDTTT-E-T | MoO3 | Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | Bphen | Cu',
-    'SLG | FTO | TiO2-c | Perovskite | SWCNTs | Spiro-MeOTAD | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | PtMePy | Au',
-    'SLG | ITO | PTAA | Perovskite | Ti | Cu',
-    'SLG | FTO | TiO2-c | Perovskite | TPDCN | Au',
-    'SLG | ITO | WO3 | Perovskite | PCBM-60 | LiF | Al',
-    'SLG | FTO | TiO2-c | SnO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PTAA | Perovskite | 2PDI-2S | PEIE | Ag',
-    'SLG | ITO | SnO2-c | C60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | MPA-BTI | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | TiO2-c | Perovskite | Spiro-OEtTAD | Au',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | PrCMA | Ag',
-    'SLG | FTO | TiO2-mp | SAM1 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-c | Perovskite | P-R | Au',
-    'SLG | FTO | TiO2-c | PS:TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | ZnO-c | PCBM-70 | Perovskite | benzo[1,2b:4,5b′]-dithiophene | Ag',
-    'SLG | ITO | Perovskite | PCBM-60 | Ca | Al',
-    'SLG | FTO | TiO2-nanofibers | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | SWCNTs | PEDOT:PSS | Ni-grid',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | BCP | AZO | ITO',
-    'SLG | FTO | NiO-c | Perovskite | PS | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | DTS | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Q216 | Carbon',
-    'SLG | ITO | PTAA | PS | Perovskite | PCBM-60 | Bphen | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | YC02 | Ag',
-    'SLG | ITO | SnO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-c | Perovskite | Au',
-    'PET | ITO | ZSO-np | PCBM-60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PTAA | PMMA | Perovskite | PCBM-60 | Bphen | Al',
-    'SLG | FTO | TiO2-c | PCBA | Perobskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Ba | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TPD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Cu | Cu2O | Ag',
-    'SLG | ITO | C60-lactone | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZrO2-mp | Perovskite | NiO-np | Carbon',
-    'SLG | ITO | AZO-np | Perovskite | P3HT | Au',
-    'SLG | FTO | SnO2-c | PCBM-60 | Perovskite | M113 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | M101 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | C12-carbazole | Ag',
-    'SLG | FTO | BenMeIM-Cl | C60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | NiO-c | Perovskite | ZnO-np | Al',
-    'SLG | ITO | PEDOT:PSS | 5,6,11,12-Tetraphenylnaphthacene | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | V2Ox | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Si-PO-2CN | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Cabon | FTO | SLG',
-    'SLG | FTO | NiMgLiO | Perovskite | TiO2-np | Sb',
-    'SLG | FTO | TiO2-c | TiO2-mp | PbI2 | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | DEME-TFSI | ITO',
-    'PET | ITO | ZnO-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BTT-TPA | Au | Ag',
-    'SLG | ITO | PTAA | PFN | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | COPV2 | Au',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | Ppz | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | BCP; TZ-4 | Ag',
-    'SLG | ITO | SnO2-np | CPTA | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 3,6-Pyr | Au',
-    'SLG | ITO | SnO2-np | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | M117 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-macroporous | Perovskite | Spiro-MeOTAD | Au',
-    "SLG | ITO | SnO2-c | Perovskite | 4,4'-(5,10,11-Trihexyl-10,11-dihydro-5H-thieno[2′,3':4,5]pyrrolo [3,2-g]thieno[3,2-b][1,2,3]triazolo[4,5-e]indole-2,8-diyl)bis(N,N-bis(4- (hexyloxy)phenyl)aniline) | Au",
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SM13 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuMePc | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | NaPTH | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | WO3 | Ag',
-    'SLG | FTO | TiO2-c | SnO2-nanosheets | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-np | Perovskite | B-MWCNTs',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DM | Au',
-    'SLG | ITO | SnO2-np | PCBM-60 | Perovskite | BTPA-TCNE | MoO3 | Au',
-    'SLG | ITO | ZnO-c | ZnO-c | Ba(OH)2 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | PBTTTV-h | Au',
-    'SLG | FTO | TiO2-mp | Perovskite | CuSCN | Carbon | FTO | SLG',
-    'SLG | ITO | ZnO-np | Perovskite | P3HT | P3HT; PMMA | Ag',
-    'PET | SWCNTs | PEDOT:PSS | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Perovskite | P3HT; SWCNTs; Spiro-MeOTAD | Ag',
-    'SLG | ITO | NiO-c | Al2O3-mp | Perovskite | PCBM-60 | Rhodamine 101 | Ag | Au',
-    'SLG | ITO | ZnCsO | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | WO3-nw | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | ZnO-np | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | PEDOT:PSS | PTAA | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | PTAA | PEDOT:PSS | ITO',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PTTI-2 | Ag',
-    'SLG | Ti | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | MoO3 | IZO',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon-nt',
-    'SLG | FTO | SnO2-c | PCBM-60 | Perovskite | PbS | Au',
-    'SLG | ITO | P3CT-Na | Perovskite | ITCPTC-Th | LiF | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DMF; I2; PVA; TBAI | Pt | FTO',
-    'SLG | FTO | SnO2-c | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-c | SnO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | HS-Ph-CN | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Fluorene-dithiophene | Au',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-70 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | ICBA | Ca | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CBP | Au',
-    'SLG | FTO | PEI | PCBM-60 | Perovskite | PTAA | Au',
-    'SLG | FTO | TiO2-c | TiO2-np | Perovskite | Au',
-    'PET | SnO2-c | Au | SnO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | CuSCN | Perovskite | PCBM-60 | AZO-np | Ag-nw',
-    'SLG | FTO | PTCBI | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | ZnO | PEIE | Perovskite | Spiro-MeOTAD | Au',
-    'PET | ITO | PANI | Perovskite | PCBM-60 | Au',
-    'SLG | ITO | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | PCP-TPA | Au',
-    'SLG | FTO | TiO2-c | Perovskite | PTAA | Pd',
-    'SLG | FTO | CrO2 | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BTF-1 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | ITO | SnO2-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'PET | Au | PEDOT:PSS | NPB | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | diPDI | TiO2 | Al',
-    'SLG | ITO | BCP | C60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | PTB7-Th | MoO3 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | Fullerene-2b | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P(BDTT-tPPD) | Au',
-    'SLG | FTO | TiO2-mp | Perovskite | HfO2 | Spiro-MeOTAD | Graphite',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PCBM-60 | TIPD | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | F-PDI | ZnO-np | Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | Ag@Au-np',
-    'SLG | ITO | F6-TCNNQ; TaTm | TaTm | Perovskite | C60 | C60; Phlm | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | pentaerythritol tetrakis(3-mercaptopropionate) | Spiro-MeOTAD | Au',
-    'SLG | FTO | NiO-c | DEA | Perovskite | PCBM-60 | PN4N | Al',
-    'SLG | ITO | NiO-c | Perovskite | SnO2-c | AZO | Ni | Al | Ni',
-    'SLG | ITO | PTEBS | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PTPAANT | Perovskite | PCBM-60 | C60 | BCP | Al',
-    'SLG | FTO | SnO2-c | PCBM-60 | Perovskite | XDB | MoO3 | Ag',
-    'SLG | ITO | ZnO-c | ZnO-nw | Perovskite | P3HT | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PTAA-2F | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuPc‐OTPAtBu | Carbon',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | AZO-np | SnO2-c | Ag-nw',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DPBTD-B[BMPDP]2 | Au',
-    'PEN | ITO | PEIE | PCBM-60 | Perovskite | P3HT | Au',
-    'PET | IZO | TiO2-c | TiO2-np | Perovskite | Spiro-MeOTAD | Ag',
-    'PEN | ITO | PEDOT:PSS | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | KR133 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P3HT | Au | Pt',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PDPP3T; PCBM-60 | Al',
-    'PEN | ITO | MFGO | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DMFA-FA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Graphite | Cu',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Z30 | Au',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | AgAl-np | LiF | AgAl',
-    'SLG | ITO | NiO-np | Perovskite | ITIC | BCP | Ag',
-    'SLG | FTO | TiO2-mp | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | n-CuBuPc | Au',
-    'MgF2 | SLG | ITO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | MoOx | ITO | Au | MgF2',
-    'SLG | ITO | ZnO-np | PCBM-60 | Perovskite | P3HT | Au',
-    'SLG | FTO | NiO-c | Perovskite | TEACl | PCBM-60 | PEI | Ag',
-    'SLG | FTO | TiO2-c | SrTiO3 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | rGO | CuSCN | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DPP-F | Au',
-    'SLG | ITO | Polythiophene | Perovskite | C60 | BCP | Ag',
-    'PET | ITO | CdS | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | BCP; TZ-1 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | LD22 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | ITIC | PEIE | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-mp | Perovskite | Carbon; WO3-np',
-    'SLG | FTO | SnO2-c | Perovskite | CuHePc | Au',
-    'SLG | ITO | 3EGO-PPV | Perovskite | PCBM-60 | BCP | cu',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60 | Bphen | Ag',
-    'SLG | ITO | PTAA | LiF | Perovskite | C60 | BCP | Cu',
-    'SLG | FTO | TiO2-nc | TiO2-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | NiO-c | Perovskite | CSCNT@SnO2',
-    'SLG | FTO | TiO2-mp | Perovskite | NiO | Au',
-    'SLG | FTO | TiO2-mp | LPP | N719 | Perovskite | I2; KI; Propylene carbonate; Polyethylene glycol | Pt | FTO',
-    'SLG | ITO | TiO2-c | TiO2-mp | Perovskite | P3HT | Au',
-    'SLG | ITO | SnO2-np | Perovskite | Graphene oxide | PTAA | Au',
-    'SLG | FTO | SnO2-nw | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | bis-C60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | NiO-c | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | MoS2 | Au',
-    'SLG | ITO | P3CT-Na | Perovskite | ITCPTC-Se | LiF | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | ZnO | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZIF-8-40 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | PCBSD:GD | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | AgZn | Al',
-    'SLG | FTO | ZrO2-c | TiO2-c | Al2O3-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'Ti | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | ITO',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | T102 | Au',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Perovskite | PCBM-60 | Au',
-    'SLG | FTO | C60-SAM | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | tri-TPA | Au',
-    'SLG | FTO | 2H-TaS2 | Perovskite | P3HT | Ag',
-    'SLG | FTO | TiO2-c | ZrO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-c | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'PEN | ITO | C60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | CuSCN | Perovskite | PCBM-60 | LiF | Ag',
-    'PET | AZO | ZnO-nw | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | AZO-np | Ag | SnO2-c',
-    'SLG | FTO | NiMgLiO-c | Perovskite | PCBM-60 | TiO2-c | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | Spiro-MeOTAD | MoO3 | Au',
-    'SLG | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | WO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZrO2-mp | Perovskite | Cu:NiO-np | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PTPD | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-np | CPTA | Perovskite | PTAA | Au',
-    'SLG | ITO | TiO2-c | Perovskite | Carbon',
-    'Au | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | V1036 | Perovskite | C60 | BCP | Cu',
-    'SLG | FTO | ZnO-c | ZnO-nw | Au-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | [BMIM]BF4 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TPD-4EtCz | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | X26 | Au',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Perovskite | Au',
-    'SLG | FTO | WO3 | TiO2-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | Ag-Nws | Spiro-MeOTAD | Perovskite | ZnO-np | ITO | SLG',
-    'SLG | ITO | SnO2-np | MSAPBS | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | CuI | Perovskite | PCBM-60 | PEI | Ag',
-    'Polyimide | SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-c | Perovskite | SWCNTs | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Ag | Al',
-    'SLG | FTO | NiO-c | Perovskite | CdS-np | Au',
-    'SLG | FTO | TiO2-c | TiO2-nanoballs | SiO2 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | CeO2-c | Perovskite | CuSCN | Au',
-    'SLG | ITO | SnO2-np | Perovskite | TTE-1 | Au',
-    'SLG | FTO | CeOx | PCBM-60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | (CH3)3SPbI3 | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | CaTiO3 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | Cu0.67Cr0.33O2 | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PDBS-PDI | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | P3 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Carbon black',
-    'SLG | ITO | TiO2-c | PCBM-60 | WS-C60 | Perovskite | P3HT | MoO3 | Al',
-    'SLG | FTO | TiO2-c | ZnO-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | r-GO-BH | Perovskite | PCBM-60 | Ag',
-    'SLG | AZO | PCBM-60 | Perovskite | P3HT | Au',
-    'SLG | ITO | Graphene oxide | PFNBr | Perovskite | PCBM-60 | BCP | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | BrTPA-PCBM | bis-C60 | Ag',
-    'SLG | Ni:Au-grid | PEDOT:PSS | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Ag',
-    'PEN | ITO | WOx | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | P3HT; SWCNTs | PEDOT:PSS | Ni-grid',
-    'SLG | ITO | br-4C | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | M7-BR | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P3 | Au',
-    'SLG | AZO | ZnO-nw | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-nw | CuInS2-QDs | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | JY5 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CsSnI3-QDs | Carbon',
-    'PET | AuCl3; Graphene | PEDOT:PSS | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Decaphenylcyclopentasilane | Spiro-MeOTAD | Au',
-    'SLG | FTO | ZnO | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-c | PCBM-60-np | Perovskite | PDCBT | Ta-Wox | Au',
-    'SLG | FTO | SnO2-c | 1‐butyl‐3‐methylimidazolium bromide | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Ca | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 2,7 BCz-OMeTAD | Au',
-    'SLNOA63 | CPI | Cr | Au-grid | EG-PEDOT:PSS | Ti | SnO2-c | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | CdS | Perovskite | Carbon | Ag',
-    'SLG | ITO | P3CT | Perovskite | C60 | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Cu',
-    'SLG | ITO | SnO2 | C60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | 2-PA-SAM | Perovskite | Spiro-MeOTAD | Au',
-    'PET | IWO | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZrO2-mp | Carbon | Perovskite',
-    'SLG | ITO | PEDOT:PSS | Perovskite | N2200 | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | OMeTPA-TPA | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PTCBI | BCP | Al',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | AgAl',
-    'SLG | ITO | NiCo2O4-np | Perovskite | PCBM-70 | Al',
-    'SLG | FTO | NiO-c | Perovskite | PMMA | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Perovskite | P3HT | Au',
-    'SLG | ITO | PTAA | PFN | Perovskite | PCBM-60 | BCP | Cu',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | AZO-np | SnO2-c | Ag | SnO2-c',
-    'SLG | Ni | PEDOT:PSS | Perovskite | PCBM-60 | PEIE | Cu',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | NiO | CuSCN | Au',
-    'SLG | FTO | TiO2-c | Perovskite | DIQ-C6 | Au',
-    'SLG | FTO | TiO2-c | TiO2; Al2O3-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | Zn2SnO4-np | Perovskite | PTAA | Au',
-    'SLG | ITO | MoO3 | TaTm | Perovskite | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | MoO3 | TPA-3,6-FLTPA-TPA | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | TiO2-c | PCBM-60 | Perovskite | PCDTBT | MoO3 | Au',
-    'SLG | FTO | ZnO-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | OAI | DM | Au',
-    'SLG | FTO | TiO2-c | Perovskite | PPDI | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Cu2O | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon-nt | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PC(70)BM | AZO | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Al2O3-c | Au',
-    'SLG | ITO | TiO2-c | TiO2-nw | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Y2 | Au',
-    'SLG | FTO | TiO2-c | Perovskite | CuPc | Carbon',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | Zr(acac)4 | Al',
-    'SLG | FTO | TiO2-c | C60-SAM | Perovskite | HTM3 | Ag',
-    'SLG | FTO | Ag-np | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | Graphene oxide | Perovskite | C60 | BCP | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | TiN | Perovskite | PTAA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DPIE | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | (2Z,2′Z)-3,3′- (5,5′-(2,7-dioctyl-1,3,6,8-tetraoxo-1,2,3,6,7,8-hexahydrobenzo [lmn][3,8]phenanthroline-4,9-diyl)bis (thiophene-5,2-diyl))bis(2-(4-(trifluoromethyl)phenyl) acrylonitrile) | Ag',
-    'SLG | ITO | In2O3-c | PCBM-60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | KH560 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | M6 | Au',
-    "SLG | ITO | TiO2-c | Perovskite | N2,N2,N7,N7-tetrakis(4-methoxyphenyl)spiro[fluorene-9,9'-xanthene]-2,7-diamine | Au",
-    'PET | ITO | ZnO-c | ZnO-nw | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PDI | Au',
-    'PET | IZO | PTAA | Perovskite | PCBC6 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Polystyrene-ns | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Perovskite | Spiro-MeOTAD | PEDOT:PSS | PEDOT:PSS:PSA',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | BMIM-OTF | Cu',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | MeO-BPZTPA | Au',
-    'SLG | FTO | TiO2-c | Dimethylbiguanide | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | P3CT-Na | Perovskite | IDT6CN-4F | BCP | Ag',
-    'SLG | ITO | TiO2-c | Perovskite | Spiro-OprTAD | Au',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | Ag | Ta2O5',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | Au',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | 2D-Sb | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | TIPD | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | NiPc | V2O5 | Au',
-    'SLG | ITO | PEDOT:PSS | PTAA | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | C60 | Ag',
-    'SLG | FTO | TiO2-c | PCBM-60 | Perovskite | PTAA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-c | Perovskite | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Metal',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | C13-FAS | Spiro-MeOTAD | Au',
-    'SLG | ITO | PTAA | Perovskite | PCBB-S-N | PCBM-60 | Al',
-    'SLG | ITO | SnO2-np | C60 | Perovskite | BTF4 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | B74 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | MoO3 | AZO | NiAl -grid | MgF2',
-    'SLG | ITO | Ca | Perovskite | TAPC | MoO3; TAPC | MoO3 | Ag',
-    'SLG | ITO | TBDI | Perovskite | IPH | PDINO | Ag',
-    'SLG | ITO | NiO | BrBA | Perovskite | PCBM-60 | C60 | Ag',
-    'SLG | ITO | PEDOT:PSS | VOx | Perovskire | PCBM-60 | CIL | Al',
-    'PET | ITO | NiO-np | Perovskite | PCBM-60 | BCP | Ag',
-    'PET | IZO | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | 5,6,11,12-Tetraphenylnaphthacene | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | rGO:CZTS0.75Se0.25 | Au',
-    'SLG | FTO | NiO-np | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | SnO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | TZ2 | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | SnO2-c | C3-SAM | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | NaYF4:Yb:Er-np | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Perovskite | TPD | Au',
-    'Willow glass | IZO | SnO2-np | Perovskite | Spiro-MeOTAD | MoO3 | Al',
-    'SLG | Cd2SnO4 | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | S101 | Au',
-    'PES | FTO | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TZ1 | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | PTAA | MoO3 | Ag',
-    'PET | ITO | VOx | Cu phtalocyanine | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | SrTiO3-c | SrTiO3-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | S5 | Au',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | PEIE | Cu',
-    'SLG | FTO | SnO2-c | Perovskite | Spiro-MeOTAD | FTO | SLG',
-    'SLG | FTO | TiO2-np | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | OTS | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | TiO2-mp | Al2O3-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | ZnO-np | ZnO-nw | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TQ1d | Au',
-    'N-Graphene-QDs | SLG | FTO | TiO2-c | Perovskite | PTAA | Au',
-    'SLG | ITO | SnO2-c | Perovskite | HZ2 | Au',
-    'SLG | FTO | NiMgLiO-c | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | HL-2 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SWCNTs | Graphene oxide | PMMA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ITO',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | rGO | Au',
-    'SLG | FTO | TiO2-c | Perovskite | SP-02 | Au',
-    'SLG | FTO | PCBM-60 | Perovskite | P3HT | Au',
-    'SLG | FTO | NiMgLiO | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | rGO | PTAA | Perovskite | PCBM-60 | BCP | Ag',
-    'PET | ITO | NiO-c | Perovskite | PCBM-60 | LiF | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | ZnMe2Pc | Au',
-    'SLG | FTO | TiO2-c | Perovskite | P3HT | Cu',
-    'SLG | FTO | TiO2-c | TiO2-mp | PCBM-60; PMMA | Perovskite | PDPP-3T | MoOx | Ag',
-    'PET | Graphene | ZnO-np | Perovskite | PTAA | PEDOT:PSS | Graphene | PET',
-    'SLG | FTO | ZnO-c | C60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | ITO | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | YN3 | Au',
-    'SLG | ITO | TaTm | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | CIGS | Perovskite | PCBM-60 | Zr(Acac) | Ag',
-    'SLG | ITO | CuI | Cu@CuI-nw | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | NiO-c | Perovskite | ZnO-np | Al',
-    'SLG | ITO | PEIE | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | X18 | Au',
-    'SLG | FTO | TiO2-c | TiO2-nanowalls | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Azu-Hex | Au',
-    'SLG | ITO | NiO-c | Au-np | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | SnO2-np | PCBM-60 | Perovskite | M107 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PEI | Ag',
-    'SLG | FTO | LiNiO-c | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-mp | ZrO2-mp | Perovskite | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | OIPC-Br | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | FT73 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | Corannulene-derivative | Al',
-    'PET | ITO | CPTA | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | ZnO-c | ZnO-nanowells | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SYN1 | Au',
-    'SLG | ITO | SnO2-np | Perovskite | Caffeine | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | TFB | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PEDOT | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | [BMMIm]Cl | Carbon',
-    'SLG | ITO | PEDOT:PSS | Perovskite | P(NDI2DT-T2) | Al',
-    'SLG | ITO | SnO2-c | ABA-SAM | Perovskite | Spiro-MeOTAD | Au',
-    'Polyimide | ITO | ZnO-np | Perovskite | PTAA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | FH-0 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | ZnMgO | Al',
-    'SLG | ITO | PEDOT:PSS | Au@poly(4-styrenesulfonate) | Perovskite | PCBM-60 | BCP | Au',
-    'PEN | Planarization | SiN | ITO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | NiO-c | PTZ-2 | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | P3CT-N | Perovskite | IT-4M | s-Bphen | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | KR145 | Au',
-    'SLG | FTO | ZnO-c | ZnO-nanofibers | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | NiO-np | Carbon',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | TiO2-c | Perovskite | PBDTT-SeDPP | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | (OctPhO)8ZnPc | Au',
-    'SLG | FTO | TiO2-c | Perovskite | DCZ-OMeTPA | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | AV-Carbon; MAI',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | AZO-np | SnO2-c | Cu | SnO2-c',
-    'PET | ITO | PEDOT:PSS | PEDOT:PSS | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | P3CT | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CsSnBr2I-QDs | Carbon',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | SAF-5 | MoO3 | Ag',
-    'PET | Ag-nw | PEDOT:PSS | PEDOT:PSS | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | BCP | Ag | SiO2 | ZnS | Ag | ZnS',
-    'SLG | FTO | SnO2-np | Perovskite | Cu3SbS4-np | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BChl-1 | Ag',
-    'SLG | ITO | ZnO-c | T2CA | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Sym-HTPCH | Au',
-    'SLG | AZO | SnO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PCBM-60 | Perovskite | PEDOT:PSS | Ag',
-    'SLG｜FTO | TiO2-np | Perovskite | Tea Catachinrich biomolecules | Ag | FTO',
-    'SLG | ITO | PB2T-SO | Perovskite | PCBM-60 | ZnO | Al',
-    'SLG | FTO | TiO2-c | TiO2-nanoflowers | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | PolyTPD | Perovskite | PCBM-60 | Au | LiF',
-    'SLG | ITO | NiO-np | KCl | Perovskite | PCBM-60 | Zr(acac)4 | Ag',
-    'SLG | PEDOT:PSS | Ag | PEI | PCBM-60 | Perovskite | Spiro-MeOTAD | PEDOT:PSS',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CoPcNO2-COU | Au',
-    'SLG | FTO | PEDOT:PSS | Perovskite | Zr(acac)4 | Au',
-    'SLG | ITO | NiO-np | Perovskite | Choline chloride | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | Pt',
-    'SLG | FTO | SnO2-c | Perovskite | P3HT | Ag',
-    'PET | Graphene | PTAA | PEDOT:PSS | Perovskite | ZnO-np | TETA-Graphene | PET',
-    'SLG | FTO | TiO2-c | PEO | Al2O3-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | Au-np; Graphene; TFSA | Graphene-QDs | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | PTAA | PMMA | Perovskite | HPDT | PCBM-60 | Bphen | Al',
-    'SLG | ITO | SnO2-c | SnO2-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Cu12Sb4S13 | Au',
-    'SLG | FTO | Nb2O5; TiO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | C60 | Perovskite | PTAA | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | MoO3 | Al',
-    'PET | ITO | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | PDMS | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PN4N | Ag',
-    'SLG | ITO | Au-np; Graphene oxide | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | rGO; PMMA | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Al',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | Zr(acac)4 | Ag',
-    'SLG | ITO | PCBM-60 | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | Sr2CeO4:Sm | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | BPTI | C60 | BCP | Al',
-    'SLG | FTO | SnO2-c | Perovskite | Spiro-MeOTAD | PTAA | FTO | SLG',
-    'SLG | ITO | PEI | PCBM-60 | Perovskite | P3HT | MoO3 | Ag',
-    'SLG | ITO | PTAA | Perovskite | C60 | BCP | Graphene',
-    'SLG | ITO | NiO-mp | Perovskite | PCBM-60 | ZnO-np | Ag',
-    'SLG | FTO | Perovskite | Graphene | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Oleylmine | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | 3-PA-SAM | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Y1 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | ZnO-np | Ag-nw | Dielectric-Mirror',
-    'SLG | FTO | TiO2-c | 3-OMe-SAM | Perovskite | P3HT | MoO3 | Au',
-    'SLG | FTO | TiO2-c | ZnO-c | Perovskite | CZTS-np | Au',
-    'SLG | ITO | SnO2-np | Perovskite | 2‐aminoterephthalic acid | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | TiO2 -np | Al',
-    'SLG | FTO | TiO2-c | Perovskite | TAE4 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ZnPc-th-ZnPc | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | ZnO-c | Ag',
-    'SLG | FTO | ZnO-np | Perovskite | P3TAA | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon-nt; P3HT | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | Au | Ni',
-    'SLG | ITO | CuGaO2-np | Perovskite | PCBM-70 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Bis-amide-TTF | Au',
-    'SLG | FTO | ZnO-c | MgO | TiO2-mp | Perovskite | TPB(2-TPTZ) | Au',
-    'SLG | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | MoO3 | Au | MoO3',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P6 | Au',
-    'SLG | ITO | ZnO-np | Perovskite | P3OHT | Ag',
-    'SLG | ITO | NiO-c | Perovskite | 2,6-Py | PCBM-60 | PEI | Ag',
-    'SLG | ITO | C60 | Perovskite | TAPC | MoO3; TAPC | MoO3 | Ag',
-    'SLG | ITO | Lignosulfonate; PEDOT:PSS; PDA | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | PAF-68 | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | ZnO-c | ZnO-nw | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | NiO-np | Choline chloride; Glycerol | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | Cu-nw | PEDOT:PSS | Perovskite | PCBM-60 | Bphen | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | OMeTPA-DPP | Au',
-    'SLG | ITO | NiO-c | DEA | Perovskite | C60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TBP | Au',
-    'SLG | FTO | TiO2-c | Perovskite | 3,4-spiro | Au',
-    'SLG | FTO | Mg0.2Zn0.8O-np | Perovskite | P3HT | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SO10 | Au',
-    'SLG | ITO | 3F-SAM | PEDOT:PSS | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp; ZrO2-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | ITIC | PEI | Ag',
-    'SLG | ITO | MoOx | TPTPA | Perovskite | C60 | Al',
-    'SLG | FTO | ZnO-c | Nb2O5 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | AZO | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | CZTS | Au',
-    'SLG | ITO | P3CT-K | Perovskite | PCBM-60 | SnO2-c | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | NiCo2O4-np | Au',
-    'SLG | FTO | SnO2-c | Perovskite | Carbon | CuSCN',
-    'SLG | ITO | SnO2-c | SnO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | ZnO-np | ITO',
-    'SLG | ITO | PEDOT:PSS | Perovskite | ICTA | C60 | BCP | Al',
-    'SLG | FTO | TiO2-c | Ba0.8Sr0.2SnO3-np | Perovskite | PTAA | Au',
-    'SLG | FTO | ZrO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-c | Perovskite | Spiro-MeOTAD | Carbon | Graphite',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | P3HT; SWCNTs | PEDOT:PSS | Ni-grid',
-    'SLG | ITO | PEDOT:PSS | PTAA | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | Perovskite | F22 | Ag',
-    'FPA-PDMS | SnO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | CuAlO2; CuO | Perovskite | PCBM-70 | AZO-np | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Spiro-MeOTAD | NaYF4-np | Au',
-    'PET | IZO | TiO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CDTh-EtHex 2 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PYPH | LiF | Al',
-    'SLG | FTO | TiO2-c | Perovskite | pBBTa‐BDT1 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | SnO2-c | Perovskite | Spiro-MeOTAD | Ag',
-    'PEN | ITO | SnO2-np | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | PCBM-60 | BCP | Perovskite | CuO | Ag',
-    'SLG | ITO | C60-SAM | Perovskite | PDCBT | MoOx | Au',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60; PDI-DA | BCP | Ag',
-    'SLG | ITO | Spiro-MeOTAD | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | COPV5 | Au',
-    'SLG | ITO | ZnO-c | p-amino-benzoic acid-SAM | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | T60P | Au',
-    'PDMS | PET | Au-grid | PEDOT:PSS | Perovskite | C60 | BCP | Cu',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 1d | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PVCz-OMeDPD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Bacteriorhodopsin | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BTT-Me | Au | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Poly(TA) | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TPA-BP-OXD | Perovskite | PCBM-60 | ZnO-np | Ag',
-    'SLG | FTO | Nb2O3-c | Al2O3-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PDPP3T | Au',
-    'PEN | ITO | NiO-np | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | CeO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | Carbon-np; PEDOT:PSS | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | Spiro-MeTAD | Ag',
-    'PET | TCE | ZnO-c | Perovskite | PEDOT:PSS | Ag',
-    'SLG | ITO | SnO2-c | C60-5d | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | PDIN | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | KR131 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DFTAB | Au',
-    'SLG | ITO | P3CT-Na | Perovskite | C60; PDI | BCP | Ag',
-    'SLG | ITO | SnO2-c | Perovskite | Spiro-MeOTAD | MoOx | ITO',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | ZnO-np | Ag',
-    'SLG | FTO | NiO-c | BMIMBF4 | Perovskite | PCBM-60 | BCP | Cr | Au',
-    'SLG | ITO | ZnO-np | Perovskite | PTAA | Au',
-    'PI | Cu-grid | Graphene | PEDOT:PSS | Perovskite | PCBM-60 | ZnO-np | Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | ZnO | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | P3HT | Au',
-    'SLG | FTO | [EMIM]PF6-IL | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | H64 | Au',
-    'SLG | ITO | PTAA | Perovskite | PCB-C4 | AZO | Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBB-3N-3I | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | HA1 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | OTPA-ZnPc | Au',
-    'SLG | ITO | TiO2-np | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Mo | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon-nt | PMMA',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Imidazolium iodide | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | H-Tri | Au',
-    'SLG | FTO | SnO2-c | 3-(1-pyridinio)-1-propanesulfonate | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-tBuBED | MoO3 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PDI-Br | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Aminocaproic acid | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | ZnO-mp | Perovskite | Ta2O5 | Spiro-MeOTAD | Carbon',
-    'SLG | FTO | ZnO-c | EMIM-PF6 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-np | PCBA | C60 | Perovskite | Spiro-MeOTAD | MoO3 | Au',
-    'A.R.C. | SLG | ITO | 2PACz | Perovskite | C60 | BCP | Cu',
-    'SLG | ITO | NiO | Perovskite | C60 | bis-C60 | Ag',
-    'SLG | ITO | NiO-c | EPA | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | PcM-Cou | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | (1,6-di{3-[2-(4- methylphenyl)vinyl]carbazol-9-yl}hexane | Au',
-    'SLG | AZO | PEDOT:PSS | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-70 | Al',
-    'SLG | ITO | NiMgO | PVP | Perovskite | PCBM-60 | ZnMgO | Al',
-    'PEN | FTO | TiO2-c | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | NDI3HU-DTYM2 | BCP | Ag',
-    'SLG | FTO | SnO2-c | PCBM-60 | Perovskite | M114 | Au',
-    'PET | ITO | PEDOT:PSS | Perovskite | PCBM-60 | LiF | Ag',
-    'SLG | ITO | Carbon-nt; Graphene oxide | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuSCN | Carbon-nt',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Carbon | Au',
-    'SLG | ITO | PFN | C60; PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-c | C60-SAM | Perovskite | CZ-TA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | WY-3 | Ag',
-    'SLG | ITO | C70 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60 | PFN-Br | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Polypseudorotaxane | Au',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Perovskite | P3HT | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PFN-P1 | Ag',
-    'Foil | AZO | LiF | C60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-c | Perovskite | SnO2-c | AZO | Au',
-    'SLG | FTO | Zn2SnO4 | Zn2SnO4-nw | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | C60-SAM | SnO2-c | PCBM-60 | Perovskite | pDPP5T-2 | WOx | Au',
-    'SLG | ITO | MoO3 | Perovskite | C60 | Ca | Al',
-    'SLG | FTO | SnO2-c | PCBM-60 | Perovskite | Spiro-MeOTAD | PbS | Au',
-    'SLG | ITO | C60-SAM | SnO2-c | PCBM-60 | Perovskite | PTB7 | WOx | Au',
-    'SLG | FTO | PyCEE | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | 2-OMe-SAM | Perovskite | P3HT | MoO3 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | NDI-PM | Al',
-    'SLG | FTO | TiO2-c | SiO2-nanocolumns | TiO2-nw | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | InP-np | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuI | Cr | Pt | FTO',
-    'SLG | FTO | SnO2-np | Perovskite | EH44 | MoO3 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuPc-Bu | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DPPS | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-np | Perovskite | CuInSe2-QDs | Au',
-    'SLG | FTO | TiO2-3D | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon; PEMA',
-    'PET | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Ca | Al',
-    'SLG | ITO | SFT-TPA | Perovskite | C60 | BCP | Ag',
-    'PEN | ITO | SnO2-np | SnO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PDINO | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | IEICO; PBDTTT-E-T | MoO3 | Ag',
-    'SLG | ITO | PEDOT:LS | Perovskite | PCBM-60 | PEI | Ag',
-    'SLG | ITO | CPEPh-Na | Perovskite | PCBM-60 | Al',
-    'PEN | ITO | TiO2-np | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Vox | Perovskite | N2200; PCBM-70; TT | Al',
-    'PET | ITO | Nb2O5 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | S14 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | HTM-M1 | Au',
-    'SLG | ITO | SnO2-QDs | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60 | CeOx | Ag',
-    'SLG | FTO | BaSnO3-np | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | SnO2-c | SnO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | Perovskite | C60 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Ph-OMeTPA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZrO2-mp | Perovskite | Carbon; MAI',
-    'PEN | ITO | Black P-QDs | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60 | PCBDAN | Ag',
-    'SLG | FTO | SnO2-c | SnO2-np | Perovskite | Spiro-MeOTAD | Al2O3-c | Au',
-    'PET | ITO | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Al',
-    'PET | Ag-nw; PEDOT:PSS | PEDOT:PSS | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | TiO2-c | Perovskite | P3DDT | Ag',
-    'SLG | ITO | PCDTBT | Perovskite | PCBM-60 | LiF | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | CaTiO3-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | EFGnPs-F | Al',
-    'SLG | ITO | NiO-c | Perovskite | ADAHCl | C60 | BCP | Ag',
-    'SLG | ITO | CuI | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | ITO | SnO2-c | Perovskite | CdTe@MAPbI3-QDs | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TTPA-DSQT | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | FH-3 | Au',
-    'SLG | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | PEDOT:PSS | Au',
-    'SLG | ITO | SnO2-np | Perovskite | P3HT | Ag',
-    'PEN | ITO | NiO-c | Perovskite | PCBM-60 | BCP | Bi2Te3',
-    'PET | ITO | Graphene | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | PEDOT:PSS | Au',
-    'SLG | ITO | P3CT-Na | Perovskite | ITCPTC-Se | C60 | BCP | Ag',
-    'SLG | ITO | ZnO-np | Perovskite | P3HT | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuI | Cu',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | S,Si‐heteropentacene | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | YC01 | Ag',
-    'PEN | ITO | TiO2-c | Perovskite | Carbon-nt',
-    'SLG | FTO | SnO2-c | PCBM-60 | Perovskite | IDTC4-TPA | Au',
-    'SLG | ITO | NiO-np | ME1 | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | ITO | TPA-TVT-TPA | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | PPP | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-70 | ZnO-np | Al',
-    'SLG | FTO | TiO2-c | Perovskite | rGO | FTO | SLG',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | AZO | Al',
-    'SLG | FTO | TiO2-c | Perovskite | CTZS | Au',
-    'SLG | FTO | TiO2-c | ZIF-8 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-c | Perovskite | Py-C | Au',
-    'SLG | ITO | TiO2-c | PCBM-60 | Perovskite | PCDTBT | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BL08 | Au',
-    'SLG | FTO | TiO2-c | ZrO2-c | Al2O3-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | DR3T | Au',
-    'SLG | FTO | c-OTPD | Perovskite | PCBM-60 | C60 | BCP | Al',
-    'SLG | ITO | PTB7-Th; PFN | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | P3CT-Na | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | TiO2-c | PDI2 | Perovskite | PCDTBT | MoO3 | Ag',
-    'Graphite | Perovskite | CdS | ITO',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Pt | Si',
-    'SLG | ITO | SiTP-OMeTPA | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | XY1 | Perovskite | C60 | BCP | Cu',
-    'SLG | FTO | TiO2-c | Perosvkite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-70 | Rhodamine 101 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | MgO | Perovskite | Montmorillonite | Spiro-MeOTAD | Au',
-    'SLG | ITO | Fullerene-SAM | Perovskite | CuSCN | Ta:Wox-np | Carbon',
-    'SLG | ITO | PEDOT | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | ZnO-np | SnO2-np | Perovskite | H-Z3 | MoO3 | Ag',
-    'PEN | ITO | SnO2-QDs | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | BTPA | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | TiO2-c | C60 | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | ITO | M115 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiZnO12-c | Perovskite | Spiro-MeOTAD | Au',
-    'PET | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | Ag-nw | PCBM-60',
-    'SLG | ITO | VOx | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | MeO-2PACz | Perovskite | C60 | SnO2-c | Cu',
-    'SLG | FTO | SnO2 | Perovskite | Spiro-MeOTAD | MoOx | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | AZ1 | Au',
-    'SLG | FTO | ZnO-c | Perovskite | CuI | Au',
-    'INVAR | ITO | SiO2 | ITO | NiO-c | Perovskite | PCBM-60 | IZTO',
-    'SLG | ITO | PEDOT:PSS | Perovskite | ZnO-c | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | THY-1 | Au',
-    'PET | IZO | ZnO-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Trimethylamine oxide | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | NaYF4:Yb:Tm-np | Spiro-MeOTAD | Au',
-    'PET | Ag-nw | Graphene | ZnO-np | Perovskite | PTAA | Au',
-    'SLG | ITO | Carbon-QDs; SnO2-c | Perovskite | Spiro-MeOTAD | MoO3 | Au',
-    'PET | ITO | PTAA | Perovskite | Teflon | C60 | BCP | Al',
-    'SLG | FTO | TiO2-c | Graphene-QDs | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | ZnO-np | Perovskite | Spiro-MeOTAD | Ag-Nws',
-    'SLG | ITO | Fullerene-SAM | Perovskite | P3HT | Ta:Wox-np | Carbon',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-70 | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuS | Au',
-    'SLG | ITO | ZnO-c | Perovskite | CuSCN | NPB | Ag',
-    'PET | Ag-grid | ZnO-c | TiO2-c | Perovskite | Spiro-MeOTAD | MoOx | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZIF-8 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60 | SnO2-c | AZO-c',
-    'SLG | ITO | SnO2-np | PCBM-60 | C60 | Perovskite | Spiro-MeOTAD | MoO3 | Au',
-    'SLG | ITO | P3CT-Na | Perovskite | IDTCN | Rhodamine 101 | LiF | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | X14 | Au',
-    'SLG | FTO | NiO-np | Perovskite | C60 | bis-C60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 2H-MoS2 | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | H-Ca | Au',
-    'SLG | ITO | TiO2-c | NAMF-Br | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PTAA | Perovskite | C60 | SnS | Ag',
-    'SLG | ITO | NiO-np | PSS | Perovskite | PSS | PCBM-60 | BCP | Ag',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | LiF | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ST1 (4-(4-(bis(4-(4-(dibutylamino)styryl)phenyl)amino)styryl)-N,N-dibutylaniline) | Au',
-    'SLG | FTO | TiO2-c | Perovskite | DCZ-OMeTAD | MoO3 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Ca',
-    'SLG | ITO | PolyTPD | Perovskite | PCBM-60 | C60 | BCP | Al',
-    'ITO | PEN | WOx | PCBM-60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | VOx | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | TBASBP | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | BCP | Cu',
-    'SLG | ITO | PMA | TaTm | Perovskite | C60 | BCP | Au',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60 | TIPD | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | P-OR | Au',
-    'SLG | FTO | SnO2-c | Perovskite | P3HT | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PTB7 | Au',
-    'SLG | FTO | ZnO-np | MgO-EA | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | ZnCdS | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | P3HT | Au | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | Theophylline | Spiro-MeOTAD | Ag',
-    'SLG | FTO | Graphene | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | ZnO-c | ZnO-nw | TiO2-np | Perovskite | P3HT | Ag',
-    'SLG | ITO | ZnO-np | SnO2-np | Perovskite | P3 | MoO3 | Ag',
-    'SLG | FTO | MoS2 | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | F33 | Ag',
-    'SLG | ITO | Perovskite | Diketopyrrolopyrrole | MoO3 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-70 | AZO-np | Au',
-    'SLG | FTO | SnO2-c | PCBM-60 | Perovskite | CuMe2Pc | Au',
-    'SLG | FTO | SnO2-c | Perovskite | 2,7-Bis(4,4′-dimethoxydiphenylamine)-9- (bis(methylsulfanyl)methylene)fluorene | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | HA2 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BuO-DATPA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Ph-TPA-6A | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | X51 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Trux1 | Au',
-    'SLG | ITO | SnO2-np | Perovskite | Bp-OMe | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuPs-TIPS | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon black; Carbon-nt; Graphite',
-    'SLG | ITO | SnO2-np | Perovskite | TTE-2 | Au',
-    'SLG | ITO | C60 | Perovskite | PH3T | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Graphite',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Graphene oxide | PMMA | Au',
-    'SLG | ITO | PTAA | Perovskite | PCBB-S-N | Al',
-    'PET | ITO | CzPAF-TPA | Perovskite | PCBM-60 | ZnO | Ag',
-    'SLG | ITO | TiO2-c | Perovskite | J2 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PEH-8 | Au',
-    'SLG | ITO | ZnO-c | C-PCBSD | Perovskite | PDBT-co-TT | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | N2,N2,N12,N12-Tetrakis(4-methoxyphenyl)-9-methyl-9H-naphtho[2,1-c]carbazole-2,12-diamine | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | B2Pin2 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ZrO2 | MPTMS-SMA | Ag | MUTAB-SAM | PCBM-60 | Perovskite | PTAA | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60 | LiF | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | X55 | Au',
-    'SLG | FTO | TiO2-c | PCBM-60 | Perovskite | COTT-2 | Au',
-    'SLG | FTO | NiO | Perovskite | PCBM-60 | PEI | Ag',
-    'SLG | ITO | SnO2-c | Perovskite | PBT | Au',
-    'SLG | ITO | F6-TCNNQ; TaTm | Perovskite | C60 | C60; Phlm | Ag',
-    'SLG | FTO | ZnO-c | Al2O3-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | H2Pc-1 | Au',
-    'SLG | ITO | TiO2-c | PCBM-60 | Perovskite | PEDOT | Ag',
-    'PET | ITO | PEDOT:PSS | Perovskite | Ag',
-    'SLG | ITO | NiO-c | Perovskite | Bi2S3 | Au',
-    'SLG | ITO | CzPAF-TPA | Perovskite | PCBM-60 | ZnO-np | Ag',
-    'SLG | ITO | SnO2-c | Perovskite | TFAP | Au',
-    'SLG | ITO | Graphene oxide | PEDOT:PSS | Perovskite | PCBM-60 | ZnO-np | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P3HT; PCBM-60 | Ag',
-    'SLG | ITO | NiO-c | Perovskite | C60 | SnO2-c | ITO | Au',
-    'SLG | FTO | TiO2-np | Perovskite | NiO-np | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CsPbBrI2-np | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 1b | Au',
-    'SLG | FTO | TiO2-c | TiOZn-nanosphere | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | C60 | Al',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PCBM-60 | TiO2 | Al',
-    'SLG | FTO | SnO2-np | PCBM-60 | Perovskite | X25 | Au',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PCBM-60 | ZnO | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-70 | C60 | Al',
-    'SLG | ITO | NiO-c | NiO-mp | Perovskite | ZnO-np | Ag',
-    'SLG | ITO | PEIE | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NP-BC | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | Zr(acac)4 | PEI | Ag',
-    'A.R.C. | SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'PET | Ag-grid | PEDOT:PSS; PEI | PEDOT:PSS | Perovskite | PCBM-60 | PEI | Ag',
-    'SLG | FTO | TiO2-nw | Perovskite | Spiro-MeOTAD | WO3 | Ag',
-    'PET | ITO | Ag-nw | ZnO-c | TiO2-c | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | PbI2 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | cyclopenta[2,1-b; 3,4-b′]dithiophene | Ag',
-    'SLG | ITO | PTAA | Perovskite | 2PDI-0S | PEIE | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | EtO-DATPA | Au',
-    'SLG | ZnO0.95Sn0.05O1.05 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TPDI | Carbon',
-    'SLG | ITO | TZ3 | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Triazine-Ph-OMeTPA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TQ1 | Au',
-    'SLG | FTO | TiO2; WOx | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | C60 | BCP | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | NDI-ID(RR) | Al',
-    'SLG | ITO | TiO2-c | Perovskite | PDTSTTz-4 | MoO3 | Ag',
-    'SLG | ITO | NiO-np | TPI-4MEO | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Ag | Au',
-    'SLG | ITO | SnO2-np | Perovskite | PEAI | PTAA | Au',
-    'SLG | ITO | SnO2-np | Perovskite | PDCBT | MoO3 | Ag',
-    'Regenerated cellulose film | Ag-nw | PEDOT:PSS | Perovskite | PCBM-60 | Au',
-    'SLG | ITO | NiO-c | NiO-nw | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | ZnPc | Perovskite | C60 | BCP | Al',
-    'SLG | ITO | NiO-c | Perovskite | C60 | SnO2-c | ITO | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | BTTI-C6 | Au',
-    'SLG | FTO | TiO2-c | C60 | Perovskite | P3HT | Au',
-    'SLG | FTO | Cu2BaSnS4 | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-mp | Perovskite | HfO2 | Acetonitrile; I2; LiI; TBP | Graphite',
-    'SLG | FTO | TiO2-c | C60 | Perovskite | TCTA-BVP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | P3HT; Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-np | Perovskite | Spiro-MeOTAD; PEDOT | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | TiO2-c | Al',
-    'SLG | ITO | 2-F-br-4C | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | PCBM-60 | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | ITO | NiO-c | SY4 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | PEDOS:PSS | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60 | bis-C60 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60; PCBM-60-DPM-OE | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | PEAI | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | PolyTPD | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-c | C60-SAM | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | VO | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | PEDOT:PSS | PTAA | Perovskite | PCBM-60 | C60 | BCP | Cu',
-    'SLG | FTO | TiO2-c | C60-SAM | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | ICBA | BCP | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | TDTP | LiF | Al',
-    'SLG | FTO | NiO | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | PBDTT | MoO3 | Ag',
-    'SLG | FTO | SnO2 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-nanosphere | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-mp | NiO | Perovskite | Carbon',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | C70 | BCP | Al',
-    'SLG | FTO | CdS | Perovskite | Spiro-MeOTAD | Ag',
-    'PEN | ITO | ZnO-np | Perovskite | PTAA | Au',
-    'SLG | ITO | Perovskite | Polyimid | PCBM-60 | BCP | Ag',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | ZnO-np | DPO | ITO',
-    'SLG | ITO | ZnO-np | NH4Cl | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | CuGaO2 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | FPI-PEIE | Ag',
-    'SLG | FTO | Au-np; SnO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | C60; Phlm | C60 | Perovskite | F6-TCNNQ; TaTm | Ag',
-    'SLG | ITO | PEI | ICBA | Perovskite | PTAA | MoO3 | Ag',
-    'SLG | ITO | WS2 | Perovskite | PCBM-60 | BCP | LiF | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PMMA | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | IPH | Ba | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | S:DIB | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | t-BPTI | PDI-C4 | BCP | Al',
-    'SLG | FTO | AZO-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | NiO-np | Perovskite | TiO2-np | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Graphene oxide; NiO-c | Carbon',
-    'PET | ZnO-c | Ag | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | MPMIC60 | ZnO-np | Al',
-    'SLG | FTO | SnO2-c | SnO2-nw | Perovskite | Spiro-MeOTAD | Au',
-    'PEN | PEDOT:PSS | PEI | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-np | Perovskite | PEDOT | Au',
-    'SLG | ITO | SnO2-c | SnO2-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | SnO2-c | C60 | Perovskite | TRUX-E-T | Au',
-    'SLG | FTO | TiO2-c | Perovskite | di-TPA | Au',
-    'SLG | FTO | TiO2-c | Perovskite | pm-TPE-4DPA | Ag',
-    'PET | ITO | NiO-c | Perovskite | C60 | bis-C60 | Ag',
-    'SLG | ITO | IBF-Ep | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | HBT-ZnPc | Au',
-    'PET | ITO | PEDOT:PSS | Perovsktie | ZnO-np | Al',
-    'SLG | ITO | PEG; SnO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | AgAl',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuPc | Carbon',
-    'SLG | ITO | P3CT-Na | Perovskite | PCBM-60 | C60 | Al',
-    'SLG | PEDOT:PSS | ITO | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | FPI-PEIE | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | AQ310 | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PTAA | Ag',
-    'SLG | FTO | TiO2-c | CsCl | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | KR216 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DM1P | Au',
-    'SLG | FTO | PTAA | PFN | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | C60 | Perovskite | Crosslinked TCTA-BVP | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | P3HT | Au',
-    'SLG | ITO | V2Ox | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | TPA-OMeTPA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ZnChl | Ag',
-    'SLG | ITO | MoOx | F4-TCNQ | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | Ca | C60 | Perovskite | TAPC | MoO3; TAPC | MoO3 | Ag',
-    'SLG | FTO | X1 | Perovskite | PCBM-60 | C3-CBL | Ag',
-    'SLG | FTO | TiO2-c | Perovskite-QDs | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | MoO3 | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | VOx | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | NiO-c | Perovskite | PN | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | RE-ZnBu4Pc | Au',
-    'SLG | FTO | SnO2-c | PCBM-60 | Perovskite | XOP | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | SnO2-c | Perovskite | HTM3 | Au',
-    'SLG | FTO | TiO2-c | rGO:TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CZTSe-QDs | Au',
-    'SLG | ITO | TiO2-c | Perovskite | J1 | Ag',
-    'SLG | ITO | TAPC | Perovskite | PCBM-60 | BCB | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | Graphene | Au',
-    'SLG | FTO | SnO2-c | Perovskite | ZnBu4Pc | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DTBT | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuInS | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-np | Perovskite | Spiro-MeOTAD | Graphene | PEDOT',
-    'SLG | FTO | TiO2-c | TiO2-mp | Carbon-np:Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au | ITO | Au',
-    'SLG | FTO | TiO2-bulk | Perovskite | Spiro-MeOTAD | Graphite',
-    'PET | ITO | PTAA | Perovskite | Fluorosilane | C60 | BCP | Al',
-    'SLG | ITO | SnO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | HTM1 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZrO2-mp | Perovskite | PEDOT:PSS | Carbon',
-    'SLG | ITO | PEDOT:PSS | Perovskite | B2T | C60 | Al',
-    'SLG | FTO | SnO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'PEN | Graphene | MoO3 | PEDOT:PSS | Perovskite | C60 | BCP | LiF | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TbT-1 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Q221 | Au',
-    'PET | ITO | SnO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | MoO3 | Au | MoO3',
-    'SLG | ITO | SnO2-c | PCBM-60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | SnO2-c | Perovskite | HTB-OMe | Au',
-    'PET | ITO | P3CT-Na | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | BV-FNPD | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | ODA-FeS2-np | Au',
-    'Ti-foil | TiO2-c | Perovskite | Spiro-MeOTAD | Cu | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | PCBM-60; PS | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | TiO2 | Al',
-    'SLG | FTO | NiO-c | Perovskite | BCP | Au',
-    'SLG | ITO | SnO2-np | Perovskite | Zn-ChL | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | NDIF1 | C60 | Ag',
-    'SLG | ITO | ZnO-nw | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOS:PSS | Perovskite | C60; C70 | Ag',
-    'Pt | Perovskite | Al',
-    'SLG | ITO | PEDOT:PSS | PolyTPD | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | NiO-c | Perovskite | HATNASOC7-Cs | Ag',
-    'SLG | FTO | CuGaO2-mp | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | NiO | Perovskite | PCBM-60 | ZSO-np | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PTCDI | BCP | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PDPP3T; PCBM-60 | Ca | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Ag | V2O5',
-    'SLG | FTO | NiO-c | NiO-mp | Perovskite | Ethyl acetate; I2; LiI; TBP; Urea | Pt | FTO | SLG',
-    'SLG | ITO | CPTA | BACl | Perovskite | Spiro-MeOTAD | MoO3 | Au',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60 | TiO2-c | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SWCNTs | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | IDT1 | Au',
-    'SLG | ITO | P3CT-N | Perovskite | PCBM-60 | Bphen | Ag',
-    "SLG | ITO | SnO2-c | Perovskite | 4,4'-((2-Hexyl-2H-benzo[d][1,2,3]triazole-4,7-diyl)bis(thiophene5,2-diyl))bis(N,N-bis(4-methoxyphenyl)aniline) | Au",
-    'SLG | ITO | P3CT-Na | Perovskite | PDI | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | AZO',
-    'SLG | ITO:ATO | TiO2-c | TiO2-mp | Perovskite | Perylene | Au',
-    'SLG | ITO | PolyTPD | PFN | Perovskite | LiF | C60 | PEIE | SnO2-c | ZTO | Au',
-    'SLG | ITO | PEDOT:PSS | PTAA | Perovskite | PCBM-60 | TiO2 | Al',
-    'SLG | AZO | Cu-nw | AZO | ZnO-c | PEI | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | ZnO-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | NiMgLiO | Perovskite | PCBM-60 | CeOx-np | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZrO2-mp | Silane-SAM | Perovskite | Carbon',
-    'SLG | ITO | CuI | Perovskite | C60 | BCP | Ag',
-    'MgF2 | Willow glass | IZO | SnO2-np | Perovskite | Spiro-MeOTAD | MoO3 | Al',
-    'SLG | ITO | P3CT-Na | Perovskite | PCBM-60 | HDAC | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Carbon-QDs | Perovskite | Carbon',
-    'SLG | ITO | SnO2-np | PCBM-60 | Perovskite | TZ3 | Ag',
-    'SLG | FTO | TiO2-c | 1-OMe-SAM | Perovskite | P3HT | MoO3 | Au',
-    'PEN | ITO | TiO2-c | SnO2-c | Perovskite | Graphene; P3HT | Carbon',
-    'SLG | FTO | IDIC | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SFX-TPA | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ACE-QA-ACE | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon | Al',
-    'SLG | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au | Ag',
-    'PEN | ITO | TiO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-c | PCBM-60 | Perovskite | FBT-TH4 | CuxO | Au',
-    'PET | ITO | ZnO-np | Perovskite | P3HT | Ag',
-    'SLG | ITO | ZnO-c | Perovskite | Spiro-MeOTAD | PEDOT:PSS',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Bphen | Ag',
-    'SLG | ITO | NiO-c | NiO-np | Perovskite | PCBM-60 | BCP | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Bi2Te3 | Spiro-MeOTAD | Ag',
-    'SLG | ITO | NiO-np | Perovskite | COi8DFIC | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | M:ON | Au',
-    'SLG | FTO | SnO2-nw | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DEPT-SC | Au',
-    'SLG | FTO | Mg0.25Zn0.75O-np | Perovskite | P3HT | Au',
-    'SLG | Graphene | PCBM-60 | Perovskite | PTAA | Au',
-    'SU-8 | MoO3 | Au | PEDOT:PSS | Perovskite | PCBM-60 | Ca | Ag',
-    'SLG | ITO | c-TCTA | Perovskite | c-HATNA | bis-C60 | Ag',
-    'SLG | ITO | V2O5 | PEDOT:PSS | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | ITO',
-    'SLG | FTO | SrTiO3 | Al2O3-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | F-graphene; P3HT | Ag',
-    'SLG | ITO | SnO2-c | NPC60 OH | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | ZnO-c | ZnO-nw | ZrO2-mp | Perovskite | Carbon',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-derivate11 | Al',
-    'SLG | ITO | NiO-c | Sn2O3-QDs | Perovskite | PCBM-60 | C60 | Ag',
-    'SLG | ITO | ZnO-c | ZnO-nw | Perovskite | MEH-PPV | PEDOT:PSS | Au',
-    'SLG | FTO | TiO2-c | TiO2-nw | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | 4Pa-SAM | Perovskite | PTAA | Au',
-    'SLG | ITO | 3-F-br-4C | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | Phenyltrichlorosilane | PCBM-60 | Ca | Al',
-    'SLG | ITO | 3,6-2,7-PCzTPA | Perovskite | PCBM-60 | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Thiophene | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO | Perovskite | PCBM-60 | Ag',
-    'SLG | Zn0.9Sn0.1O1.10 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Azomethine | Au',
-    'SLG | ITO | NiO | Perovskite | PCBTh | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | I2; LiI; Methoxyacetonitrile | Pt | FTO',
-    'Transparent wood | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PTEG-1 | Ag',
-    'SLG | ITO | Perovskite | PCBM-60 | LiF | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Y3 | Au',
-    'SLG | ITO | SnO2-c | PCBM-60 | Perovskite | DPPZnP-TSEH; PCBM-60 | BCP | Ag',
-    'SLG | FTO | NiO-mp | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | MoOx | IZO | Au',
-    'SLG | ITO | SnO2 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | MoS2 | Perovskite | PCBM-60 | Bphen | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | S,N-heteropentacene based HTM 2 | Au',
-    'SLG | FTO | TiO2-c | TiO2-nw | Perovskite | TPA3C | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | NiCo2O4-np | Spiro-MeOTAD | Au',
-    'SLG | ITO | PB2T-S | Perovskite | PCBM-60 | ZnO | Al',
-    'SLG | FTO | SnO2-np | PCBM-60 | Perovskite | M108 | Au',
-    'SLG | ITO | SnO2-np | Perovskite | PTAA; Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-np | Perovskite | Graphene oxide | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-np | Perovskite | P3HT | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | MoO3 | IZO',
-    'SLG | Graphene | TiO2-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | p-PFP-O | PTAA | Perovskite | PCBM-60 | PFN | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | V1207 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | HOOC-Ph-SH | Perovskite | Pentafluorobenzenethiol | Spiro-MeOTAD | Au',
-    'SLG | ITO | 4-F-br-4C | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | PBDB-T | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CW4 | Au',
-    'SLG | FTO | TiO2-c | Perovskite | PVP | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | THY-5 | Au',
-    'Foil | AZO | C60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | ZnO-np | Perovskite | Spiro-MeOTAD | PEDOT:PSS',
-    'SLG | ITO | PEDOT:PSS | Perovskite | P4 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ZnPc | Au',
-    'SLG | FTO | TiO2-c | Perovskite | WO3 | Ag',
-    'PET | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Cu',
-    'SLG | ITO | PEDOT:PSS | Perovskite | F4 | BCP | Mg | Ag',
-    'SLG | ITO | NiO-c | Perovskite | ZnO-np | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | NiO | MWCNTs',
-    'SLG | FTO | ZnO-np | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | ITO | Perovskite | Carbon-nt | Ag',
-    'SLG | ITO | DBTMT | Perovskite | C60 | BCP | Ag',
-    'PAA-PEG | Ti | PANI | Ti | Perovskite | PCBM-60 | Ti',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | M104 | Ag',
-    'SLG | ITO | TiO2-c | TiO2-mp | Perovskite | CuI | Au',
-    'SLG | ITO | PTAA | Perovskite | ICBA | C60 | BCP | Cu',
-    'SLG | ITO | PCBDAN | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-QDs | Perovskite | Carbon',
-    'SLG | ITO | MoO3 | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | H3PW12O4; TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TcTa | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | Ag | Ni',
-    'SLG | ITO | SnO2-np | Perovskite | D101 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | bis‐C60 | ITO',
-    'SLG | Au-np; Graphene | Graphene-QDs | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | MCA | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-mp | Perovskite | Carbon black; Graphite | MWCNTs',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CDTh 1 | Au',
-    'SLG | ITO | Grafted rGO; Polyacrylonitrile | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | ZnO-np | MgO-EA | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-derivate10 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PEDOT; Graphene | Au',
-    'SLG | ITO | B-γ-CsSnI3 | Cs2SnI6 | Au',
-    'SLG | ITO | Ni | NiMgO | Perovskite | PCBM-60 | ZnMgO | Al',
-    'SLG | ITO | ZnO-c | Graphene; ZnO-np | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | PCBM-60 | Perovskite | COTT-1 | Au',
-    'SLG | FTO | WOx | C60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CT2 | MoO3 | Ag',
-    'SLG | ITO | SnO2-c | Perovskite | HZ1 | Au',
-    'Ti-wire | TiO2-mp | Perovskite | Spiro-MeOTAD | Ag-nw',
-    'SLG | ITO | SnO2-c | Perovskite | PEDOT:PSS | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Azu-Me | Au',
-    'SLG | ITO | PEDOT:PSS | PTPD | Perovskite | PCBM-60 | Bphen | Al',
-    'SLG | ITO | C60 | Perovskite | FTA1 | MoO3 | Ag',
-    'Au | Ni | Al | Ti | GaN | Perovskite | Graphene aerogel | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Z33 | Au',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60 | BCP | Cr | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Graphene',
-    'SLG | FTO | TiO2-c | TiO2-mp | SnO2-c | Perovskite | V1012 | Ag',
-    'SLG | FTO | ZnSnO4-c | ZnSnO4-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | PCBA | Perovskite | Spiro-OMeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Z2 | Au',
-    'SLG | ITO | PFB | Al2O3-np | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | MoS2; TiO2-np | Perovskite | Au',
-    'PET | APTES | AuCl3; Graphene | PEDOT:PSS | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuI | Au',
-    'SLG | ITO | PNP-BC | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Perovskite | P3HT; SWCNTs | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SBFCz2 | Au',
-    'SLG | FTO | TiO2-c | ZnO-nw | AZO-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P:ON | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Ag | Al',
-    'SLG | ITO | Ni-acetate | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | Perovskite | BTT(DPP)3-C8 | Au',
-    'SLG | ITO | TiO2-c | TiO2-mp | Perovskite | CuPc | Au',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60 | bis-C60 | Ag',
-    'SLG | FTO | TiO2-c | SiW11O39-POM | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | CuCrO2-np | Perovskite | C60 | BCP | Ag',
-    'SLG | FAZO | SnO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | Carbon-nt | PEDOT:PSS | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | ZnO-c | MgO | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | MoS2-nanosheets | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | 4-Aminobenzoic acid | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon-nt | FTO | SLG',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | MoOx | ITO',
-    'SLG | FTO | TiO2-c | PCBA | Perobskite | Hexakis[4-(N,N-di-p-methoxyphenylamino)phenyl]benzene | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon | Graphite',
-    'SLG | ITO | NiO-np | Perovskite | ZnO | C60 | Ag',
-    "SLG | ITO | TiO2-c | Perovskite | (N2,N2,N2',N2',N7,N7,N7',N7'-octakis(4-methoxyphenyl)spiro[fluorene-9,9'-xanthene]-2,2',7,7'-tetraamine) | Au",
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | YT1 | Au',
-    'SLG | ITO | TiO2-c | PCBM-60 | Perovskite | Al2O3 | Spiro-MeOTAD | Au',
-    'SLG | ITO | BDT-PTZ | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | Cu0.33Cr0.67O2 | Perovskite | PCBM-60 | Ag',
-    'Au | Ni | Al | Ti | GaN | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | MgO | TiO2-nw | Perovskite | Spiro-MeOTAD | AgAl',
-    'SLG | FTO | TiO2-mp | MK2 | Perovskite | Pt | SLG | FTO',
-    'SLG | FTO | SnO2-np | C60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | PEIE | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | TAT-t BuSTy | Au',
-    'SLG | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | ITO | Au',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | CMB | Ag',
-    'SLG | ITO | Carbon-QDs; TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiMgLiO | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DAI | DM | Au',
-    'SLG | ITO | MoOx | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | D205 | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Cu',
-    'SLG | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | ITO | MWCNTs',
-    'SLG | ITO | 4C | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | WOx | Perovskite | Spiro-MeOTAD | Au',
-    'PEN | ITO | NiO-np | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | ITO | NiO-np | PTAA | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | ITO | Ag',
-    'SLG | ITO | PolyTPD | Perovskite | PCBM-60 | C60 | BCP | Ag',
-    'SLG | ITO | TiO2-mp | Perovskite | 2,5-bis (5-(5-(5-hexylthiophen-2-yl)thiophen-2-yl) furan-2-yl) thiazolo[5,4-d] thiazole | Au',
-    'SLG | FTO | SnO2-np | Perovskite | Spiro-MeOTAD | MoOx | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PyThTPA | Au',
-    'SLG | ITO | ZnO-np | PCBM-60 | Perovskite | P3HT | PEDOT:PSS | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | THY-2 | Au',
-    'SLG | ITO | NiO-c | Perovskite | CdZnSeS-QDs | C60 | BCP | Cu',
-    'SLG | ITO | ZnO-np | C60 | Perovskite | PEDOT:PSS | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Z35 | Au',
-    'SLG | ITO | SnO2-np | Perovskite | IEICO; PBDTTT-E-T | MoO3 | Ag',
-    'SLG | ITO | ZnO-c | C-PCBSD | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-np | Perovskite | Spiro-MeOTAD | Ag',
-    'Ti | TiO2-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | MoOx | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PEI | Al',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60; ICBA | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SGT-421 | Au',
-    'SLG | AZO | ZnO-c | ZTO | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | PCBM-60 | Perovskite | Co-porphyrin | Au',
-    'SLG | FTO | TiO2-c | Perovskite | dly-1 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Graphen Oxide | Perovskite | Spiro-MeOTAD | Au',
-    'Au | ZnO-c | Perovskite | Cu2O | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PEDOT | FTO | SLG',
-    'SLG | ITO | NiO-c | Perovskite | PN-F25 | Ag',
-    'SLG | FTO | BaSnO3-nw | Perovskite | Spiro-MeOTAD | Carbon',
-    'SLG | FTO | TiO2-c | ZnPtriazine(gly)2 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | SnO2-c | Perovskite | BL50 | Au',
-    'SLG | FTO | PCBM-60 | BCP | Perovskite | NiO-np | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | JK-216D | Ag',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | BCP | Al',
-    'SLG | FTO | SnO2-c | Perovskite | WO3 | Spiro-MeOTAD | Au',
-    "SLG | FTO | TiO2-c | TiO2-mp | Perovskite | tetra{4-[N,N-(4,4'-dimethoxydiphenylamino)]phenyl}ethene | Au",
-    'SLG | ITO | NiO-c | Perovskite | HATNAS3C7 | Ag',
-    'SLG | ITO | PSS-g-PANI:PFI | Perovskite | PCBM-60 | Al',
-    'SLG | Au | OMeTP-SAM | Perovskite | CITP-SAM | Au',
-    'SLG | ITO | SnO2-c | Perovskite | Carbon',
-    'SLG | AZO | ZnO-nw | Perovskite | Carbon',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | Carbon | FTO',
-    'SLG | FTO | NiO-c | Perovskite | MoOx | Au',
-    'Flexible | IZO | PEIE | C60 | BCP | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | Oxo-Graphene | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | LHTM-2 | Au',
-    'SLG | ITO | SnO2-np | LiF | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-np | PEO; KI; I2 | Pt | FTO | SLG',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Z29 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | SWCNTs',
-    'SLG | FTO | NiMgLiO | Perovskite | PCBM-60 | TiO2-c | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PPy | Carbon',
-    'SLG | FTO | ZnO-np | TiO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SrTiO3 | TiO2-mp | Al2O3-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-np | Perovskite | PBDT(2F)T | Ag',
-    'SLG | ITO | P3CT-K | Perovskite | PCBM-60 | ZnO | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BTT-3 | Ag',
-    'SLG | ITO | PEDOT:PSS | PTPADCF3FSONa | Perovskite | PCBM-60 | PN4N | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Asy-PBTBDT | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Ethyl acetate; I2; LiI; TBP; Urea | Pt | FTO',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PCDTBT | Au',
-    'SLG | ITO | Perovskite | Au',
-    'SLG | FTO | SnO2-c | Perovskite | CuPc | Carbon',
-    'SLG | ITO | SnO2-np | Perovskite | CuSCN | MoOx | Au-grid',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PTAA | Carbon',
-    'SLG | FTO | SnO2-c | Perovskite | N-CuMe2Pc | Au',
-    'SLG | FTO | SnO2-c | Perovskite | Spiro-MeOTAD | SWCNTs | Au',
-    'SLG | FTO | ZnO-c | ZnO-nanofibers | PEI | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DPEDOT-B[BMPDP]2 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ATT-ODec | Au',
-    'SLG | FTO | TiO2-c | Perovskite | EDOT-OMeTPA | Au',
-    'SLG | FTO | Black P-QDs | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | WO3-c | Perovskite | P3HT | Au',
-    'SLG | FTO | TiO2-c | SnO2-c | SnO2-np | Perovskite | PTAA | Au',
-    'SLG | ITO | TiO2-c | Perovskite | CuSCN | Au',
-    'SLG | ITO | P3CT-Na | Perovskite | ITCPTC | Rhodamine 101 | LiF | Ag',
-    'SLG | ITO | TiO2-nw | Perovskite | Spiro-MeOTAD | Au',
-    'ITO | PEDOT:PSS | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | PCBA | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PSe-PDI | Al',
-    'NaYF4:Eu-np | SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | WO3-c | Cs2CO3 | PCBM-60 | Perovskite | P3HT | Au',
-    'SLG | ITO | PEDOT:PSS | PSS-Na | Perovskite | PCBM-60 | PEI | Ag-nw',
-    'SLG | FTO | TiO2-c | Perovskite | PolyTPD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | X54 | Au',
-    'Au | 4-methoxythiophenol | Perovskite | 4-chlorothiophenol | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | C6TBPH2 | Au',
-    'SLG | FTO | TiO2-c | PCBA | Perovskite | P1 | Au',
-    'SLG | FTO | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | SiO2 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | Graphene oxide | PEDOT:PSS | Perovskite | PCBM-60 | Carbon-tape',
-    'SLG | ITO | SnO2-c | TiS2 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Ag@SnO2-nw | Spiro-MeOTAD | Au',
-    'SLG | ITO | c-OTPD | Perovskite | PCBM-60 | C60 | BCP | Al',
-    'SLG | FTO | Zn2SnO4 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | P3HT | Al2O3-mp | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | ZnO-c | ZnO-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | HTM-2 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskte | PCBM-70 | Ag',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60; Zn0.8Cd0.2S-np | Ag',
-    'SLG | ITO | Spiro-MeO-TPD | PEDOT:PSS | Perovskite | C60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | S197 | Au',
-    'PET | ITO | NiO-c | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DTB | Au',
-    'SLG | ITO | ZnO-np | Perovskite | P3ODDT | Ag',
-    'SLG | ITO | TiO2-c | TiO2-mp | Perovskite | PCA-1 | Au',
-    'SLG | SMPTMS-SMA | Ag | MUTAB-SAM | PCBM-60 | Perovskite | PTAA | Ag',
-    'SLG | ITO | OCNR; PEDOT:PSS | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ZnPc-p-ZnPc | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Azu-EH | Au',
-    'SLG | FTO | TiO2-c | PCBA | Perovskite | DTB | Au',
-    'SLG | ITO | NiO-c | Perovskite | BCP; PCBM-60 | Ag',
-    'Eu(TTA)2(Phen)MAA | SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | NiO | Ag | NiO | NaYF4 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DBT(QT-TPA)2 | Au | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | Ni-grid',
-    'SLG | ITO | TiO2-c | Perovskite | PCDTBT | MoO3 | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | CuInS2-QDs | Au',
-    'SLG | ITO | Au-np; TiO2-np | C-PCBOD | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-nt | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SY1 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | P1C1 | Au',
-    'SLG | ITO | CdS | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | pTPD | Perovskite | PCBM-60 | Ba | Ag',
-    'SLG | ITO | TiO2-np | Perovskite | DORDTS–TFBT | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | AZ2 | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Cu2ZnSnS4 | Al',
-    'SLG | ITO | ZnO-c | Perovskite | Ag',
-    'SLG | ITO | PEDOT:PSS | GeO2 | Perovskite | PCBM-60 | Bphen | Ag',
-    'PET | ITO | NiO-c | Perovskite | PCBM-60 | bis-C60 | Ag',
-    'SLG | FTO | PCBM-60; TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | ZnO-c | ZnO-nw | Al2O3-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | TiO2-mp | BaTiO3-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | Zr(acac)4 | PEI | Ag | Ta2O5',
-    'SLG | ITO | PEDOT:PSS | Perovskite | LiF | Au | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | PEG | Spiro-MeOTAD | Ag',
-    'SLG | ITO | Perovskite | C60 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | NH4I | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-mp | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PANI:PSS | Perovskite | PCBM-60 | Au',
-    'SLG | ITO | C60 | Perovskite | Spiro-MeOTAD | MoO3 | Au | MoO3',
-    'SLG | ITO | NiO | Perovskite | PCBM-60 | CD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-TPM | Au',
-    'SLG | ITO | Perovskite | PCBM-60 | C60 | BCP | Al',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | TiO2-c | Ag',
-    'MgF2 | Quartz | ITO | PTAA | Perovskite | PCBM-60 | AZO-np | PEI | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | 3-hydroxypyridine | Spiro-MeOTAD | Au',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60; MAI | Cu',
-    'SLG | ITO | PolyTPD | Al2O3-mp | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | NaYF4:Yb:Er-np | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-IO | Perovskite | PTAA | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | AZO-np | Ag',
-    'SLG | Ag | MoOx | PEDOT:PSS | Perovskite | PCBM-60 | C60 | BCP | Cu | Ag | MoO3',
-    'SLG | ITO | ZnO-c | Perovskite | Au',
-    'SLG | ITO | LiF | PEDOT:PSS | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | NiMgLiO | Perovskite | 4-acetylpyridine | PCBM-60 | BCP | Ag',
-    'SLG | ITO | TiO2-c | Perovskite | PCA-2 | Au',
-    'SLG | FTO | TiO2-c | TiO2-nw | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'PET | ITO | ZnO-np | p-(F)-PO-TAZ | Perovskite | PB(NAP-Th)TBT | Ag',
-    'SLG | ITO | P3CT-N | Perovskite | TMTA | PCBM-60 | C60 | TPBi | Cu',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD-F | Au',
-    'SLG | Ni | Au | Perovskite | C60 | BCP | Al',
-    'SLG | FTO | TiO2-c | Perovskite | C60 | Au',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | Rodhamine 101 | Ag',
-    'SLG | ITO | HTM-1 (bifluorenylidene-based) | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-mp | NiO-mp | Perovskite | Carbon',
-    'SLG | ITO | Perovskite | C60 | B4PyMPM | Ag',
-    'SLG | FTO | SnO2-c | PCBM-60 | Perovskite | CuMe32c | Au',
-    'SLG | Zn0.85Sn0.15O1.15 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-hollow spheres; TiO2-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | L-alanine | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | CdS-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-nw; Zn2SnO4-np | Perovskite | PTAA | Au',
-    'SLG | ITO | SnO2-np | B2Cat2 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-np | PN4N | Perovskite | PDCBT | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Li-GO | Perovskite | Spiro-MeOTAD | Au',
-    'Y2O3:Eu3 | Au-np | SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | ZnO-c | PCBA | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2; Al2O3-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Au@SiO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | I2; LiI; Methoxypropionitrile | Pt | FTO',
-    'SLG | ITO | CuSCN-nw | Perovskite | C60 | Bphen | Ag',
-    'SLG | ITO | NiO-c | NP-BC | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | S,N-Heteroacene 2 | Au',
-    'SLG | ITO | AZO-np | Perovskite | Spiro-MeOTAD | MoO3 | Al',
-    'SLG | ITO | SnO2-np | Perovskite | C12H10B2O4 | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Yih-1 | Au',
-    'SLG | ITO | PCBM-60; PCBDAN | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | ZnSe | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | P3CT | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | Perovskite | ICBA | BCP | Ag',
-    'SLG | ITO | MoS2 | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PVP | Ag',
-    'SLG | ITO | CuSCN | Perovskite | PCBM-60 | BCP | Al',
-    'SLG | ITO | Graphene oxide | Perovskite | PCBM-60 | BCP | LiF | Al',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PCBM-60; F8TBT | Ag',
-    'SLG | ITO | WO3-np | Cs2CO3 | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | WO3-c | WO3-nw | Perovskite | P3HT | Au',
-    'SLG | ITO | ZnO-c | C60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | NiO-np | Perovskite | CeOx | Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | BCP | Al',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | Carbon | FTO | SLG',
-    'PEN | ITO | ZnO-c | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | PTAA | Au',
-    'PET | ITO | ZnO-c | Urea | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | PolyTPD | Perovskite | PCBM-60 | Au',
-    'SLG | FTO | ZnO-c | CdSO | Perovskite | Spiro-MeOTAD | Ag',
-    'PET | ITO | CuPc | PEI | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | m-PYBrZnPor | Ag',
-    'SLG | ITO | ZnO-np | Perovskite | P3HT | Ag',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | Zr(acac)4 | Au',
-    'SLG | FTO | SrSnO3 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 9,9-bis(3-(dimethylamino)propyl)-N2,N2,N7,N7-tetrakis(4-methoxyphenyl)-9H-fluorene- 2,7-diamine | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PCBDANI | LiF | Al',
-    'SLG | ITO | SnO2-np | Perovskite | NO2-PEAI | Spiro-MeOTAD | Au',
-    'SLG | ITO | JW8 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | ZnO-np | PFS-FC | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | CuInS2 | Al2O3-np | Perovskite | TIPD; ZnO-np | Ag',
-    'SLG | PEDOT:PSS | PEDOT:PSS | PTAA | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | PEIE | C60 | Perovskite | P3HT | MoOx | Cu',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Bphen | Au',
-    'SLG | FTO | TiO2-c | Graphene-np; TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | CsBr | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-np | APTES-SAM | Perovskite | PTAA | Au',
-    'SLG | FTO | SnO2-c | C60-SAM | Perovskite | CZ-STA; CZ-TA | Au',
-    'SLG | ITO | H6 | Perovskite | PCBM-60 | BCP | Au',
-    'PET | ITO | SnO2-np | Perovskite | PCPD2FBT:BCF | PEDOT:PSS | ITO | PET',
-    'SLG | FTO | TiO2-c | Graphydine-QDs | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Perovskite | TTB-TTQ | Au',
-    'SLG | ITO | ZnO-c | WPF‐6‐oxy‐F | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | PEDOT:PSS | Perovskite | C60 | bis-C60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuPc-DMP | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | C5PcH2 | MoOx | Au',
-    'SLG | FTO | SnO2-nanospheres | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SrGO | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ZnPc(tBu)4 | Au',
-    'SLG | ITO | ZnO | ZnO-nw | Perovskite | P3HT | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BF002 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | FePc-Cou | Au',
-    'SLG | MSA-PEDOT:PSS | Perovskite | PCBM-60 | Rhodamine 101 | C60 | Rhodamine 101 | LiF | Ag',
-    'SLG | Ag-nw | AZO | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-c | Perovskite | PBDTP-DTDPP | Au',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | C60 | BCP | Al',
-    'PET | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Cu-ribbon',
-    "SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 2,2'-[(4,5-Bis(2-ethylhexyl)-dithieno[2,3-d:2',3'-d']thieno[3,2-b:4,5-b']dipyrrole-2,7-diyl)-bis(4,3'-dihexyl-2,2'-bithien-5,5'-diyl)bis(methane-1-yl-1-ylidine)]dimalononitrile | Au",
-    'SLG | ITO | NiO-c | Perovskite | LiF | C60 | TmPyPB | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeTAD | Au',
-    'SLG | ITO | TiO2-c | Perovskite | PBDTT-SeDPP; PCBM-70 | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | AAO | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | P3CT-CH3NH2 | Perovskite | PCBM-60 | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | P | Au',
-    'SLG | FTO | NiO-c | SDSB | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | NiO-c | Perovskite | C5-NCMA | bis-C60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | M104 | MoO3 | Ag',
-    'SLG | FTO | Graphene; TiO2-c | Al2O3-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-c | BMIMBF4 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | P3CT-Na | Perovskite | ITCPTC-Th | C60 | BCP | Ag',
-    'SLG | ITO | NiO-c | Perovskite | C60 | bis-C60 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | pp-TPE-4DPA | Ag',
-    'SLG | FTO | SnO2-np | TiO2-c | Perovskite | Carbon',
-    'SLG | ITO | WOx | I-Ph-PA_C60-C6-PA | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | SrTiO3-np | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | SnO2 | Perovskite | Spiro-MeOTAD | Au',
-    'PEN | FTO | SnO2-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | P3CT-Na | Perovskite | NDP-V | Rhodamine 101 | LiF | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TTPA-DBQT | Au',
-    'SLG | FTO | TiO2-c | Perovskite | 3-Hexylthiophene | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | cyclopenta[2,1-b; 3,4-b′]dithiophene | SLG | ITO',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | Ag-nw',
-    'SLG | ITO | P3CT-N | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | D103 | Au',
-    'PET | ITO | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Poly-N-vinylcarbazole | SP-12 | Au',
-    'SLG | ITO | NiO-c | Perovskite | N2200 | bis-C60 | Ag',
-    'SLG | ITO | PEDOT:PSS | PCDTBT | Perovskite | PCBM-60 | BCP | Al',
-    'PEN | ITO | nTi-MOF | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 2,7-Cbz-EDOT | Au',
-    'SLG | ITO | M118 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | ZnO-c | JTCA | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | ZnO-c | Perovskite | PZn-DPPA-O | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | ZrAcac | Ag',
-    'SLG | ITO | NiO-c | Perovskite | bis-C60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | A101 | Au',
-    'SLG | FTO | TiO2-c | Perovskite | DIP-C6 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Zr(acac)4 | Ag',
-    'PET | ITO | SnO2-c | C60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | X-DVTPD | Perovskite | PC6BM | Bphen | Ag',
-    'SLG | FTO | PTCA | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Al2O3-np | Perovskite | PCBM-60 | Ag',
-    'PET | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | Graphene; SrTiO3 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | ZnO-c | Perovskite | P3HT | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C70 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | PCBM-60 | Perovskite | Spiro-MeOTAD | ITO | MgF2',
-    'SLG | ITO | MoO3 | PTAA | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | ZnO-c | ZnO-nw | TiO2-np | Perovskite | P3HT | Ag',
-    'Ag-nw; GFRHybrimer; ITO | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskte | PCBM-60 | BCP | IZO',
-    'SLG | FTO | ZnO-c | AZO-c | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | Graphite-nf | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | NiMgLiO | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | Spiro-MeOTAD | MoOx | ITO | MgF2',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | BCP | Au',
-    'SLG | ITO | CuSCN-3D | Perovskite | C60 | Bphen | Ag',
-    'SLG | ITO | SnO2-np | ZnO-np | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Rhodamin 101 | Au',
-    'SLG | ITO | 3,6-PCzTPA | Perovskite | PCBM-60 | C60 | BCP | Ag',
-    'SLG | ITO | NiO-c | Perovskite | C60 | ZnO-c | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Sb2S3 | Perovskite | CuSCN | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | TMPA-Cl | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | JY6 | Ag',
-    'SLG | ITO | NiO-c | NiO-mp | Perovskite | PCBM-70 | BCP | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | N3,N3,N9,N9‐tetrakis(4‐methoxyphenyl)xantheno[2,1,9,8‐klmna]xanthene‐3,9‐diamine | Au',
-    'SLG | FTO | Al2O3-c | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PTAA | Perovskite | C60 | SnO2 | ZTO | IZO',
-    'SLG | ITO | TiO2-c | PCBM-60 | Perovskite | NPD | MoO3 | Au',
-    'SLG | ITO | Carbon-np; SnO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEI | PCBM-60 | Perovskite | T1 | MoO3 | Ag',
-    'SLG | ITO | ZnCsO | PCBA | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ATT-OHex | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PD-10-DTTE-7 | Spiro-MeOTAD | Au',
-    'SLG | APTES; Graphene | PCBM-60 | Perovskite | PTAA | Au',
-    'SLG | ITO | C60 | Perovskite | FBA2 | MoO3 | Ag',
-    'SLG | ITO | NiO-c | DEA | Perovskite | PCBM-60 | PN4N | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | NiO-np | Au',
-    'SLG | ITO | PEDOT:PSS-NH2-OH | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | NiO-c | Perovskite | ZnO | PTFE | Ag',
-    'ITO | PEN | SnO2-np | Perovskite | PEDOT:PSS | Carbon',
-    'SLG | ITO | PEDOT:PSS | Perovskite | N2200 | ZnO-np | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | G2 | Au',
-    'Ti-foil | TiO2-nt | Perovskite | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TTA2 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | Fullerene-2a | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | CuPc | Au',
-    'SLG | ITO | PolyTPD | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | ZnO-c | ZnO-nw | Perovskite | Spiro-MeOTAD | MoO3 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ZnChl-2 | Ag',
-    'SLG | FTO | TMAH | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | LiMgNiO-c | Perovskite | PCBM-60 | Carbon-QDs | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | M102 | Ag',
-    'SLG | ITO | NiO-np | Perovskite | C60; PCBM-60 | BCP | Ag',
-    'SLG | FTO | SnO2-c | C60 | Perovskite | PMMA | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | MoOx | Cu | MoOx',
-    'SLG | ITO | NO-Graphene-QDs | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | P3HT | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | C60 | Perovskite | SWCNTs | P3HT',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | AS37 | Au',
-    'SLG | ITO | PTAA | Perovskite | C60 | SnO2 | BCP | Cu',
-    'SLG | FTO | TiO2-c | Perovskite | ZnPc | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-c | Perovskite | Spiro-MeOTAD | Ag | Au',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BT | Au',
-    'SLG | FTO | TiO2-c | Au@SiO2-np; TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60 | Bphen | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | Spiro-MeOTAD | Carbon',
-    'SLG | ITO | Cu2O | Perovskite | PCBM-60 | Ca | Al',
-    'SLG | FTO | SnO2-c | Perovskite | Spiro-MeOTAD | TL- PEDOT:PSS | FTO | SLG',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | V862 | Au',
-    'SLG | FTO | PANI | Perovskite | PCBM-60 | Au',
-    'SLG | ITO | MoO3 | TPTPA | Perovskite | TmPyPB | C60 | TmPyPB | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BTDTP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite-IO | Carbon-QDs | Spiro-MeOTAD | Ag',
-    'SLG | FTO | SnO2-c | SnO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | MBA-SAM | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SY4 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | ZTO | SnO2-c | Perovskite | PTAA | Au',
-    'SLG | ITO | rGO | PEDOT:PSS | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | WO3 | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60 | PCBM-60 | BCP | Ag',
-    'PET | PEDOT:PSS | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Pyridine | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60; PMMA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | POZ3 | Ag',
-    'SLG | ITO | PEDOT:PSS | PSS-Na | Perovskite | PCBM-60 | Ag-nw',
-    'SLG | In2O3:H | PTAA | Perovskite | PCBM-60 | ZnO-np | AZO | AlNi-grid',
-    'SLG | FTO | SnO2-nt | Perovskite | P3HT | Au',
-    'SLG | ITO | SnO2-np | EPA | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | PTAA | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-nw | Perovskite | TPA2C | Au',
-    'SLG | ITO | NiO-np | PMMA | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | TRUX2 | Perovskite | PCBM-60 | LiF | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CZTS-QDs | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DOPT-SC | Au',
-    'SLG | FTO | SnO2-c | PCBM-60 | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | Carbon-nt; TiO2-mp | Perovskite | PTAA | Au',
-    'SLG | ITO | Spiro-TBB | Perovskite | C60 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | T30P | Au',
-    'SLG | ITO | PETDOT:PSS | Perovskite | PCBM-60 | AZO-np | Ag',
-    'SLG | FTO | TiO2-c | TiO2-nw | Al2O3 | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | Zn0.8Sn0.2O1.2 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-c | C60-SAM | Perovskite | Spiro-MeOTAD | MoO3 | Au | MoO3',
-    'Ti | TiO2-nw | TiO2-np | Perovskite | Carbon-nt | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZrO2-mp | Carbon-mp | Perovskite | Carbon',
-    'PEN | ITO | SnS2 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | Bis-FITG | Ag',
-    'SLG | ITO | MoOx | PEDOT:PSS | Perovskite | PCBM-60 | TOPD | Ag',
-    'SLG | FTO | Ag:CuO-nanofibers | PEDOT:PSS | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | PTAA | Perovskite | C60; C70 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | Polystyrene | PCBM-60 | BCP | Ag',
-    'SLG | ITO | TP-FTzF-TP | Perovskite | PCBM-60 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | MoS2 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-70 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | MoOx | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BDT-4MeOTPA | Au',
-    'SLG | ITO | PEDOT:PSS | PEG | Perovskite | PCBM-60 | Ag',
-    'PET | ITO | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'PET | ITO | Ti | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-derivate12 | Al',
-    'SLG | FTO | TiO2-mp | Perovskite | PTAA | Au',
-    'SLG | ITO | P3CT-N | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | Al:ITO-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | NiPc | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ODA-FeS2-np | Au',
-    'SLG | ITO | H2 | Perovskite | PCBM-60 | LiF | Al',
-    'SLG | ITO | NiO-np | TPI-2MEO | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | V1050 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 1-Donecyl Mercaptan | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | SiO2-np; TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | CuSCN | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | dly-2 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P3HT | Cu',
-    'SLG | ITO | CdS | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-c | Perovskite | HMe2Pc | Au',
-    'SLG | FTO | TiO2-c | Al2O3-nt | Perovskite | Spiro-MeOTAD | MoOx | ITO',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | YC-1 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BT-BTH | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Q197 | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | [BMPA-EDOT]3-TPA | Au',
-    'SLG | FTO | TiO2-c | Au-np | Perovskite | P3HT | Ag',
-    'SLG | ITO | P3HT | Perovskite | C60 | BCP | Cu',
-    'SLG | ITO | TiO2-c | Perovskite | PTAA | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | COPV3 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PEIE | Cu',
-    'SLG | FTO | SnO2-c | Perovskite | Mo(tfd-COCF3)3 | SWCNTs | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | In2O3-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PTAA | Al2O3-mp | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | Choline chloride | Spiro-MeOTAD | SWCNTs | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Sinapoyl malate | Perovskite | ZnP | Au',
-    'SLG | DWCNTs | PTAA | PFN-P2 | Perovskite | C60 | BCP | Cu',
-    'SLG | FTO | TiO2-c | Perovskite | PbS-QDs | Au',
-    'SLG | AZO | Au | AZO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | Perovskite | PCBM-60 | PEI | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | CIGS-np | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DAHI | Spiro-MeOTAD | Au',
-    'SLG | Zn0.75Sn0.25O1.25 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | GABAHI | Perovskite | Spiro-MeOTAD | Ag | Au',
-    'SLG | FTO | SnO2-c | Perovskite | PdMePy | Au',
-    'SLG | FTO | TiO2-c | Perovskite | tris(4-(5-hexylthiophen-2-yl)phenyl)amine | MoOx | Ag',
-    'SLG | FTO | ZnO-np | Graphene | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PTPD | Perovskite | PCBM-60 | LiF | Ag',
-    'SLG | ITO | H3 | Perovskite | PCBM-60 | BCP | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite-IO | Spiro-MeOTAD | Ag',
-    'SLG | FTO | SnO2-np; TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Cr2O3:Cr',
-    'SLG | FTO | ZnO-nw | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-c | Perovskite | C60 | TmPyPB | Ag',
-    'SLG | FTO | PCBM-60 | Carbon | Perovskite | PEDOT:PSS | Ag',
-    'SLG | ITO | CuI | Perovskite | ICBA | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | In2O3 | Perovskite | P3HT | Au',
-    'SLG | ITO | CuSCN | Perovskite | PCBM-60 | bis-C60 | Ag',
-    'SLG | FTO | TiO2-c | (3-Aminopropyl)trimethoxysilane | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | SnO2-np | BSO-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | VOx | X-DVTPD | Perovskite | PCBM-60 | FPI | Ag',
-    'PET | ITO | PEDOT:PSS | Perovskite | PCBM-60 | ZnO-np | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | P3HT | MoO3 | Au',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | ZnO-np | ZnO-c | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 1,3,6,8-tetrakis-(N,N-di-p-methoxyphenylamine)pyrene | Au',
-    'PET | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PPy | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZrO2-mp | Perovskite | NiO-c | Carbon',
-    'SLG | ITO | MoO3 | TPTPA | Perovskite | B4PyMPM | C60 | TmPyPB | Ag',
-    'SLG | ITO | NiO-c | PFN-P2 | Perovskite | C60 | BCP | Ag',
-    'PEN | ITO | SnO2-np | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | ZnO-np | Perovskite | P3OFHT | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | Al2O3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | HBZ-71 | Carbon | FTO | SLG',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | THY-3 | Au',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | Phen-NaDPO | Ag',
-    'SLG | ITO | rGO | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | NiMgLiO | Perovskite | TiO2-c | Ag',
-    'SLG | ITO | PVBT-SO3 | Perovskite | PCBM-60 | C60-N | Ag',
-    'SLG | ITO | TiO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | NiO-mp | Perovskite | Carbon',
-    'SLG | ITO | C60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-QDs | Perovskite | Au@CdS | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-np | Perovskite | PTAA | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | PEDOT:PSS | Au',
-    'Au | Perovskite | C60 | BCP | Au',
-    'SLG | Ni | NiO-c | Perovskite | PCBM-60 | PEIE | Cu',
-    'SLG | FTO | TiO2-c | Perovskite | PCPD2FBT:BCF | PEDOT:PSS | ITO | SLG',
-    'SLG | FTO | TiO2-c | Al2O3-mp | NiO-mp | Perovskite | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Sinapoyl malate | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Au',
-    'SLG | ITO | PEI | ICBA | Perovskite | PTAA | MoO3 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | SWCNTs | Ag',
-    'SLG | FTO | TiO2-np | Perovskite | PDCBT | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | V886 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | quart-p-phenylene1 | Au',
-    'SLG | FTO | TiO2-c | Perovskite | PCBM-60 | Au',
-    'SLG | ITO | F6-TCNNQ | TaTm | Perovskite | C60 | C60; Phlm | Ag',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60 | PEI | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | DNDIF3 | C60 | Ag',
-    'SLG | IZO | PEDOT:PSS | Perovskite | PCBM-60 | ZnO-np | Al',
-    'PEN | ITO | C60 | C60-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | Perovskite | P3HT | Au',
-    'SLG | ITO | TiO2-c | Perovskite | PCz | Ag',
-    'SLG | FTO | TiO2-mp | MgO | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | M116 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | Ni | Au | Cu | Perovskite | C60 | BCP | Al',
-    'SLG | ITO | V1036:C2 | Perovskite | C60 | BCP | Cu',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Acetonitrile; B2; LiBr | Pt | FTO',
-    'SLG | FTO | ZnO-np | Perovskite | P3HT | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | YR3 | Au',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | NiCo2O4 | Perovskite | C60; PCBM-60 | Zr(acac)4 | Ag',
-    'PET | ITO | FPI-PEIE | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | Au | Ag',
-    'PET | Ag-nw; Graphene oxide | PEDOT:PSS | Perovskite | PCBM-60 | PFN-P1 | Ag',
-    "SLG | FTO | TiO2-c | TiO2-mp | Perovskite | (2Z,2'Z)-2,2'-((10-(2-ethylhexyl)-10H-phenothiazine-3,7-diyl) bis(4,1- phenylene)) bis(3-(4-(diphenylamino) phenyl) acrylonitrile | Au",
-    'SLG | FTO | CdS-nw | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | F6-TCNNQ; TaTm | TaTm | Perovskite | C60 | C60; PhIm | Ag',
-    'SLG | ITO | Au@TiO2-np; TiO2-np | Perovskte | Spiro-MeOTAD | Au',
-    'SLG | ITO | PTAA | Perovskite | PCB-C12 | AZO | Ag',
-    'SLG | ITO | P3CT-Na | PASP | Perovskite | PCBM-60 | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PEDOT:PSS | FTO | SLG',
-    'SLG | FTO | CuI | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PPV | Au',
-    'SLG | ITO | MoO3 | NPB | PbI2 | C60 | BCP | Al',
-    'SLG | FTO | PEDOT:PSS | TPA-NAP-TPA | Perovskite | PCBM-70 | Ag',
-    'SLG | ITO | ZnO-np | SnO2-np | Perovskite | H-Z2 | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Perovskite | Au-np; NiO',
-    'SLG | FTO | PEDOT:PSS | NPB | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | TiO2-c | C60 | Perovskite | TaTm | F6-TCNNQ; TaTm | Au',
-    'SLG | ITO | TAE | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ZnNc | Au',
-    'SLG | ITO | PTAA | Perovskite | Au',
-    'ZnSe-QDs | SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEI | PCBM-60 | Perovskite | PTAA | MoO3 | Au',
-    'PET | ITO | ZnO-c | ZnO-nanospheres | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | TiO2-c | TiO2-nw | N-[3-(Trimethoxysilyl)propyl]ethylenediamine-SAM | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | V2O5 | Au',
-    'SLG | ITO | Perovskite | PCBM-60 | bis-C60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TbT-3 | Au',
-    'SLG | FTO | WO3 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | ZnO-c | 1,2 ethanedithio | Perovskite | PZn-2FTPA | Au',
-    'PEN | ITO | NiO-np | Perovskite | PCBM-60 | Zr(acac)4 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | BTT(DPP-Th)3-EH | Au',
-    'SLG | ITO | Perovskite | C60 | BCP | Al',
-    'SLG | FTO | TiO2-c | SAED | Perovskite | ZnPc | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-mp | Perovskite | I2; KI; Propylene carbonate; Polyethylene glycol | Pt | FTO',
-    'SLG | FTO | TiO2-c | TiO2-mp | N719 | Perovskite | Pt | SLG | FTO',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Al2O3 | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Fu-OMeTPA | Au',
-    'SLG | ITO | SnO2-np | Perovskite | PTAA | Ag',
-    'SLG | ITO | NiO-np | Perovskite | C60; PCBM-60 | Zr(acac)4 | Cu',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | rGO-flakes | Spiro-MeOTAD | Au',
-    'SLG | ITO | ZnO-np | SnO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PTBT-th | Au',
-    'SLG | FTO | X1 | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SGT-411 | Au',
-    'PET | PEDOT:PSS | PEDOT:PSS | Perovskite | PCBM-60 | Al',
-    'PET | ITO | P3CT-CH3NH2 | Perovskite | PCBM-60 | C60 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS; PEG | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | P1-2 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | P3CT-N | Perovskite | PCBM-60 | C60 | TPBi | Cu',
-    'SLG | FTO | TiO2-c | SnO2-mp | Perovskite | P2 | Au',
-    'SLG | ITO | Spiro-TAD | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Me-QTPA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZnO-mp | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-mp | NiO-mp | Perovskite',
-    'SLG | TiO2-c | SnO2-c | TiO2-c | SnO2-c | TiO2-c | SnO2-c | TiO2-c | SnO2-c | TiO2-c | ITO | NiO-np | Perovskite | PCBM-60 | ZnO-np | ITO',
-    'SLG | FTO | NiO-c | Al2O3-mp | Perovskite | PCBM-60 | BCP | Au',
-    'SLG | ITO | P3CT-K | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | FTO | TiO2-c | C60-NH2 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | ZnSO | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60 | LiF | Al',
-    'SLG | FTO | PolyTPD | PFN | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | ZnO-np | ZnO-c | ITO | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PEAI | PCBM-60 | BCP | Ag',
-    'SLG | FTO | C60 | Perovskite | Spiro-MeOTAD | Al',
-    'PEN | Ag-grid | ZnO-c | TiO2-c | Perovskite | Spiro-MeOTAD | MoOx | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BDTT:DPPD:TT | Au',
-    'SLG | ITO | V2O5 | PEDOT:PSS | Perovskite | PCBM-60 | Bphen | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | PCPDTBT | Perovskite | PCBM-60 | LiF | Ag',
-    'SLG | FTO | ZnOS | Perovskite | Carbon | Au',
-    'SLG | ITO | SnO2-np | Perovskite | Aminothiazolium iodide | P3HT | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | MeO-TPD | Au',
-    'SLG | ITO | SnO2-np | C60 | Perovskite | Spiro-TTB | VOx | ITO',
-    'SLG | FTO | TiO2-c | Perovskite | JY7 | Ag',
-    'PEN | ITO | PCBM-60 | Perovskite | PTAA | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | BCP | LiF | Al',
-    'SLG | ITO | TiO2-c | C60-SAM | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PTAA | PFN | Perovskite | PCBM-60 | BCP | Al',
-    'SLG | FTO | CdS | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | NiO-c | NiO-mp | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | NiO-c | Perovskite | PEAI | PCBM-60 | BCP | SnO2-c | ITO | LiF',
-    'SLG | ITO | PEDOT:PSS | PolyTPD | Perovskite | PCBM-60 | Ba | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SM09 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | MoO3 | Al',
-    'SLG | ITO | NiO-c | Perovskite | HATNASO2C7-Cs | Ag',
-    'SLG | ITO | MgO-c | Perovskite | Spiro-MeOTAD | Au',
-    'PEN | Graphene; MoO3 | PEDOT:PSS | Perovskite | C60 | BCP | LiF | Al',
-    'SLG | FTO | TiO2-mp | D35 | Perovskite | Pt | SLG | FTO',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-70 | TiO2 | Al',
-    'SLG | ITO | SnO2-np | Perovsite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | FTO | Carbon | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-c | C60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | ZnO-np | C60 | Perovskite | PEDOT:PSS | FrGO | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | EtheneDTPA | Au',
-    'SLG | FTO | TiO2-c | TiO2-nw | Perovskite | TPA4C | Au',
-    'SLG | ITO | NiO-c | Cysteine | Perovskite | PCBM-60 | Bphen | Al',
-    'SLG | ITO | PEIE | C60 | Perovskite | P3HT | MoO3 | Cu',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60 | B4PyMPM | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-c | Perovskite | SWCNTs | PMMA | Ag',
-    'SLG | ITO | PEDOT:PSS | PolyTPD | Perovskite | IPH | PDINO | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | 2,7-triphenylamine-carbazole | Au',
-    'PET | ITO | PEDOT:PSS | Perovskite | C60 | BCP | Ca | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZIF-8 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BzTA | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Carbon-QDs | Perovskite | Red Phosphorous-QDs | Carbon',
-    'SLG | FTO | TiO2-c | Perovskite | Cu2ZnSn4-np | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | N-Graphene',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | SnO2-c | Perovskite | V950 | Ag',
-    'Ti | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Ag-np | ITO',
-    'SLG | FTO | TiO2-c | STHNP | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | NiO | Ag | NiO',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | LiF | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P2 | Au',
-    'SLG | ITO | PEDOT:PSS | CuI | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TIPS-Pentacene | Au',
-    'SLG | FTO | TiO2-nt | Perovskite | Spiro-MeOTAD | WO3 | Ag',
-    'SLG | FTO | TiO2-c | SnO2-np | Perovskite | Spiro-MeOTAD | Carbon | FTO',
-    'SLG | ITO | ZTO | SnO2-c | PCBM-60 | Perovskite | PTAA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon | IPA',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BTT-4 | Au',
-    'SLG | ITO | MoO3 | Perovskite | Alq3; C60 | LiF | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | DR3TBDTT; PDMS | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CoTh-TTPA | Au',
-    'SLG | ITO | SnO2-np | Perovskite | PTQ10 | PTAA | Ag',
-    'SLG | FTO | CF-Sp-BTh | Perovskite | PCBM-60 | Au',
-    'Willow glass | ITO | ZnO-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TPA-ANR-TPA | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | EDOT-MPH | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | MoOx | Au | MoOx',
-    'SLG | FTO | PEDOT:PSS | Perovskite | MABr | PCBM-60 | BCP | Ag',
-    'SLG | ITO | PEI | PCBM-60 | Perovskite | PCDTBT | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | mm-SFX-2PA | Au',
-    'SLG | ITO | MoS2 | Perovskite | PCBM-60 | BCP | LiF | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | TPBi | Al',
-    'SLG | FTO | Perovskite | Metal',
-    'SLG | ITO | TiO2-c | C60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Florinated polymer | Spiro-MeOTAD | Ag',
-    'SLG | ITO | C60-SAM | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | T80P | Au',
-    'SLG | FTO | TiO2-c | Perovskite | CuSCN | Au',
-    'SLG | ITO | NiO-c | Perovskite | ICBA | Al',
-    'SLG | FTO | NiO-c | PTZ-1 | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | SrTiO3-np; TiO2-nw | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | 2PACz | Perovskite | C60 | BCP | Cu',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Ni | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | ITIC; PCBM-60 | PEI | Ag',
-    'SLG | ITO | PEDOT:PSS | PSS-Na | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | SnO2-c | Perovskite | NiO-c | ITO | SLG',
-    'SLG | FTO | TiO2-c | SnO2-c | Perovskite | Graphene; P3HT | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PAH 1 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | X60 | Au',
-    'SLG | ITO | P3CT-Na | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | SnO2-QDs | Perovskite | CsCuBr3-QDs | Carbon',
-    'SLG | ITO | MeO-TPD | PEDOT:PSS | Perovskite | C60 | Ag',
-    'SLG | FTO | ZnO-nw | Perovskite | Graphite | FTO',
-    'SLG | ITO | PEIE | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:SSS | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | M103 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | NiO-np | Au',
-    'SLG | FTO | TiO2-c | Ba0.5Sr0.5SnO3-np | Perovskite | PTAA | Au',
-    'SLG | FTO | TiO2-nanoplatelets | Perovskite | Au',
-    'SLG | FTO | TiO2-c | Perovskite | MoO3 | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-c | ZrO2-mp | Perovskite | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BTTP | Au',
-    'SLG | ITO | TiO2-c | Ag-nw | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | NiO-c | Perovskite | Ag',
-    'SLG | ITO | f-C60 | C60 | Perovskite | P3HT | MoO3 | Ag',
-    'SLG | ITO | SnO2-c | Perovskite | TATF8HBP | Ag',
-    'SLG | ITO | PEDOT:PSS | Black phosphorous QDs | Perovskite | PCBM-60 | ZrAcac | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DPA-QA-DPA | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | MoOx | IZO',
-    'SLG | ITO | PEDOT:P(SS-co-TFPMA) | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BDT-4D | Au',
-    'SLG | FTO | 1-ethyl-3-methylimidazolium iodide | C60 | 1-ethyl-3-methylimidazolium iodide | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DPA-ANT-DPA | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZrO2-mp | PbTiO3 | Perovskite | Carbon',
-    'SLG | ITO | pBDT-BODIPY | PFN | Perovskite | PCBM-60 | Zr(acac)4 | Al',
-    'SLG | FTO | PEDOT:PSS | Perovskite | C60 | BCP | Cu',
-    'SLG | ITO | PTAA | Perovskite | Polystyrene | C60 | BCP | Cu',
-    'SLG | FTO | TiO2-c | SnO2-c | Perovskite | CuPc | Carbon',
-    'SLG | ITO | PEDOT:PSS | Perovskite | TPA-PCBM | bis-C60 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | GaIn',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PEDOT:PSS | ITO | SLG',
-    'SLG | ITO | CuI | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | P3Ct | Perovskite | PCBM-60 | C60 | BCP | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60 | ZnO-c | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BTPA-5 | Au',
-    'SLG | FTO | TiO2-c | Perovskite | CuI | Graphite',
-    'SLG | ITO | NiO-np | Perovskite | TiO2-np | C60; PCBM-60 | Ag',
-    'PET | Graphene | ZnO-np | Perovskite | PTAA | PEDOT:PSS | TFSA-Graphene | PET',
-    'SLG | FTO | Nb2O5 | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | AQ | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-mp | ZrO2-mp | Perovskite | Carbon | Galinstan',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Mo',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60 | SnO2-c | ITO | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | HTM-1 | Ag',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | SnO2-c | SnZnO | ITO',
-    'SLG | ITO | SnO2-np | C60-SAM | Perovskite | P3HT | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ADAHI | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | F3 | BCP | Mg | Ag',
-    'PET | APTES; Graphene | PCBM-60 | Perovskite | PTAA | Au',
-    'SLG | ITO | TAPC | Perovskite | PCBM-60 | LiF | Al',
-    'SLG | ITO | DPC60 | Perovskite | Spiro-MeOTAD | Au',
-    "SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Field's metal",
-    'SLG | FTO | TiO2-c | Perovskite | Poly-N-vinylcarbazole | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | pSNT | Ag',
-    'PET | Graphene; TETA | ZnO-np | Perovskite | PTAA | PEDOT:PSS | Graphene; TFSA | PET | Ag',
-    'SLG | ITO | Aniline; rGO | CsCO3 | Perovskite | PffBT4T-2OD | Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | CMB-vTA | Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | Mg | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon | Sn',
-    'SLG | ITO | CuCrO2 | Perovskite | C60 | BCP | Ag',
-    'PET | PEDOT:PSS | Perovskite | PCBM-60 | GaIn',
-    'SLG | ITO | ZnTiO3-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BPZTPA | Au',
-    'SLG | FTO | Nb2O5 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-c | Perovskite | Spiro-MeOTAD | Cu1.75S | Au',
-    'PEN | ITO | ZnO-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | Ag | ITO',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PCBC | LiF | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | C60SB; TBAI | Ag',
-    'SLG | FTO | TiO2-c | AgInS2-QDs; TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-c | Perovskite | P3HT | Au',
-    'SLG | ITO | PMT | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | NiO-c | PTAA | Perovskite | PCBM-60 | BCP | Au',
-    'SLG | ITO | VOx | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | PTPD | Perovskite | PCBM-60 | LiF | Al',
-    'SLG | ITO | PEDOT:PSS | PTPAFSONa | Perovskite | PCBM-60 | PN4N | Ag',
-    'SLG | FTO | NiO-mp | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | P3HT | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | X50 | Au',
-    'PET | ITO | PEIE | CDIN | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | SnO2-c | Perovskite | TATCz3 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PCBM-60 | TmPyPB | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCTDI | Cr | Cu',
-    'SLG | ITO | PTAA | Perovskite | SiPc-Py-2 | PTCDA | PO-T2T | Cu',
-    'PET | ITO | CzPAF-TPA | Perovskite | PCBM-60 | ZnO-np | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | BP | CuSCN | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | ZnO-c | Perovskite | PBTTT-14 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Graphene oxide | CuBuPc | Au',
-    'SLG | FTO | PCBM-60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | Cu:Ni-acetate | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | MATS | Al',
-    'SLG | FTO | SnO2-c | PCBM-60 | Perovskite | IDTC6-TPA | Au',
-    'SLG | FTO | NiO-c | CuGaO2-c | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | JY5 | Ag',
-    'SLG | FTO | TiO2-c | ZnO-c | Perovskite | Spiro-MeOTAD | Pt | SLG | FTO',
-    'SLG | FTO | TiO2-c | Perovskite | COPV1 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PolyTPD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | P(NDI2OD-T2); PCBM-60 | BCP | Ag',
-    'SLG | ITO | PolyTPD | Perovskite | PCBM-60 | Zr(acac)4 | Ag',
-    'SLG | ITO | Au-np; PEDOT:PSS | Perovskite | PCBM-60 | PFN | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Carbon-QDs | Perovskite | Carbon | Perovskite | Carbon-QDs | TiO2-mp | TiO2-c | FTO | SLG',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Poly(2-ethyl-2-oxazoline) | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | MeOAc-Spiro-OMeTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | M7-TFSI | Au',
-    'PEN | ITO | LiQ; PEIE | PCBM-60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | MWCNTs',
-    'SLG | ITO | F6-TCNNQ | TaTm | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | SnO2-np | Perovskite | PBDT(2H)T | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD-I | Au',
-    'SLG | FTO | TiO2-c | Perovskite | MEH-PPV | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SrCl2 | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Th101 | Au',
-    'Ti-wire | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au-np',
-    'Textile | PEN | ITO | Au | Spiro-MeOTAD | Perovskite | PCBM-60 | SnO2-c | ITO | PEN',
-    'SLG | ITO | CA-Br; TPA-PT-C6 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | TiO2-c | Perovskite | Na@Carbon-nanowalls',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PF8-TAA | Au',
-    'SLG | ITO | PolyTPD | Perovskite | C60 | BCP | CU',
-    'PET | ITO | SnO2-np | Perosvkite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | C60-SAM | SnO2-c | PCBM-60 | Perovskite | Spiro-MeOTAD | MoOx | Au',
-    'PET | ITO | SnO2-np | Perosvkite | P3HT | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-70 | Ag',
-    'SLG | ITO | c-OTPD; TPACA | Perovskite | PCBM-60 | C60 | BCP | Al',
-    'SLG | FTO | TiO2-c | Perovskite | Cu2NiSn4-np | Au',
-    'PEN | ITO | Zn2SnO4 | Perovskite | PTAA | Au',
-    'SLG | FTO | MgO | TiO2-mp | NiO-mp | Perovskite | Carbon',
-    'SLG | ITO | PEDOT:PSS | PTAA | Perovskite | PCBM-60 | FPyBr | Al',
-    'SLG | ITO | NiO-c | SY1 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | KR122 | Au',
-    'SLG | FTO | Fe2O3-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-QDs | Perovskite | CsSnBr3-QDs | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PiF8-TAA | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60; TDPP-CN4 | BCP | Ag',
-    'SLG | FTO | Al2O3; TiO2-c | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | FTO | ITIC | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PCBDANI | Al',
-    'SLG | ITO | MoO3 | CH3NH3PbI3 | C60 | TmPyPB | Ag',
-    'SLG | ITO | N,N‐di‐p‐methylthiophenylamine | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | ZnO-np | Al',
-    'SLG | ITO | ZnO-c | 1,2 ethanedithio | Perovskite | PZn-FTPA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | mGO | P3HT | Au',
-    'SLG | ITO | C60 | Perovskite | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TT-2,5-TPA | Au',
-    'SLG | ITO | NiO-c | Perovskite | FAD | PCBM-70 | AgAl',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | B1 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | P3HT; PCBM-60Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Polymer1 | Au',
-    'SLG | ITO | PTAA | Perovskite | ITIC | Zn(acac)2 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au | ITO',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PTZ1 | Au',
-    'SLG | FTO | FeO | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | AgI-QDs | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-np | Perovskite | MWCNTs',
-    'SLG | ITO | SnO2-np | Perovskite | Spiro-MeOTAD | Cu9S5-np | Au',
-    'SLG | ITO | SnO2-np | Perovskite | Theophylline | PTAA | Ag',
-    'SLG | FTO | SnO2-c | SnO2-c | Perovskite | V1091 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | XY1 | Au',
-    'SLG | FTO | TiO2-c | Ag-np | TiO2-c | Perovskite | Spiro-MeOTAD | Ag',
-    'PET | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Ag-np | BCP | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | D102 | Au',
-    'SLG | ITO | PTAA | Perovskite | ITIC-Th | Zn(acac)2 | Ag',
-    'SLG | TCO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'Ti-wire | TiO2-c | TiO2-nw | Perovskite | Carbon-nw',
-    'SLG | ITO | PEDOT:PSS | Perovskite | OCA | C60 | BCP | Ag',
-    'SLG | FTO | Perovskite | BCP | Au',
-    'SLG | ITO | Carbon-np; SnO2-np | Perovskite | CTAB | Spiro-MeOTAD | Au',
-    'SLG | AZO | Cu@Ni-nw | ZnO-c | Al2O3-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | ITO | Au',
-    'SLG | ITO | Perovskite | PCBM-60 | Rhodamine 101 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | NP1 | Au',
-    'SLG | ITO | MgO-c | SnO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | C60 | LiF | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TTPA-DTP | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | POSS-SH | Spiro-MeOTAD | Au',
-    'SLS | FTO | ZnO-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | SnO2-c | Perovskite | BL25 | Au',
-    'SLG | FTO | BenMeIM-Cl | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | MoS2-QDs; rGO-flakes | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | PCBM-60 | Perovskite | Spiro-MeOTAD | PEDOT:PSS',
-    'SLG | FTO | TiO2-c | Perovskite | P3HT; Spiro-MeOTAD | Au | Ag',
-    'SLG | ITO | BPADF | PEDOT:PSS | Perovskite | C60 | Ag',
-    'SLG | ITO | TTA | Perovskite | PCBM-60 | C60 | BCP | Ag',
-    'PET | Ag-grid | PEDOT:PSS | PEDOT:PSS | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | SnO2@TiO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | CuO-nw | PEDOT:PSS | Perovskite | PCBM-60 | Bphen | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-mp | NiO-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | In2O3 | Perovskite | PTAA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | NiPc-Cou | Au',
-    'SLG | FTO | Zn2SnO4-c | rGO; Zn2SnO4-fiber | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | ZnO | ITO',
-    'SLG | ITO | TiO2-c | Perovskite | P3HT | Ag',
-    'SLG | ITO | TiO2-c | PBCM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | PEDOT:PSS | Graphene',
-    'SLG | FTO | TiO2-c | TiO2-nw | Perovskite | P3HT | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-mp | TiO2-c | Perovskite | Spiro-MeOTAD | MoOx | Au | MoOx',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-derivate13 | Al',
-    'SLG | ITO | F6-TCNNQ; TaTm | TaTm | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | H101 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | CYTOP | PCBM-60 | PEIE | Ag',
-    'SLG | ITO | Perovskite | PCBM-60 | Methanol-hydroquinolatolithium | Ag',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-70 | Ag',
-    'SLG | ITO | SnO2-c | Perovskite | HZ3 | Au',
-    'PEG | ITO | SnO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | SWCNTs; TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | AZO | Ag-nw | AZO | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | Spiro-MeOTAD | Perovskite | PCBM-60 | LiF | Al',
-    'SLG | ITO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | MoO3 | IZO',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Phen‐NaDPO | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | [Fe(bpyPY4)](OTf)2.5 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | pBTT | Ag',
-    'SLG | ITO | NiO-c | PhNa-1T | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | P3CT-Na | Perovskite | TPE-ISO4 | C60 | BCP | Ag',
-    'SLG | ITO | PTAA | Perovskite | C60-SAM | C60 | BCP | Cu',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-mp | Perovskite | Carbon black; Graphite',
-    'SLG | ITO | 1F-SAM | PEDOT:PSS | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2; SiO2-IO | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO | Perovskite | PCBM-60 | PEOz | Ag',
-    'SLG | FTO | TiO2-c | TiO2-nw | Perovskite | Spiro-MeOTAD | AgAl',
-    'SLG | ITO | CdSe-Qds | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | poly(DTSTPD-r-BThTPD) | Au',
-    'SLG | FTO | NiO-c | Perovskite | CSCNT@Al2O3-c | CSCNT@SnO2',
-    'SLG | FTO | TiO2-c | Perovskite | Cu2MnSn4-np | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | P3HT | MoO3 | Al',
-    'SLG | ITO | SnO2-c | SnO2-np | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60 | ITO',
-    'SLG | ITO | PANI | Perovskite | C60 | BCP | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | C70 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CsSnBrI2-QDs | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon | FTO | SLG',
-    'SLG | ITO | Ni | PEDOT:PSS | Perovskite | C60 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SDTCz2F | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PTAA | MoO3 | Au',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PCBM-70 | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-70; ZnO-np | TiO2-c | Al',
-    'SLG | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | ITO',
-    'SLG | ITO | ZnO-c | CsCO3 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | MoOx | TPTPA | Perovskite | C60 | BCP | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DPIO | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | Pb',
-    'SLG | ITO | P3CT-Na | Perovskite | PCBM-60 | C60 | BCP | Ag',
-    'ITO | ZnO-c | Perovskite | Cu2O | ITO',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Perovskite | SWCNTs | PMMA | Ag',
-    'SLG | FTO | NiO-c | Perovskite | C60 | Ag',
-    'SLG | ITO | TiO2-c | C60 | Perovskite | PEO | Spiro-MeOTAD | Au',
-    'SLG | WO3 | Ag | WO3 | Perovskite | C60 | Bphen | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | Au | Ag',
-    'SLG | ITO | PCBZANT | Perovskite | PCBM-60 | C60 | BCP | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BI25 | Au',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PCBM-60 | C60 | BCP | Ag | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | P(NDI2OD-T2) | Al',
-    'SLG | ITO | TiO2-c | PCBM-60 | Perovskite | P3HT | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | MoOx | Al',
-    'SLG | ITO | PEDOT:SAF | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | ZnO-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'PET | ITO | PTAA | Perovskite | Polystyrene | C60 | BCP | Al',
-    'SLG | ITO | Cu2O | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TPB-4-MOTPA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | SnO2-c | Perovskite | V1013 | Ag',
-    'PET | Graphene | TiO2-c | PCBM-60 | Perovskite | Carbon-nt',
-    'SLG | ITO | Spiro-N | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | ITO | PTAA | Perovskite | 2PDI-4S | PEIE | Ag',
-    'SLG | ITO | MoO3 | Au | SnO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | FDPI | Perovskite | Spiro-MeOTAD | MoO3 | Au',
-    'SLG | ITO | poly(2-ethyl-2-oxazoline); PEDOT:PSS | Perovskite | PCBM-60 | Bphen | Ag',
-    'SLG | ITO | ZnO-c | C-PCBSD | Perovskite | PBTTT-14 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ZnPc | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | HTM | Au',
-    'SLG | FTO | TiO2-mp | Perovskite | Ethyl acetate; I2; LiI; TBP; Urea | Pt | FTO | SLG',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TT80 | Au',
-    'SU-8 | Ca | Au | PEDOT:PSS | Perovskite | PCBM-60 | Ca | Ag',
-    'SLG | ITO | NBP-BC | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | TiO2-c | CdS | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | Perovskite | SAF‐OMe | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Graphene | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | DMAPA-C60 | Ag',
-    'SLG | AZO | SnO2-c | SnO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'PET | ITO | Ag-nw | ZnO-c | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | ITO | PFN-OX; ZnO | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PTAA | Car-ETTA | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | ZnO-c | Al2O3-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | P8TTT | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | Liq | Al',
-    'SLG | ITO | SnO2-c | Perovskite | PEAI | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | H-Fl | Au',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PCBM-60 | C3-CBL | Ag',
-    'SLG | FTO | SrTiO3 | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiMgO | Perovskite | PCBM-60 | ZnMgO | Al',
-    'SLG | PET | ZnO@rQD-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | V885 | Au',
-    'SLG | FTO | ZnO-c | Al2O3-mp | Perovskite | Spiro-MeOTAD | Au',
-    'MgF2 | Willow glass | ITO | SnO2-np | Perovskite | Spiro-MeOTAD | MoO3 | Al',
-    'SLG | ITO | SnO2-np | Perovskite | Imidazolium iodide | P3HT | Au',
-    'SLG | FTO | ZnO-c | ZnO-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | Cu',
-    'SLG | FTO | TiO2-c | Perovskite | P3HT | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-c | Sb2O3-QDs | Perovskite | Sn2O3-ns | PCBM-60 | Bphen | Ag',
-    'SLG | FTO | LiMgNiO-c | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | Spiro-TBB | Spiro-TBB | Perovskite | C60 | Ag',
-    'SLG | ITO | PEDOT:PSS | 4-bromobenzenediazonium tetrafluoroborate | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | CuO2 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuPcNO2-OPh | Au',
-    'SLG | FTO | ZnO-np | Perovskite | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60-N | Al',
-    'SLG | ITO | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | Ag-grid | ITO | ZnO-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-np | NaCl | Perovskite | PCBM-60 | Zr(acac)4 | Ag',
-    'SLG | ITO | F6-TCNNQ; TaTm | TaTm | Perovskite | C60; PhIm | Ag',
-    'SLG | FTO | SnO2-c | PCBM-60 | Perovskite | PTZ-TPA | Au',
-    'PET | ITO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PNDI-2T | PEIE | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Ca | Al',
-    'SLG | ITO | P3HT | Perovskite | C60 | BCP | CU',
-    'SLG | FTO | TiO2-c | Perovskite | 3-Dodecylthiophene | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | PCBM-60 | Perovskite | PDPPT-TT | Ag',
-    'SLG | ITO | TiO2-c | Perovskite | Spiro-OiPrTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuInS2@ZnS-QDs | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Y2O3-c | Perovskite | Spiro-MeOTAD | Ag | Au',
-    'PEN | ITO | SnO2-np | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | 3-aminopropanoic acid-SAM | Perovskite | P3HT | Ag',
-    'PET | ITO | SnO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'Paper | Au | SnO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | MoO3 | Au | MoO3',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60 | BCP | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Poly-N-vinylcarbazole | SP-11 | Au',
-    'SLG | FTO | CrOx | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | PTTh | Perovskite | PCBM-60 | AZO-np | Au',
-    'SLG | ITO | F6-TCNNQ; TaTm | TaTm | Perovskite | C60; Phlm | Ag',
-    'SLG | FTO | Graphene; NDI; SnO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'PET | Ag-grid | PEDOT:PSS | PEDOT:PSS | Perovskite | PCBM-60 | LiF | Al',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | Zr(acac)4 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C70 | LiF | Al',
-    'Silk | Ag-nw | PEDOT:PSS | PEDOT:PSS | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | NiO-c | Perovskite | HATNA-F6 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | H2Pc | Au',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PCBM-60 | Carbon | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Carbon-QDs | Perovskite | Phosphor-QDs | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Preovskite | Spiro-MeOTAD | Au',
-    'PET | Ag-mesh | PH1000 | PEDOT:PSS | Perovskite | PCBM-60 | Al',
-    'NOA63 | ITO | PEDOT:PSS | Perovskite | PCBM-60 | MoO3 | Au | Ag | MoO3 | Alq3',
-    'SLG | FTO | TiO2-c | Perovskite | T40P | Au',
-    'SLG | ITO | MC8-TPA | Perovskite | PCBM-60 | LiF | Al',
-    'SLG | ITO | PEDOT:PSS | Rubrene | Perovskite | PCBM-60 | Bphen | Ag',
-    'SLG | FTO | TiO2-c | PCBM-60 | Perovskite | PTAA｜Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CT4 | MoO3 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | AgAl',
-    'SLG | FTO | SnO2-c | Al2O3-mp | NiO-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | PCBM-60 | Perovskite | PCDTBT1 | MoO3 | Au',
-    'SLG | FTO | ZnO-c | AZO-np | Perovskite | Spiro-MeOTAD | Au',
-    'PET | ITO | ZnO-np | Perovskite | PB(NAP-Th)TBT | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | SCZF-5 | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | NBA-SAM | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | HBZ-70 | Carbon | FTO | SLG',
-    'SLG | FTO | TiO2-c | TiO2-mp | beta-Alanine-SAM | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | Perovskite | PDTSTTz | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | POSS-NH2 | Spiro-MeOTAD | Au',
-    'SLG | ITO | P3CT-Na | Perovskite | ITCPTC | C60 | BCP | Ag',
-    'PEN | ITO | NiO-c | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Alq3 | Ag',
-    'SLG | FTO | TiO2-c | C60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | FASnI3 | C60 | BCP | Ag',
-    'SLG | ITO | SnO2-c | Perovskite | Spiro-MeOTAD | MoO3 | Al',
-    'PES | ITO | Perovskite | Spiro-MeOTAD | Au',
-    'PEN | ITO | TiO2-np | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | FEH | Au',
-    'SLG | FTO | TiO2-c | Au-np; TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | TiO2-np | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Polystyrene | Spiro-MeOTAD | Ag',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | TiO2-c | Al | Au',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Perovskite | P3HT; SWCNTs | Ag',
-    'SLG | FTO | ZnO | Perovskite | Spiro-MeOTAD | Mo2O3 | Ag',
-    'SLG | FTO | MgO | NiO-mp | Perovskite | Carbon',
-    'SLG | ITO | TiO2-c | C60 | Perovskite | TaTm | TPBi | MoO3 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | OIPC-I | Au',
-    'SLG | FTO | SnO2-c | TiO2-c | Perovskite | CuPc | Carbon',
-    'SLG | ITO | Perovskite | PCBM-70; PTB7-Th | Ca | Al',
-    'SLG | ITO | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | ZnLiO | PCBA | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | pTPD | Perovskite | IPB | Ba | Ag',
-    'SLG | ITO | Ti3C2Tx | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PCBM-60 | Perovskite | Spiro-MeOTAD | MoO3 | Ag | MoO3',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P(BDTT-ttPPD) | Au',
-    'SLG | ITO | NiO-np | Perovskite | EVA | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Au@Ag-np | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | 2,5‐bis(4,4′‐bis(methoxyphenyl)aminophen‐4′′‐yl)‐3,4‐ethylenedioxythiophene | Au',
-    'SLG | FTO | TiO2-np | PCBM-60 | Perovskite | PDCBT | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | TPE-Nme | Ag',
-    'SLG | ITO | PEDOT:PSS | Vox | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | CuPc | PEI | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | MeO-FDPA | Perovskite | PCBM-60 | PEI | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Polystyrene | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TSHBC-tBu | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | SiO2-mp | Perovskite | CuPc | Carbon',
-    'SLG | FTO | ZnO-c | ZnO-nw | TiO2-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | KR321 | Au',
-    'SLG | FTO | Ag-np; TiO2-c | TiO2-mp | ZrO2-mp | Perovskite | Carbon',
-    'SLG | ITO | NiO-c | Perovskite | ICBA; PCBM-60 | Al',
-    'SLG | ITO | H5 | Perovskite | PCBM-60 | BCP | Au',
-    'MgF2 | Willow glass | ITO | PTAA | Perovskite | C60 | BCP | Cu',
-    'SLG | ITO | PEDOT:PSS | Perovskite | (DTYM-NDI-DTYA)2 | BCP | Ag',
-    'SLG | ITO | ZnO-c | ZnO-nw | Perovskite | Cu2O | ITO',
-    'SLG | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | MoO3 | Ag | ZnS',
-    'SLG | FTO | SnO2-np | SnO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-np | PCBM-60 | Perovskite | PTA | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PDPPDBTE | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | ETPM | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SGT-422 | Au',
-    'PEN | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PEIE | Au',
-    'SLG | ITO | TFB | Perovskite | C60 | B4PyMPM | Ag',
-    'SLG | FTO | TiO2-c | NaYF4:Yb:Er-np; TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiPcS4 | Perovskite | PCBM-60 | C60 | BCP | Ag',
-    'SLG | Ag-nw; Chitosan | PEDOT:PSS | Perovskite | PCBM-60 | Bphen | Al',
-    'SLG | FTO | PTO | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-c | Perovskite | NDT | Au',
-    'SLG | FTO | TiO2-c | Perovskite | CuPc | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | AV-Carbon; MAI',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CdSe-QD | CsPbI3-QD | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | H-PDI | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Carbon-QDs | Perovskite | Carbon-QDs | Carbon | Carbon-QDs | Perovskite | Carbon-QDs | TiO2-mp | TiO2-c | FTO | SLG',
-    'SLG | ITO | P3HT | Perovskite | PCBM-60 | PEI | Ag',
-    'SLG | ITO | NiO-c | Perovskite | PEAI | PCBM-60 | BCP | Ag',
-    'SLG | ITO | TiO2-c | PCBM-60 | Perovskite | Spiro TTB | MoO3 | Au',
-    'SLG | FTO | Perovskite | Spiro-MeOTAD | CANP | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | PCBM-60 | PbI2 | Perovskite | Spiro-MeOTAD | Au',
-    'MgF2 | Quartz | ITO | PTAA | CuSCN | Perovskite | PCBM-60 | AZO-np | PEI | Ag',
-    'SLG | ITO | SnO2-np | PN4N | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'PET | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Bphen | Al',
-    'SLG | ITO | ZnO-np | PFS-FTEG | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-fibres | Perovskite | Au',
-    'SLG | MSA-PEDOT:PSS | PEDOT:PSS | Perovskite | PCBM-60 | C60 | Unknown | Rhodamine 101 | LiF | Ag',
-    'SLG | FTO | TiO2-c | OTS | Perovskite | Spiro-MeOTAD | Ni-grid',
-    'SLG | ITO | PEDOT:PSS | MoO3 | Perovskite | PCBM-60 | Bphen | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | ITO | L-F | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | TPE-W1 | Ag',
-    'SLG | FTO | TiO2-c | ZnO-c | Perovskite | Spiro-MeOTAD | H2PtCl6',
-    'Willow glass | Graphene | Ag-nw | PEDOT:PSS | PEDOT:PSS | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | GaN | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | H-PDI | ZnO-np | Ag',
-    'SLG | ITO | TiS2 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | Cr2O3 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-c | C60-5a | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-nt | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | a-PTCDI | Al',
-    'SLG | FTO | CuO2 | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | MPTS-SAM | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Ag-nw',
-    'SLG | ITO | Perovskite | C60 | BCP | Cu',
-    'PET | ITO | NiO-c | NiO-nw | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | NiO-c | YC-1 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | CuSCN | Au',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Graphene oxide | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuSCN | ITO',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | mp-SFX-2PA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Tetra-substituted azulene | Au',
-    'SLG | FTO | TiO2-c | TiO2-nw | Perovskite | TPA1C | Au',
-    'SLG | ITO | TAPC | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuI | Pt | FTO',
-    'SLG | ITO | NiO-np | Al2O3-mp | Perovskite | PCBM-60 | Rhodamine 101 | Ag',
-    'SLG | ITO | NiO-np | Perovskite | Ag',
-    'SLG | FTO | TiO2-c | TiO2-nw | Perovskite | Ethyl acetate; I2; LiI; TBP; Urea | Pt | FTO | SLG',
-    'SLG | FTO | SnO2-c | C60-SAM | Perovskite | TET | Au',
-    'SLG | FTO | SnO2-c | PCBM-60 | Perovskite | XMP | MoO3 | Ag',
-    'PEN | ITO | PyCEE | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | nTi-MOF | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | Graphene oxide | Perovskite | PCBM-60 | BCP | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | GD; P3HT | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PVK | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | Ome-TPA-CuPc | Au',
-    'SLG | FTO | (RhCp*Cp)2 | C60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-mp | Perovskite | Spiro-MeOTAD | Metal',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60 | BCP | Au',
-    'SLG | ITO | SnO2-c | Au | SnO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-mp | NiO-mp | Perovskite | Au',
-    'SLG | ITO | TiO2-c | PNP | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | MgO-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | PCBM  Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Phen-NaDPO | Ag',
-    'SLG | ITO | TAPC | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | ITO | SnO2-c | PCBM-60 | Perovskite | PDCBT | Ta:WOx | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | D1 | Au',
-    'SLG | FTO | SnO2-np | PFN-Br | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Carpoic acid | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BTT-2 | Au',
-    'SLG | ITO | In2O3-c | SnO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-np | Perovskite | CuSCN | Au',
-    'SLG | ITO | NiO-np | Perovskite | C60; PCBM-60 | Zr(acac)4 | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | Py | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuCrO2 | Au',
-    'SLG | FTO | ZnO-np | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon; MAI | Carbon',
-    'SLG | FTO | NiMgLiO-c | Perovskite | SFX-PDI4 | TiO2-c | Ag',
-    'SLG | ITO | PTAA | Perovskite | ICBA-tran3 | C60 | BCP | Cu',
-    'SLG | ITO | NiO-np | TPI | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp; YVO4:Eu:Bi-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | FDT | Au',
-    'SLG | FTO | NiO-c | Perovskite | C60-MPy | BCP | Ag',
-    'SLG | ITO | P3HT | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | NiO-c | Perovskite | TEABr | PCBM-60 | PEI | Ag',
-    'SLG | ITO | CuSCN | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PTAA | AU',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PCPDTBT | Ag',
-    'SLG | ITO | PVBT-TMA | Perovskite | PCBM-60 | C60-N | Ag',
-    'SLG | FTO | Al2O3-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-c | Perovskite | SnO2-np | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | S12 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Cr',
-    'SLG | ITO | ZnO-c | 1,2-ethanedithiol | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Z1011 | Au',
-    'SLG | FTO | TiO2-mp | Perovskite | I2-electrolyte | Pt | FTO',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BTT-3 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-OMeOTAD | Au',
-    'Ti | TiO2-c | Perovskite | Spiro-MeOTAD | MoOx | Ag | MoOx',
-    'SLG | ITO | PTAA | Perovskite | C60 | BCP | Al',
-    'SLG | FTO | TiO2-c | Perovskite | DIQ-C12 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | ITIC | PCBM-60 | PEIE | Ag',
-    'SLG | FTO | SnO2-c | PCBM-60; PMMA | Perovskite | PMMA | Spiro-MeOTAD | Au',
-    'SLG | ITO | CuInS2 | Al2O3-mp | Perovsktie | PCBM-60 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | P3TMAHT | Ag',
-    'SLG | FTO | SnO2-c | TiO2-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PDI | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | X59 | Au',
-    'SLG | ITO | P3OT | Perovskite | C60 | BCP | CU',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TAA14 | Au',
-    'SLG | FTO | TiO2-c | ZIF-8 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovsite | Boron subphthalocyanine chloride | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuH | Au',
-    'PDMS | SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | HTM5 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BL07 | Au',
-    "SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Tetrakis(4-methoxyphenyl)spiro[cyclopenta[1,2-b:5,4-b']dipyridine-5,9'-fluorene]-2',7'-diamine | Au",
-    'SLG | FTO | TiO2-nanoleaves | MgO | Perovskite | Spiro-MeOTAD | Graphite',
-    'SLG | FTO | MTDATA | Perovskite | C60 | BCP | Cu',
-    'SLG | FTO | SnO2-np | Perovskite | Spiro-MeOTAD | Carbon black',
-    'SLG | ITO | SnO2-np | PCBM-60 | Perovskite | TZ1 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | POZ9 | Au',
-    'SLG | FTO | TiO2-c | Perovskite | NiO-np | Spiro-MeOTAD | Au',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | ITO | SnO2-np | Dompamin-SAM | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-nanosphere | ZrO2-mp | Perovskite | Carbon',
-    'SLG | ITO | poly(1,4-phenylenevinylene) | Perovskite | PCBM-60 | LiF | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Sinapoyl malate | Perovskite | Co(II)P | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | diPDI:DMBI | TiO2 | Al',
-    'SLG | ITO | NiO-c | PEAI | Perovskite | PCBM-60 | AgAl',
-    'SLG | ITO | PEDOT:PSS | Perovskite | S-acetylthiocholine chlorde | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Oleylamine | Au',
-    'SLG | ITO | SnO2-np | PCBM-60; PCBA | C60 | Perovskite | Spiro-MeOTAD | MoO3 | Au',
-    'PET | ITO | PEDOT:PSS | NiO-c | Perovskite | PCBM-60 | TIPD | Al',
-    'SLG | ITO | MeO-2PACz | Perovskite | C60 | BCP | Cu',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | FTO',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | POZ2 | Ag',
-    'SLG | ITO | Graphene oxide; MoOx-np | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | JW6 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | P3CT-Na | Perovskite | PCBM-60 | Rhodamine 101 | LiF | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | (n-BuO)4ZnPc | Au',
-    'SLG | FTO | NiO-c | Perovskite | CeOx | Ag',
-    'SLG | ITO | SnO2-c | Perovskite | SDF-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuSCN | Carbon',
-    'SLG | FTO | TiO2-c | BaSnO3-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | ZnO-c | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | CuI | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | PCBM-60 | Perovskite | COTT-1 | COTT-2 | Au',
-    'SLG | ITO | Z9 | Perovskite | PCBM-60 | BCP | Ag',
-    'Carbon-nt-yarn | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Pt-Carbon-nt',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Cs2CO3 | Al',
-    'SLG | FTO | TiO2-c | MPMIC60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEI | PCBM-60 | Perovskite | PTAA | MoO3 | Ag',
-    'SLG | ITO | PDTON35 | SnO | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | TiO2-c | Ag | TiO2-c | CPTA | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Trux2 | Au',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | ZnO-np | DPO | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | V911 | Au',
-    'SLG | FTO | TiO2-c | PCBM-60 | Perovskite | V997 | Au',
-    'SLG | FTO | SnO2-c | PCBM-60 | Perovskite | M112 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZrO2-mp | Perovskite | Carbon | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | Spiro-MeOTAD | MoOx | Al',
-    'SLG | FTO | SnO2-c | Perovskite | SM09 | Ag',
-    'SLG | ITO | PTAA | PFN | Perovskite | PCBM-60 | BCP | Cu | Ag',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | Mg | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-mp | Perovskite | AgAu-mp',
-    'SLG | FTO | TiO2-c | Perovskite | CBP | Au',
-    'SLG | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | PEDOT:PSS | In',
-    'SLG | FTO | Perovskite | P3HT | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P3HT | Ag | Au',
-    'SLG | ITO | SnO2-c | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | MoO3 | TPTPA | Perovskite | 3TPYMB | C60 | TmPyPB | Ag',
-    'SLG | ITO | C60 | C60 | Perovskite | TaTm | F6-TCNNQ; TaTm | Au',
-    'SLG | ITO | SnO2-c | PEIE | PCBM-60 | Perovskite | Spiro-MeOTAD | MoOx | IO | ITO | Au',
-    'SLG | FTO | TiO2-c | TiO2-nw | Perovskite | HTM | Ag',
-    'SLG | ITO | ZnO-c | ZnO-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | PEDOT:GSL | Perovskite | PCBM-60 | LiF | Al',
-    'SLG | ITO | PTAA | PFN | Perovskite | PCBM-60 | PFN | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | BDT-C1 | Ag',
-    'SLG | FTO | TiO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-PT-OMeTAD | Au',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60-np | PrC60MA | PEI | Au',
-    'Steel | ZnO-c | ZnO-nw | Perovskite | Spiro-MeOTAD | Carbon-nt',
-    'SLG | ITO | WOx | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | NiO | Perovskite | Q10 | BCP | Ag',
-    'Ti | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Ag-nw',
-    'SLG | ITO | SnO2-np | DTPA | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | pBBTa‐BDT2 | Au',
-    'SLG | FTO | C60 | Perovskite | P3HT | Au',
-    'SLG | FTO | Carbon-mp | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PEIE | Au',
-    'SLG | ITO | SnO2-np | Perovskite | CH3O-PEAI | Spiro-MeOTAD | Au',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 1c | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Ag | PMMA',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | S,N-Heteroacene 1 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BTTP-CN | Au',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Pervskite | CuSCN | Au',
-    'SLG | FTO | In2O3 | Perovskite | Spiro-MeOTAD | MoO3 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PDPP3T | Ag',
-    'SrTiO3 | Sr2RuO4 | Perovskite | ITO',
-    'SLG | ITO | PEDOT:PSS | Dex-CB-MA | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CZTS0.25Se0.75; rGO | Au',
-    'SLG | ITO | Ts-CuPc | PEDOT:PSS | Perovskite | PCBM-60 | Bphen | Ag',
-    'SLG | ITO | TiO2-c | Perovskite | P3HT | Au',
-    'SLG | FTO | TiO2-c | Perovskite | MoO2-np | Au',
-    'SLG | AZO | Ag-grid | AZO | ZnO-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PCPDTBT | PEDOT:PSS | Au',
-    'SLG | ITO | NiO-np | Perovskite | C60 | BCP | Cu',
-    'SLG | ITO | NiO-c | Perovskite | ZnO-np | C60 | Ag',
-    'SLG | ITO | Spiro-TTB | Perovskite | LiF | C60 | SnO2-c | IZO | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | MoOx | Ag | Mox',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | HPPHT | Carbon',
-    'SLG | Ag-nw | Graphene | ZnO-np | Perovskite | PTAA | Au',
-    'SLG | ITO | NiO-c | Perovskite | C60 | SnO2-np | Ag',
-    'SLG | ITO | SnO2-c | MgO-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | CuO | Perovskite | PCBM-60 | Ca | Al',
-    'SLG | ITO | WOx | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | PCDTBT | Perovskite | PCBM-60 | LiF | Ag',
-    'SLG | FTO | TiO2-c | Ba(La)SnO3 | Perovskite | PTAA | Au',
-    'SLG | ITO | C60 | Perovskite | MoO3 | Ag',
-    'SLG | ITO | Spiro-TTB | Perovskite | C60 | TmPyPB | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | F1 | BCP | Mg | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | PTAA | NiO-c | ITO | PEN',
-    'SLG | ITO | NiO-np | TPI-6MEO | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | SnO2-c | C9 | Perovskite | Spiro-MeOTAD | Au',
-    'PET | Graphene | PEDOT:PSS | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Perovskite | PDI | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PEIE | Ag | MoO3 | Back-reflector',
-    'SLG | FTO | WO3-c | WO3-nw | Cs2CO3 | PCBM-60 | Perovskite | P3HT | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Black phosphorous nanosheets | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | C60-SAM | Perovskite | P3HT | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | DBP | PCBM-60 | Bphen | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | ZnO | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | H66 | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Phenethylamine | Spiro-MeOTAD | Au',
-    'PET | ITO | PFN | C60; PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO-HMDS Scaffold | TiO2-c | C60 | Perovskite | PTAA | Ag',
-    'SLG | ITO | Ag-grid | AZO | ZnO-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TPA‐ANT‐TPA | Ag',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PCBM-60 | bis-C60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | X23 | Au',
-    'SLG | ITO | PEDOT:PSS | TS-CuPc | Perovskite | PCBM-60 | Bphen | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | DTS(IIThThHEX)2 | MoOx | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | CTAB | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DM2 | Au',
-    'SLG | ITO | PEIE | C60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | Perovskite | Au',
-    'SLG | ITO | p-PFP-O | PTAA | Perovskite | PCBM-60 | PFN | Cu',
-    'SLG | ITO | CuI | PbPc | Perovskite | C60 | Bphen | Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBB-OEG; PCBM-60 | C60 | BCP | Cu',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Polyrotaxane | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | H111 | Au',
-    'SLG | ITO | rGO | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | NiO-c | Perovskite | C60 | ZnSe | Ag',
-    'A.R.C. | SLG | ITO | PTAA | Perovskite | C60 | BCP | Cu',
-    'SLG | FTO | TiO2-nw | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | TiO2-c | TiO2-mp | Nb2O5-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEG; ZnO-np | Perovskite | Spiro-MeOTAD | Au',
-    'PET | Al2O3 | Ti | C60 | Perovskite | NiO-c | Ni | Al2O3 | PET',
-    'SLG | FTO | SnO2-np | PCBM-60 | Perovskite | Selenium | Au',
-    'SLG | ITO | SnO2-np | Perovskite | AL2O3-c | Spiro-MeOTAD | MoOx | ITO | MgF2',
-    'SLG | FTO | In2S3 | Perovskite | Spiro-MeOTAD | Au',
-    'PET | IZO | PTAA | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuPc-OBu | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | MoOx | Au',
-    'SLG | ITO | ZnO-c | ZnO-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | Benzoic acid | Perovskite | Spiro-MeOTAD | WO3 | Ag',
-    'SLG | FTO | NiO-c | Perovskite | Au',
-    'SLG | ITO | TiO2-c | Perovskite | TPADPP-1 | Au',
-    'SLG | FTO | TiO2-nw | N719 | Perovskite | Au@CZTS-np | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | BMIM-OTF | Al',
-    'SLG | ITO | SnO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PCBM-70 | LiF | Al',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZrO2-mp | Perovskite | Carbon',
-    'SLG | FTO | SnO2-c | SnO2-mp | TiO2-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | Graphene | MoO3 | PEDOT:PSS | Perovskite | C60 | BCP | LiF | Al',
-    'SLG | FTO | TiO2-c | PCBM-60 | C60-ETA | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | M:OO | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CsSnI2.95F0.05 | FTO | SLG',
-    'SLG | ITO | DA-PEDOT:PSS | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TTF1 | Ag',
-    'SLG | ITO | MoO3 | Perovskite | PCBM-60 | Bphen | Ag',
-    'NOA88 | PEI | Au | PEDOT:PSS | Perovskite | PCBM-60 | ZnO-np | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PTTI-1 | Ag',
-    'SLG | ITO | NiO-c | Perovskite | FSIP | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | PEDOT:PSS; Sorbitol | Ag-grid | PET',
-    'SLG | FTO | Cu0.5Cr0.5O2 | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | NiO | PS | Perovskite | PS | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Ni',
-    'SLG | FTO | TiO2-c | KY7F22-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | Au-np; Graphene; TFSA | PEDOT:PSS | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | X61 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SCPDT-BiT | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BChl-3 | Ag',
-    'SLG | FTO | SnO2-np | Perovskite | Hexamethyl-substituted subphthalocyanine | Au',
-    'SLG | ITO | PB2T-O | Perovskite | PCBM-60 | ZnO | Al',
-    'SLG | FTO | PEDOT:PSS | Perovskite | H-DIPBI | Al',
-    'SLG | ITO | C60; PhIm | Perovskite | TaTm | F6-TCNNQ; TaTm | Ag',
-    'SLG | FTO | ZnO@rQD-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | f-C70 | Perovskite | P3HT | MoO3 | Ag',
-    'SLG | ITO | Graphene oxide | Perovskite | PCBM-60 | LiF | Ag',
-    'SLG | FTO | NiO-c | NiO-mp | Perovsite | C60 | BCP | Al',
-    'SLG | ITO | H7 | Perovskite | PCBM-60 | BCP | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Co-porphyrins | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Graphene | Spiro-MeOTAD | Au',
-    'SLG | ITO | PTAA | Perovskite | C70 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | PbI2 | PDPP3T; PCBM-60 | Al',
-    'PEN | ITO | WOx | SnO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | ZnO-c | Perovskite | PDBT-co-TT | Au',
-    'PEN | ITO | rGO | PTAA | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | TiO2-c | C60 | Perovskite | PS | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | C60 | ZrO2-mp | Perovskite | Carbon',
-    'SLG | FTO | NiMgLiO | Perovskite | In2O3-c | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | PTAA | Ag',
-    'SLG | FTO | TiO2-c | TiO2-helices | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | Cobalt–porphyrin | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | AZO | BCP | Ag',
-    'SLG | ITO | CzPAF-TPA | Perovskite | PCBM-60 | ZnO | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | OMeTPA-BDT | Au',
-    'SLG | FTO | NiO-c | PMMA | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | HT-ZnPc | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 4-(4-phenyl-4-alfa-naphthylbutadienyl)-N,N-di(4-methoxyphenyl)-phenylamine | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | F8T2e | Au',
-    'SLG | FTO | SnO2-np | C60 | Perovskite | V950 | Au',
-    'SLG | ITO | SnO2-c | Perovskite | Spiro-MeOTAD | MoO3 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SO8 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | Mono-PCBOE | ZnO | Al',
-    'SLG | ITO | TiO2-c | Perovskite | DOR3T-TBDT | MoO3 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | NDI-ID | Al',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | AgAl-np | Au-np | LiF | AgAl',
-    'PEN | ITO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | YVO4:Eu | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | X-DVTPD | Perovskite | PCBM-60 | FPI | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | Ni',
-    'PEN | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | EP02 | Au',
-    'SLG | ITO | PEDOT:PSS | DPP-DTT | Perovskite | PCBM-60 | LiF | Ag',
-    'SLG | WO3 | Ag | SnO2-np | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | FTO | Nb2O5-c | Nb2O5-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Thiourea | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | CuI | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | P3HT; PFN | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | MXene | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-c | Perovskite | Spiro-MeOTAD | Carbon | Al',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Perovskite | EH44 | Au',
-    'SLG | ITO | PT | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | SnO2-c | SnO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | MPA-BTTI | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | KR355 | Au',
-    'SLG | ITO | PTAA | PFN-Br | Perovskite | C60 | BCP | Cu',
-    'SLG | MSA-PEDOT:PSS | PEDOT:PSS | Perovskite | PCBM-60 | Rhodamine 101 | C60 | Rhodamine 101 | LiF | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | PBDTTT-CT | Spiro-MeOTAD | Au',
-    'SLG | ITO | P3CT-Na | Perovskite | TPE-DPP8 | C60 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PFN-Br | Al',
-    'SLG | ITO | TiO2-c | Perovskite | Spiro-OBuTAD | Au',
-    'SLG | ITO | PANI:PSS | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | SnO2-mp | Perovskite | P1 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | NDI-BTH2 | Ag',
-    'SLG | ITO | TRUX1 | Perovskite | PCBM-60 | LiF | Al',
-    'SLG | FTO | PEG; PEDOT:PSS | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-mp | Perovskite | HfO2 | CuI | Graphite',
-    'SLG | WO3 | Ag | WO3 | PEDOT:PSS | Perovskite | C60 | Bphen | Ag',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PCBM-60 | Au',
-    'SLG | ITO | PTAA | MoS2 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-c | Perovskite | Cu2O | Au',
-    'SLG | ITO | Py-COF | PTAA | Perovskite | PCBM-60 | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | AgAl',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TTB3 | Au',
-    'SLG | ITO | C60(OH)16 | C60 | Perovskite | PH3T | MoO3 | Ag',
-    'PEN | ITO | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | SnO2-c | IDTT2FPDI | Perovskite | PTAA | Ag',
-    'SLG | FTO | SnO2-c | KCl | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | C60; PhIm | C60 | Perovskite | TaTm | F6-TCNNQ; TaTm | Ag',
-    'PEN | ITO | C60 | Perovskite | Spiro-MeOTAD | MoO3 | Au',
-    'SLG | ITO | P3CT-N | Perovskite | PCBM-60 | C60 | BCP | Cu',
-    'SLG | FTO | MgO | SnO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | HTM | Metal',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 3,6-tris-(N,N-di-p-methoxyphenylamine)pyrene | Au',
-    'SLG | FTO | [EMIM]PF6-IL | C60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | CO2CO3 | Perovskite | PolyTPD | Au',
-    'SLG | FTO | PTAA | Perovskite | C60 | BCP | Cu',
-    'SLG | ITO | ZnO-c | APTES-SAM | Perovskite | PCBM-60 | Au',
-    'SLG | FTO | PbZrTiO3 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Cr | Au',
-    'SLG | FTO | SnO2-c | TiO2-np | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PTAA | Perovskite | PS | C60 | BCP | Cu',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZrO2-mp | Perovskite | Carbon; TiO2-np',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | WO3 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Zr(acac)4 | Al',
-    'SLG | ITO | TiO2-c | C60 | Perovskite | PDTSTTz-4 | MoO3 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60; PCBM-60 | bis-C60 | Ag',
-    'SLG | ITO | ZnO-nw | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-c | BBA | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | ICBA | bis‐C60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | YC-3 | Ag',
-    'SLG | ITO | PVBT-SB | Perovskite | PCBM-60 | C60-N | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TPA-BPV-TPA | Au',
-    'PEN | ITO | SnO2-c | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | PTAA | Perovskite | PCBM-60 | Rhodamine 101 | LiF | Ag',
-    'SLG | ITO | CuInS2 | Al2O3-np | Perovskite | PCBM-60 | TIPD; ZnO-np | Ag',
-    'SLG | ITO | PCDTBT; PFN | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | Au-np; TiO2-np | C-PCBSD | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TPA-TPM | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZrO2-mp | Co3O4-mp | Perovskite | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 2-((2-(4-(2-ethylhexyl)-4H-dithieno[3,2-b:2′,3′-d]pyrrol-2-yl) thiazol-5-yl)methylene) malononitrile | Ag',
-    'PEN | ITO | C60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-mp | Perovskite | H:MoO3-nanobelts',
-    'SLG | ITO | Cs2CO3 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | P(VDF-TrFE) | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P4 | Au',
-    'SLG | FTO | TiO2-c | Perovskite | TPE-W2 | Ag',
-    'PEN | ITO | ZnO-c | Perovskite | Carbon',
-    'SLG | FTO | PEDOT:PSS | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | Perovskite | PCBM-60 | ZnO | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SnS-np | NiO-np | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | KM03 | MoO3 | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | HOFP | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-np | Perovskite | TCPI | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-mp | Perovskite | 2,5-bis (5-(5-(5-hexylthiophen-2-yl) thiophen2-yl) thiophen-2-yl) thiazolo[5,4-d]thiazole | Au',
-    'SLG | ITO | ZTO | SnO2-c | C60 | Perovskite | PTAA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuInS2@ZnS-QDs | Au',
-    'SLG | ITO | AZO-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | WOx | Perovskite | Spiro-MeOTAD | Ag',
-    'PET | Ag | MoOx | PEDOT:PSS | Perovskite | PCBM-60 | C60 | BCP | Cu | Ag | MoO3',
-    'Ti-foil | TiO2-nt | Perovskite | Spiro-MeOTAD | Carbon-nt',
-    'SLG | ITO | PEDOT:PSS | Propionic acid | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CS03 | Au',
-    'PET | ITO | PEDOT:PSS | Perovskite | PCBM-60 | LiF | Al',
-    'SLG | ITO | SnO2-c | Ba(OH)2 | Perovskite | PDCBT | MoOX | Au',
-    'SLG | FTO | SnO2-c | PCBM-60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | TPAC0M | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | FTO | TiO2-c | TiO2-nw | TiO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-np | Perovskite | Spiro-MeOTAD | Graphen',
-    'SLG | FTO | TiO2-mp | Perovskite | V841 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60 | Bphen | Ca | Ag',
-    'SLG | FTO | TiO2-c | KH550 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | MoO3 | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | (10-butyl-3,7-diphenylphenoxazine) | Au',
-    'SLG | ITO | NiO-c | Perovskite | PEAI | PCBM-60 | BCP | TeO2 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | P3HT | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TBP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | 0F | Au',
-    'SLG | ITO | PSS-g-PANI | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | NiO-np | Perovskite | NiO-np | Spiro-MeOTAD | Au',
-    'SLG | FTO | NiO-c | NiO-mp | Perovsite | ZnO | Al',
-    'SLG | FTO | Fe2O3-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-c | Perovskite | Ome-DPA-CuPc | Au',
-    'SLG | FTO | TiO2-c | PCBDAN | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-np | Perovskite | CuIn1.5Se3-QDs | Au',
-    'SLG | FTO | ZnO | MgO | EA | TiO2-mp | Perovskite | Spiro-MeOTAD | CuI | Au',
-    'SLG | FTO | SnO2-np | Ethanol amine | Perovskite | Spiro-MeOTAD | Au',
-    "SLG | FTO | SnO2-c | C60 | Perovskite | N4,N4'-(4,10-dimethyl-6H,12H-5,11-methanodibenzo[b,f][1,5]diazocine-2,8-diyl)bis(N4,N4',N4'-tris(4-methoxyphenyl)-[1,1'-biphenyl]-4,4'-diamine) | Ag",
-    'SLG | FTO | Au-grid | TiO2-c | SnO2 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | F-60; bis-C60 | Ag',
-    'SLG | ITO | C60 | Perovskite | BTF2 | MoO3 | Ag',
-    'SLG | FTO | NiMgLiO | Perovskite | CeOx-np | Ag',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | TiO2-c | Ag',
-    'SLG | ITO | NDI-P | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | Graphene oxide | Perovskite | ZnO-np | Al',
-    'Unknown | Perovskite | Unknown',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | BCP | Al',
-    'SLG | FTO | Fe2O3 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | PCBM-60 | Perovskite | CzPF | Au',
-    'SLG | ITO | ZnO-np | Perovskite | Bifluo | Ag',
-    'SLG | ITO | TiO2-c | Perovskite | PCA-1 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CJ-01 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | HL-1 | Au',
-    'SLG | ITO | Graphene oxide | PTAA | Perovskite | PCBM-60 | BCP | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Ag',
-    'PEN | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-c | Perovskite | PTEG-1 | Ag',
-    'SLG | ITO | NiO-c | Perovskite | ZnO-np | BCP | Ag',
-    'SLG | ITO | PTAA | Perovskite | TTC | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Poly[4,8-bis(2-(4-(2-ethylhexyloxy)phenyl)-5-thienyl)benzo[1,2-b:4,5b’]dithiophene-alt-1,3-bis(4-octylthien-2-yl)-5-(2-ethylhexyl)thieno[3,4-c]pyrrole-4,6-dione | Ag',
-    'SLG | FTO | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PVBT-SO3 | Perovskite | C60/C70-N | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TT0 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon-nt | PMMA | Au',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | ZnO-np | Ag',
-    'SLG | ITO | SnO2-c | Perovskite | PMMA | Carbon',
-    'SLG | ITO | TFB | Al2O3-np | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | Ag-nw; PEDOT:PSS | Perovskite | PCBM-60; CTAB | Ag',
-    'SLG | ITO | SnO2-np | ImAcHcl | Perovskite | Spiro-MeOTAD | Au',
-    'PEN | ITO | Ti(OiPr)4 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | TiO2-np | Perovskite | BDTS-2DPP | Au',
-    'SLG | FTO | ZnO-c | Perovskite | Graphene oxide | Ag',
-    'SLG | ITO | PEDOT:PSS | Graphene oxide; PEG | Perovskite | PCBM-60 | MoS2 | Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | WT3 | Au',
-    'SLG | FTO | NiO-c | NiO-mp | Perovskite | Acetyl acetate; I2; LiI | Pt | FTO | SLG',
-    'SLG | ITO | PCBM-60; PDI-DA | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | SnO2-c | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-70 | C60 | AUH | Ag',
-    'SLG | ITO | MgZnO | Perovskite | Spiro-MeOTAD | MoOx | Al',
-    'PET | ITO | SnO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | Zn2SnO4 | Perovskite | PTAA | Au',
-    'SLG | FTO | F4-TCNQ | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | Spiro-MeOTAD | P3HT | FTO | SLG',
-    'SLG | ITO | TiO2-c | Na2SO4 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-nanosphere | TiO2-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TPB | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-70 | LiF | Al',
-    'SLG | FTO | AZO-np | Perovskite | PTB7 | MoO3 | Al',
-    'SLG | FTO | CeOx | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PTEG-1 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | MWCNTs',
-    'SLG | ITO | HTM-3 (bifluorenylidene-based) | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | PSS-Na | Perovskite | PCBM-60 | ZnO | Al',
-    'SLG | ITO | P3CT-K | Perovskite | PCBM-60 | ZnO-c | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | B2 | Au',
-    'SLG | FTO | TiO2-c | SiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Montmorillonite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | PCBM-60 | Perovskite | P3HT | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | D35 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | H-3,4 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | HAT-CN | BCP | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 3,6-Cbz-EDOT | Au',
-    'SLG | ITO | NiO-np | Perovskite | C60 | bis-C60 | Ag',
-    'SLG | FTO | TiO2-c | SiO2-IO | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-nw | Perovskite | Spiro-MeOTAD | Au',
-    "SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Poly[4,8-bis(2-(4-(2-ethylhexyloxy)3-fluorophenyl)-5-thienyl)benzo[1,2-b:4,5-b'] dithiophenealt-1,3-bis(4-octylthien-2-yl)-5-(2-ethylhexyl)thieno[3,4-c]pyrrole-4,6-dione | Ag",
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TPA-Pc | Au',
-    'SLG | FTO | TiO2-c | PCBM-60 | Perovskite | CzP | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-mp | Perovskite | NiO-mp | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PVAc | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Cr',
-    'SLG | ITO | CuOx | Perovskite | PCBM-60 | C60 | BCP | Ag',
-    'SLG | ITO | SnO2-np | PCBM-60 | Perovskite | Spiro-MeOTAD | MoO3 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | YN1 | Cu',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | ZnO | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ACE‐ANT‐ACE | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SnS | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuPc | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | cyclopenta[2,1-b; 3,4-b′]dithiophene | MoOx | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | TDPP-CN4 | BCP | Ag',
-    'SLG | ITO | NiO | Perovskite | C60; PCBM-60 | bis-C60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZrO2-mp | Perovskite | VOx | Carbon',
-    'Eu-complex LDL | SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    "SLG | ITO | TiO2-c | Perovskite | N2',N2',N7',N7'-tetrakis(4-methoxyphenyl)spiro[fluorene-9,9'-xanthene]-2',7'-diamine | Au",
-    'SLG | ITO | TiO2-c | Perovskite | HAB1 | Au',
-    'SLG | ITO | TiO2-mp | Perovskite | 4-(5-(5-(5-(5-(5-hexylthiophen-2-yl) thiophen-2-yl) thiophene-2-yl) thiazolo[5,4-d]thiazol-2-yl) thiophene2-yl)-N,N-diphenyl-benzenamine | Au',
-    'SLG | ITO | SnO2-np | Perovskite | PTAA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | IDT2 | Au',
-    'SLG | FTO | SnO2-c | Perovskite | RCP | Au',
-    'SLG | ITO | SnO2-np | PCBM-60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | C60 | PAA | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | TPASBP | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskire | PCBM-60 | CIL | Ag',
-    'SLG | FTO | Ag-np; PEDOT:PSS | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | NiO-np | Choline chloride | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | ZnO-c | AZO-mp | Perovskite | Carbon',
-    'SLG | FTO | TiO2-nw | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-np | Perovskite | EHCz-2EtCz | MoOx | Al',
-    'PET | ITO | SnO2-np | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | CA-Br | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | PEDOT:PSS | PEI | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-nw | SnO2-nw | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | NiO-c | PS | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | ZnO-c | Perovskite | PCBM-60 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Carbon | FTO',
-    'SLG | ITO | PTAA | PMMA | Perovskite | IDTT2FPDI | PCBM-60 | Bphen | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CdZnSe@ZnSe-QDs | Carbon',
-    'SLG | ITO | PEDOT:PSS | Perovskite | d-PCBM-60; PCBM-60 | Ca | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-70 | AZO-np | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | SbI3 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | ZnO-c | ZnO-nw | Au-np | Perovskite | Graphene',
-    "SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Poly[4,8-bis(2-(4-(2-ethylhexyloxy)3,5-fluorophenyl)-5-thienyl)benzo[1,2-b:4,5-b']dithiophenealt-1,3-bis(4-octylthien-2-yl)-5-(2-ethylhexyl)thieno[3,4-c]pyrrole-4,6-dione | Ag",
-    'SLG | FTO | SnO2-c | Perovsite | Spiro-MeOTAD | Ag',
-    'PET | Graphene; TETA | PTAA | PEDOT:PSS | Perovskite | ZnO-np | Graphene | PET',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Ba | Al',
-    'SLG | FTO | ZnO-c | ZnO-mp | PEI | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | M106 | Ag',
-    'NOA63 | MoO3 | Au | PEDOT:PSS | Perovskite | PCBM-60 | MoO3 | Au | Ag | MoO3 | Alq3',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PCBM-60 | PEI | Ag',
-    'SLG | ITO | NiO | Perovskite | PCBM-60 | PN6 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BTT-5 | Au',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | ZnO-np | AZO | Ni | Al | MgF2',
-    'SLG | FTO | TiO2-mp | Perovskite | Ethyl acetate; I2; LiI; TBP | Pt | FTO | SLG',
-    'SLG | ITO | PEDOT:PSS | Perovskite | Graphene | Al',
-    'SLG | ITO | rGO | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | ZnO-np | Ag-nw',
-    'SLG | FTO | TiO2-c | TiO2-nc | Perovskite | P3HT | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | F2 | BCP | Mg | Ag',
-    'SLG | ITO | SnO2-c | Perovskite | Z2 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Cs-oleate | Spiro-MeOTAD | Au',
-    'SLG | ITO | PolyTPD | Perovskite | C60 | BCP | Cu',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SubPc | Au',
-    'SLG | FTO | Zn2SnO4-c | Zn2SnO4-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TPAC3M | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TBC-2 | Au',
-    'SLG | ITO:ATO | TiO2-c | Perovskite | Perylene | Au',
-    'SLG | ITO | NiCo2O4 | Perovskite | PS | C60 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Ag | MoO3',
-    'SLG | FTO | TiO2-c | Perovskite | Al2O3-c | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | C60-ETA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | NiO@C | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Ag | Teflon',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | bis-C60 | Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | Ag-nw',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon black; Graphite',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PEL | PH 1000',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | C60 | BCP | Al',
-    'SLG | FTO | Cu0.8Cr0.2O2 | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuPcNO2-OMFPh | Au',
-    'SLG | ITO | MoOx | Perovskite | C60 | BCP | Al',
-    'SLG | FTO | SnO2-c | Perovskite | CuBuPc | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | YK2 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | CsI | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | CsPbI3-QDs | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | TiO2-nw | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | C60-SAM | Perovskite | PDCBT | WOx | Au',
-    'Flexible | IZO | PEIE | C60 | B4PyMPM | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | MEH-PPV; PFN | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | PEIE | PCBM-60 | Perovskite | P3HT | Au',
-    'SLG | ITO | NPB | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | NiMgLiO | Perovskite | 2-acetylpyridine | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | X59 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-mp | Perovskite | Carbon',
-    'SLG | ITO | PTAA | Perovskite | C60 | BCP | IZO',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BEDCE | Spiro-MeOTAD | Ag',
-    'SLG | ITO | NiPc | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | DPO | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | BMIM-OTF | Au',
-    'SLG | ITO | Perovskite | Carbon-nt | PFN-Br | Ag',
-    'SLG | ITO | CuO | Perovskite | PC(70)BM | AZO | Al',
-    'SLG | ITO | SnO2-c | Perovskite | PDMS | CuSCN | Au',
-    'SLG | ITO | NiO-np | Perovskite | NDI-BiSe | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | m-MTDATA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon | Carbon | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | C60-SAM | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskte | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | AgAu-mp',
-    'ITO | PEN | SnO2-c | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | rGO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BTPA-4 | Au',
-    'SLG | ITO | ZnO-c | Perovskite | P3HT | Ag',
-    'SLG | FTO | TiO2-c | TiO2-nanoflowers | Perovskite | PTAA | Au',
-    'SLG | FTO | TiO2-c | Perovskite | pPh-2MODPACz | Au',
-    'PEN | ITO | TiO2-np | C60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | PbTiO3 | Perovskite | Carbon-nt',
-    'SLG | ITO | PEDOT:PSS | Perovskite | bis‐C60 | Ag',
-    'SLG | ITO | NiO-c | Perovskite | LiF | C60 | SnO2-c | ZnSnO2-c | ITO | Ag',
-    'SLG | FTO | SnO2-np | Preovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-c | Perovskite | ICBA | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | AuAg@SiO2-np | Perovskite | TPCBM | PFN | Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | Polyethylimine | Ag',
-    'SLG | ITO | PTAA | Perovskite | ICTA | BCP | Cu',
-    'SLG | ITO | PTAA | PMMA | Perovskite | PEAI | PCBM-60 | Bphen | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | IC60BA | bis-C60 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | F16CuPc | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PIF8-TAA | Au',
-    'SLG | ITO | ZnO-np | SnO2-np | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | KR378 | Au',
-    'SLG | ITO | NiO-np | ME3 | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | ITO | PVK | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | TiO2-np | Perovskite | P3HT | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PBT1-C | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PTB1 | Au',
-    'SLG | ITO | TiO2-c | Perovskite | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | P1 | Ag',
-    'SLG | ITO | SnO2-c | Perovskite | Spiro-MeOTAD | Au | Ag',
-    'SLG | FTO | ZnO-c | ZnO-nw | TiO2-c | Perovskite | Spiro-MeOTAD | MoO3 | Al',
-    'SLG | ITO | Rubrene | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | PEDOT:PSS | PTMA-BP | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TT-3,6-TPA | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | Al',
-    'SLG | ITO | BTF3 | Perovskite | PCBM-60 | LiF | Ag',
-    'SLG | ITO | SnO2-c | C60 | Perovskite | PPyra-XA | MoO3 | Ag',
-    'SLG | ITO | PEI | PCBM-60 | Perovskite | PTAA | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PMDPT | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Ag-nw | ZnO-np',
-    'SLG | ITO | PEDOT:PSS | Perylene | Perovskite | PCBM-70 | C60 | BCP | Al',
-    'SLG | ITO | FPI-PEIE | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | B3 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CIGGSe-np | Au',
-    'SLG | ITO | MoO3 | TBDI | Perovskite | IPH | PDINO | Ag',
-    'SLG | ITO | PFN | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | Cu',
-    'SLG | FTO | TiO2-c | TiO2-mp | D205 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-c | Perovskite | X2 | Au',
-    'SLG | ITO | FPDI | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | ITO | PTAA | Perovskite | 2PDI-3S | PEIE | Ag',
-    'SLG | FTO | ZnO-c | ZnO-nanodisks | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PTAA; TPFB | Au',
-    'SLG | ITO | CdS-nw | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | FTO | SnO2-QDs | C60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | FTO | Al2O3-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-70 | PN4N | Al',
-    'PET | ITO | PEDOT:PSS | PTAA | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | AU',
-    'SLG | FTO | NiO-c | NiO-mp | Perovskite | PCBM-60 | BCP | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | X22 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Ag-nw | Spiro-MeOTAD | Au',
-    'SLG | FTO | C60 | Perovskite | CuPc | Au',
-    'SLG | ITO | L-H | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | MoOx | ITO',
-    'SLG | ITO | ITO | NiO-c | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PP-Spiro | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ZnChl-3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Graphene-QDs | Perovskite | Carbon',
-    'SLG | ITO | BDT-POZ | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | ZnO-c | PCBM-70 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | CuSCN | Ag',
-    'SLG | FTO | TiO2-c | PCBA | Perovskite | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Al2O3-np | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | SnO2-np | Perovskite | PDO1 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | FNCA | C60 | BCP | Ag',
-    'SLG | ITO | TiO2-c | C60 | Perovskite | TaTm | MoO3 | Au',
-    'SLG | ITO | ZnO-c | ZnO-nw | PCBM-60 | Perovskite | P3HT | Au',
-    'SLG | ITO | Spiro-MeOTAD | Perovskite | PCBM-60 | LiF | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | NiO-np | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-np | Perovskite | Spiro-MeOTAD | MoO3 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TTB1 | Au',
-    'SLG | FTO | TiO2-c | Perovskite | C201 | Ag',
-    'SLG | rGO | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | VB-MeO-FDPA | Perovskite | PCBM-60 | PEI | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Poly(ethylene oxide) | Carbon',
-    'SLG | FTO | TiO2-c | ITIC | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | PCBSD | Perovskite | HPB-OMeDPA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | NiO-np | CuSCN | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Graphene oxide | P3HT | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | mm-SFX-3PA | Au',
-    'SLG | FTO | SnO2-c | Al2O3-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | H11 | Au',
-    'SLG | ITO | 2EGO-PPV | Perovskite | PCBM-60 | BCP | cu',
-    'SLG  FTO | TiO2-c | TiO2-mp | Perovskite | BX-OMeTAD | Au',
-    'PETUG | C60 | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | ZnO-np | Ag',
-    'SLG | ITO | DNA-CTMA | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PT3HT | Ag',
-    'Flexible | IZO | PEIE | C60 | LiF | Perovskite | Spiro-MeOTAD | Au',
-    'PET | ITO | TPA-BP-OXD | Perovskite | PCBM-60 | ZnO-np | Ag',
-    'SLG | ITO | p-PFP-O | PTAA | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | PEDOT:PSS | Graphene oxide | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | X19 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BTT-OMe | Au | Ag',
-    'SLG | ITO | MFGO | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | WS2 | Perovskite | C60 | BCP | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TDAB | Au',
-    'SLG | FTO | TiO2-c | PCBM-60 | Perovskite | ACR-TPA | Au',
-    'SLG | ITO | P3CT-Na | Perovskite | IDT6CN-4F | C60 | BCP | Ag',
-    'SLG | ITO | NiO-c | Mg(AcO)2 | Perovskite | C60 | BCP | Cu',
-    'SLG | ITO | PbI2 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Ag',
-    'SLG | FTO | NiMgLiO | Perovskite | 3-acetylpyridine | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BAI | DM | Au',
-    'SLG | ITO | PEDOT:PSS | NaI | Perovskite | PCBM-60 | AZO | BCP | Ag',
-    'SLG | ITO | SnO2-np | Li-TFSI | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | PFN-P1 | Perovskite | PCBM-60 | PFN-P2 | Ag',
-    'SLG | ITO | PEDOT:PSS | Au-np; VOx | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | SrGeO3 | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | ITO | ZnO-c | 3-aminopropanioc acid-SAM | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | ITO | PCBM-70 | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | ITO | C60 | Perovskite | F22 | Au',
-    'SLG | FTO | NiO-c | Perovskite | ZnO-c | Ag',
-    'SLG | ITO | X-DVTPD | Perovskite | PCBM-60 | Bphen | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P1Z2 | Carbon',
-    'SLG | FTO | TiO2-c | SnO2-c | TiO2-mp | ZrO2-mp | Perovskite | Carbon',
-    'SLG | FTO | TiO2-c | Perovskite | COPV7 | Au',
-    'SLG | FTO | BaSnO3-mp | Perovskite | Spiro-MeOTAD | Carbon',
-    'SLG | FTO | TiO2-c | Perovskite | IEICO-4F | Spiro-MeOTAD | MoO3 | Au',
-    'SLG | FTO | ZnO-np | EA | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | DEME-BF4 | ITO',
-    'SLG | FTO | NiMgO-c | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | LiF | Al',
-    'SLG | ITO | SnO2-np | Perovskite | CH3-PEAI | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | PABA-SAM | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-np | Perovskite | MEAI | Spiro-MeOTAD | Au',
-    'SLG | FTO | NiO | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | NiO-c | N749 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | TiO2-c | PCBM-60 | Perovskite | Spiro-MeOTAD | WO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | MoS2; PEDOT:PSS | Perovskite | PCBM-60 | Ag',
-    'Quartz | TaN | TaS2 | Perovskite | CdS | ITO',
-    'SLG | ITO | MoO3 | PEDOT:PSS | Perovskite | C60 | BCP | LiF | Al',
-    'SLG | FTO | TiO2-c | CSOE | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | PEDOT:PSS | Perovskte | PCBM-60 | Cr2O3 | Ag',
-    'PEN | ITO | SnO2-np | Perovskite | P3HT; Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | AZO-np | ITO',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | MoO3 | Au',
-    'SLG | ITO | PolyTPD | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | Spiro-MeOTAD | MoO3 | AuAg | MoO3',
-    'SLG | FTO | TiO2-nw | Perovskite | CuSCN | Carbon',
-    'SLG | ITO | NiO-c | Perovskite | C60 | BCP | Ag',
-    'PET | Graphene; TETA | PTAA | PEDOT:PSS | Perovskite | ZnO-np | Graphene; TETA | PET | Ag',
-    'SLG | ITO | p-PFP-O | PTAA | Perovskite | PCBM-60 | PFN | Al',
-    'SLG | ITO | PEDOS:PSS | Perovskite | PCBM-60 | C60 | BCP | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Au@Ag-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CsSnBr3-QDs | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon | Perovskite | TiO2-mp | TiO2-c | FTO | SLG',
-    'Cellophane | TiO2-c | Ag | TiO2-c | CPTA | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-np | Perovskite | PTAA | NiO-c | Au | PEN',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | YKP06 | Ag',
-    'SLG | FTO | NiO-np | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | TiO2-c | Perovskite | Al2O3-c | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | PMMA | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | PS | Perovskite | PTAA | PEDOT:PSS | ITO | SLG',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-mp | Perovskite | Spiro-MeOTAD | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZrO2-mp | Perovskite | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-mp | Perovskite | Graphite ribbon',
-    'SLG | ITO | PTAA | Perovskite | PCBB-3N | PCBM-60 | Al',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | Ti | Au',
-    'SLG | ITO | PEDOT:PSS | Carbon-nt | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-nc | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | TPA-NADT-TPA | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | In2O3-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | Zn-ChL | H2-Chl | Ag',
-    'SLG | FTO | NiO-c | TiO2-c | Perovskite | Carbon',
-    'SLG | FTO | TiO2-c | PCBM-60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Ag@SnO2-nw | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | styryl-functionalized GO | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | C60; Phlm | Perovskite | TaTm | F6-TCNNQ; TaTm | Ag',
-    'SLG | FTO | TiO2-c | BZnTPP | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | ZTO-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 1-(N,N-di-p-methoxyphenylamine)pyrene | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | D149 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-c | Perovskite | N,N-bis-[7-(4,4′-dimethoxydiphenylamine)-9- (bis(methylsulfanyl)methylene)fluoren-2-yl]-4-methoxyaniline | Au',
-    'SLG | ITO | PEDOT:PSS | Au-nw; VOx | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | VOx | PEI | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | NiO-c | Al2O3-mp; Au@SnO2-nw | Perovskite | PCBM-60 | BCP | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Phosphoniumfluorene | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | YC06 | Ag',
-    'SLG | FTO | SnO2-c | C60 | Perovskite | Spiro-MeOTAD | Ag',
-    'A.R.C. | SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PTAA | Au | A.R.C.',
-    'SLG | ITO | ZnO-c | Perovskite | CzPAF‐SBF | Au',
-    'SLG | ITO | PCBM-60 | Perovskite | P3HT | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | S9 | Au',
-    'SLG | FTO | SnO2-c | Perovskite | Spiro-MeOTAD | Ag | ITO',
-    'SLG | ITO | TiO2-c | PCBM-60 | Perovskite | PCDTBTB | MoO3 | Au',
-    'SLG | ITO | VOx | Cu phtalocyanine | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | C60-SAM | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PCBC | Al',
-    'SLG | ITO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | PEDOT:PSS | ITO | SLG',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DMFA-FA | AU',
-    'SLG | ITO | NiO-mp | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | SnO2-nanosheets | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-c | SnO2-c | Perovskite | Au',
-    'SLG | ITO | SnO2-np | Perovskite | BTTI-C8 | Au',
-    'SLG | FTO | TiO2-np | Perovskite | Spiro-MeOTAD | Graphite',
-    'SLG | SU-8 | MoO3 | Au | PEDOT:PSS | Perovskite | PCBM-60 | Ca | Ag',
-    'SLG | FTO | ZnO-c | MgO | TiO2-mp | Perovskite | TPB(2-MeOTAD) | Au',
-    'SLG | FTO | TiO2-nanoplatelets | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60; Graphene | BCP | Ag',
-    'SLG | FTO | In2S3 | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SFXDAnCBZ | Au',
-    'SLG | ITO | PPN | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | SnO2-np | C60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | ICBA | BCP | Ag',
-    'SLG | ITO | NiO-np | Perovskite | IT-4f | BCP | Ag',
-    'SLG | ITO | NiO-np | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-70 | AZO | Al',
-    'PET | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | MoOx | Ag',
-    'SLG | ITO | Z7@MWCNTs | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | X25 | Au',
-    'SLG | ITO | ZnO-c | Hexamethylenetetramine | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | DMZ | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TBC-3 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon; NiO-np',
-    'SLG | ITO | Fullerene-SAM | Perovskite | CuSCN | Carbon',
-    "SLG | ITO | TiO2-c | Perovskite | N2,N2,N3',N3',N6',N6',N7,N7-octakis(4-methoxyphenyl)spiro[fluorene-9,9'-xanthene]-2,3',6',7-tetraamine | Au",
-    'SLG | ITO | TiO2-c | Perovskite | PTAA | Au',
-    'SLG | ITO | PEDOT:MNSF | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | P3CT-Na | Perovskite | TPE-PDI4 | C60 | BCP | Ag',
-    'PET | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Rhodamine 101 | C60 | Rhodamine 101 | LiF | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P2 | Ag',
-    'SLG | FTO | PEDOT:PSS | Perovskite | C60 | BCP | Ag | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | MUTAB | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | B2F | C60 | Al',
-    'PET | ITO | SnO2-c | Al2O3-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | MoO3 | TaTm | Perovskite | C60 | BCP | Ag',
-    'ITO | PTAA | Perovskite | PCBM-60 | Ti | Au',
-    'PET | ITO | PEDOT:PSS | 3-aminopropanoic acid-SAM | Perovskite | PCBM-60 | ZnO-np | Ag',
-    'PEN | ITO | TiO2-c | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BTP-1 | Au',
-    'SLG | ITO | NiO-np | Br-BPA-SAM | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | YK1 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Carbon',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | AZO | Ag',
-    'SLG | ITO | P3CT-Na | Perovskite | B2F | C60 | BCP | Ag',
-    'SLG | FTO | ZnO-c | Ethyl acetate | Perovskite | Spiro-MeOTAD | MoOx | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 4,4′-(9-Methyl-9H-naphtho[2,1-c]carbazole-2,12-diyl)bis(N,N-bis(4-methoxyphenyl)aniline) | Ag',
-    'SLG | FTO | SnO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | P3CT-Na | Perovskite | ITCP-M | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | CuSeCN | Au',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | Ca(acac)2 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | AZO-np | Ag-nw',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PANI | FTO | SLG',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZrO2-mp | Perovskite | Carbon | Spiro-MeOTAD',
-    'SLG | PEI | Au | PEDOT:PSS | Perovskite | PCBM-60 | ZnO-np | Ag',
-    'SLG | ITO | PEDOT:PSS | PEI | Perovskite | PCBM-60 | BCP | Ag',
-    'PET | ITO | PEDOT:PSS | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | AZO-np | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | PTDPQ | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | HOOC-Ph-SH | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 3,6-cbz-EDOT | Au',
-    'SLG | FTO | Nb2O5-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P1 | Ag',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | Zr(acac)4 | Au',
-    'SLG | PEDOT:PSS | Perovskite | PCBM-60 | Rhodamine 101 | Ag',
-    'SLG | ITO | CuInS2 | Al2O3-np | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | ZnO-c | WPF‐6‐oxy‐F | Perovskite | pTPA-DBTP | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | AIGS-QDs | Carbon',
-    'SLG | ITO | TiO2-c | IPH | Perovskite | TaTm | F6-TCNNQ; TaTm | Au',
-    'MgF2 | SLG | FTO | TiO2-c | Perovskite | Perovskite-QD | PTAA | Au',
-    'SLG | FTO | TiO2-nanobundles | Perovskite | CF-BTz-ThR | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | MoOx | Au | Cu | MoOx',
-    'SLG | ITO | NiO-c | Perovskite | ITIC | BCP | Ag',
-    'SLG | FTO | NiO-mp | Perovskite | PCBM-60 | BCP | Al',
-    'Stainless steel | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Carbon-nt',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | IZTO',
-    'SLG | ITO | SnO2-np | Perovskite | Co3O4 | Carbon',
-    'SLG | FTO | Al:ITO-c | SnO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | ZnO-nw | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | ZnO-np | AZO',
-    'SLG | ITO | PEDOT:PSS | V2O5 | Perovskite | PCBM-60 | Bphen | Ag',
-    'SLG | ITO | Spiro-MeOTAD | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Z34 | Au',
-    'PET | PEDOT:PSS | PEI | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | bis‐C60 | Ag',
-    'SLG | ITO | JW7 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Q219 | Carbon',
-    'PS | ZnO | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | a-DMEC70 | Al',
-    'SLG | ITO | ZnO-c | Perovskite | PTAA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon | KAc',
-    'PET | Graphene; TETA | PTAA | PEDOT:PSS | Perovskite | ZnO-np | Graphene; TETA | PET',
-    'MgF2 | SLG | FTO | TiO2-c | TiO2-mp | PCBM-60; PMMA | Perovskite | Spiro-MeOTAD | ITO | Au-grid | MgF2',
-    'SLG | ITO | H1 | Perovskite | PCBM-60 | LiF | Al',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | PEI | Ag',
-    'SLG | ITO | PEDOT:PSS | Au-nanobipyramide; VOxs | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | NiMgLiO | 5-AVA | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-a | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60 | BCP | Al',
-    'SLG | ITO | C60 | Perovskite | FBA1 | MoO3 | Ag',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | FTO | Zn:SnO2 | Perovskite | CuPc | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | HOOC-C11H22-SH | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | pi-PFE4 | Ag',
-    'SLG | ITO | PTAA | Perovskite | IT-M | Zn(acac)2 | Ag',
-    'PET | Graphene | TiO2-c | PCBM-60 | Perovskite | Spiro-MeOTAD | Carbon-nt',
-    'SLG | ITO | PEDOT:PSS | PBDB‐T; ITIC | Perovskite | C60 | BCP | Ag',
-    "SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 3,3'-(2,7-bis(bis(4-methoxyphenyl)amino)-9H-fluorene-9,9-diyl)bis(N-ethyl-N,N- dimethylpropan-1-aminium) bis(trifluoromethanesulfonyl)imide | Au",
-    'SLG | ITO | P3CT-Na | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Al | Ag',
-    'SLG | FTO | PEDOT:PSS | CuSCN | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | PEDOT:PSS | Perovskite | ZnO-c | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Z28 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZrO2-mp | Perovskite | AV-Carbon; MAI',
-    'SLG | ITO | C60 | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | ITO | Graphene oxide | Perovskite | PCBM-60 | ZnO-np | Al',
-    'PEN | ITO | TiO2-np | C70 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | p-DTS(FBTTh2)2 | MoOx | Ag',
-    'SLG | ITO | ZnO-c | Perovskite | Graphite | FTO',
-    'SLG | FTO | TiO2-c | C60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60; PTP-DFBT | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Mg | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CsAc | Carbon',
-    'SLG | ITO | PTAA | PFN-P2 | Perovskite | LiF | C60 | BCP | Cu',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | B[BMPDP]2 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60 | Al',
-    'SLG | ITO | DFTAB | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-mp | Perovskite | P3HT | Pt',
-    'SLG | FTO | Nb2O5 | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-nw | Perovskite | Carbon',
-    'SLG | FTO | SnO2-c | Perovskite | asy-PBTBDT | Au',
-    'SLG | ITO | PTAA | Perovskite | C60 | SnO2 | IZO',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbazole-based HTM | Au',
-    'SLG | ITO | AZO-np | PCBM-60 | Perovskite | Spiro-MeOTAD | MoO3 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | cyclopenta[2,1-b; 3,4-b′]dithiophene | MoOx | SLG | ITO',
-    'SLG | FTO | TiO2-c | Perovskite | CuI | Au',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Perovskite | Al2O3-mp | Me2N-DATPA | Ag',
-    'SLG | ITO | PEDOT:PSS | VOx | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | SnO2-np | C60 | Perovskite | Spiro-MeOTAD | VOx | Au',
-    'SLG | ITO | PFN; ZnO | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | PCBM-60-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'PET | PEDOT:PSS | ZnO-c | Perovskite | Spiro-MeOTAD | PEDOT:PSS',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DPP-Ome | Au',
-    'Foil | AZO | PEIE | C60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | ZnO-c | Perovskite | PTB7-Th | MoOx | Ag',
-    'SiO2-mp | SLG | ITO | TiO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | MoOx | Au | Ag | MoOx',
-    'SLG | ITO | TiO2-c | Perovskite | CsOAc | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | CMO | Au',
-    'SLG | FTO | SnO2-np | Perovskite | PTAA | Spiro-MeOTAD | Au',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60 | PPDIN6 | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | PTT | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-np | 2,2’-BiPy | Perovskite | PCBM-60 | Zr(acac)4 | Ag',
-    'SLG | FTO | ZnO-c | ZnO-nw | SnO2-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DNA | Au',
-    'SLG | FTO | SnO2-c | PCBM-60 | Perovskite | PTAA | Au',
-    'SLG | ITO | PTAA | Perovskite | PDIN | Ag',
-    'SLG | ITO | C60 | Perovskite | TaTm | F6-TCNNQ; TaTm | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TTPA-BDT | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Bphen | Al',
-    'PEN | ITO | NiO-c | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | SnO2-c | Perovskite | Spiro p-xylene | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuP | Au',
-    'SLG | FTO | NiO-c | Perovskite | TiO2 | Ag',
-    'SLG | ITO | TiO2-c | PCBM-60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | Ag-nw | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Ag',
-    'PET | AZO | Ag | AZO | PEDOT:PSS | PolyTPD | Perovskite | PCBM-60 | Au',
-    'SLG | ITO | SnO2-np | Perovskite | Au',
-    'PEN | ITO | ZnO | PEIE | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-np | Perovskite | C60 | bis-C60 | ITO | Ni | Al',
-    'SLG | ITO | SnO2-nw | Perovskite | PTAA | Au',
-    'SLG | ITO | PEDOT:PSS | Porphyrin | Perovskite | PCBM-60 | C60 | BCP | Al',
-    'SLG | ITO | SnO2-np | TPPO | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | V1036:C4 | Perovskite | C60 | BCP | Cu',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Black phosphorous nanosheets | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | NDI-ID(RS) | Al',
-    'SLG | ITO | SnO2-np | PbF2 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | AZO | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 2,7-Ben | Au',
-    'SLG | FTO | C60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SFX-TPAM | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | PEI | PCBM-60 | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | ITO | DBFMT | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | PTAA | Perovskite | PTCDA | PO-T2T | Cu',
-    'SLG | FTO | SnO2-np | Perovskite | Spiro-MeOTAD | Graphite',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TAZ-[MeOTPATh]2 | Au',
-    'SLG | FTO | ZnO-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CZTSSe; rGO | Au',
-    'PET | ITO | SnO2-np | KCl | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | SnO2-np | PEG; SnO2-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | NiO-np | Perovskite | C60; PCBM-60 | Ag',
-    'SLG | ITO | FrGO | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TPE-TPA-8A | MoO3 | Ag',
-    'SLG | ITO | (RuCp*mes)2 | C60 | Perovskite | TaTm | F6-TCNNQ; TaTm | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-70 | C60 | BCP | Al',
-    'SLG | FTO | TiO2-c | Perovskite | HTM | Au',
-    'SLG | ITO | PEDOT | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | MAI | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | MoO3 | NPB | Perovskite | C60 | BCP | Al',
-    'SLG | ITO | PEDOT:PSS | VOx | Perovskire | PCBM-60 | Al',
-    'SLG | ITO | TFM | Perovskite | Carbon | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Al2O3 | Sym-HTPCH | Au',
-    'SLG | ITO | ZnO-c | Perovskite | CzPAF‐SBFN | Au',
-    'SLG | FTO | SnO2-c | Cs2SnO4 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | Polyacrylonitrile | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | Ni | NiMgO | PVP | Perovskite | PCBM-60 | ZnMgO | Al',
-    'SLG | ITO | CuSCN | Perovskite | PCBM-60 | PDINO | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C70 | TmPyPB | Ag',
-    'SLG | ITO | P3CT | Perovskite | CPTA-E | Al',
-    'SLG | ITO | PolyTPD | Perovskite | PCBM-60 | C60 | BCP | Au',
-    'SLG | FTO | ZnO-np | Mg-EA | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | FT-OMeTPA | Perovskite | PCBM-60 | BCP | Ag',
-    "SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 2,2'-[(4,5-Bis(2-ethylhexyl)-dithieno[2,3-d:2',3'-d']thieno[3,2-b:4,5-b']dipyrrole-2,7-diyl)-bis(3-hexylthien-5,5'-diyl)bis(methane-1-yl-1-ylidine)]dimalononitrile | Au",
-    'SLG | FTO | NiO-c | Perovskite | ZnO-np | C60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 2TPA-1-DP | Au',
-    'SLG | ITO | SnO2-np | Perovskite | Spiro-MeOTAD | MnO3 | Ag',
-    'SLG | ITO | SnO2-np; ZnO-np | Al2O3-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | P3CT-K | CuZnS | Perovskite | PCBM-60 | ZnO | Al',
-    'SLG | FTO | TiO2-c | Zn2Ti3O8-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | FT55 | Au',
-    'SLG | FTO | Zn2SnO4 | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PNVT-8 | ZnO | Al',
-    'PET | ITO | PEDOT:PSS | Perovskite | PCBM-60 | ZnO | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-029 | Ag',
-    'SLG | ITO | ZnO-nw | PEDOT:PSS | Perovskite | PCBM-60 | Bphen | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | Py-C | Au',
-    'SLG | TCO | TiO2-c | SrTiO3:TiO2-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | Bphen | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | pBTTz | Ag',
-    'SLG | FTO | TiO2-mp | Perovskite | CuSCN | Carbon | FTO',
-    'SLG | ITO | NiO-c | PCDTBT | Perovskite | PCBM-60 | BCP | Al',
-    'SLG | FTO | Nb2O5-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | C60-SAM | Al2O3-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | pi-PFE1 | Ag',
-    'SLG | FTO | NiO-c | Perovskite | CSCNT@Al2O3-c | CSCNT',
-    'Willow glass | AZO | SnO2-np | Perovskite | Spiro-MeOTAD | MoOx | Al',
-    'MgF2 | PET | ITO | 1‐benzyl‐3‐methylimidazolium chloride | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | ZnSO | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'PET | ITO | LiCoO2 | Perovskite | C60 | BCP | Ca | Al',
-    'SLG | FTO | SnO2-c | C60-SAM | Perovskite | PMMA | Spiro-MeOTAD | Au',
-    'SLG | FTO | CuI | Perovskite | PCBM-60 | PEI | Ag',
-    'SLG | FTO | NiO-c | Perovskite | NMPFP | Ag',
-    'SLG | ITO | C60 | Perovskite | F23 | Au',
-    'SLG | ITO | 2PACz | MeO-2PACz | Perovskite | C60 | BCP | Cu',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | HMDI | Au',
-    'SLG | FTO | SnO2-c | Perovskite | ME6Bu-ZnPc | Ag',
-    'SLG | FTO | TiO2-nw | TiO2-nw | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | TPCBM | PFN | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | PT3HT | Ag',
-    'SLG | ITO | PEI | SnO2-np | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | PTAA | CuGaO2-mp | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 2TPA-3-DP | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ZnPc | Carbon',
-    'SLG | ITO | C60 | Perovskite | SWCNTs | PTAA',
-    'SLG | FTO | TiO2-c | Perovskite | TAE1 | Au',
-    'PET | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | C8-BTBT | Perovskite | PCBM-60 | BCP I Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | C60 | BCP | Cu',
-    'SLG | ITO | Graphene oxide | PEDOT:PSS | Perovskite | PCBM-60 | LiF | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | NiS | Cr | Pt | FTO | SLG',
-    'MgF2 | SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P3HT | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | Carbon | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | C60-SAM | Perovskite | PCPDTBT | Ag',
-    'SLG | FTO | PEDOT | Perovskite | PCBM-60 | Au',
-    'SLG | ITO | NiCo2O4 | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | PEDOT:PSS | PTB7 | Perovskite | PCBM-70 | C70 | BCP | Ag',
-    'SLG | FTO | TiO2-np | CsBr | Perovskite | Carbon',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PCBM-60 | TiO2 | BCP | Ag',
-    'SLG | FTO | TiO2-c | CdS | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | RCP-BTT | Au',
-    'SLG | ITO | PCT | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SWCNTs | PMMA | Au',
-    'PEN | ITO | NiO-np | Perovskite | PCBM-60 | TiO2-c | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | NbS2',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | PEDOT:PSS | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P3HT; SWCNTs-PhOMe | Au',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | Cr | Au',
-    'SLG | ITO | SnO2-c; SWCNTs | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CAS | Au',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | BCP | AZO-c | Ag',
-    'SLG | FTO | TiO2-a | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | P3CT-Na | Perovskite | PDI-V | C60 | BCP | Ag',
-    'SLG | ITO | MoS2 | Perovskite | PCBM-60 | PFN | Al',
-    'SLG | FTO | ZTO | TiO2-mp | ZrO2-mp | Perovskite | Carbon',
-    'SLG | FTO | C60 | Perovskite | Thiophene | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Graphene oxide | Au',
-    'SLG | ITO | TiO2-c | C60 | Perovskite | PDTSTTz | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TTPA-OMeTPA | Au',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PCPDT-PDI | Al',
-    'SLG | FTO | Graphene | Al2O3-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | PCBSD | Perovskite | HFB-OMeDPA | Au',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | PFN | Cu',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | P4V4 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ZnPor | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-mF | Au',
-    'SLG | FTO | Cu3PS4-np | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Fe3O4-np | Au',
-    'SLG | ITO | PTPD | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 1‐adamantylamine | Spiro-MeOTAD | Au',
-    'SLG | FTO | ZnSO4-c | ZnSO4-mp | Perovskite | Spiro-MeOTAD | Au',
-    'PET | ITO | CuPc | PEI | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | PEIE | PCBM-60 | Perovskite | Spiro-MeOTAD | MoOx | IO | ITO | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TDT-OMeTAD | Au',
-    'PET | ITO | SnO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Triazine-Th-OMeTPA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | SnO2-c | Perovskite | CS05 | Au',
-    'PI | PEDOT:PSS | PEDOT:PSS | Perovskite | PCBM-60 | PEI | Ag',
-    'SLG | FTO | ZnO-np | Sinapoyl malate | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | ZnO-np | Perovskite | P3OEGT | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Si-QDs | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | Au | FTO',
-    'SLG | FTO | TiO2-nw | Sb2O3-np; SnO2-np | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PTAA | Perovskite | C60 | SnO2-c | ZTO | IZO',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | EFGnPs-H | Al',
-    'SLG | ITO | Graphene | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | YT3 | Au',
-    'SLG | FTO | TiO2-c | TiO2-nanobeads | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | AZO | Perovskite | P3HT | Au',
-    'SLG | FTO | ZnO-c | ZnO-nw | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Graphene-QDs | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-np | PCBM-60 | Perovskite | PTAA | MoO3 | Ag',
-    'SLG | ITO | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-mp | Pbs-QDs | Perovskite | P3HT | Pt',
-    'SLG | FTO | BaCoF4 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60; F8BT | C60 | Al',
-    'SLG | ITO | SnO2-np | Perovskite | CI-GO | PTAA | Au',
-    'SLG | FTO | SnO2-c | PCBM-60 | Perovskite | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZrO2-mp | Perovskite | Carbon-mp',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Rodhamine 101 | C60 | Rodhamine 101 | LiF | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | WY-1 | Ag',
-    'SLG | ITO | CuPc | PEI | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | PCP‐Na | Perovskite | C60 | BCP | Al',
-    'SLG | FTO | TiO2-c | Perovskite | TPE-4DPA | Ag',
-    'SLG | ITO | GeO2 | Perovskite | PCBM-60 | Bphen | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Al2O3 | CuPc(tBu)4 | Au',
-    'SLG | FTO | Graphene oxide | Perovskite | Graphene oxide | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | NDIF2 | C60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | HS-Ph-SCH3 | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | SP-12 | Au',
-    'SLG | FTO | Nb2O5 | Perovskite | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | X1 | Au',
-    'SLG | FTO | TiO2-c | SnO2-c | Perovskite | PTAA | Au',
-    'SLG | FTO | C60 | Perovskite | FU7 | Au',
-    'SLG | ITO | PTAA | Perovskite | Ti | Au',
-    'SLG | FTO | SnO2 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | NiO | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | Carbon',
-    'SLG | ITO | TiO2-c | PCBM-60 | Perovskite | Spiro TAD | MoO3 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | SiO2-mp | Perovskite | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | MoO3 | Au',
-    'SLG | FTO | SnO2-c | PCBM-60 | Perovskite | IDTT-TPA | Au',
-    'SLG | FTO | Nb2O5 | (EMIM)PF6 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | P3CT-Na | Perovskite | PDI-T | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Au-np | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Na3C6H5O7 | Perovskite | PCBM-60 | Bphen | Ag',
-    'SLG | FTO | ZnO-np | Perovskite | Carbon',
-    'Carbon-nt-fiber | TiO2-c | TiO2-mp | Perovskite | P3HT; SWCNTs | Ag-nw',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 2,7-Pyr | Au',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Perovskite | CBP | Au',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | BCP | TiO2-c | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | NP-SC6-TiOPc | Au',
-    'SLG | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | Au | MoO3',
-    'SLG | FTO | TiO2-c | Perovskite | Ph-inv-OMeTPA | Au',
-    'SLG | ITO | TiO2-c | C60 | Perovskite | Spiro-MeOTAD | WO3 | Ag',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60 | Zr(acac)4 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TPA-CN | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | J61-ITIC | Carbon',
-    'SLG | ITO | P3CT-N | Perovskite | IT-4F | s-Bphen | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Poly(TA) | Perovskite | Poly(TA) | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | EH44 | Au',
-    'SLG | ITO | CuI | Perovskite | PCBM-60 | AZO-np | Ag',
-    'SLG | FTO | TiO2-c | SnO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | Graphene | Graphene-QDs | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | SnO2-mp | Perovskite | P3 | Au',
-    'SLG | ITO | TiO2-c | TiO2-mp | Perovskite | Au-np | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CW5 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PDPT | Ag',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | F-R-COOK | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | P3HT; SWCNTs | Spiro-MeOTAD | Au',
-    'Si | MgO | SrRuO3 | SrRuO3 | Perovskite | ITO',
-    'SLG | ITO | SnO2-np | ZnO-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-c | Perovskite | PTAA | Ag',
-    'PET | PEDOT:PSS | PEDOT:PSS | Perovskite | PCBM-60 | TiO2 | Al',
-    'PET | ITO | ZnO-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | Ca | C60 | Perovskite | TPTPA | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | Ag@TiO2-nw | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Titanylphthalocyanine | Au',
-    'SLG | FTO | SnO2-np | Graphene-QDs | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | bis-PCBM; DMC | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | FTO | SnO2-np | Perovskite | PTAA | Au',
-    'SLG | FTO | TiO2-c | Perovskite | TPE-NMe | Ag',
-    'PEN | ITO | Au-np | NiO-c | Perovskite | PCBM-60 | PEI | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PFO | Au',
-    'SLG | PEDOT:PSS | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | CuInS2 | Al2O3-np | Perovskite | Ag',
-    'SLG | ITO | CPE-K | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Al2O3 | CuSCN | Au',
-    'SLG | FTO | SnO2-c | Perovskite | CuEtPc | Au',
-    'Ti-wire | TiO2-c | TiO2-np | Perovskite | Spiro-MeOTAD | Au | Au-wire',
-    'SLG | ITO | SnO2-np | Perovskite | NiO-np | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Me-BPZTPA | Au',
-    'SLG | ITO | SnO2-np | Perovskite | PMAA; Spiro-MeOTAD | Spiro-MeOTAD | Au',
-    'SLG | ITO | C60-SAM | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Graphene; TSHBC | Au',
-    'PET | ITO | Nb2O5; TiO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'PET | ITO | SnO2-c | C60-SAM | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-nanocones | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | PTAA | Perovskite | PCBM-60 | C60 | BCP | Al',
-    'SLG | FTO | NiO-np | Perovskite | PCBM-60 | Zr(acac)4 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Ni',
-    'SLG | FTO | PolyTPD | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | NiO | Au',
-    'SLG | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | MEH-PPV | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | V2O5 | Au',
-    'SLG | ITO | SnO2-np | Perovskite | TFB | P3HT | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | O5H-OMeDPA | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Ag | ITO | Ag',
-    'SLG | FTO | TiO2-c | Graphene | Perovskite | Spiro-MeOTAD | Au',
-    'PEN | ITO | NiO-np | Perovskite | PCBM-60 | Al',
-    'PET | FTO | NiO-c | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | TiO2-np | C60 | Perovskite | Spiro-MeOTAD | Ag',
-    'PEN | ITO | PTAA | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | PolyTPD | Perovskite | IPH | PFNBr | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | T101 | Au',
-    'SLG | ITO | NiO-c | NiO-c | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | IZO',
-    'SLG | ITO | PTAA | LiF | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | ZnO-np | Perovskite | Spiro-MeOTAD | MoOx | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Pervskite | P3TAA-co-P3HT | Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | BCP | cu',
-    'SLG | ITO | PEDOT:PSS | PFN | Perovskite | PCBM-60 | Zr(acac)4 | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PDINO | Al',
-    'SLG | ITO | SnO2-c | Perovskite | TATSFHBP | Ag',
-    'SLG | ITO | H4 | Perovskite | PCBM-60 | BCP | Au',
-    'SLG | ITO | C60; C70 | Perovskite | Spiro-MeOTAD | Au',
-    'PET | ITO | VB-DAAF | Perovskite | C60 | BCP | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Al2O3-np | CuBuPc | Au',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | PDINO | Ag',
-    'SLG | ITO | ZnO-nanospheres | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | sGO | Perovskite | PCBM-60 | BCP | Ag',
-    'PEN | ITO | CdSe | PCBM-60 | Perovskite | CuPc | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | MgO | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | SnO2-c | C60 | Perovskite | PTAA | Au',
-    'SLG | ITO | P3CT-N | Perovskite | IT-4H | s-Bphen | Ag',
-    'SLG | ITO | N1,N3,N5-tris(4-n-butylphenyl)-N1,N3,N5-triphenylbenzene-1,3,5-triamine | Perovskite | PCBM-60 | LiF | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BEDN | Au',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | Zn(acac)2 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | Graphene',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Ag-nanocubes | BCP | Ag | MoO3',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon',
-    'SLG | FTO | SnO2-n | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DHPT-SC | Au',
-    'SLG | FTO | TiO2-c | PCBM-60 | Perovskite | P3HT | WO3 | Ag',
-    'SLG | ITO | ZnO-c; Graphene-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BChl-2 | Ag',
-    'SLG | ITO | TiO2-c | Perovskite | PTB7 | Au',
-    'SLG | ITO | Ag-np; NiO-c | Perovskite | PCBM-60 | AgAl',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PAH 2 | Au',
-    'SLG | FTO | SnO2-c | C60-SAM | Perovskite | Spiro-MeOTAD | MoOx | ITO',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | PFN | Ag',
-    'SLG | ITO | Graphene oxide | PEDOT:PSS | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 3,3′,5,5′-tetrasubstituted 1,1′-biphenyl | Au',
-    'PEN | ITO | TiO2-c | PCBM-60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | SnO2 | Perovskite | V1160 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PFN | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PTAA-1F | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CJ-02 | Au',
-    'PET | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PEI | PEDOT:PSS',
-    'SLG | ITO | SnO2-np | C60 | Perovskite | Spiro-MeOTAD | MoO3 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | F101 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | LiSPS | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Graphene | Perovskite | Spiro-MeOTAD | Au',
-    'FTO | TiO2-c | Perovskite | Carbon',
-    'SLG | FTO | NiO-c | MoOx | Perovskite | ZrO2-c | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon; NiS',
-    'SLG | ITO | Z7 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | In2O3 | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | DS2 | Ag',
-    'SLG | FTO | ZnO-c | Perovskite | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | IEICO; PBDB-T | MoOx | Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBM-70 | ZnO-np | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | BCP I Ag',
-    'SLG | FTO | TiO2-c | Perovskite | PCE-10 | MoO3 | Ag',
-    'SLG | FTO | PTPD | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | GO-nanoribbons | Perovskite | ZnO-np | Al',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | AZO-np | SnO2-c | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TTBCPE | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZIF-8-20 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TT1 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | MoO3 | CuPc | Au',
-    'SLG | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | MoO3 | ITO | MgF2',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Mg | Ag',
-    'SLG | ITO | CdS | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | MnS | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | MgO | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | SWCNTs-HNO3 | PEDOT:PSS | Perovskite | C60 | BCP | LiF | Al',
-    'SLG | ITO | SWCNTs | PEDOT:PSS | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | TiO2-c | Al2O3-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60 | C60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TPBC | Au',
-    'PEN | ITO | NiO-np | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | NiO-c | Perovskite | Nb2O5 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | F-C60 | Ag',
-    'SLG | FTO | SnO2 | Perovskite | Spiro-MeOTAD | MoOx | IAI',
-    'SLG | ITO | SnO2-c | Perovskite | CZTPA-1 | MoO3 | Au',
-    'SLG | ITO | NiO-c | PTAA | Perovskite | C60 | SnO2 | BCP | Cu',
-    'Quartz | Graphene | C60 | Perovskite | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | HS-Ph-NO2 | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | PEI-HI | Perovskite | PCBM-60 | LiF | Ag',
-    'SLG | FTO | Perovskite | Carbon',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | SnO2-c | ITO | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | SnO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuSCN | rGO | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P5 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 1,2-Bis[3,6-(4,4`-dimethoxydiphenylamino)-9H-carbazol-9-methyl]benzene | Au',
-    'SLG | ITO | BTF1 | Perovskite | PCBM-60 | LiF | Ag',
-    'SLG | FTO | TiO2-c | C60-ETA | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-70 | Bphen | Ag',
-    'SLG | ITO | TiO2-c | Perovskite | P3HT | MoO3 | Ag',
-    'SLG | MPTMS-SMA | Ag | MUTAB-SAM | PCBM-60 | Perovskite | PTAA | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon | Ag',
-    'SLG | ITO | SnO2-c | Perovskte | Spiro-MeOTAD | Ag',
-    'PET | ITO | TiS2 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P3HT | MoO3 | Au',
-    'SLG | ITO | ZnO-np | Perovskite | PTAA | PEDOT:PSS | Au',
-    'SLG | ITO | SnO2-np; ZnO-np | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | Graphene oxide | Perovskite | PCBM-60 | Carbon-tape',
-    'SLG | ITO | TiO2-c | C60 | Perovskite | TOPO | TaTm | MoO3 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | H65 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | HTM | Ag',
-    'SLG | FTO | AgAu-np | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NBNDD | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | SnO2-c | Graphene | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | SnO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'Willow glass | AZO | SnO2-np | Perovskite | Spiro-MeOTAD | MoO3 | Al',
-    'SLG | FTO | PEDOT:PSS | Perovskite | 4-HI-PVK | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | PTAA | Spiro-MeOTAD | Au',
-    'SLG | ITO | C60 | Perovskite | SWCNTs',
-    'SLG | ITO | PTAA | PFN-P2 | Perovskite | C60 | BCP | Cu',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | PEIE | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Li4Ti5O12 | Spiro-MeOTAD | Au',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | Bphen | Al',
-    'SLG | FTO | TiO2-c | rGO; TiO2-nanofibers | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Aminocaproic acid; Caproic acid | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | Au | Ag-nw',
-    'SLG | ITO | P3CT-Na | Perovskite | TPE-DPP6 | C60 | BCP | Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | PFN | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | BCP; TZ-2 | Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | PEIE | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TPA-BPFN-TPA | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Azu-Bu | Au',
-    'SLG | Ag | MoOx | PEDOT:PSS | Perovskite | PCBM-60 | C60 | BCP | ITO',
-    'SLD | ITO | PEDOT:PSS | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PbS-QDs | Au',
-    'SLG | FTO | TiO2-c | TiO2-nt | Perovskite | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon | FTO',
-    'SLG | ITO | PEDOT:PSS | Perovskite | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | M3 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Triazine-Flu | Au',
-    'SLG | FTO | NiO-c | NiO-mp | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | A102 | Au',
-    'SLG | FTO | NiO | Perovskite | PTEG-1 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ZnBChl | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | F8BT | C60 | Al',
-    'SLG | ITO | TPAC-SAM | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | CuSCN | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | Alkoxy-PTEG | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PTAA | TPFB | Au',
-    'SLG | FTO | SrTiO3 | Graphene; Al2O3-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | V886 | Au',
-    'PET | ITO | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | Perovskite | TPFPB | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TPA-BP-TPA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | OMeTPA-FA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | MoOx | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | EH44 | MoO3 | Al',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60; PDI-DA | Ag',
-    'SLG | ITO | ZnO-c | Perovskite | EDT; PbS | Au',
-    'SLG | ITO | Perovskite | Spiro-MeOTAD | Au | Ag',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | Rhodamine 101 | Ag',
-    'SLG | FTO | TiO2-c | SnO2-c | Perovskite | P3HT | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | FA-MeOPh | Au',
-    'SLG | ITO | A-PDTON | PEDOT:PSS | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | ZnO-c | CPTA; PbI2 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-c | Perovskite | ZnO-c | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | CMP | Au',
-    'SLG | ITO | SnO2-np | DPC60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | C60 | Perovskite | TaTm | TaTm:F6-TCNNQ | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | pi-PFE2 | Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | ZnO-np | AZO | NiAl | MgF2',
-    'SLG | ITO | CuAlO2 | PEDOT:PSS | Perovskite | PCBM-60 | Ag',
-    'Cu | CuI | Perovskite | ZnO-np | Ag-nw',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | TBAI | Ag',
-    'SLG | ITO | PTAA | PFN | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | SnO2-c | Perovskite | Spiro-MeOTAD | MoOx | ICO',
-    'SLG | ITO | Cu0.67Cr0.33O2 | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | Nb2O5 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Perovskite | PEDOT | Au',
-    'SLG | ITO | ZnO-c | ZnMgO-c | ZnO-nw | PCBM-60 | Perovskite | PEDOT:PSS | Ag',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60 | BCP | Ga2O3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | SnO2-c | Perovskite | BL51 | Au',
-    'SLG | FTO | ZnO-c | Perovskite | Spiro-MeOTAD | MoO3 | Al',
-    'SLG | ITO | MoS2 | Perovskite | C60 | BCP | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | ZnO-np | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | BaTiO3 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | ZnO-c | ZnO-c | Perovskite | CuI | Carbon',
-    'SLG | ITO | C60-SAM | SnO2-c | PCBM-60 | Perovskite | PffBT4T-2OD | WOx | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | V1221 | Au',
-    'SLG | ITO | NiO-c | MOF-808 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PNDI20D-TT | ZnO | Al',
-    'SLG | FTO | TiO2-c | Perovskite | InP-np | Au',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TP1 | Au',
-    'SLG | ITO | SnO2-np | Perovskite | Py-OMe | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 2TPA-4-DP | Au',
-    'SLG | ITO | NiO-c | Perovskite | C60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-nanofibers | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Carbon | FTO | SLG',
-    'Ti-foil | TiO2-c | Al2O3-mp | Perovskite | Spiro-MeOTAD | PEDOT:PSS | TCA | PET:Ni-mesh',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | MPA | Au',
-    'SLG | FTO | TiO2-np | Perovskite | Al2O3-np | TPA-ZnPc | Au',
-    'SLG | FTO | SnO2-c | Perovskite | CuMePy | Au',
-    'SLG | FTO | Nafion; PEDOT:PSS | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | Ag-np; NiO-c | Perovskite | Poly(9-vinylcarbazole) | PCBM-60 | AgAl',
-    'SLG | FTO | SnO2-np | Perovskite | Spiro-MeOTAD | PEDOT:PSS | PDMS',
-    'SLG | ITO | NPB | Perovskite | PCBM-60 | PDI-Br | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | FU7 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | t-BPTI | C60 | BCP | Al',
-    'SLG | ITO | C60-SAM | SnO2-c | PCBM-60 | Perovskite | Spiro-MeOTAD | WOx | Au',
-    'SLG | ITO | r-GO-HBS | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | 3,6-triphenylamine-carbazole | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | Au',
-    'SLG | ITO | SnO2-np | C60 | Perovskite | Spiro-TTB | VOx | Au',
-    'SLG | ITO | PTAA | Perovskite | LiF | C60 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | AZO-np | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | MWCNTs; ONC3',
-    'SLG | ITO | TiO2-c | PCBM-60 | Perovskite | P3HT | MoO3 | Al',
-    'SLG | FTO | TiO2-c | TiO2-IO | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | CoO | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | C60 | Perovskite | F4-TCNQ | CuPc | Au',
-    'SLG | ITO | TiO2-c | Perovskite | MEH; PPV | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 2FBTA-2 | Au',
-    'SLG | FTO | SnO2-c | C60-SAM | Perovskite | PMMA | DTP-C6Th | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-mp | Perovskite | NiO-mp | SWNCTs',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Y4 | Au',
-    'SLG | FTO | 1-ethyl-3-methylimidazolium iodide | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | ATO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | ZnO-np | SnO2-np | Perovskite | PSQ2 | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | C12-silane-SAM | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TSHBC-CF3 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | AZO-np | ITO | MgF2',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon | MAAc',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | mp-SFX-3PA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PDBD-T | Au',
-    "SLG | ITO | SnO2-c | Perovskite | 4,4'-(5,10,11-Trihexyl-10,11-dihydro-5H-thieno[2′,3':4,5]pyrrolo [3,2-g]thieno[3,2-b][1,2,3]triazolo[4,5-e]indole-2,8-diyl)bis(N,N-bis(4- methoxyphenyl)aniline) | Au",
-    'SLG | FTO | TiO2-c | Perovskite | C102 | Au',
-    'SLG | AZO | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Au',
-    'SLG | FTO | NiO-c | Perovskite | (4AMP)I2 | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuCrO2-np | Carbon',
-    'SLG | ITO | ZnO-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | P3CT-Na | Perovskite | IDT6CN | Rhodamine 101 | LiF | Ag',
-    'SLG | ITO | ZnO-c | ZnO-mp | PEI | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | YC-1 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | SnO2-np | PCBM-60 | Perovskite | M110 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | TOPD | Ag',
-    'SLG | FTO | ZnSe | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-c | C60-SAM | Perovskite | Spiro-MeOTAD | Au',
-    'PET | ITO | NiO-c | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | ZnO-c | C3-SAM | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | ITO | ZnO-np | ZnO-nanospheres | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | YC-2 | Ag',
-    'SLG | ITO | PCBM-60 | BCP | Perovskite | PEDOT:PSS | Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | TrNBr | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | CdS | Perovskite | PTAA | Au',
-    'SLG | ITO | TiO2-c | C60-SAM | SiO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | PCBM-60 | Perovskite | CuPc | Carbon',
-    'SLG | FTO | TiO2-nw | N719 | Perovskite | CZTS-np | Au',
-    'SLG | ITO | Perovskite | PCBM-60 | LiF | Ag',
-    'SLG | FTO | TiO2-nanosphere | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | MTA | Au',
-    'SLG | FTO | TiO2-c | Perovskite | po-TPE-4DPA | Ag',
-    'SLG | FTO | Perovskite | KY7F22-np | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PBDTT-FTTE | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | MeO-PheDOT | Au',
-    'PEN | ITO | PEDOT:PSS | Perovskite | PCBM-60 | LiF | Ag',
-    'SLG | ITO | PTAA | Perovskite | CMB | AZO | Ag',
-    'SLG | ITO | SnO2-c | SnO2-c | Perovskite | NiO-np | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | EVA; SWCNTs | Spiro-MeOTAD | Au',
-    'SLG | ITO | Perovskite | PCBM-60 | PFN | Al',
-    'SLG | ITO | SnO2-np | Perovskite | 2-MP | Spiro-MeOTAD | Au',
-    'SLG | FTO | WO3 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | Fe2O3-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PTAA | Perovskite | C60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Porphyrin-H2 | Au',
-    'SLG | ITO | VOx | X-DVTPD | Perovskite | PCBM-60 | Bphen | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Carbon-nanowalls',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ATT-OBu | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuPcNO2-OBFPh | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BDT:TT | Au',
-    'SLG | ITO | NiO-c | Perovskite | HATNAS3C7-Cs | Ag',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60 | Carbon-nt; PEI | Ag',
-    'SLG | ITO | PCBM-60; PEI | Perovskite | Spiro-MeOTAD | PEDOT:PSS',
-    'SLG | FTO | TiO2-c | TiO2-mp | Carbon-QDs | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | Ag-np; TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO | Perovskite | PCBBz | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | M1 | Au',
-    'SLG | ITO | PFBT-Na | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | SnO2-c | Perovskite | PTAA | Au',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | Zr(acac)4 | Ag | CsF',
-    'SLG | FTO | TiO2-mp | Perovskite | V842 | Au',
-    'SLG | ITO | Spiro-MeOTAD | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | nPrO-DATPA | Au',
-    'SLG | ITO | C60-SAM | SnO2-c | PCBM-60 | Perovskite | PDBT-T1 | WOx | Au',
-    'SLG | FTO | TiO2-c | Perovskite | CuPc(tBu)4 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | iPrO-DATPA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon; Graphite; PANI',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuInS2@ZnS-QDs | Carbon; LPP',
-    'SLG | FTO | TiO2-mp | Perovskite | V873 | Au',
-    'SLG | FTO | NiO-c | Perovskite | PPEA | PCBM-60 | BCP | Ag',
-    'SLG | ITO | PANI-PAMPSA | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | TiO2-c | Perovskite | PTZDPP-2 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Chl-1 | Ag',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Perovskite | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Ag-nw | SLG',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | ITO | TiO2-c | PPDI-F3N | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TCl-PDI | Perovskite | P3HT | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P3HT | Carbon-nt | Au',
-    'SLG | ITO | Perovskite | PCBM-60 | Isopropanol-hydroquinolatolithium | Ag',
-    'SLG | ITO | NiO-np | PAS | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | SnO2-c | Perovskite | PDCBT | MoOX | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Cu2CoSn4-np | Au',
-    'SLG | FTO | C60 | BenMeIM-Cl | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SO9 | Au',
-    'SLG | ITO | Ti3C2 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | alfa-NPD | MoO3 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PH 1000',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuSCN | Au',
-    'SLG | FTO | Nb2O5-c | Perovskite | CuPc | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 3,6 BCz-OMeTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | tetra-TPA | Au',
-    'SLG | FTO | Graphene oxide; TiO2-np | Perovskite | Au',
-    'PET | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Au',
-    'SLG | FTO | TiO2-c | Perovskite | PTAA | MoOx | Ag',
-    'SLG | ITO | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | PCBM-60 | EGME | Perovskite | PTAA | Au',
-    'SLG | ITO | NiO-c | PTAA | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P1Z1 | Carbon',
-    'SLG | FTO | SnO2-np | CPTA | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | PEI | Perovskite | PCBM-60 | LiF | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PEA2PBI4 | Carbon',
-    'SLG | ITO | TN-P | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-nanosheets | C60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PTAA | PMMA | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PFN-Br | Ag',
-    'SLG | ITO | Cu2O | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | P3CT-Na | Perovskite | ITCPTC-Th | Rhodamine 101 | LiF | Ag',
-    '42P2O5-22Li2O-22ZnO-12Sm2O3-2CeO2 | FTO | Perovskite | Metal',
-    'SLG | ITO | NiO-np | Glycerol | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | ZnO-c | Urea | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | Perovskite | P3HT | Ag',
-    'SLG | ITO | NiO-c | PNP-BC | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au | FTO',
-    'SLG | ITO | CuOx | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | ZnO-c | Perovskite | PZn-DPPA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZrO2-mp | NiO-mp | Perovskite | Carbon',
-    'SLG | ITO | SnO2-c | C60-5f | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | WO3 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | TiO2-c | C60 | Perovskite | PTAA | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PEIE | Al',
-    'SLG | ITO | NiO-np | Perovskite | PEAI | PCBM-60 | BCP | Ag',
-    'SLG | Ti | Au | Perovskite | ITO',
-    'SLG | FTO | TiO2-c | Perovskite | DFBT(DTS-FBTTh2)2 | Au',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Perovskite | Th-PDI | Au',
-    'SLG | ITO | NiO-c | 1bb | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | PCBM-60; PEI | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PTAA | Perovsktie | ZnO-np | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | F-PDI | Ag',
-    'SLG | FTO | ZnO-c | ZnO-nw | Perovskite | Au',
-    'SLG | ITO | PASQ-IDT | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | PEDOT:PSS | Perovskite | 1,2-diaminoethane | C60 | BCP | Ag | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PVAc | Graphene oxide | Carbon',
-    'SLG | FTO | ZnO-c | AZO-mp | Perovskite | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | C60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-nt | ZnO-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | Phen-NaDPO; Sn(SCN)2 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Au',
-    'SLG | ITO | NiO-c | PEDOT:PSS | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | NbOH5 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | CuO | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PMMA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TAZ-[MeOTPA]2 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Cu; Cu2O',
-    'SLG | ITO | TiO2-c | TiO2-mp | Perovskite | Au',
-    'PET | Graphene; TETA | ZnO-np | Perovskite | PTAA | PEDOT:PSS | Graphene | PET',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-mp | Perovskite | Carbon-nt',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PV-PDI | Al',
-    'SLG | ITO | CuI | Cu@CuI-nw | Perovskite | PCBM-60; ZnO-np | Ag',
-    'SLG | ITO | Graphene | AuCl3 | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Al',
-    'SLG | FTO | SnO2-c | TiO2-mp | PbI2 | Spiro-MeOTAD | Au',
-    'SLG | ITO | C60 | Perovskite | H1 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DPA-TPM | Au',
-    'SLG | FTO | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PTB-BO | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SM01 | Ag',
-    'PET | ITO | PTCA | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | r-GO-NH | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | PMAA; Spiro-MeOTAD | Spiro-MeOTAD | AgAu',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | ZnO-np | PEI | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Au',
-    'PET | Ni-mesh:PH1000 | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | TPP-OMeTAD | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Cz-Pyr | Au',
-    'SLG | FTO | TiO2-c | Perovskite | MeO-TPD | Au',
-    'SLG | ITO | CuO | Perovskite | PCBM-70 | AZO | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Mg | Al',
-    'SLG | ITO | Porphyrin | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | S2 | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | IZO | Au',
-    'SLG | ITO | CPE-Na | Perovskite | PCBM-60 | Al',
-    'PEN | ITO | C60 | PAA | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | N2200 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | SQ2 | Perovskite | Spiro-MeOTAD | Au',
-    'SiO2-hollow | SLG | ITO | TiO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'PET | ITO | PEDOT:PSS | Perovskite | PCBM-60 | C60 | BCP | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | YC04 | Ag',
-    'SLG | ITO | SnO2-np | C60 | Perovskite | Spiro-MeOTAD | VOx | ITO',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | MWCNTs; ONC2',
-    'SLG | ITO | ZnO-c | PCBM-60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | ZnO-c | ZnO-nw | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | SnO2-c | Perovskite | IT-4F; PBDB-T-SF | MoO3 | Ag',
-    'Phosphor-in-glass | SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | P3CT-N | Perovskite | PCBM-60 | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | SWCNTs | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | Perovskite | PVP | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | THY-4 | Au',
-    'SLG | ITO | SnO2-np | Perovskite | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | NiO-c | Perovskite | C60 | BCP | Ag',
-    'PET | ITO | PTAA | Perovskite | PVDF-TrFE | C60 | BCP | Al',
-    'SLG | ITO | NiO-np | Perovskite | NDI-TriSe | Ag',
-    'SLG | ITO | NiO-c | Perovskite | ZnO-np | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | MoO3 | Au | MoO3',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PEDOT:PSS | Carbon',
-    'SLG | ITO | Cu2O | Perovskite | PCBM-60 | Au',
-    'SLG | ITO | PTAA | Perovskite | C60 | PEI | Ag',
-    'SiO2 | SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | AgAl',
-    'SLG | FTO | SnO2-c | Perovskite | PTEG | Ag',
-    'SLG | ITO | C60 | C60-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | Al2O3-mp | Perovskite | Au',
-    'SLG | FTO | Graphene oxide | Perovskite | Graphene oxide; TiO2-c | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-mp | Perovskite | Au-np; NiO',
-    'SLG | ITO | V2O5 | Perovskite | PCBM-60 | Bphen | Ag',
-    'SLG | ITO | Rubrene | PEDOT:PSS | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C70 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | TPE-S | Perovskite | PCBM-60 | ZnO | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | SnO2-c | Perovskite | BL52 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | PhCOOH | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | Cr | Au',
-    'SLG | ITO | TiO2-c | PCBB-2CN-2C8 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | sGO | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | AZO-np | Perovskite | PCE-10 | MoO3 | Al',
-    'SLG | ITO | WO3-nw@PEDOT | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | ZnO-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | LD29 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SM-1 | Ag',
-    'PET | ITO | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ZnPcNO2-OPh | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Ag,',
-    'SLG | FTO | TiO2-c | TiO2-mp | 5-aminovaleric acid | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-70 | C70 | BCP | Ag',
-    'SLG | ITO | In2O3-c | Perovskite | Spiro-MeOTAD | Au',
-    'Ag-nw; Graphene; Polycarbonate; Polystyrene | MoO3 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | Au-np | NiO-c | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | ZnO-c | ZnO-nw | TiO2-c | ZrO2-mp | Perovskite | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | X62 | Au',
-    'SLG | ITO | C60; PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60; PS-b-PEO | Ag',
-    'SLG | FTO | PEDOT:PSS | Perovskite | Ru(acac) | Au',
-    'SLG | FTO | TiO2-c | Perovskite | P3HT:Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | PSS-Na | Perovskite | PCBM-60 | PEI | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TbT-2 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SGT-405 | Au',
-    'SLG | FTO | SnO2-QDs | Perovskite | CsBiBr3-QDs | Carbon',
-    'SLG | FTO | TiO2-c | SnO2-np | Perovskite | PDO2 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | CBA-SAM | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 5,7-disubstituted azulene | Au',
-    'SLG | FTO | C60 | Perovskite | Carbon',
-    'SLG | FTO | NiO-c | Perovskite | C60-HPy | BCP | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | CuMePc | Au',
-    'SLG | FTO | TiO2-c | TiO2-nw | Perovskite | Spiro-MeOTAD | Pd',
-    'SLG | FTO | TiO2-c | TiO2-mp | SnO2-c | Perovskite | CS04 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | ZnO-c | 1,2 ethanedithio | Perovskite | PZn-3FTPA | Au',
-    'SLG | FTO | ZnO-c | Perovskite | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | H-Tetra | Au',
-    'SLG | ITO | PTAA | Perovskite | Ag',
-    'PEN | ITO | NiO-np | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | C3N5 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ATT-OMe | Au',
-    'SLG | ITO | ZnO-c | WPF‐6‐oxy‐F | Perovskite | pDPA-DBTP | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon | FAAc',
-    'SLG | ITO | NiO-np | PSS | Perovskite | PSS | PCBM-60 | ZnO-np | ITO',
-    'SLG | ITO | PFN-2TNDI | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Z1012 | Au',
-    'SLG | FTO | SnO2-QDs | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-np | Perovskite | PABA | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Z1 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | MWCNTs; ONC1',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | FA-CN | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | X36 | Au',
-    'SLG | Ag-nw; Graphene oxide | PEDOT:PSS | Perovskite | PCBM-60 | PFN-P1 | Ag',
-    "SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Fused-F (Tris[[4-[3,3'-dihexylsilylene-2,2'-bithiophene]-7-[5′′-n-hexyl-(2,2′; 5′,2′′-terthiophen\ne)-5-yl]-benzo[c]-[1,2,5]thiadiazole]-2,6,10-yl]-4,4,8,8,12,12-hexamethyl-4H,8H,12\nHbenzo[1,9]quinolizino [3,4,5,6,7,-defg]acridine ) | Au",
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CW3 | Au',
-    'PET | PEDOT:PSS | Ag-nw | SnO2-np | C60-SAM | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | CuCo2O4 | Perovskite | PCBM-60 | bis-C60 | Ag',
-    'SLG | ITO | PTAA | Perovskite | C60 | BCP | Cu',
-    'Au | Ni | Al | Ti | GaN | Perovskite | hexagonal-BN | Perovskite | Graphene aerogel | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Perovskite | IPFB | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | POZ6-2 | Ag',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60 | LiF | Al',
-    "SLG | FTO | TiO2-c | Perovskite | 9,9'-([1,2,5]thiadiazolo[3,4-c]pyridine-4,7-diylbis(4,1- phenylene))bis(N3,N3,N6,N6-tetrakis(4-methoxyphenyl)-9H-carbazole-3,6-diamine) | Au",
-    'SLG | FTO | CdSe | Perovskite | CuPc | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | PCBM-60 | Perovskite | Spiro-MeOTAD | Ag',
-    'PEN | ITO | NiO-c | Perovskite | PCBM-60 | Au | ITO | PEN',
-    'Carbon-nt-fiber | TiO2-c | TiO2-mp | Perovskite | P3HT; SWCNTs | Ag-nw | PMMA',
-    'SLG | FTO | SnO2-c | C60-SAM | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P2Z1 | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Spiro-MeOTAD | Au',
-    'SLG | ITO | P3CT-Na | Perovskite | TPE-DPP12 | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ZnP | Au',
-    'SLG | ITO | PolyTPD | PFN | Perovskite | LiF | C60 | BCP | Au',
-    'SLG | FTO | SnO2-c | Perovskite | CuPrPc | Au',
-    'SLG | ITO | YC-3 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Ba0.9Sr0.1SnO3-np | Perovskite | PTAA | Au',
-    'SLG | ITO | ZnO | MgZnO | Perovskite | Spiro-MeOTAD | MoOx | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PEI | PEDOT:PSS | Al',
-    'SLG | ITO | TPA-NAP-TPA | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P1 | Au',
-    'SLG | ITO | C60:Phlm | C60 | Perovskite | TaTm | TaTm:F6-TCNNQ | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | ZnO-c | Al',
-    'SLG | ITO | TiO2-c | PCBA | Perovskite | Spiro-MeOTAD | WO3 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | IEICO | MoO3 | Ag',
-    'SLG | FTO | ETM | Perovskite | HTM | Metal',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Chl-2 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au | Al2O3-c',
-    'SLG | ITO | PEDOT:GSL | Perovskite | PCBM-60 | LiF | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Pyrimidine | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | ITO',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | B58 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Sinapoyl malate | Perovskite | Co(II)P; Co(III)P | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | H1 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | Br-PDI | Ag',
-    'SLG | FTO | PEDOT:PSS | Perovskite | D-C60 | Al',
-    'SLG | FTO | TiO2-nc | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-c | Perovskite | C60 | BCP | Al',
-    'PDMS | SLG | ITO | PTAA | Perovskite | C60 | BCP | Cu',
-    'SLG | ITO | Spiro-MeOTAD | PEDOT:PSS | Perovskite | C60 | Ag',
-    'SLG | ITO | 2EGO-PPV | PFN-P2 | Perovskite | PCBM-60 | BCP | cu',
-    'SLG | FTO | NiO-c | Perovskite | Fulleropyrrolidinium Iodide | Ag',
-    'SLG | ITO | ZnO-c | SnO2; TiO2-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuPc | PTAA | Au',
-    'SLG | FTO | PEDOT:PSS | Perovskite | DMEC-60 | LiF | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | H112 | Au',
-    'SLG | FTO | TiO2-c | Perovskite | 3-Butylthiophene | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PTCBI | BCP | Ag',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60-MCM | Ag',
-    'SLG | FTO | BCP | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | ZnO-np | Perovskite | Ag',
-    'PET | ITO | ZnO-np | Perovskite | PTAA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Z3 | Au',
-    'SLG | FTO | SnO2-mp | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | ZnO-c | C60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TPA-MeOPh | Au',
-    'SLG | FTO | SnO2-c | SnO2-c | Perovskite | V1056 | Au',
-    'PET | ITO | PEDOT:PSS | Perovskite | C60 | Al',
-    'SLG | FTO | TiO2-c | Perovskite | PO-Spiro | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Pt',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | TPBi | Ag',
-    'SLG | FTO | SnO2-np | Perovskite | NiO-c | FTO',
-    'PET | WO3 | Ag | WO3 | PEDOT:PSS | Perovskite | C60 | Bphen | Ag',
-    'SLG | ITO | NPB; PTAA | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | CuSCN | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PEDOT | Au',
-    'SLG | ITO | C60-SAM | SnO2-c | PCBM-60 | Perovskite | PDCBT | WOx | Au',
-    'SLG | ITO | PCBM-60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | PIDT-DFBT | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-70 | TiO2-c | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60 | Ca | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | M3; PCBM-60 | Au',
-    'SLG | FTO | ZnO-c | Perovskite | P3HT | Au',
-    'SLG | FTO | NiCoO4 | Perovskite | PCBM-60 | bis-C60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | NiO-c | Carbon',
-    'SLG | FTO | TiO2-c | AAO | Perovskite | MoOx | ITO',
-    'SLG | FTO | TiO2-c | Perovskite | MWCNTs; Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | BPB-M | LiF | Ag',
-    'SLG | FTO | SnO2-np | Perovskite | Spiro-MeOTAD | PEDOT:PSS | PEDOT:PSS | PDMS',
-    'SLG | FTO | ZnO-c | Perovskite | Spiro-MeOTAD | MoOx | Al',
-    'SLG | FTO | TiO2-c | Perovskite | Pyridine | Spiro-MeOTAD | Au',
-    'Mica | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | NiO-c | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | NaYF4-np; TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Carbon-QDs | Au',
-    'SLG | ITO | PEDOT:PSS | PolyTPD | Perovskite | IPH | Ba | Ag',
-    'SLG | Graphene | PEDOT:PSS | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | SnO2-np | Perovskite | EHCz-MeFl | MoOx | Al',
-    'SLG | ITO | NiO-np | Perovskite | NDI-Se | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PTh; Graphene | Au',
-    'SLG | ITO | P3CT-Na | Perovskite | TPE-DPP4 | C60 | BCP | Ag',
-    'Ti-wire | TiO2-nt | Perovskite | Spiro-MeOTAD | Carbon-nt',
-    'SLG | FTO | NiO-c | Perovskite | TEAI | PCBM-60 | PEI | Ag',
-    'SLG | ITO | PFN-OX | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | Ag-nw | Graphene oxide | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | NaYF4:Yb:Tm-np | Perovskite | NaYF4:Yb:Tm-np | Spiro-MeOTAD | Au',
-    'SLG | FTO | PEDOT:PSS | Perovskite | ZnO-np | Al',
-    'SLG | ITO | TiO2-c | CdSe-tetrapod | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT | Perovskite | PCBM-60 | BCP | Al',
-    'SLG | FTO | NiO-mp | Perovskite | PCBM-60 | Zr(acac)4 | Ag',
-    'SLG | ITO | MC8-9-NPC | Perovskite | PCBM-60 | LiF | Al',
-    'PEN | SWCNTs | MoO3 | PEDOT:PSS | Perovskite | C60 | BCP | LiF | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Cz-N | Au',
-    'SLG | ITO | P3CT | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | W',
-    'SLG | ITO | NiO | PS | Perovskite | PCBM-60 | Ag',
-    'PEN | ITO | Al2O3-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-mp | Perovskite | HfO2 | PTAA | Graphite',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TB-ZnPc | Au',
-    'SLG | ITO | PolyTPD | Perovskite | PCBM-60 | BCP | Al',
-    'SLG | ITO | SnO2-np | Perovskite | PTAA | MoO3 | Al',
-    'SLG | FTO | TiO2-c | Perovskite | NiO-c | Ni',
-    'SLG | FTO | TiO2-c | Perovskite | Au-np; P3HT | Au',
-    'SLG | ITO | Graphene oxide | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZrO2-mp | Perovskite | Carbon | Graphite',
-    'SLG | ITO | PMA | Perovskite | C60 | BCP | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Si-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | CuPc | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | P3HT | MoO3 | Ag',
-    'SLG | FTO | ZnO-c | ZnO-nw | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | ZnO-c | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | PCBM-60; PMMA | BAI | Perovskite | BAI | Spiro-MeOTAD | Au',
-    'SLG | ITO | ZnO-np | Perovskite | P3HT | P3HT; PMMA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TTA1 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Rhodamine 101 | C60 | Rhodamine 101 | LiF | Ag',
-    'SLG | FTO | TiO2-c | ZnO-nw | Al2O3-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | BCP | C60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SGT-410 | Au',
-    'SLG | ITO | TiO2-c | NAMF-H | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | SnO2-mp | Perovskite | Carbon',
-    'SLG | FTO | BaSnO3 | Perovskite | NiO | FTO | SLG',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | Bis-FIMG | Ag',
-    'SLG | ITO | PTB7-Th | Perovskite | PCBM-60 | PEI | Ag',
-    'SLG | ITO | ZnO-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | TiO2-mp | Perovskite | PTAA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ZnPcNO2-OBFPh | Au',
-    'SLG | ITO | PTAA | Perovskite | IDIC | C60 | BCP | Cu',
-    'SLG | ITO | P3CT-Na | Perovskite | IDT6CN-TM | BCP | Ag',
-    'SLG | FTO | Au-np | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | EGO-PPV | Perovskite | PCBM-60 | BCP | cu',
-    'SLG | FTO | C60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | ZnO-c | Perovskite | Co-Porphyrin | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60 | BCP | LiF | Al',
-    'SLG | ITO | NiO-c | NBP-BC | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | NiO-c | Perovskite | c-HATNA | bis-C60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Graphite | Pt',
-    'SLG | ITO | PEDOT:PSS | Perovskite | P2 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | X2 | Au',
-    'SLG | ITO | PEDOT:PSS | PolyTPD | Perovskite | PCBM-60 | BCP | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon Paper',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PEI | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Ag | MoO3',
-    'SLG | ITO | PEDOT:PSS | Perovskite | DS1 | Ag',
-    'SLG | ITO | C60; Phlm | C60 | Perovskite | TaTm | F6-TCNNQ; TaTm | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Bphen; Ir(MDQ)2(acac) | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | NiO@C',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Pt',
-    'SLG | ITO | P3CT | Perovskite | PFPDI | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | MoS2-QDs | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZIF-8-10 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | B63 | Au',
-    'SLG | FTO | TiO2-c | TiO2-np | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PCBM-60 | BCP | Perovskite | PEDOT:PSS | Al | Ag',
-    'SLG | ITO | P3CT-Na | Perovskite | IDTCN | C60 | BCP | Ag',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | ZnO-np | PEI | D-Sorbito; PEDOT:PSSl | Ag-nw | PET',
-    'SLG | ITO | SnO2-np | PCBA-60 | Perovskite | PTA | MoO3 | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | EHCz-3EtCz | MoOx | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PVDF-HFP | Spiro-MeOTAD | Au',
-    'SLG | ITO | P3CT-Na | Perovskite | IDT6CN | C60 | BCP | Ag',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | C60 | Ag',
-    'SLG | ITO | PEDOT:PSS | Al2O3-mp | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TPD-4MeTPA | Au',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60 | AZO-c',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | TiO2 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | T103 | Au',
-    'SLG | ITO | PEDOT:PSS | PbI2 | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | EDTA | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-c | Perovskite | LiF | C60 | SnO2-c | ITO | Ag',
-    'SLG | ITO | Perovskite | PCBM-60 | BCP | Al',
-    'PET | ITO | ZnO-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG  FTO | TiO2-c | TiO2-mp | Perovskite | BTX-OMeTAD | Au',
-    'SLG | ITO | ZnO-c | ZnO-nw | Perovskite | MDMO-PPV | MoO3 | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PDI | C60 | BCP | Al',
-    'SLG | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | MoOx | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SWCNTs | Ag',
-    'SLG | FTO | TiO2-c | ZnO-np | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60-PCP | Ag',
-    'SLG | ITO | CuCrO2 | C60; PCBM-60 | Perovskite | Zr(acac)4 | Ag',
-    'SLG | FTO | TiO2-c | SiO2-np | TiO2-c | SiO2-np | TiO2-c | SiO2-np | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PPDIDTT | PCBM-60 | Bphen | Ag',
-    'SLG | ITO | SrTiO3 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BTT-1 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | HTM-P1 | Au',
-    'SLG | ITO | ZnO | Perovskite | Spiro-MeOTAD | MoO3 | Au',
-    'SLG | ITO | NiO-c | UiO-66 | Perovskite | PCBM-60 | BCP | Ag',
-    'PEN | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | SWCNTs | Spiro-MeOTAD | Au',
-    'SLG | AZO | ZnO-c | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SY2 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Tetrakis-Triphenylamine | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | T(EDOT-TPA)2 | Au | Ag',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | ZnO-c | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 1a | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon-epoxy | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZnS | Perovskite | PTAA | Au',
-    'SLG | ITO | TAPC | Perovskite | C60 | BCP | Ag',
-    'PEN | ITO | ZnO-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | ZSO-np | PCBM-60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | PTAA | Perovskite | PCBM-60 | BCP | Au',
-    'PET | ITO | ZnO-c | Perovskite | PTAA | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | AZO-np | Al',
-    'SLG | ITO | NiO-np | Perovskite | ICBA | PrC60MAI | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | P(NDI2OD-T2) | Ag',
-    'SLG | ITO | SnO2-np | C60 | Perovskite | BTF1 | Au',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | PrCMA | Ag',
-    'PAA-PEG | Ti | PANI | Perovskite | PCBM-60 | Ti-grid',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | SnO2-c | SnZnO | Al',
-    'SLG | ITO | Graphene oxide; ZnO-np | Perovskite | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SQ2 | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PTAA | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | P(NDI2OD-TET) | Al',
-    'SLG | ITO | PTAA | PFN | Perovskite | PCBM-60 | PFN | Cu-CFNs',
-    'SLG | ITO | ICMA | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 4-(4-Phenyl-4-alfa-naphthylbutadienyl)-N,N-di(4-tolyl)-phenylamine | Au',
-    'SLG | ITO | PTAA | Perovskite | ICBA | C60 | BCP | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60 | BCP | Cu',
-    'MgF2 | Willow glass | AZO | SnO2-np | Perovskite | Spiro-MeOTAD | MoO3 | Al',
-    'SLG | ITO | MoO3 | TPBi | TaTm | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | KY7F22-np | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | PCBM-60; PTAA | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | MgO-c | SnO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NTPA | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | SnO2-c | C60-5g | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-nw | Perovskite | CuI | Au',
-    'SLG | ITO | ZnO-np | SnO2-np | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PFB | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon Black | Carbon',
-    'SLG | ITO | CuInS2 | Al2O3-mp | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | PFN; PTPD | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | CuS-np | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | ZnO-c | Perovskite | PZn-TPA | Au',
-    'SLG | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | MWCNTs',
-    'SLG | Graphene | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | ZnO-c | Ag-nw',
-    'SLG | ITO | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | FTO | TiO2-c | TiO2-nw | ZrO2-mp | Perovskite | Carbon',
-    'SLG | ITO | TiO2-c | Perovskite | Au',
-    'SLG | ITO | CuSCN-2D | Perovskite | C60 | Bphen | Ag',
-    'SLG | ITO | SnO2-c | C60 | Perovskite | PPyra-ACD | MoO3 | Ag',
-    'SLG | ITO | PEDOT:PSS | PSS-Na | Perovskite | PCBM-60 | ZnO | PEI | Al',
-    'SLG | FTO | SnO2-c | C60 | Perovskite | PMMA | DTPC8-ThDTPA | Au',
-    'SLG | ITO | NiO-c | Perovskite | CeOx | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | NiO-c | Ni',
-    'NOA88 | PEI | Au | PEDOT:PSS | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | MoO3 | Perovskite | PCBM-60 | C60 | BCP | Al',
-    'SLG | ITO | TPASB | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PN4N | Al',
-    'SLG | FTO | C70 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | IZO | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | Poly TPD-NPD | Perovskite | PCBM-60 | BCP | Ag',
-    "SLG | ITO | TiO2-c | Perovskite | N3',N3',N6',N6'-tetrakis(4-methoxyphenyl)spiro[fluorene-9,9'-xanthene]-3',6'-diamine | Au",
-    'SLG | ITO | C60 | Perovskite | IDF-DiDPA | MoO3 | Ag',
-    'SLG | FTO | TiO2-mp | Perovskite | Carbon | PEDOT:PSS | FTO | SLG',
-    'PET | Carbon-nt; P3HT | PEDOT:PSS | Perovskite | Carbon-nt:PCBM-60',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Z26 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | MWCNTs; Spiro-MeOTAD | Au',
-    'SLG | ITO | MeO-PPV | PFN-P2 | Perovskite | PCBM-60 | BCP | cu',
-    'SLG | FTO | TiO2-c | Perovskite | 2F | Au',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | Bphen | Al',
-    'PEN | ITO | SnO2-np | Perovskite | PTAA | NiO-c | Au | PEN',
-    'SLG | FTO | CZTS | Perovskite | PCBM-60 | Ag',
-    'SLG | resist | ITO | PEDOT:PSS | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | FTO | NiO-c | Perovskite | PEAI | PCBM-60 | PEI | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PbPc | Au',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | AZO-np | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | PCBM-60; Poly(N-vinylcarbazole) | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | CuOx | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | C60 | Perovskite | H2 | Au',
-    'SLG | ITO | DFH | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | PFN; PTPD | Perovskite | PCBM-60 | TiO2 | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | CNTPA-PCBM | bis-C60 | Ag',
-    'SLG | Ag | TiO2-c | Perovskite | Au',
-    'SLG | FTO | TiO2-c | SiO2-np | TiO2-c | SiO2-np | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-c | Perovskite | Spiro-MeOTAD | MoO2 | ITO',
-    'SLG | ITO | PTPD | PFN | Perovskite | PCBM-60 | LiF | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TSHBC | Au',
-    'PEN | ITO | SnO2-np | Perovskite | PTAA | NiO-c | ITO | PEN',
-    'PET | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | YT2 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | T-MWCNTs',
-    'SLG | FTO | TiO2-c | TiO2-mp | SnO2-c | Perovskite | V1004 | Ag',
-    'SLG | ITO | ATO | TiO2-c | TiO2-mp | Perovskite | PTAA | Au',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Perovskite | AS44 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SnS-np; ZnS-np | NiO-np | Carbon',
-    'SLG | ITO | NiO-c | Perovskite | PbS | PCBM-60 | Al',
-    'SLG | FTO | ZnO-c | ZnO-mp | ZrO2-mp | Perovskite | Carbon',
-    'SLG | ITO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | SnO2-np | BBA | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | ZnO-np | SnO2-np | Perovskite | H-Z1 | MoO3 | Ag',
-    'SLG | ITO | ZnO-c | ZnO-nw | Perovskite | Rubene | P3HT | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | PbS-QDs | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P3TI | Au',
-    'SLG | ITO | ZnO-np | ATAA | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | FTO | Mg0.05Zn0.95O-np | Perovskite | P3HT | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PANI | Carbon',
-    'SLG | ITO | NiO-c | Perovskite | N2200; PFN-Ox | bis-C60 | Ag',
-    'SLG | ITO | PCBM-60 | Perovskite | P3HT | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PTAA | Au | pV3d3 | Al2O3',
-    'SLG | FTO | NiO-c | Perovskite | C60-BPy | BCP | Ag',
-    'SLG | ITO | p-PFP-O | PTAA | Perovskite | PCBM-60 | PFN | Ag',
-    'SLG | ITO | ZnO-np | SnO2-np | Perovskite | PSQ1 | MoO3 | Ag',
-    'SLG | ITO | SnO2-np | TiO2-np | Perovskite | PTAA | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PDTP-DFBT:PCBM-60 | Ca | Al',
-    'SLG | FTO | ZnO-c | ZnO-nw | Perovskite | P3HT | Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBB-S-N | C60 | BCP | Cu',
-    'SLG | ITO | TPAC2M | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | FTO | 1-ethyl-3-methylimidazolium iodide | C60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perylene | Perovskite | PCBM-60 | Bphen | Ag',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | ZnO-np | ITO | MgF2',
-    'SLG | ITO | TiO2-c | DMF | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-np | Perovskite | Spiro-MeOTAD | Ag',
-    "SLG | ITO | SnO2-c | Perovskite | 4,4'-((2-Hexyl-2H-benzo[d][1,2,3]triazole-4,7-diyl)bis(thiophene5,2-diyl))bis(N,N-bis(4-(hexyloxy)phenyl)aniline) | Au",
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | WT3 | MoOx | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | M4 | Au',
-    'SLG | FTO | TiO2-c | Perovskite | PTB7 | MoO3 | Ag',
-    'Flexible | IZO | PEIE | C60 | 3TPYMB | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | ZnO-c | Perovskite | PQT-12 | Au',
-    'SLG | ITO | V2O5 | Perovskite | PCBM-60 | ZnO | Ag',
-    'PET | ITO | P3CT-Na | Perovskite | PCBM-60 | HDAC | Ag',
-    'SLG | FTO | TiO2-mp | N719 | Perovskite | Pt | SLG | FTO',
-    'SLG | ITO | WOx | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | SnO2-np | Choline Chloride | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-nw | SiO2-nanocolumns | TiO2-nw | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-nanoballs | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | Spiro-MeOTAD | Perovskite | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PDVT-10 | Au',
-    'SLG | FTO | NiO-c | Perovskite | SnO2-c | AZO-c',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Porphyrin-H1 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P3HT | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | BaSnO3-np | Perovskite | PTAA | Au',
-    'SLG | ITO | SnO2-np | Perovskite | OMe-TATPyr | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PM-Spiro | Au',
-    'Ti | TiO2-nw | Perovskite | PEDOT | ITO | PEN',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TPB-2-MOTPA | Au',
-    'SLG | ITO | PTAA | Perovskite | Cu',
-    'SLG | FTO | NiO | Perovskite | PCBM-60 | LiF | Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | CMB-vTA | AZO | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | YC03 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | S-acetylthiocholine chloride | C60 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60 | SnO2-c | IZO',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 4-(2-(4-(Bis(4-(hexyloxy)phenyl)methyl)phenyl)-9-methyl-9H-naphtho[2,1-c]carbazol-12-yl)-N,N-bis(4-(hexyloxy)phenyl)aniline | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | BP-DC | Ag',
-    'SLG | ITO | PolyTPD | Perovskite | PCBM-60 | Bphen | Ag',
-    'SLG | ITO | PEDOT:PSS | X-QUPD | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | SnO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | Mix-DMEC70 | Al',
-    'SLG | FTO | SnO2-c | C60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | ITIC | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 4,8-bis-\n(5-bromothiophene-2-yl)-benzo thiadiazole | Au',
-    'SLG | ITO | Pentacene | Perovskite | PCBM-60 | C60 | BCP | Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | AZO-np | SnO2-c | ITO',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PC61BEH | Al',
-    'SLG | FTO | TiO2-c | Al2O3-mp | NiO-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | Ca | C60 | Perovskite | TAPC | MoO3; TAPC | Ag',
-    'SLG | ITO | YC-2 | Perovskite | PCBM-60 | BCP | Ag',
-    'PET | MSA-PEDOT:PSS | Perovskite | PCBM-60 | Rhodamine 101 | C60 | Rhodamine 101 | LiF | Ag',
-    'SLG | ITO | ZnO-c | PCBM-70 | Perovskite | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | P3HT | Graphite',
-    'SLG | ITO | NiO-c | Perovskite | Nb2O5 | PCBM-60 | Bphen | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | V950 | Au',
-    'Cellulose paper | Carbon black | Perovskite | C60 | BCP | Cu | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Rhodamine 101 | LiF | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Y2A2 | Au',
-    'SLG | ITO | LiQ; PEIE | PCBM-60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | Z8 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | PCBM-60 | C60-SAM | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | PEDOT:PSS | Perovskite | B-DIPBI | Al',
-    'SLG | FTO | TiO2-c | Alq3 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PCBM-60 | Ca | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | KR360 | Au',
-    'SLG | FTO | TiO2-c | TiO2-nw | Perovskite | PTAA | Au',
-    'SLG | FTO | Cu2O | Perovskite | SiO2-c | ZnO-c | Ag',
-    'SLG | ITO | Spiro-E | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | FTO | TiO2-nanoleaves | Perovskite | Spiro-MeOTAD | Graphite',
-    'SLG | ITO | s-PANI:PSS | Perovskite | PCBM-60 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PDPP-3T | MoOx | Ag',
-    'Willow glass | Ti | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | MoO3 | IZO',
-    'PET | In2O3 | ZnO-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | ZnO-c | ZnO-nw | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | CeO2-c | TiO2-c | Perovskite | CuSCN | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | La2O3 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | Graphene-QDs | Perovskite | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | asy-PBTBDT | Au',
-    'SLG | FTO | NiO-c | Perovskite | MAI | PCBM-60 | PEI | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | bis-PCBM | Al',
-    'SLG | FTO | PEDOT:PSS | Perovskite | DMEC-70 | LiF | Al',
-    'SLG | ITO | Graphene oxide; PEDOT:PSS | Perovskite | PCBM-60 | LiF | Al',
-    'SLG | ITO | Perovskite | P3HT | MoO3 | Ag',
-    'PET | ITO | Graphene | ZnO-QDs | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | Spiro-TAD | PEDOT:PSS | Perovskite | C60 | Ag',
-    'SLG | FTO | TiO2-c | PCBM-60 | Perovskite | PCDTBT1 | MoO3 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovsksite | PCBM-60 | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | TmPyPB | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | F16CuPc | Bphen | Al',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Perovskite | Ag',
-    'SLG | FTO | KY7F22-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | ZnO-c | Perovskite | Bifluo-OMeTAD | MoO3 | Ag',
-    'SLG | ITO | C60 | Perovskite | IDF-TeDPA | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Benzylamine | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | NiO-np | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | Ag-nw',
-    'SLG | FTO | TiO2-mp | N719 | Perovskite | Dye | I2; KI; Propylene carbonate; Polyethylene glycol | Pt | FTO',
-    'SLG | FTO | Cu0.2Cr0.8O2 | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TPA-AZO | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SGT-404 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZrO2-mp | Perovskite | TOPO | Carbon',
-    'SLG | ITO | TPA | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | ZnO-nw | ZnO-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CZTS; rGO | Au',
-    'SLG | ITO | PTAA | Perovskite | C60 | B4PyMPM | Ag',
-    'Willow glass | ITO | SnO2-np | Perovskite | Spiro-MeOTAD | MoO3 | Al',
-    'SLG | FTO | NiO-c | n-Butylamine | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | SnO2-c | Perovskite | OMe-TATPyr | Au',
-    'MgF2 | PET | ITO | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-c | Carbon-QDs | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | NiO | Perovskite | PCBM-60:C60 | bis-C60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | PbSe | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | NiO-np | Graphene oxide | Perovskite | GO-Li | TiO2-c | Al',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | MnOx | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | T5H-OMeDPA | Au',
-    'SLG | FTO | TiO2-c | MgO | TiO2-mp | ZrO2-mp | NiO-mp | Perovskite | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Triazine | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Rhodamine 101 | LiF | Al',
-    'SLG | ITO | P3CT-Na | Perovskite | ITCPTC-Se | Rhodamine 101 | LiF | Ag',
-    'PES | PEDOT:PSS | Ag | PEI | PCBM-60 | Perovskite | Spiro-MeOTAD | PEDOT:PSS',
-    'SLG | FTO | TiO2-c | CsPbBr3-QDs | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | ZnO-np | PEI | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | P3HT | Ag',
-    'PET | TiO2-c | Ag | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TPP-SMeTAD | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CT3 | MoO3 | Ag',
-    'SLG | ITO | SnO2-c | C60-5e | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | Perovskite | Graphene',
-    'SLG | FTO | Perovskite | HTM | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | PHPT-py | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Graphene',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-70 | Ca | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PEIE | Ag | MoO3',
-    'SLG | ITO | SnO2-c | ZnTiO3-mp | Perovskite | Spiro-MeOTAD | Au',
-    'PDMS | PEDOT:PSS | Perovskite | PCBM-60 | PEI | PEDOT:PSS | PDMS',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuInS2-QDs | Au',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Perovskite | Al2O3-mp | MeO-DATPA | Ag',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | MnS | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PEH-3 | Au',
-    'Carbon-np | SLG | ITO | Graphene oxide | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | MoO3 | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | TiO2-c | Perovskite | PTAA | MoO3 | Au',
-    'SLG | FTO | TiO2-np | Perovskite | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | KIPIG',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | MAI | Spiro-MeOTAD | Au',
-    'PET | ITO | PEI | SnO2-np | Perovskite | Spiro-MeOTAD | Ag',
-    'PEN | ITO | NiO-c | Perovskite | CSCNT@Al2O3-c | CSCNT@SnO2',
-    'SLG | ITO | MC6Cz-9-NPC | Perovskite | PCBM-60 | LiF | Al',
-    'SLG | ITO | AZO-c | ZnO-nw | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | SnO2-c | Perovskite | BL38 | Au',
-    'SLG | FTO | (RhCp*Cp)2 | PTCBI | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | H-Bi | Au',
-    'SLG | FTO | ZnO-np | MgO | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | CL1-2 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZrO2-mp | Perovskite | Carbon-nt | Carbon',
-    'SLG | FTO | PTEG-1 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Au@SiO2-nw; TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Yih-2 | Au',
-    'SLG | ITO | TiO2-c | TiO2-mp | MgO-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | SrTiO3-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | Perovskite | PEDOT:PSS | Au',
-    'MgF2 | SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | ZnO-np | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | ITO | PEIE | SnO2-np | ITIC | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | P3CT-K | Perovskite | PCBM-60 | ZnO | Al',
-    'PET | ITO | ZnO-np | PCBM-60 | Perovskite | P3HT | PEDOT:PSS | Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | C60 | BCP | Al',
-    'SLG | ITO | TiO2-c | SnO2-np | PCBM-60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | CuI | Perovskite | PCBM-60 | ZnO-np | Ag',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | PEI | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | C70 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | COPV4 | Au',
-    'SLG | ITO | ITO-nw | TiO2-np | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | PIF8-TAA | Au',
-    'SLG | ITO | SnO2-np | PCBM-60 | Perovskite | TZ2 | Ag',
-    'SLG | ITO | Perovskite | C60 | Bphen | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BTSe-1 | Au',
-    'SLG | ITO | PTAA | Perovskite | CMB-vTA | AZO | Ag',
-    'SLG | ITO | C60; PhIm | C60 | Perovskite | F6-TCNNQ; TaTm | Ag',
-    'SLG | ITO | SY3 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | Spiro-TTB | PEDOT:PSS | Perovskite | C60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CsPbBr2I-np | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-nt | ZrO2-mp | Perovskite | Carbon',
-    'SLG | ITO | PEDOT:PSS | Perovskte | PCBM-60 | TIPD | Al',
-    'SLG | TiO2-mp | Ti:TiO2 | ZrO2-mp | Perovskite | Au',
-    'PET | ITO | PEDOT:PSS | PEI-HI | Perovskite | PCBM-60 | LiF | Ag',
-    'SLG | FTO | PCBCB | Perovskite | Thiophene | Spiro-MeOTAD | Au',
-    'SLG | ITO | In2O3 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | f-C70 | C60 | Perovskite | P3HT | MoO3 | Ag',
-    'SLG | ITO | TB(MA) | Perovskite | PCBM-60 | C60 | BCP | Ag',
-    'SLG | ITO | TiO2-c | PCBM-60 | Perovskite | TPD | MoO3 | Au',
-    'SLG | FTO | NiO-c | Perovskite | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PVP | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Au | Al',
-    'NOA63 | Au | PEDOT:PSS | Perovskite | PCBM-60 | MoO3 ∣ Au ∣ Ag ∣ MoO3 | Alq3',
-    'SLG | ITO | PEDOT:PSS | VB-DAAF | Perovskite | C60 | BCP | Al',
-    'PI | Ag-np | PEDOT:PSS | PEDOT:PSS | Perovskite | PCBM-60 | PEI | Ag',
-    'PEN | ITO | CuPc | PEI | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | ZnO-mp | Perovskite | Spiro-MeOTAD | Carbon',
-    'SLG | ITO | 3C | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | NiO-c | SY2 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CdSe-QD | Spiro-MeOTAD | Au',
-    'SLG | ITO | PTAA | Perovskite | C60 | BCP | CU',
-    'SLG | FTO | Perovskite | CuPc | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | iDM1 | Au',
-    'SLG | ITO | PCBM-60 | ICL | Perovskite | PTAA | Au',
-    'SLG | ITO | VOx | APPA | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | PANI-PAMSA | Perovskite | C60 | BCP | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PEI | PH 1000',
-    'SLG | FTO | TiO2-c | Al2O3-mp | Perovskite | P3HT | SWCNTs | PMMA | Cu',
-    'SLG | Au; NiO-c | Perovskite | C60 | BCP | Al',
-    'SLG | ITO | TiO2-np | Perovskite | DERDTS-TBDT | MoO3 | Ag',
-    'SLG | FTO | TiS2 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | TPD | Perovskite | PCBM-60 | Ba | Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | PFN | Au',
-    'SLG | ITO | PTAA | Perovskite | PCBB-S-N | PCBM-60 | C60 | BCP | Cu',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BT41 | Au',
-    'SLG | Cu | PEDOT:PSS | Perovskite | PCBM-60 | PEIE | Cu',
-    'SLG | ITO | PEDOT:PSS | Perovskite | LiF | Al',
-    'SLG | ITO | CuSCN | Perovskite | PCBM-60 | Ag',
-    'Nanopaper | TiO2 | Ag | TiO2-c | ZnO-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-np | SnO2-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | Nb2O5 | PCBM-60 | (EMIM)PF6 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | 2,4-spiro | Au',
-    'PET | Au-np; Graphene; TFSA | Graphene-QDs | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | Perovskite | Diazo-OMeTPA | Au',
-    'ITO | PET | ZnO2-c | ZnO-nw | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | ZnO-c | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | FTO | Perovskite | PCBM-60 | C60 | BCP | Cu',
-    'Ti | TiO2-c | Perovskite | PTAA | Graphene | PDMS',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BDT0FMeDPA | Carbon',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PFN; ZnO-np | Al',
-    'PET | Graphene; TETA | ZnO-np | Perovskite | PTAA | PEDOT:PSS | Graphene; TFSA | PET',
-    'SLG | FTO | SnO2-c | TiO2-c | Perovskite | PTAA | Au',
-    'SLG | FTO | TiO2-mp | Z907 | Perovskite | Pt | SLG | FTO',
-    'SLG | FTO | TiO2-c | [EMIM]PF6-IL | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | ZnO-c | ZnO-nw | Perovskite | Graphene',
-    'SLG | FTO | CuCrO2 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | Perovskite | PCBM-60 | Ethanl-hydroquinolatolithium | Ag',
-    'SLG | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | Al',
-    'SLG | FTO | SnO2-c | Perovskite | P-SC6-TiOPc | Au',
-    'SLG | FTO | SnO2-c | PCBM-60 | Perovskite | PdMe2Pc | Au',
-    'SLG | ITO | PEDOT:PSS | Etylene glycol | Perovskite | Liq | Al',
-    'SLG | ITO | PN-P | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | Perovskite | P3DT | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | M2 | Au',
-    'SLG | FTO | TiO2-np | Perovskite | TPA-ZnPc | Au',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | PEI | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Sinapoyl malate | Perovskite | Co(III)P | Au',
-    'SLG | FTO | SnO2-c | TiO2-mp | ZrO2-mp | Perovskite | Carbon',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | Al',
-    'SLG | ITO | CPTA | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | NiO-c | N719 dye | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | SnO2-c | PA-SAM | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuInS2 | ZnS-QDs | Carbon',
-    'SLG | ITO | SnO2-np | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | ZnO-np | Perovskite | Spiro-MeOTAD | Ag',
-    'PET | AZO | Ag | AZO | PEDOT:PSS | Perovskite | PCBM-60 | Au',
-    'SLG | FTO | SnO2-np | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | 3-Ethylthiophene | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-70 | ZrO2 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-CPDT | Au',
-    'SLG | ITO | TiO2-np | PCBM-70 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-c | CuGaO2 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PTAA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | NaYF2@SiO2-np | Perovskite | Carbon',
-    'SLG | FTO | TiO2-c | SnO2-QDs | Perovskite | Spiro-MeOTAD | Au',
-    'Ti | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-c | Perovskite | P3HT | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZrO2-mp | Perovskite | Graphite',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 2-((5-(4-(2-ethylhexyl)-4H-dithieno[3,2-b:2′,3′-d]pyrrol-2-yl) thiophen-2-yl)methylene) malononitrile | Ag',
-    'SLG | ITO | TiO2-np | C-PCBOD | Perovskite | Spiro-MeOTAD | Au',
-    'Epoxy | ITO | ZnO-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | SnO2-c | Ag | SnO2-c | SnO2-c | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | B186 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | KTM3 | Au',
-    'SLG | ITO | PEDOT:PSS | CrO3 | Perovskite | PCBM-60 | Bphen | Ag',
-    'SLG | ITO | P3CT-Na | Perovskite | TPE-DPP16 | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | p-DTS(FBTTh2)2 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | H-Di | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | [BMPA-BTD]3-TPA | Au',
-    'SLG | ITO | TiO2-c | Perovskite | P3HT | MoO3 | Al',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | Cu',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | MoO3 | CuPc | Au',
-    'SLG | FTO | PEDOT:PSS | Perovskte | PCBM-60 | Ag',
-    'SLG | ITO | ZnO-nanoflake | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnS2 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | NiO-c | CuI | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | Graphene; TFSA | Graphene-QDs | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | SnO2-np | Perovskite | BTTI-C12 | Au',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PCBM-60; PCDTBT | Ag',
-    'Au | Ni | Al | Ti | GaN | Perovskite | hexagonal-BN | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-np | OTES:APTES-SAM | Perovskite | PTAA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | M105 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60 | LiF | Au',
-    'SLG | ITO | AZO-c | Perovskite | Ag',
-    'SLG | ITO | P3CT-Na | Perovskite | IDT6CN-TM | C60 | BCP | Ag',
-    'SLG | FTO | NiO | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | NH-2,6 | Au',
-    'Perovskite | C60 | BCP | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Al2O3 | Ethyl acetate; I2; LiI; NMBI; Urea | Pt | FTO',
-    'SLG | FTO | CoOx | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | SP-11 | Au',
-    'SLG | ITO | SFT-TPAM | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | ZnO-c | Al2O3-c | Perovskite | Spiro-MeOTAD | Au',
-    'PET | Ag-grid | PEDOT:PSS | PTAA | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | ZnO-np | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | PDI2 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DDOF | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Graphene oxide; NiO-c | Au',
-    'SLG | ITO | NiO-np | 2,2’-BiPy | Perovskite | PCBM-60 | Zr(acac)4 | Ag | CsF',
-    'PEN | ITO | SnO2-c | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | MoO3 | Au',
-    'SLG | FTO | TiO2-c | Perovskite | NiO | Au',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PCBM-60 | C60 | BCP | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Glycine | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | ZnO-c | Perovskite | PDQT | Au',
-    'A.R.C. | SLG | FTO | TiO2-c | Perovskite | PTAA | Au',
-    'SLG | FTO | TiO2-c | TiO2; CoCr-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-c | Perovskite | Z1 | Au',
-    'SLG | FTO | NiO-np | Perovskite | PCBM-60 | BCP | Au',
-    'SLG | ITO | ZnO-c | PVP | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | FTO | ZnO-c | Perovskite | FDT | Ag',
-    'SLG | ITO | EGO-PPV | PFN-P2 | Perovskite | PCBM-60 | BCP | cu',
-    'SLG | ITO | 3EGO-PPV | PFN-P2 | Perovskite | PCBM-60 | BCP | cu',
-    'SLG | FTO | TiO2-c | Perovskite | DR3TBDTT | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | CuOxNy | Au',
-    'SLG | FTO | NiMgLiO | Perovskite | SnO2-c | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | NiO | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-nw | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | AZO-np | Al | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuFeO2-np | Au',
-    'PDMS | PET | PEDOT:PSS | Perovskite | C60 | BCP | Cu | Parylene-film',
-    'SLG | ITO | Spiro-TTB | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | TiO2-c | PCBM-60 | Perovskite | MeoTPD | MoO3 | Au',
-    'SLG | ITO | V2O5 | P3CT-K | Perovskite | PCBM-60 | ZnO | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | M4; PCBM-60 | Au',
-    'SLG | ITO | C60 | Perovskite | FTA2 | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PhCz-4MeOTPA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | EtheneTTPA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | LHTM-1 | Au',
-    'PET | ITO | TiO2-c | Perovskite | PTAA | Au',
-    'SLG | SnO2-c | SnO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PET-OMeDPA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-c | Perovskite | Ethyl acetate; I2; LiI; NMBI; Urea | Pt | FTO',
-    'SLG | FTO | Zn2SnO4-c | Zn2SnO4-fiber | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | Cu2O | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | CuSCN | Perovskite | C60 | Bphen | Ag',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PCBM-60 | LiF | Al',
-    'SLG | ITO | SnO2 | Perovskite | Spiro-MeOTAD | MoO3 ∣ ITO',
-    'SLG | ITO | NiO-np | M3 | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Bphen | Cs2CO3; MoO3 | Ag',
-    'SLG | ITO | PEDOT:PSS | Au@SiO2-np | Perovskite | PCBM-60 | Rhodamine 101 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Ph-TPA-4A | MoO3 | Ag',
-    'SLG | ITO | PEDOT:PSS | pTPD | Perovskite | PCBB | Ba | Ag',
-    'SLG | ITO | 2F-SAM | PEDOT:PSS | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | PTAA | PFNBr | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | Cu | NiO-c | Perovskite | PCBM-60 | PEIE | Cu',
-    'SLG | FTO | TiO2-c | TiO2-mp | PCBM-60; PMMA | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PTAA | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | PTAA | Perovskite | Choline chloride | C60 | BCP | Cu',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60 | Zr(acac)4 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | ICBA | bis-C60 | Ag',
-    'SLG | FTO | Perovskite | PCBM-60 | C60 | BCP | Cu | Au | BCP',
-    'SLG | FTO | TiO2-c | Perovskite | CGS | Au',
-    'SLG | ITO | PTAA | TFPPy-ETTA | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | Al-np; PEDOT:PSS | Perovskite | PCBM-60 | PFN | Al',
-    'SLG | FTO | NiO-c | NiO-mp | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | Perovskite | Ag',
-    'Textile | PEN | ITO | Au | Spiro-MeOTAD | Perovskite | SnO2-c | ITO | PEN',
-    'SLG | ITO | SnO2-np | ImAcHcl | Perovskite | PTAA | Au',
-    'SLG | FTO | SnO2-c | C60-SAM | Perovskite | PMMA | DTPC13-ThTPA | Au',
-    'SLG | CuS | Perovskite | PCBM-60 | Rhodamine 101 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ZnChl-4 | Ag',
-    'SLG | PEDOT:PSS | Perovskite | PCBM-60 | Ag',
-    'PET | ITO | SnO2-np | SnO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-c | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Adamantane | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | Ca | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Th-PDI | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | HTM4 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | SnO2-c | Perovskite | V1021 | Ag',
-    'SLG | ITO | CoOx | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | Au@TiO2-nw; TiO2-np | Perovskte | Spiro-MeOTAD | Au',
-    'SLG | FTO | NDI; SnO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZrO2@TiO2-mp | Perovskite | Carbon',
-    'SLG | ITO | NiO-c | Perovskite | PCBM-60 | ZnO | IZTO',
-    'SLG | FTO | SnO2-c | PCBM-60 | Perovskite | IDT-TPA | Au',
-    'SLG | ITO | SnO2-np | Perovskite | Spiro-MeOTAD | MoO3 | Ag | WO3',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P3HT | Carbon',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-70 | Fe2O3 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DIPO-Ph4 | Au',
-    'SLG | FTO | SnO2-np; TiO2-np; MXene | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-c | PCBM-60 | Perovskite | M111 | Au',
-    'SLG | SnO2 | SiO2 | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-c | Perovskite | C60 | BCP | Cu',
-    'SLG | ITO | PEDOT:PSS | Perovskite | Fullerene-2c | Ag',
-    'SLG | FTO | PCBCB | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | CuCrO2 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | NiO-c | Perovskite | FA-PDI2 | TiO2-c | Ag',
-    'SLG | ITO | NiO | Perovskite | Nb2O5 | Ag',
-    'SLG | ITO | FB-OMeTPA | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | MoS2 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ZnChl-1 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Azu-Oct | Au',
-    'SLG | FTO | ZnO-np | Perovskite | P3TAA-co-P3HT | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Ph-TPA-2A | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | KR373 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PCPDTBT | Au',
-    'SLG | ITO | TiO2-c | Perovskite | P3OT | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | CdSe-QDs | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ZnPc-flu-ZnPc | Au',
-    'SLG | ITO | SnO2-c | C60 | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | EH44 | MoOx | Al',
-    'SLG | FTO | TiO2-c | TiO2-nw | TiO2-np | Perovskite | Spiro-MeOTAD | Ag',
-    'Ag-np | SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | LiF | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Graphite | FTO | SLG',
-    'SLG | ITO | C60 | Perovskite | P3HT | MoO3 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCTDI | Cr | Au',
-    'SLG | FTO | SnO2-np | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | YN2 | Cu',
-    'SLG | ITO | PEDOT:PSS | P3HT | Perovskite | PCBM-60 | LiF | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Cu',
-    'SLG | ITO | NiO-c | 1ab | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | Mg0.1Zn0.9O-np | Perovskite | P3HT | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | HMPDI | Au',
-    'SLG | ITO | TaTm | Perovskite | C60 | C60; Phlm | Ag',
-    'SLG | ITO | CA-Br; TPA-PT-C6 | Perovskite | Polyimid | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon | PANI | FTO | SLG',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PEH-1 | Au',
-    'SLG | ITO | ZnO-c | ZnO-nw | CdS-QDs | Perovskite | MEH-PPV | PEDOT:PSS | Au',
-    'SLG | ITO | CuI | PEDOT:PSS | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | FTO | PEDOT:PSS | Perovskite | Me4NBr | PCBM-60 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | BAFB | ZnO-np | Ag',
-    'SLG | In2O3:H | PTAA | Perovskite | PCBM-60 | ZnO-np | AZO-c | Ni | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PTB7-TH | Ag',
-    'SLG | FTO | SnO2-np | Perovskite | CZTS | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | apv-EC | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 3,6Cz-TPA | Au',
-    'SLG | ITO | C60 | Perovskite | IDF-SFXPh | MoO3 | Ag',
-    'SLG | FTO | SnO2-QDs | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'PET | ITO | PTAA | Perovskite | Plastic foam | C60 | BCP | Al',
-    'Unknown',
-    'PEN | ITO | SnO2-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PDI-EH | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | ZnO-np | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | ZnS | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | DPA-ANR-DPA | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | Bphen | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | MoO3 | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BF003 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CT1 | MoO3 | Ag',
-    'PET | ITO | TiO2-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | C-PDTON | ZnO | Perovskite | Spiro-MeOTAD | Ag',
-    'PEN | ITO | SnO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60 | bis‐C60 | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | NH2-POSS | Spiro-MeOTAD | Au',
-    'SLG | FTO | ZnO-c | PEI | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DBC-OMeDPA | Au',
-    'SLG | FTO | SnO2-c | C60-SAM | Perovskite | PMMA | DTPC8-ThTPA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | tert-CuBuPc | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | CdSe | LiF | Au | Ag',
-    'SLG | ITO | Au-np; TiO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'PET | ITO | PTAA | Perovskite | PCBM-60 | C60 | BCP | Al',
-    'SLG | ITO | Graphne oxide | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | TaTm | Perovskite | PCBM-60 | AZO-np | Au',
-    'SLG | ITO | NiO-c | Perovskite | C60 | SnS | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | CuSCN | Carbon',
-    'SLG | FTO | TiO2-c | Perovskite | SWCNTs',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TQ2 | Au',
-    'SLG | FTO | TiO2-c | C60-BCT | Perovskite | PTAA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | SnO2-c | Perovskite | V1000 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | 4-Aminobutyric acid | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PTAA | MoO3 | ITO | MgF2',
-    'SLG | FTO | PEDOT:PSS | Perovskite | F8TBT | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SiO2 | MWCNTs',
-    'SLG | ITO | TPL | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | ZnO | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | Al2O3-c | TiO2-mp | Perovskite | PTAA | Au',
-    'SLG | ZnO | ITO | Ag-nw | ITO | ZnO-c | Al2O3-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PARA1 | Au',
-    'SLG | ITO | CuOx | Perovskite | C60 | BCP | Al',
-    'SLG | FTO | SnO2-c | PCBM-60 | Perovskite | CuPc | Au',
-    'SLG | FTO | CoCuO | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SDTFCz2 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | C60-SAM | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | C101 | Au',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PCBM-60 | TiO2-c | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Ag-nw',
-    'SLG | ITO | PTAA | Perovskite | C60 | ZnSe | Ag',
-    'SLG | ITO | NiO-c | Perovskite | C60 | SnO2-c | ITO | Cu',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | FeS2 | Au',
-    'SLG | ITO | TiO2-c | Perovskite | TaTm | F6-TCNNQ; TaTm | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Graphene-QDs | Perovskite | CISZ-QDs | Carbon',
-    'SLG | ITO | Trux-OMeTAD | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | ITO | PTAA | Perovskite | C60MC12 | AZO-np | Ag',
-    'SLG | FTO | TiO2 | Perovskite | MEH-PPV | Carbon',
-    'SLG | FTO | ZnO-nw | ZnO-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Aniline | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | MgO | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | NiMgLiO | Perovskite | ZnO-c | Ag',
-    'SLG | ITO | TiO2-c | C60 | Perovskite | P3HT | MoO3 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | TPPI | Al',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | MWCNTs; Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO | Perovskite | C60 | Zr(AcAc) | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Bphen | Cs2CO3 | Ag',
-    'Willow glass | ITO | PTAA | Perovskite | C60 | BCP | Cu',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TB4-ZnPc | Au',
-    'SLG | ITO | NPB | Perovskite | C60 | BCP | Al',
-    'Polyimide | In2O3:H | PTAA | Perovskite | PCBM-60 | ZnO-np | AZO | Ni | Al',
-    'SLG | ITO | Fullerene-SAM | Perovskite | P3HT | Carbon',
-    'SLG | ITO | PEDOT:PSS | PolyTPD | Perovskite | C60 | Ba | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD; X60 | Au',
-    'PEN | Ag-nw | PEDOT:PSS | Perovskite | PCBM-60 | C60 | BCP | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Au',
-    'SLG | ITO | C60 | Perovskite | SWCNTs | Spiro-MeOTAD',
-    'SLG | FTO | NiO-c | Al2O3-mp; Au@SnO2-np | Perovskite | PCBM-60 | BCP | Au',
-    'SLG | FTO | TiO2-c | Perovskite | PTB7:Th | Au',
-    'SLG | ITO | Ag-np; PEDOT:PSS | Perovskite | PCBM-60 | PFN | Al',
-    'Eu(TTA)2(Phen)MAA | SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | ZnO-c | ZnOS | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | C60-N | Ag',
-    "SLG | FTO | TiO2-c | TiO2-mp | Perovskite | (2Z,2'Z)-2,2'-(((2,4-dimethylphenyl) azanediyl) bis([1,1'-biphenyl]-4',4-diyl)) bis(3-(4-(diphenylamino) phenyl) acrylonitrile | Au",
-    'SLG | FTO | TiO2-c | TiO2-mp | beta-alanine | Perovskite | Spiro-MeOTAD | Au',
-    'PEN | ITO | SnO2-c | Perovskite | PTAA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CsPbI3-np | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Ti3C2',
-    'Ti | TiO2-np | Perovskite | PEDOT | ITO | PEN',
-    'PET | PEDOT:PSS | Perovskite | PCTDI | Cr | Cu',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ZPPHT | Carbon',
-    'SLG | ITO | MoOx | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60 | AZO-np | ITO',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PTB7 | Ag',
-    "SLG | FTO | TiO2-c | Perovskite | 5,5',5''-(5,5',5''-(nitrilotris(benzene-4,1-diyl))tris(furan-5,2-diyl))tris(2-octylisoindoline-1,3-dione) | MoOx | Ag",
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CdSe-QDs | Spiro-MeOTAD | Au',
-    'Willow glass | ITO | ZnO-c | Perovskite | Spiro-MeOTAD | Au | PDMS Nanocone',
-    'SLG | FTO | SnO2-c | 3-(1-pyridinio)-1-propanesulfonate | Perovskite | asy-PBTBDT | Au',
-    'SLG | ITO | SnS2 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Li-TFSI; TBPAu',
-    'SLG | FTO | PEDOT:PSS | Perovskite | Me4NI | PCBM-60 | BCP | Ag',
-    'SLG | ITO | PEIE | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | Fullerenol | Perovskite | P3HT | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Carbon | Carbon-fiber',
-    'PES | AZO | CuNW | AZO | SnO2-np | Perovskite | P3HT; Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Cs2CO3 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-c | Perovskite | Spiro-MeOTAD | Cu',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | X60(TFSI)2 | Au',
-    'SLG | FTO | CuO | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | PFO | Al2O3-np | Perovskite | PCBM-60 | BCP | Ag',
-    'Y2O3:Eu3 | SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-nanosphere | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | C60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | ZrO2-mp | Perovskite | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P3HT-MoS2 | Au',
-    'SLG | FTO | TiO2-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | TiO2-c | Perovskite | Al2O3-c | PEDOT:PSS | Au',
-    'SLG | ITO | PEIE | NDI-H | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PTAA | PFN-P2 | Perovskite | C60 | LiF | BCP | Cu',
-    'SLG | ITO | ZnO-c | WPF-6-oxy-F | Perovskite | pDPA-DBTP | Au',
-    'SLG | FTO | SnO2-c | SnO2-nw | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | Ag-nw; TiO2-np | Perovskite | Spiro-MeOTAD | Ag',
-    'PET | Graphene | PTAA | PEDOT:PSS | Perovskite | ZnO-np | Graphene | PET',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PEIE | Ag',
-    'SLG | ITO | PEDOT:PSS | Si-np | Perovsksite | PCBM-60 | Al',
-    'SLG | PEDOT:PSS | PEI | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | NiO-c | Perovskite | Graphitic carbon nitride | PCBM-60; Graphene | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | BCP; PCBM-60 | Ag',
-    'SLG | ITO | ZnO-np | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | NbOx | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | C60-SAM | SnO2-c | PCBM-60 | Perovskite | P3HT | WOx | Au',
-    'SLG | ITO | TiO2 | Perovskite | Spiro-MeOTAD | Ag',
-    'PET | ITO | PEDOT:PSS | Perovskite | F8BT | Al',
-    'SLG | FTO | TiO2-c | KH570 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-np | Perovskite | C60 | Bphen | Ag',
-    'SLG | ITO | NiO-c | Perovskite | PEAI | PCBM-60 | BCP | SnO2-c | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | S,N-heteropentacene | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | MEH-PPV | Au',
-    'SLG | FTO | TiO2-c | Perovskite | BTT(DPP)3-EH | Au',
-    'SLG | FTO | CrOx | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TPD | HAT-CN | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CsPbBr3-np | Carbon',
-    'SLG | FTO | ZnO-c | PCBM-60 | Perovskite | PTAA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BDT-2D | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | LCS01 | Au',
-    'SLG | FTO | SnO2-c | Perovskite | Spiro-MeOTAD | PDPP4T | Au',
-    'PET | ITO | SnO2-c | SnO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | AZO | Ba(OH)2 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS｜Perovskite | PCBM-60 | C60 | BCP | Al',
-    'SLG | ITO | CuI | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | BTF2 | Perovskite | PCBM-60 | LiF | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | 3-Methylthiophene | Spiro-MeOTAD | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | BPTI | PDI-C4 | BCP | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | FT37 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PO-Spiro | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P(BDTT-SePPD) | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | (BMPA-EDOT)3-TPA | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SGT-420 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | G1 | Au',
-    'SLG | FGZO | SnO2 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | MoO3 | TPA-2,7-FLTPA-TPA | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | V1225 | Au',
-    'SLG | FTO | SnO2-c | APTES-SAM | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-nw | Perovskite | Carbon',
-    'PEN | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | PCBA | Perovskite | P3 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PCBM-60 | Ag',
-    'SLG | ITO | PEDOT:PSS | pTPD | Perovskite | PCBH | Ba | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60 | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TBC-1 | Au',
-    'SLG | FTO | TiO2-c | CoCr | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | C60 | Al2O3-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | MoOx | TaTm | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | SnO2-c | PMMA | Perovskite | PMMA | Spiro-MeOTAD | Au',
-    'PET | ITO | c-TCTA | Perovskite | c-HATNA | bis-C60 | Ag',
-    'Nb:SrTiO3 | Perovskite | ITO',
-    'SLG | ITO | TiO2-c | TiO2-mp | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | ZnO-c | ZnOS | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | NiO-nanowalls | Diethanolamine | Perovskite | PCBM-60 | Zr(acac)4 | Ag',
-    'SLG | ITO | TiO2-c | Perovskite | rGO-4FPH | Spiro-MeOTAD | Au',
-    'SLG | FTO | PEDOT:PSS｜Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | Spiro-MeOTAD:P3HT | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | bis-PCBOE | ZnO | Al',
-    'SLG | FTO | CdSe | PCBM-60 | Perovskite | CuPc | Carbon',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | LiF | Al',
-    'SLG | ITO | TiO2-c | PCBM-60 | Perovskite | Spiro-MeOTAD | MoO3 | Au',
-    'SLG | FTO | SnO2-np | Perovskite | Cz-OMeTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | X21 | Au',
-    'SLG | ITO | PCP-Na | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | B-MWCNTs',
-    'SLG | ITO | XSln847 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | TiO2-c | Perovskite | HB-Cz | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Candle soot | FTO',
-    'SLG | Ag | PCBM-60 | Perovskite | PTAA | Ag',
-    'SLG | ITO | NiO-c | Perovskite | C60 | SnO2-c | ITO',
-    'SLG | ITO | PII2T8TSi | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | PTAA | Perovskite | CdI2 | C60 | BCP | Cu',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Pt-sheet',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60 | Au',
-    'SLG | FTO | Li4SiW12O40 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CsPbI3-QD | Spiro-MeOTAD | Au',
-    'SLG | ITO | C60 | Perovskite | FBA3 | MoO3 | Ag',
-    'SLG | ITO | TiO2-np | C70 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SM | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | S,N-heteropentacene based HTM 1 | Au',
-    'SLG | ITO | Spiro-s | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 2FBTA-1 | Au',
-    'SLG | FTO | SnO2-c | Perovskite | N-CuMe2Pc; P3HT | Au',
-    'SLG | FTO | TiO2-c | PCBSD | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PTAA | Perovskite | PCBM-60; Sb-Carbon-nw | BCP | Au',
-    'PET | ITO | PEDOT:PSS | Perovskite | P(NDI2DT-TTCN) | BCP | Au',
-    'SLG | FTO | TiO2-c | Al2O3-c | Perovskite | PTAA | Au',
-    'SLG | ITO | NiO-c | Mercaptoethylamine chlorate | Perovskite | PCBM-60 | Bphen | Al',
-    'SLG | ITO | ZnO-c | TiO2-c | PCBM-60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | TiO2-c | Perovskite | C202 | Ag',
-    'SLG | ITO | IDTT2FPDI | Perovskite | PTAA | Ag',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PT-PDI | Al',
-    'SLG | ITO | Z10 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Ag | PMMA | Teflon',
-    'PET | IZO | PTAA | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Z25 | Au',
-    'SLG | ZnO | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | PEDOT:PSS | Perovskite | Cytop | PCBM-60 | BCP | Ag',
-    'SLG | ITO | SnO2-c | Perovskite | Carbon-nt | Spiro-MeOTAD | Ag',
-    'Polyester-satin textile | Polyurethane | Carbon-nt; PEDOT:PSS | PEDOT:PSS | Perovskite | PCBM-60 | Ag',
-    'SLG | ITO | CONs | PEDOT:PSS | Perovskite | PCBM-60 | TiO2 | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60; PCBM-60 | Zr(acac)4 | Ag',
-    'PET | FTO | NiO-np | Perovskite | C60 | bis-C60 | Ag',
-    'SLG | ITO | MSAPBS | Perovskite | Spiro-MeOTAD | Au | Ag',
-    'SLG | ITO | XSln1453 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | PSS-Na | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | JK-217D | Ag',
-    'SLG | FTO | PEDOT:PSS | PTAA | Perovskite | Me4NBr | PCBM-60 | BCP | Ag',
-    'SLG | ITO | SnO2-np | Perovskite | PEDOT:PSS | MoO3 | Ag',
-    'SLG | FTO | Fe2O3 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60 | BCP | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | C60 | TmPyPB | Ag',
-    'SLG | IWO | SnO2-c | KCl | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | PCBA | Perovskite | P2 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon black; MWCNTs',
-    'PET | ITO | PEDOT:PSS | Perovskite | PCBM-60 | TiO2 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | H16 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | P:OO | Au',
-    'SLG | ITO | SnO2-np | Perovskite | TCPBr | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BTPA-6 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PTB-DCB21 | Au',
-    'PET | ITO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | NiO-c | Perovskite | ZnO | C60 | Au',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | Ag-nw | C60',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | MoS2 | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | KR353 | Au',
-    'SLG | FTO | SnO2-c | Perovskite | 1‐adamantylamine hydrochloride | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | SnO2 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Zn2SnO4-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | TiO2-c | Perovskite | DOR3T-TBDT; PCBM-70 | MoO3 | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | Carbon',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CZTS0.5Se0.5; rGO | Au',
-    'SLG | FTO | TiO2-nw | N719 | Perovskite | Pt-np | Au',
-    'SLG | FTO | TiO2-c | Perovskite | NiCoO | Al | Al203',
-    'SLG | ITO | MeO-PPV | Perovskite | PCBM-60 | BCP | cu',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | bis‐C60 | Ag',
-    'SLG | FTO | Au-nw | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | PEDOT:PSS | Graphene | PMMA | PDMS',
-    'SLG | ITO | SnO2-c | NiCl2 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | CsAc | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TTB2 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | (2Z,2′Z)-3,3′-(5,5′-(2,7-dioctyl-1,3,6,8-tetraoxo-1,2,3,6,7,8-hexahydrobenzo[lmn][3,8] phenanthroline-4,9-diyl)bis(thiophene-5,2-diyl))bis(2-(3,5-bis (trifluoroomethyl)phenyl) acrylonitrile) | Ag',
-    'SLG | FTO | SnO2-np | Perovskite | CsPbBr3-np | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-c | Perovskite | H6Bu-ZnPc | Ag',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PCBM-60 | C60 | Ag',
-    'SLG | ITO | MEH-PPV-20 | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | COPV6 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | HTM3 | Au',
-    'SLG | ITO | ZnO-c | SnO2-np | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | PTAA | Perovskite | C60 | Ag',
-    'SLG | ITO | PEDOT | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Metal',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PTEG | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Rhodamine 101 | Ag',
-    'SLG | FTO | ZnO-np | Perovskite | P3HT | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | LiF | Au',
-    'SLG | FTO | TiO2-mp | Perovskite | Carbon | FTO | SLG',
-    'SLG | FTO | PEDOT:PSS | Perovskite | 2-HI-PVK | PCBM-60 | BCP | Ag',
-    'SLG | ITO | f-C60 | Perovskite | P3HT | MoO3 | Ag',
-    'SLG | ITO | SnO2-c | Perovskite | CZTPA-2 | MoO3 | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | BCP; TZ-3 | Ag',
-    'SLG | FTO | ZnO | Au-nw | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | SnO2-c | SnO2-c | Perovskite | V1102 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | PEDOT:PSS | FTO | SLG',
-    'SLG | ITO | ZnO-np | Perovskite | PbS-QDs | MoO3 | Au | Ag',
-    'SLG | FTO | ZnO@SnO2-np | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | ITO | PEDOT:PSS | VB-MeO-FDPA | Perovskite | PCBM-60 | PEI | Ag',
-    'SLG | ITO | P3CT-Na | Perovskite | TPE-PDI4 | Rhodamine 101 | LiF | Ag',
-    'SLG | ITO | ZnLiO | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | C60-BCT-Au-NP | Perovskite | PTAA | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | apv-T | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | HS-Ph-OCH3 | Spiro-MeOTAD | Au',
-    'PEN | ITO | MC8-9-NPC | Perovskite | PCBM-60 | LiF | Al',
-    'SLG | FTO | TiO2-c | Perovskite | 2mF-X59 | Au',
-    'SLG | ITO | ZnO-c | PO-TAZ | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | NiO-c | Al2O3-mp | Perovskite | PCBM-60 | Rhodamine 101 | Au | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PEH-2 | Au',
-    'PET | ITO | ZnO-c | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | TS-CuPc | MoO3 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | QCAPZ | LiF | Al',
-    'SLG | FTO | PEDOT:PSS | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-mp | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | CZTS | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | Perovskite | Spiro-MeOTAD | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | Graphite',
-    'SLG | ITO | NiO-c | DEA | Perovskite | C60 | PN4N | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Q222 | Au',
-    'SLG | ITO | SnO2-np | Perovsite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | CuSCN | Perovskite | PCBM-60 | AZO-np | Ag',
-    'SLG | ITO | VB-DAAF | Perovskite | C60 | BCP | Al',
-    'SLG | FTO | PolyTPD | Perovskite | C60 | BCP | Ag',
-    'SLG | FTO | NiO-c | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | Sr2CeO4:Eu | Perovskite | Spiro-MeOTAD | Au',
-    'PET | Ag-nw | FZO | TiO2-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon | Silica-gel-electrolyte | Carbon',
-    'SLG | FTO | NiO-c | Perovskite | PPA | PCBM-60 | BCP | Ag',
-    'SLG | ITO | PTB7 | Perovskite | PCBM-60 | PEI | Ag',
-    'PET | Graphene | PEDOT:PSS | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | Au-np | NiO-c | Perovskite | PCBM-60 | PEI | Ag',
-    'SLG | ITO | TaTm | Perovskite | C60 | Ag',
-    'SLG | ITO | SnO2-np | ZnO-c | Perovskite | PTAA | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DM1 | Au',
-    'PDMS | Graphene | PEDOT:PSS | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TPA-QA-TPA | Ag',
-    'PET | Ag-mesh:PH1000 | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | SnO2 | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | ITO | SnO2 | Perovskite | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 3,8,13-tris[2,2-bis(4-methoxyphenyl)ethenyl]-5,10,15-triethyl-10,15-dihydro-5H-indolo-[3,2-a:3′,2′-c]carbazole | Au',
-    'SLG | ITO | DH-MeO-FDPA | Perovskite | PCBM-60 | PEI | Ag',
-    'Ti | TiO2-nt | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | MSA-PEDOT:PSS | PEDOT:PSS | Perovskite | PCBM-60 | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | CuSCN | Graphite | Cu-tape',
-    'SLG | FTO | TiO2-c | Si-nw | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | NiO-c | Perovskite | TPA-3CN | BCP | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PS | C60 | BCP | Ag',
-    'SLG | ITO | TiO2-c | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | ITO | PEIE | SnO2-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | Cu-BHT | PEDOT:PSS | Perovskite | PCBM-60 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Tetracene | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | PEDOT:PSS',
-    'SLG | FTO | TiO2-c | TiO2-mp | PCBM-60 | Perovskite | Spiro-MeOTAD | ITO | Au',
-    'SLG | FTO | NiMgLiO | Perovskite | 4-DMABA | PCBM-60 | BCP | Ag',
-    'SLG | ITO | NiO-c | Perovskite | PN-F50 | Ag',
-    'PEG | ITO | PEDOT:PSS | Perovskite | bis-C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | DMFA-TPA | Au',
-    'SLG | ITO | Graphene oxide | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | NaYF4:Yb:Tm-np | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | Rhodamine 101 | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PFN-P2 | Ag',
-    'SLG | ITO | PBT | Perovskite | C60 | BCP | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | tris-PCBOE | ZnO | Al',
-    'SLG | ITO | C60-SAM | Perovskite | PDCBT | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PTPD2 | Au',
-    'SLG | FTO | SnO2-c | Perovskite | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | CdSe-QDs; PCBM-60 | Rhodamine 101 | LiF | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PEH-9 | Au',
-    'SLG | FTO | ZnO-c | TiO2-mp | Perovskite | 18-crown-6 ether | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PEO; KI; I2 | Pt | FTO | SLG',
-    'SLG | ITO | NiO-np | Perovskite | PCBM-60 | ZnO | Ag',
-    'SLG | FTO | ZnO-c | ZnO-nw | TiO2-c | Perovskite | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | DTAB | Ag',
-    'PET | ITO | C60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | P3CT-Na | Perovskite | NDP-V | C60 | BCP | Ag',
-    'SLG | FTO | SnO2-c | Perovskite | Spiro-MeOTAD | Rubrene | Au',
-    'SLG | ITO | PEDOT:PSS | Perovskite | Ti | Au',
-    'SLG | ITO | NiO-np | Perovskite | C60; PCBM-60 | bis-C60 | Ag',
-    'SLG | FTO | ZnO-c | ZnO-nw | Perovskite | NiO | Au',
-    'PEN | ITO | PEDOT:PSS | Perovskite | PCBM-60 | PEI | Ag',
-    'SLG | FTO | Graphene oxide | Perovskite | TiO2-c | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Spiro-MeOTAD | PEDOT:PSS | Ag-nw | PDMS',
-    'SLG | ITO | SnO2-c | CBA-SAM | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-np | PCBM-60 | Perovskite | BTPA | MoO3 | Au',
-    'SLG | ITO | PEDOT:PSS | PFI | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | SWCNTs | PMMA',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | KM05 | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | 2D-PT | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | CuBuPc | Au',
-    'SLG | FTO | Poly-EDOT-C60 | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | SrGO | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | ITO | PEIE | CDIN | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-nw | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'Moth eye PDMS | SLG | ITO | PTAA | Perovskite | C60 | BCP | Cu',
-    'SLG | ITO | PEDOT:PSS | Perovskite | Br-PDI | ZnO-np | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | 4b | Au',
-    'SLG | ITO | TiO2-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | NDI-PhE | Al',
-    'SLG | ITO | PVBT-SO3 | Perovskite | PCBM-60 | C60/C70-N | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | (OctPhO)8CuPc | Au',
-    'SLG | SWCNTs | MoO3 | PEDOT:PSS | Perovskite | C60 | BCP | LiF | Al',
-    'SLG | ITO | PEDOT:PSS | PolyTPD | Perovskite | Au',
-    'SLG | ITO | VB-Me-FDPA | Perovskite | PCBM-60 | PEI | Ag',
-    'SLG | ITO | MoO3 | Perovskite | C60 | BCP | Al',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | bis-C70 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TDAC | Au',
-    'SLG | ITO | C60; Phlm | C60 | Perovskite | TaTm | F6-TCNNQ; TaTm | Au',
-    'SLG | ITO | NiO-c | SY3 | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SGT-409 | Au',
-    'SLG | ITO | Si-OMeTPA | Perovskite | PCBM-60 | Al',
-    'SLG | ITO | ZnO-c | WPF‐6‐oxy‐F | Perovskite | mDPA-DBTP | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | X51 | Ag',
-    'SLG | ITO | SnO2-np | C60 | Perovskite | BTF2 | Au',
-    'PET | TCE | ZnO-c | Perovskite | P3HT | Ag',
-    'SLG | ITO | CuO | Perovskite | PCBM-60 | ZnO-np | Al',
-    'SLG | ITO | WO3-nw@PEDOT | PEDOT:PSS | Perovskite | PCBM-60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | ZnPy | Au',
-    'SLG | ITO | Perovskite | PCBM-60 | C60 | BCP | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | PBDTTT-C | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | HTM2 | Au',
-    'SLG | ITO | NiO-c | PEDOT:PSS | Perovskite | PCBM-60 | bis-C60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon | CsAc',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TPBS | Au',
-    'PEN | ITO | PhNa-1T | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | HPDI | Au',
-    'SLG | FTO | C60 | [EMIM]PF6-IL | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | SnO2-c | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | Perovskite | CuSCN | Graphene | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Ph-TPM | Au',
-    'SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | FTO | SnO2-np | Sinapoyl malate | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | ZnO-c | TiO2-c | Perovskite | Spiro-MeOTAD | MoO3 | Al',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | BTPA-3 | Au',
-    'SLG | FTO | PEI | PCBM-60 | Perovskite | PTAA｜Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Carbon-QDs | Spiro-MeOTAD | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | S7 | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | TPD-4MeOTPA | Au',
-    'SLG | ITO | ZnO-c | Perovskite | PZn-TPA-O | Au',
-    'SLG | ITO | PFN | PCBM-60 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | PolyTPD | PFN | Perovskite | LiF | C60 | SnO2-c | ZTO | Au',
-    'Mn:CsPbCl3-QDs | SLG | FTO | TiO2-c | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Al2O3-mp | Perovskite | Carbon; WO2-np',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SO7 | Au',
-    'SLG | ITO | PbS-QDs | Perovskite | PCBM-60 | Al',
-    'PEN | ITO | SnO2 | Perovskite | Spiro-MeOTAD | Au',
-    'SLG | ITO | SnO2-c | Perovskite | HPB-OMe | Au',
-    'SLG | ITO | ZnO-c | PCBM-60 | Perovskite | Spiro-MeOTAD | MoO3 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | SWCNTs | Graphene oxide | Au',
-    'SLG | ITO | SnO2-np | C60 | Perovskite | BTF3 | Au',
-    'SLG | FTO | TiO2-c | Au@TiO2-np; TiO2-mp | Perovskite | Spiro-MeOTAD | Ag',
-    'SLG | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Cs2CO3 | Ag',
-    'SLG | ITO | CuI-np | Perovskite | C60 | BCP | Ag',
-    'PEN | ITO | PEDOT:PSS | Perovskite | PCBM-60 | Ag',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Q205 | Carbon',
-    'SLG | ITO | SnO2-c | Perovskite | Carbon-nt | Spiro-MeOTAD | Au',
-    'SLG | FTO | TiO2-c | TiO2-mp | Perovskite | Z1013 | Au',
-]
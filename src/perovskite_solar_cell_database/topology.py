@@ -0,0 +1,99 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Cache of topology system templates.
+
+The same ions and compositions recur in thousands of entries. Their `System`
+sections, including the information that `add_system_info` derives from the atoms,
+are built once per process and copied into each entry. Copies still need to be added
+to the topology of the entry with `add_system`.
+
+Most ions are single atoms. Their `Atoms` sections are created once per element by
+`structure_atoms`.
+"""
+
+from collections.abc import Callable, Hashable
+from functools import lru_cache
+
+from ase import Atoms
+from nomad.datamodel.results import System
+from nomad.normalizing.common import nomad_atoms_from_ase_atoms
+from nomad.normalizing.topology import add_system_info
+
+from perovskite_solar_cell_database.cache import LRUCache
+
+TOPOLOGY_CACHE_SIZE = 1024
+
+_system_cache = LRUCache(maxsize=TOPOLOGY_CACHE_SIZE)
+
+
+def cached_topology_system(
+    key: Hashable,
+    build: Callable[[], System],
+    keep: Callable[[System], bool] | None = None,
+) -> System:
+    """
+    Returns a copy of the topology system template of a key. On a miss the template
+    is created with `build` and completed with `add_system_info`.
+
+    Args:
+        key (Hashable): The key of the template, it has to determine everything
+            `build` uses.
+        build (Callable[[], System]): Creates the system without ids.
+        keep (Callable[[System], bool]): Whether a new template is cached, e.g. not
+            if no structure could be generated in time. All are cached by default.
+
+    Returns:
+        System: A deep copy of the template that can be modified and added to a
+        topology.
+    """
+    template = _system_cache.get(key)
+    if template is None:
+        template = build()
+        add_system_info(template, {})
+        if keep is None or keep(template):
+            _system_cache.set(key, template)
+    return template.m_copy(deep=True)
+
+
+@lru_cache(maxsize=128)
+def _single_atom_atoms(atomic_number: int):
+    return nomad_atoms_from_ase_atoms(
+        Atoms(numbers=[atomic_number], positions=[[0.0, 0.0, 0.0]])
+    )
+
+
+def structure_atoms(ase_atoms: Atoms | None):
+    """
+    Returns the `Atoms` section of a structure like `nomad_atoms_from_ase_atoms`.
+    A single atom at the origin, as returned for monatomic ions by
+    `optimize_molecules`, is copied from a template of its element.
+    """
+    if (
+        ase_atoms is not None
+        and len(ase_atoms) == 1
+        and not ase_atoms.positions.any()
+        and not ase_atoms.cell.any()
+        and not ase_atoms.pbc.any()
+    ):
+        return _single_atom_atoms(int(ase_atoms.numbers[0])).m_copy(deep=True)
+    return nomad_atoms_from_ase_atoms(ase_atoms)
+
+
+def clear_topology_cache() -> None:
+    _system_cache.clear()
@@ -0,0 +1,140 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Eager loading of the state that the first processed entry would otherwise pay for.
+
+`warmup` imports the heavy dependencies and schema modules, loads the ion tables,
+the structure library and the synonym map, and opens the persistent caches. It is
+called by the entry points if `warmup: true` is configured for the
+`perovskite_solar_cell` entry point, and can be called from any worker start hook:
+
+    from perovskite_solar_cell_database.warmup import warmup
+
+    warmup()
+"""
+
+import importlib
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from structlog.stdlib import BoundLogger
+
+_done: set[str] = set()
+_lock = threading.Lock()
+
+
+def _import(*modules: str) -> Callable[[], None]:
+    def run():
+        for module in modules:
+            importlib.import_module(module)
+
+    return run
+
+
+def _load_ion_tables() -> None:
+    from perovskite_solar_cell_database.schema_sections.ions.ion import (
+        get_ion_catalog,
+    )
+
+    get_ion_catalog().warmup()
+
+
+def _load_structure_library() -> None:
+    from perovskite_solar_cell_database.conformers import _structure_library
+
+    len(_structure_library)
+
+
+def _load_formula_normalizer() -> None:
+    from perovskite_solar_cell_database.schema_sections.formula_normalizer import (
+        PerovskiteFormulaNormalizer,
+    )
+
+    PerovskiteFormulaNormalizer('MAPbI3').clean_formula()
+
+
+def _open_caches() -> None:
+    from perovskite_solar_cell_database import conformers, crossref, pubchem
+
+    for module in (conformers, crossref, pubchem):
+        module._disk_cache.open()
+
+
+# the steps of `warmup` in the order they are run
+WARMUP_STEPS: dict[str, Callable[[], None]] = {
+    'rdkit': _import('rdkit.Chem', 'rdkit.Chem.AllChem'),
+    'plotly': _import('plotly.graph_objects', 'plotly.express'),
+    'schema': _import(
+        'perovskite_solar_cell_database.schema',
+        'perovskite_solar_cell_database.composition',
+        'perovskite_solar_cell_database.schema_packages.tandem.schema',
+    ),
+    'synonym_map': _import('perovskite_solar_cell_database.llm_extraction_schema'),
+    'ion_tables': _load_ion_tables,
+    'structure_library': _load_structure_library,
+    'formula_normalizer': _load_formula_normalizer,
+    'caches': _open_caches,
+}
+
+
+def warmup(
+    steps: Iterable[str] | None = None, logger: 'BoundLogger' = None
+) -> dict[str, float]:
+    """
+    Runs the warmup steps that did not run in this process yet. A failing step is
+    logged and skipped, the state is then loaded on first use as before.
+
+    Args:
+        steps (Iterable[str]): The names of the steps in `WARMUP_STEPS`, all by
+            default.
+        logger (BoundLogger): A structlog logger.
+
+    Returns:
+        dict[str, float]: The duration of each step that ran in seconds.
+    """
+    if logger is None:
+        from nomad import utils
+
+        logger = utils.get_logger(__name__)
+    steps = list(WARMUP_STEPS) if steps is None else list(steps)
+    for step in steps:
+        if step not in WARMUP_STEPS:
+            raise ValueError(f'Unknown warmup step {step}.')
+
+    durations = {}
+    with _lock:
+        for step in steps:
+            if step in _done:
+                continue
+            start = time.perf_counter()
+            try:
+                WARMUP_STEPS[step]()
+            except Exception as e:
+                logger.warning(f'Warmup step {step} failed: {e}')
+            durations[step] = time.perf_counter() - start
+            _done.add(step)
+    if durations:
+        logger.info(
+            'perovskite database warmup finished',
+            total=sum(durations.values()),
+            **durations,
+        )
+    return durations
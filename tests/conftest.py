@@ -0,0 +1,24 @@
+import os
+import shutil
+import tempfile
+
+from perovskite_solar_cell_database.cache import CACHE_DIR_ENV
+
+_environ = {}
+
+
+def pytest_configure(config):
+    # the persistent caches are opened at import, the tests must neither fill nor
+    # hit the caches of the user
+    _environ['previous'] = os.environ.get(CACHE_DIR_ENV)
+    _environ['cache_dir'] = tempfile.mkdtemp(prefix='perovskite_database_cache_')
+    os.environ[CACHE_DIR_ENV] = _environ['cache_dir']
+
+
+def pytest_unconfigure(config):
+    if _environ.get('previous') is None:
+        os.environ.pop(CACHE_DIR_ENV, None)
+    else:
+        os.environ[CACHE_DIR_ENV] = _environ['previous']
+    if 'cache_dir' in _environ:
+        shutil.rmtree(_environ['cache_dir'], ignore_errors=True)
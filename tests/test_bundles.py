@@ -0,0 +1,78 @@
+import os
+import random
+import tarfile
+import zipfile
+
+import pytest
+
+from perovskite_solar_cell_database.data_tools.bundles import (
+    EntryBundle,
+    numbered_path,
+    split_bundle_path,
+)
+
+
+def read_bundle(path):
+    if path.endswith('.zip'):
+        with zipfile.ZipFile(path) as bundle:
+            return {name: bundle.read(name) for name in bundle.namelist()}
+    with tarfile.open(path) as bundle:
+        return {member.name: bundle.extractfile(member).read() for member in bundle}
+
+
+def random_files(count=200):
+    rng = random.Random(0)
+    return {
+        f'{i}.archive.json': bytes(
+            rng.getrandbits(8) for _ in range(rng.randint(1, 3000))
+        )
+        for i in range(count)
+    }
+
+
+@pytest.mark.parametrize(
+    'path, expected',
+    [
+        ('entries.zip', ('entries', '.zip')),
+        ('out/entries.tar.gz', ('out/entries', '.tar.gz')),
+        ('entries.TGZ', ('entries', '.TGZ')),
+        ('entries.tar', ('entries', '.tar')),
+    ],
+)
+def test_split_bundle_path(path, expected):
+    assert split_bundle_path(path) == expected
+
+
+def test_split_bundle_path_invalid():
+    with pytest.raises(ValueError):
+        split_bundle_path('entries.rar')
+
+
+@pytest.mark.parametrize('extension', ['.zip', '.tar', '.tar.gz'])
+def test_entry_bundle(tmp_path, extension):
+    files = random_files()
+    path = os.path.join(tmp_path, f'entries{extension}')
+    with EntryBundle(path) as bundle:
+        for name, content in files.items():
+            bundle.add(name, content)
+
+    assert bundle.parts == [path]
+    assert read_bundle(path) == files
+
+
+@pytest.mark.parametrize('extension', ['.zip', '.tar', '.tar.gz'])
+def test_entry_bundle_parts(tmp_path, extension):
+    files = random_files()
+    path = os.path.join(tmp_path, f'entries{extension}')
+    max_part_size = 300 * 1024 if extension == '.tar.gz' else 50 * 1024
+    with EntryBundle(path, max_part_size=max_part_size) as bundle:
+        for name, content in files.items():
+            bundle.add(name, content)
+
+    assert len(bundle.parts) > 1
+    assert bundle.parts[1] == numbered_path(path, 2)
+    contents = {}
+    for part in bundle.parts:
+        assert os.path.getsize(part) <= max_part_size
+        contents.update(read_bundle(part))
+    assert contents == files
@@ -71,3 +71,101 @@ def test_composition(tmp_path):
     # Check that short and long form are sorted correctly
     assert composition_archive.data.short_form == 'MAPbBrI'
     assert composition_archive.data.long_form == 'MAPbBr1.5I1.5'
+
+
+def test_resolve_ion_systems(monkeypatch):
+    from types import SimpleNamespace
+
+    from nomad import utils
+    from nomad.datamodel import EntryArchive, EntryMetadata, User
+
+    from perovskite_solar_cell_database.cache import LRUCache
+    from perovskite_solar_cell_database.composition import (
+        PerovskiteAIonComponent,
+        PerovskiteBIonComponent,
+        PerovskiteIonComponent,
+        PerovskiteXIonComponent,
+    )
+
+    queries = []
+
+    def search(query, **kwargs):
+        queries.append(query['results.eln.lab_ids:any'])
+        data = [
+            {
+                'entry_id': f'entry_{lab_id}',
+                'upload_id': 'upload',
+                'results': {'eln': {'lab_ids': [lab_id]}},
+            }
+            for lab_id in query['results.eln.lab_ids:any']
+            if lab_id not in {'perovskite_ion_Br', 'perovskite_ion_Cl'}
+        ]
+        return SimpleNamespace(
+            data=data, pagination=SimpleNamespace(next_page_after_value=None)
+        )
+
+    monkeypatch.setattr('nomad.search.search', search)
+    monkeypatch.setattr(
+        'perovskite_solar_cell_database.composition._ion_entry_cache', LRUCache()
+    )
+    monkeypatch.setattr('perovskite_solar_cell_database.network._offline', False)
+    # the references can not be resolved without an upload
+    filled = []
+    monkeypatch.setattr(
+        PerovskiteIonComponent,
+        'set_system_quantities',
+        lambda ion: filled.append(ion.abbreviation),
+    )
+    logger = utils.get_logger(__name__)
+
+    def create_composition():
+        composition = PerovskiteComposition(
+            ions_a_site=[PerovskiteAIonComponent(abbreviation='MA')],
+            ions_b_site=[PerovskiteBIonComponent(abbreviation='Pb')],
+            ions_x_site=[
+                PerovskiteXIonComponent(abbreviation='I'),
+                PerovskiteXIonComponent(abbreviation='Br'),
+            ],
+        )
+        archive = EntryArchive(
+            data=composition,
+            metadata=EntryMetadata(main_author=User(user_id='user')),
+        )
+        composition.resolve_ion_systems(archive, logger)
+        return composition
+
+    composition = create_composition()
+    assert len(queries) == 1
+    assert sorted(queries[0]) == [
+        'perovskite_ion_Br',
+        'perovskite_ion_I',
+        'perovskite_ion_MA',
+        'perovskite_ion_Pb',
+    ]
+    assert composition.ions_a_site[0].m_to_dict()['system'] == (
+        '../uploads/upload/archive/entry_perovskite_ion_MA#data'
+    )
+    assert composition.ions_x_site[1].system is None
+    assert filled == ['MA', 'Pb', 'I']
+
+    # resolved abbreviations are cached, only the missing one is searched again
+    create_composition()
+    assert queries[1] == ['perovskite_ion_Br']
+
+    # the normalization of an entry searches once for all ions of the composition,
+    # the ions do not search themselves
+    composition = PerovskiteComposition(
+        ions_a_site=[PerovskiteAIonComponent(abbreviation='Cl')],
+        ions_x_site=[
+            PerovskiteXIonComponent(abbreviation='Br'),
+            PerovskiteXIonComponent(),
+        ],
+    )
+    archive = EntryArchive(
+        data=composition.m_copy(deep=True),
+        metadata=EntryMetadata(
+            main_author=User(user_id='user'), entry_name='composition.archive.json'
+        ),
+    )
+    normalize_all(archive)
+    assert queries[2:] == [['perovskite_ion_Cl', 'perovskite_ion_Br']]
@@ -0,0 +1,109 @@
+from perovskite_solar_cell_database import conformers
+from perovskite_solar_cell_database.cache import PersistentCache
+from perovskite_solar_cell_database.conformers import (
+    _memory_cache,
+    _structure_library,
+    canonical_smiles,
+    embed_molecule,
+    monatomic_symbol,
+    optimize_molecule,
+    optimize_molecules,
+)
+
+
+def test_optimize_molecule_is_cached_and_reproducible(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        'perovskite_solar_cell_database.conformers._disk_cache',
+        PersistentCache('conformers', path=str(tmp_path / 'conformers.sqlite')),
+    )
+    _memory_cache.clear()
+
+    atoms = optimize_molecule('C[NH3+]')
+    assert atoms.get_chemical_formula() == 'CH6N'
+    # a different SMILES of the same molecule hits the cache
+    assert canonical_smiles('[NH3+]C') == canonical_smiles('C[NH3+]')
+    assert (optimize_molecule('[NH3+]C').positions == atoms.positions).all()
+
+    # the structure survives a restart through the persistent store
+    _memory_cache.clear()
+    assert (optimize_molecule('C[NH3+]').positions == atoms.positions).all()
+
+    assert optimize_molecule('not a smiles') is None
+
+
+def test_structure_library_covers_catalogued_ions(monkeypatch):
+    def embed_molecule(smiles):
+        raise AssertionError(f'{smiles} was embedded with RDKit.')
+
+    monkeypatch.setattr(
+        'perovskite_solar_cell_database.conformers.embed_molecule', embed_molecule
+    )
+    _memory_cache.clear()
+
+    assert len(_structure_library) > 300
+    for smiles, formula in [('C[NH3+]', 'CH6N'), ('[Pb+2]', 'Pb'), ('[I-] ', 'I')]:
+        assert optimize_molecule(smiles).get_chemical_formula() == formula
+
+
+def test_optimize_molecules_time_budget(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        'perovskite_solar_cell_database.conformers._disk_cache',
+        PersistentCache('conformers', path=str(tmp_path / 'conformers.sqlite')),
+    )
+    monkeypatch.setattr('perovskite_solar_cell_database.conformers._failed', {})
+    _memory_cache.clear()
+
+    # uncached molecules exceed a zero budget, catalogued ones are still returned
+    pb, slow = optimize_molecules(['[Pb+2]', 'CCCCCCCCCCCCCCCCCC[NH3+]'], timeout=0)
+    assert pb.get_chemical_formula() == 'Pb'
+    assert slow is None
+    # the stuck worker processes are terminated
+    assert conformers._pool is None
+
+    atoms = optimize_molecule('CCCCCCCCCCCCCC[NH3+]', timeout=60)
+    assert atoms.get_chemical_formula() == 'C14H32N'
+
+
+def test_monatomic_ions_skip_rdkit(monkeypatch):
+    assert monatomic_symbol('[Pb+2]') == 'Pb'
+    assert monatomic_symbol('[I-]') == 'I'
+    assert monatomic_symbol('[Pb++]') == 'Pb'
+    assert monatomic_symbol('[NH4+]') is None
+    assert monatomic_symbol('I') is None
+    assert monatomic_symbol('[Xx+]') is None
+
+    expected = [embed_molecule(smiles) for smiles in ('[Pb+2]', '[Cs+]')]
+
+    def canonical_smiles(smiles):
+        raise AssertionError(f'RDKit used for {smiles}')
+
+    monkeypatch.setattr(
+        'perovskite_solar_cell_database.conformers.canonical_smiles', canonical_smiles
+    )
+    for atoms, expected_atoms in zip(optimize_molecules(['[Pb+2]', '[Cs+]']), expected):
+        assert (atoms.numbers == expected_atoms.numbers).all()
+        assert (atoms.positions == expected_atoms.positions).all()
+
+
+def test_failed_molecules_are_retried_after_ttl(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        'perovskite_solar_cell_database.conformers._disk_cache',
+        PersistentCache('conformers', path=str(tmp_path / 'conformers.sqlite')),
+    )
+    monkeypatch.setattr('perovskite_solar_cell_database.conformers._failed', {})
+    _memory_cache.clear()
+
+    smiles = 'OCCCCCCCCCCCC[NH3+]'
+    assert optimize_molecule(smiles, timeout=0) is None
+    assert canonical_smiles(smiles) in conformers._failed
+
+    def get_pool():
+        raise AssertionError(f'{smiles} was embedded again.')
+
+    with monkeypatch.context() as m:
+        m.setattr('perovskite_solar_cell_database.conformers._get_pool', get_pool)
+        assert optimize_molecule(smiles, timeout=60) is None
+
+    monkeypatch.setattr('perovskite_solar_cell_database.conformers.FAILURE_TTL', 0)
+    assert optimize_molecule(smiles, timeout=60).get_chemical_formula() == 'C12H28NO'
+    assert canonical_smiles(smiles) not in conformers._failed
@@ -0,0 +1,176 @@
+import asyncio
+import json
+
+from perovskite_solar_cell_database.cache import PersistentCache
+from perovskite_solar_cell_database.crossref import (
+    _memory_cache,
+    fetch_crossref_metadata,
+    find_dois_in_files,
+    prefetch_crossref_metadata,
+)
+from perovskite_solar_cell_database.network import offline_mode
+
+
+class FakeResponse:
+    def __init__(self, data, status_code=200):
+        self.data = data
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        import requests
+
+        if self.status_code != 200:
+            raise requests.HTTPError(f'{self.status_code} Error')
+
+    def json(self):
+        return self.data
+
+
+class FakeSession:
+    def __init__(self, response):
+        self.response = response
+        self.urls = []
+
+    def get(self, url, timeout=None):
+        self.urls.append(url)
+        return self.response
+
+
+MESSAGE = {
+    'container-title': ['The Journal of Physical Chemistry C'],
+    'created': {'date-time': '2015-02-11T16:05:11Z'},
+    'author': [
+        {'given': 'Jane', 'family': 'Doe'},
+        {'given': 'John', 'family': 'Roe'},
+    ],
+}
+
+
+def test_crossref_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        'perovskite_solar_cell_database.crossref._disk_cache',
+        PersistentCache('crossref', path=str(tmp_path / 'crossref.sqlite')),
+    )
+    _memory_cache.clear()
+    session = FakeSession(FakeResponse({'message': MESSAGE}))
+
+    metadata = fetch_crossref_metadata('10.1021/jp5126624', session=session)
+    assert metadata['journal'] == 'The Journal of Physical Chemistry C'
+    assert metadata['lead_author'] == 'Jane Doe'
+    assert metadata['authors'][1] == {
+        'first_name': 'John',
+        'last_name': 'Roe',
+        'name': 'John Roe',
+    }
+    assert session.urls == ['https://api.crossref.org/works/10.1021/jp5126624']
+
+    _memory_cache.clear()
+    assert (
+        fetch_crossref_metadata('https://doi.org/10.1021/JP5126624', session=session)
+        == metadata
+    )
+    assert len(session.urls) == 1
+
+
+def test_crossref_failure(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        'perovskite_solar_cell_database.crossref._disk_cache',
+        PersistentCache('crossref', path=str(tmp_path / 'crossref.sqlite')),
+    )
+    _memory_cache.clear()
+    session = FakeSession(FakeResponse('Resource not found.', status_code=404))
+    assert fetch_crossref_metadata('10.1021/missing', session=session) is None
+    assert fetch_crossref_metadata('10.1021/missing', session=session) is None
+    assert len(session.urls) == 2
+
+
+def test_prefetch_crossref_metadata(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        'perovskite_solar_cell_database.crossref._disk_cache',
+        PersistentCache('crossref', path=str(tmp_path / 'crossref.sqlite')),
+    )
+    _memory_cache.clear()
+    archives = [
+        {'data': {'ref': {'DOI_number': '10.1021/jp5126624'}}},
+        {'data': {'ref': {'DOI_number': 'https://doi.org/10.1021/jp5126624'}}},
+        {'data': {'DOI_number': '10.1016/j.electacta.2017.06.032'}},
+        {'data': {'ref': {'DOI_number': '10.1000/classic', 'ID_temp': 1}}},
+    ]
+    paths = []
+    for i, archive in enumerate(archives):
+        path = tmp_path / f'{i}.archive.json'
+        path.write_text(json.dumps(archive))
+        paths.append(str(path))
+
+    dois = find_dois_in_files(paths)
+    assert dois == ['10.1021/jp5126624', '10.1016/j.electacta.2017.06.032']
+
+    session = FakeSession(FakeResponse({'message': MESSAGE}))
+    assert asyncio.run(prefetch_crossref_metadata(dois, session=session)) == 2
+    assert len(session.urls) == 2
+    fetch_crossref_metadata('https://doi.org/10.1021/jp5126624', session=session)
+    assert len(session.urls) == 2
+
+
+def test_upload_dois_are_prefetched_by_the_entries(tmp_path, monkeypatch):
+    from nomad.client import normalize_all, parse
+
+    monkeypatch.setattr(
+        'perovskite_solar_cell_database.crossref._disk_cache',
+        PersistentCache('crossref', path=str(tmp_path / 'crossref.sqlite')),
+    )
+    monkeypatch.setattr(
+        'perovskite_solar_cell_database.crossref._prefetched_uploads', {}
+    )
+    _memory_cache.clear()
+    session = FakeSession(FakeResponse({'message': MESSAGE}))
+    monkeypatch.setattr(
+        'perovskite_solar_cell_database.crossref.get_session', lambda: session
+    )
+    upload_dir = tmp_path / 'upload'
+    upload_dir.mkdir()
+    for i in range(6):
+        upload_dir.joinpath(f'{i}.archive.json').write_text(
+            json.dumps(
+                {
+                    'data': {
+                        'm_def': 'perovskite_solar_cell_database.schema.PerovskiteSolarCell',
+                        'ref': {'DOI_number': f'10.1021/jp512662{i // 2}'},
+                    }
+                }
+            )
+        )
+
+    def normalize(name):
+        archive = parse(str(upload_dir / name))[0]
+        normalize_all(archive)
+        assert archive.data.ref.journal == 'The Journal of Physical Chemistry C'
+
+    with offline_mode(False):
+        # the first entry prefetches the DOIs of the whole upload
+        normalize('0.archive.json')
+        assert len(session.urls) == 3
+        normalize('5.archive.json')
+        assert len(session.urls) == 3
+
+    # an entry only prefetches a bounded number of DOIs, the next entry that is not
+    # cached continues with the next files
+    monkeypatch.setattr(
+        'perovskite_solar_cell_database.crossref.UPLOAD_PREFETCH_DOIS', 1
+    )
+    monkeypatch.setattr(
+        'perovskite_solar_cell_database.crossref._prefetched_uploads', {}
+    )
+    _memory_cache.clear()
+    monkeypatch.setattr(
+        'perovskite_solar_cell_database.crossref._disk_cache',
+        PersistentCache('crossref', path=str(tmp_path / 'bounded.sqlite')),
+    )
+    with offline_mode(False):
+        normalize('0.archive.json')
+        assert [url[-1] for url in session.urls[3:]] == ['0']
+        normalize('5.archive.json')
+        # files 1 and 2 are read, the DOI of file 2 is fetched, then that of the entry
+        assert [url[-1] for url in session.urls[3:]] == ['0', '1', '2']
+        normalize('3.archive.json')
+        assert len(session.urls) == 6
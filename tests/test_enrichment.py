@@ -0,0 +1,115 @@
+import json
+import os.path
+
+from nomad.client import normalize_all, parse
+
+from perovskite_solar_cell_database import network
+from perovskite_solar_cell_database.cache import PersistentCache
+from perovskite_solar_cell_database.crossref import (
+    _memory_cache,
+    set_cached_crossref_metadata,
+)
+from perovskite_solar_cell_database.enrichment import (
+    enrich_archives,
+    is_pending_enrichment,
+    is_pending_enrichment_dict,
+)
+from perovskite_solar_cell_database.network import is_offline, offline_mode
+
+
+def test_deferred_enrichment(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        'perovskite_solar_cell_database.crossref._disk_cache',
+        PersistentCache('crossref', path=str(tmp_path / 'crossref.sqlite')),
+    )
+    _memory_cache.clear()
+    test_file = os.path.join(os.path.dirname(__file__), 'data', 'example.archive.json')
+    with open(test_file) as f:
+        archive = json.load(f)
+    del archive['data']['ref']['ID_temp']
+    path = tmp_path / 'example.archive.json'
+    path.write_text(json.dumps(archive))
+
+    with offline_mode(True):
+        entry_archive = parse(str(path))[0]
+        normalize_all(entry_archive)
+
+    assert is_pending_enrichment(entry_archive)
+    assert entry_archive.data.ref.journal == 'Organic Electronics'
+    assert entry_archive.data.ref.DOI_number == (
+        'https://doi.org/10.1016/j.orgel.2017.05.025'
+    )
+
+
+def test_enrich_archives(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        'perovskite_solar_cell_database.crossref._disk_cache',
+        PersistentCache('crossref', path=str(tmp_path / 'crossref.sqlite')),
+    )
+    _memory_cache.clear()
+    test_file = os.path.join(os.path.dirname(__file__), 'data', 'example.archive.json')
+    with open(test_file) as f:
+        raw_archive = json.load(f)
+
+    # process one entry that needs Crossref and one that does not in offline mode
+    paths = {}
+    for name, keep_id_temp in [('pending', False), ('complete', True)]:
+        archive = json.loads(json.dumps(raw_archive))
+        if not keep_id_temp:
+            del archive['data']['ref']['ID_temp']
+        path = tmp_path / f'{name}.archive.json'
+        path.write_text(json.dumps(archive))
+        with offline_mode(True):
+            entry_archive = parse(str(path))[0]
+            normalize_all(entry_archive)
+        path.write_text(json.dumps(entry_archive.m_to_dict()))
+        paths[name] = str(path)
+    assert is_pending_enrichment_dict(
+        json.loads(tmp_path.joinpath('pending.archive.json').read_text())
+    )
+    complete = tmp_path.joinpath('complete.archive.json').read_text()
+    assert not is_pending_enrichment_dict(json.loads(complete))
+
+    # the Crossref metadata becomes available
+    set_cached_crossref_metadata(
+        '10.1016/j.orgel.2017.05.025',
+        {
+            'journal': 'Enriched Journal',
+            'publication_date': '2017-05-16T00:00:00Z',
+            'lead_author': 'Enriched et al.',
+            'authors': [],
+        },
+    )
+    assert enrich_archives(paths.values()) == [paths['pending']]
+
+    with open(paths['pending']) as f:
+        enriched = json.load(f)
+    assert not is_pending_enrichment_dict(enriched)
+    assert enriched['data']['ref']['journal'] == 'Enriched Journal'
+    assert enriched['data']['ref']['lead_author'] == 'Enriched et al.'
+    # entries that are not pending are left as they are
+    assert tmp_path.joinpath('complete.archive.json').read_text() == complete
+    # the enriched archive is processed again like any other entry
+    entry_archive = parse(paths['pending'])[0]
+    assert not is_pending_enrichment(entry_archive)
+    assert entry_archive.data.ref.journal == 'Enriched Journal'
+
+
+def test_network_enrichment_of_any_entry_point(monkeypatch):
+    from nomad.config import config
+
+    config.load_plugins()
+    monkeypatch.delenv(network.OFFLINE_ENV, raising=False)
+    network._network_enrichment_configured.cache_clear()
+    assert not is_offline()
+
+    ion_parser = config.plugins.entry_points.options[
+        'perovskite_solar_cell_database.parsers:ion_parser'
+    ]
+    monkeypatch.setattr(ion_parser, 'network_enrichment', False)
+    network._network_enrichment_configured.cache_clear()
+    try:
+        assert is_offline()
+    finally:
+        monkeypatch.undo()
+        network._network_enrichment_configured.cache_clear()
@@ -0,0 +1,314 @@
+import json
+import os
+import zipfile
+
+import pandas as pd
+import pytest
+
+from perovskite_solar_cell_database.data_tools.entry_writer import (
+    ENTRY_M_DEF,
+    PerovskiteEntryWriter,
+    apply_schema,
+    entry_hash,
+    main,
+    metainfo_schema,
+    split_column,
+)
+
+
+@pytest.fixture
+def database_csv(tmp_path):
+    path = os.path.join(tmp_path, 'database.csv')
+    pd.DataFrame(
+        {
+            'Ref_ID': [1, 2, 3, 4, 5],
+            'Ref_publication_date': ['2017-05-16', None, '2019-01-02', None, None],
+            'Ref_lead_author': ['Liu et al.', 'Xie et al.', None, None, 'Li et al.'],
+            'Cell_area_total': [0.1, None, 0.09, None, 1.0],
+            'Perovskite_deposition_procedure': [
+                'Spin-coating',
+                None,
+                'Spin-coating >> Drop-casting',
+                None,
+                None,
+            ],
+            'JV_default_PCE': [20.1, 18.5, None, None, 15.0],
+            'JV_light_regime': ['Standard', None, None, None, 'Standard'],
+            'Stability_measured': [True, False, None, None, True],
+        }
+    ).to_csv(path, index=False)
+    return path
+
+
+@pytest.mark.parametrize(
+    'column, expected',
+    [
+        ('Ref_ID', ('ref', 'ID')),
+        ('JV_default_PCE', ('jv', 'default_PCE')),
+        ('Perovskite_deposition_procedure', ('perovskite_deposition', 'procedure')),
+        ('Perovskite_composition_a_ions', ('perovskite', 'composition_a_ions')),
+        ('Comments', ('comments', 'Comments')),
+    ],
+)
+def test_split_column(column, expected):
+    assert split_column(column) == expected
+
+
+@pytest.mark.parametrize('chunksize', [2, 1000])
+def test_entry_writer(database_csv, tmp_path, chunksize):
+    target_dir = os.path.join(tmp_path, 'entries')
+    os.makedirs(target_dir)
+    PerovskiteEntryWriter(database_csv, chunksize=chunksize).entry_writer(target_dir)
+
+    # the manifest is not written into the upload folder
+    assert sorted(os.listdir(target_dir)) == [f'{i}.archive.json' for i in range(1, 6)]
+    assert os.path.exists(os.path.join(tmp_path, 'entries.manifest.json'))
+    with open(os.path.join(target_dir, '1.archive.json')) as f:
+        assert json.load(f) == {
+            'data': {
+                'm_def': ENTRY_M_DEF,
+                'ref': {
+                    'ID': 1,
+                    'publication_date': '2017-05-16T00:00:00',
+                    'lead_author': 'Liu et al.',
+                },
+                'cell': {'area_total': 0.1},
+                'perovskite_deposition': {'procedure': 'Spin-coating'},
+                'jv': {'default_PCE': 20.1, 'light_regime': 'Standard'},
+                'stability': {'measured': True},
+            }
+        }
+    with open(os.path.join(target_dir, '4.archive.json')) as f:
+        assert json.load(f) == {'data': {'m_def': ENTRY_M_DEF, 'ref': {'ID': 4}}}
+
+
+def test_entry_writer_workers(database_csv, tmp_path):
+    serial_dir = os.path.join(tmp_path, 'serial')
+    parallel_dir = os.path.join(tmp_path, 'parallel')
+    os.makedirs(serial_dir)
+    main([database_csv, parallel_dir, '--workers', '2', '--chunksize', '2'])
+    PerovskiteEntryWriter(database_csv).entry_writer(serial_dir)
+
+    with open(os.path.join(tmp_path, 'parallel.manifest.json')) as f:
+        manifest = json.load(f)
+    assert manifest['entries'] == 5
+    assert [(shard['start'], shard['stop']) for shard in manifest['shards']] == [
+        (0, 3),
+        (3, 5),
+    ]
+    assert all(shard['seconds'] > 0 for shard in manifest['shards'])
+    files = [file for shard in manifest['shards'] for file in shard['files']]
+    assert files == [f'{i}.archive.json' for i in range(1, 6)]
+    for file in files:
+        with open(os.path.join(serial_dir, file), 'rb') as serial:
+            with open(os.path.join(parallel_dir, file), 'rb') as parallel:
+                assert serial.read() == parallel.read()
+
+
+def test_bundle_writer(database_csv, tmp_path):
+    entries_dir = os.path.join(tmp_path, 'entries')
+    os.makedirs(entries_dir)
+    PerovskiteEntryWriter(database_csv).entry_writer(entries_dir)
+    bundle_path = os.path.join(tmp_path, 'bundle', 'entries.zip')
+    main([database_csv, bundle_path, '--workers', '2'])
+
+    bundles = [os.path.join(tmp_path, 'bundle', f'entries-00{i}.zip') for i in (1, 2)]
+    with open(os.path.join(tmp_path, 'bundle', 'entries.manifest.json')) as f:
+        manifest = json.load(f)
+    assert [shard['bundles'] for shard in manifest['shards']] == [
+        [bundles[0]],
+        [bundles[1]],
+    ]
+    for bundle in bundles:
+        with zipfile.ZipFile(bundle) as zip_file:
+            for name in zip_file.namelist():
+                with open(os.path.join(entries_dir, name), 'rb') as f:
+                    assert zip_file.read(name) == f.read()
+    assert sorted(os.listdir(os.path.join(tmp_path, 'bundle'))) == [
+        'entries-001.zip',
+        'entries-002.zip',
+        'entries.manifest.json',
+    ]
+
+
+def test_entry_hash():
+    archive = {'data': {'m_def': ENTRY_M_DEF, 'ref': {'ID': 1}, 'cell': {'area': 2.0}}}
+    reordered = {'data': {'cell': {'area': 2}, 'ref': {'ID': 1}, 'm_def': ENTRY_M_DEF}}
+    assert entry_hash(archive) == entry_hash(reordered)
+    assert entry_hash(archive) != entry_hash({'data': {'ref': {'ID': 1}}})
+
+
+def test_incremental_entry_writer(database_csv, tmp_path):
+    full_dir = os.path.join(tmp_path, 'full')
+    os.makedirs(full_dir)
+    previous = PerovskiteEntryWriter(database_csv).entry_writer(full_dir)
+    assert previous['unchanged'] == 0
+    assert sorted(previous['hashes']) == ['1', '2', '3', '4', '5']
+
+    # the same database read in other chunks changes nothing
+    unchanged_dir = os.path.join(tmp_path, 'unchanged')
+    main(
+        [database_csv, unchanged_dir, '--chunksize', '1', '--previous-manifest']
+        + [os.path.join(tmp_path, 'full.manifest.json')]
+    )
+    with open(os.path.join(tmp_path, 'unchanged.manifest.json')) as f:
+        manifest = json.load(f)
+    assert (manifest['entries'], manifest['unchanged'], manifest['deleted']) == (
+        0,
+        5,
+        [],
+    )
+
+    # a new revision changes entry 2, removes entry 4 and adds entry 6
+    df = pd.read_csv(database_csv)
+    df.loc[df['Ref_ID'] == 2, 'JV_default_PCE'] = 19.0
+    df = pd.concat(
+        [df[df['Ref_ID'] != 4], pd.DataFrame({'Ref_ID': [6], 'JV_default_PCE': [12.0]})]
+    )
+    df.to_csv(database_csv, index=False)
+    bundle_path = os.path.join(tmp_path, 'bundle', 'entries.zip')
+    main(
+        [database_csv, bundle_path, '--workers', '2', '--previous-manifest']
+        + [os.path.join(tmp_path, 'full.manifest.json')]
+    )
+
+    with open(os.path.join(tmp_path, 'bundle', 'entries.manifest.json')) as f:
+        manifest = json.load(f)
+    assert manifest['entries'] == 2
+    assert manifest['unchanged'] == 3
+    assert manifest['deleted'] == ['4.archive.json']
+    assert sorted(manifest['hashes']) == ['1', '2', '3', '5', '6']
+    names = []
+    for shard in manifest['shards']:
+        for bundle in shard['bundles']:
+            with zipfile.ZipFile(bundle) as zip_file:
+                names.extend(zip_file.namelist())
+    assert names == ['2.archive.json', '6.archive.json']
+
+
+def test_iter_entries_matches_full_read(database_csv):
+    writer = PerovskiteEntryWriter(database_csv, chunksize=2)
+    entries = list(writer.iter_entries())
+    # the whole database is only read if `df_db` is accessed
+    assert writer._df_db is None
+    assert len(writer.df_db) == 5
+    assert list(writer.iter_entries()) == entries
+    assert list(writer.iter_entries(1, 3)) == entries[1:3]
+    reader = PerovskiteEntryWriter(database_csv, chunksize=2)
+    assert list(reader.iter_entries(1, 3)) == entries[1:3]
+
+
+@pytest.mark.parametrize('extension', ['.parquet', '.feather'])
+def test_columnar_database(database_csv, tmp_path, extension):
+    entries = list(PerovskiteEntryWriter(database_csv).iter_entries())
+    path = os.path.join(tmp_path, f'database{extension}')
+    df = pd.read_csv(database_csv)
+    if extension == '.parquet':
+        df.to_parquet(path, row_group_size=2)
+    else:
+        df.to_feather(path)
+
+    writer = PerovskiteEntryWriter(path, chunksize=2)
+    assert writer.count_rows() == 5
+    assert list(writer.iter_entries()) == entries
+    assert list(writer.iter_entries(1, 4)) == entries[1:4]
+    assert list(writer.iter_entries(3)) == entries[3:]
+    assert len(writer.df_db) == 5
+
+
+def test_metainfo_schema():
+    dtypes, dates = metainfo_schema(
+        ('Ref_ID', 'Ref_publication_date', 'Cell_area_total', 'JV_light_source_type')
+        + ('Stability_measured', 'Comments')
+    )
+    assert dtypes == {
+        'Ref_ID': 'Int64',
+        'Cell_area_total': 'float64',
+        'JV_light_source_type': 'str',
+        'Stability_measured': 'boolean',
+    }
+    assert dates == ['Ref_publication_date']
+
+
+@pytest.mark.parametrize('extension', ['.csv', '.parquet'])
+def test_invalid_values(tmp_path, caplog, extension):
+    path = os.path.join(tmp_path, f'database{extension}')
+    df = pd.DataFrame(
+        {
+            'Ref_ID': [1, 2, 3],
+            'Cell_number_of_cells_per_substrate': ['4', 'foo', '2.5'],
+            'JV_default_PCE': ['20.1', 'n/a', None],
+            'Stability_measured': ['Yes', 'FALSE', 'maybe'],
+        }
+    )
+    if extension == '.csv':
+        df.to_csv(path, index=False)
+    else:
+        df.to_parquet(path)
+
+    writer = PerovskiteEntryWriter(path, chunksize=2)
+    entries = [archive['data'] for _, archive in writer.iter_entries()]
+    assert [entry.get('cell') for entry in entries] == [
+        {'number_of_cells_per_substrate': 4},
+        None,
+        None,
+    ]
+    assert [entry.get('jv') for entry in entries] == [{'default_PCE': 20.1}, None, None]
+    assert [entry.get('stability') for entry in entries] == [
+        {'measured': True},
+        {'measured': False},
+        None,
+    ]
+    # the invalid cells are logged with the column and the rows
+    assert 'Cell_number_of_cells_per_substrate' in caplog.text
+    assert '"rows": [1]' in caplog.text
+    assert '"rows": [2]' in caplog.text
+    assert len(writer.df_db) == 3
+
+
+def test_empty_text_cells(tmp_path):
+    path = os.path.join(tmp_path, 'database.csv')
+    with open(path, 'w') as f:
+        f.write('Ref_ID,Ref_lead_author,JV_light_source_type\n1,,\n2,Liu et al.,""\n')
+    entries = [
+        archive['data'] for _, archive in PerovskiteEntryWriter(path).iter_entries()
+    ]
+    assert entries[0] == {'m_def': ENTRY_M_DEF, 'ref': {'ID': 1}}
+    assert entries[1] == {
+        'm_def': ENTRY_M_DEF,
+        'ref': {'ID': 2, 'lead_author': 'Liu et al.'},
+    }
+
+    # missing values of object and numeric columns are kept, not cast to 'nan'
+    df = apply_schema(
+        pd.DataFrame(
+            {
+                'Ref_lead_author': pd.Series(['Liu et al.', None], dtype=object),
+                'JV_light_source_type': [float('nan'), 1.5],
+            }
+        ),
+        {'Ref_lead_author': 'str', 'JV_light_source_type': 'str'},
+        [],
+    )
+    assert df['Ref_lead_author'].tolist()[0] == 'Liu et al.'
+    assert df.isna().to_numpy().tolist() == [[False, True], [True, False]]
+    assert df['JV_light_source_type'].tolist()[1] == '1.5'
+
+
+def test_sections(database_csv, tmp_path):
+    target_dir = os.path.join(tmp_path, 'entries')
+    main([database_csv, target_dir, '--sections', 'jv', 'cell'])
+
+    with open(os.path.join(target_dir, '1.archive.json')) as f:
+        assert json.load(f) == {
+            'data': {
+                'm_def': ENTRY_M_DEF,
+                'ref': {'ID': 1},
+                'cell': {'area_total': 0.1},
+                'jv': {'default_PCE': 20.1, 'light_regime': 'Standard'},
+            }
+        }
+    with open(os.path.join(tmp_path, 'entries.manifest.json')) as f:
+        assert json.load(f)['sections'] == ['cell', 'jv']
+    with pytest.raises(ValueError, match='no sections eqe'):
+        PerovskiteEntryWriter(database_csv, sections=['jv', 'eqe']).read_columns()
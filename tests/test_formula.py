@@ -0,0 +1,35 @@
+import pytest
+from nomad.atomutils import Formula
+from nomad.datamodel.metainfo.basesections import elemental_composition_from_formula
+from nomad.datamodel.results import Material
+
+from perovskite_solar_cell_database.formula import get_formula
+
+
+@pytest.mark.parametrize(
+    'formula',
+    ['(CH3NH3)PbI3', 'Cs0.05(CH5N2)0.8(CH3NH3)0.15PbI2.55Br0.45', 'Si', 'CsPbI3'],
+)
+def test_get_formula_matches_formula(formula):
+    expected = Material()
+    Formula(formula).populate(expected)
+    material = Material()
+    get_formula(formula).populate(material)
+    assert material.m_to_dict() == expected.m_to_dict()
+
+    assert [
+        section.m_to_dict()
+        for section in get_formula(formula).system_elemental_composition()
+    ] == [
+        section.m_to_dict()
+        for section in elemental_composition_from_formula(Formula(formula))
+    ]
+    assert get_formula(formula) is get_formula(formula)
+
+
+def test_get_formula_populate_overwrite():
+    material = Material(chemical_formula_hill='H2O')
+    with pytest.raises(ValueError):
+        get_formula('CsPbI3').populate(material)
+    get_formula('CsPbI3').populate(material, overwrite=True)
+    assert material.chemical_formula_hill == 'CsI3Pb'
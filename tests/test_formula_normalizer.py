@@ -0,0 +1,62 @@
+import re
+
+import pandas as pd
+
+from perovskite_solar_cell_database.schema_sections.formula_normalizer import (
+    PerovskiteFormulaNormalizer,
+    abbreviation_table,
+    cation_dict,
+    cation_dict_miss,
+    normalize_formulas,
+)
+
+
+def legacy_replace_formula(item):
+    if any(key in item for key in cation_dict_miss.keys()):
+        return None
+    for word, replacement in sorted(
+        cation_dict.items(), key=lambda x: len(x[0]), reverse=True
+    ):
+        item = re.sub(word, replacement, item)
+    return item
+
+
+def formula_corpus():
+    keys = list(cation_dict) + list(cation_dict_miss)
+    bare = [key.replace('(', '').replace(')', '') for key in keys]
+    corpus = ['MAPbI3', 'FAPbI', 'CsPbBr3', 'Cs0.05FA0.79MA0.16PbI2.49Br0.51']
+    for key in keys + bare:
+        corpus.append(f'{key}PbI3')
+        corpus.append(f'{key}2PbI4')
+    for first in bare:
+        for second in bare:
+            corpus.append(f'{first}0.5{second}0.5PbI3')
+            corpus.append(f'{first}{second}PbI4')
+    return corpus
+
+
+def test_replace_formula_matches_sequential_replacement():
+    assert abbreviation_table.compiled
+    for formula in formula_corpus():
+        normalizer = PerovskiteFormulaNormalizer(formula)
+        assert normalizer.replace_formula() == legacy_replace_formula(formula), formula
+
+
+def test_replace_formula_overlapping_abbreviations():
+    # `(DAP)` is replaced before `BDA`, although `BDA` starts first
+    normalizer = PerovskiteFormulaNormalizer('BDAPbI3')
+    assert normalizer.replace_formula() == 'B(C3H10N2)bI3'
+
+
+def test_normalize_formulas():
+    formulas = ['MAPbI3', None, 'Cs0.05FA0.79MA0.16PbI2.49Br0.51', 'MAPbI3', 'IMPbI3']
+    cleaned = normalize_formulas(formulas)
+    assert cleaned[0] == PerovskiteFormulaNormalizer('MAPbI3').clean_formula()
+    assert cleaned[0] == cleaned[3]
+    assert cleaned[1] == (None, None)
+    assert cleaned[4] == (None, None)
+    assert sorted(cleaned[2][1]) == ['Br', 'C', 'Cs', 'H', 'I', 'N', 'Pb']
+
+    df = normalize_formulas(pd.Series(formulas, index=list('abcde')))
+    assert list(df.index) == list('abcde')
+    assert df.loc['c', 'reduced_formula'] == cleaned[2][0]
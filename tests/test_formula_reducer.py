@@ -0,0 +1,251 @@
+import random
+
+import pytest
+from test_formula_normalizer import formula_corpus
+
+from perovskite_solar_cell_database.schema_sections.formula_normalizer import (
+    PerovskiteFormulaNormalizer,
+)
+from perovskite_solar_cell_database.schema_sections.formula_reducer import (
+    parse_formula,
+    reduce_formula,
+)
+from perovskite_solar_cell_database.schema_sections.suggestions import get_suggestions
+
+
+def baseline_reduce_formula(formula):
+    """
+    The reduction of `PerovskiteFormulaNormalizer` before `reduce_formula`.
+    """
+    from pymatgen.core import Composition
+
+    composition = Composition(formula)
+    int_formula = composition.get_integer_formula_and_factor()[0]
+    composition_final = Composition(
+        Composition(int_formula).get_reduced_composition_and_factor()[0]
+    )
+    reduced_formula = composition_final.get_reduced_composition_and_factor()[
+        0
+    ].to_pretty_string()
+    return reduced_formula, composition_final.chemical_system.split('-')
+
+
+def clean_formula(formula, reducer):
+    """
+    `PerovskiteFormulaNormalizer.clean_formula` with the given reduction.
+    """
+    normalizer = PerovskiteFormulaNormalizer(formula)
+    normalizer.pre_process_formula()
+    replaced_formula = normalizer.replace_formula()
+    if replaced_formula is None:
+        return None, None
+    try:
+        return reducer(replaced_formula)
+    except ValueError:
+        return None, None
+    except Exception as e:
+        return type(e).__name__
+
+
+def has_dummy_species(formula):
+    from pymatgen.core import Composition, DummySpecies
+
+    try:
+        return any(
+            isinstance(species, DummySpecies) for species in Composition(formula)
+        )
+    except Exception:
+        return False
+
+
+def database_formulas():
+    return get_suggestions('perovskite', 'composition_long_form') + get_suggestions(
+        'perovskite', 'composition_short_form'
+    )
+
+
+# database formulas that intentionally differ from the baseline, with the baseline
+# and the new result: amounts with four decimals are scaled exactly, pymatgen's float
+# gcd stops one step early there and rounds the amounts
+EXPECTED_DIVERGENCES = {
+    'Cs0.17FA0.83Pb0.9999Sn0.0001I3': (
+        ('Cs567H13833Pb3333C2767I10000N5533', ['C', 'Cs', 'H', 'I', 'N', 'Pb']),
+        (
+            'Cs1700Sn1H41500Pb9999C8300I30000N16600',
+            ['C', 'Cs', 'H', 'I', 'N', 'Pb', 'Sn'],
+        ),
+    ),
+    'Cs0.0664FA0.666MA0.2668PbBr0.095I0.905': (
+        (
+            'Cs332H24655Pb5000C4664I4525Br475N7994',
+            ['Br', 'C', 'Cs', 'H', 'I', 'N', 'Pb'],
+        ),
+        (
+            'Cs332H24654Pb5000C4664I4525Br475N7994',
+            ['Br', 'C', 'Cs', 'H', 'I', 'N', 'Pb'],
+        ),
+    ),
+}
+
+
+# formulas with nested parentheses and fractional multipliers that differ from the
+# baseline, with the baseline and the new result: the amounts have more than four
+# decimals, so the greatest common divisor is approximate and the baseline depends
+# on floating point errors
+EXPECTED_NESTED_DIVERGENCES = {
+    '(Cl0.33)0.167((K1.5)2SBr)0.95': (
+        ('K20357S6786Br6786Cl394', ['Br', 'Cl', 'K', 'S']),
+        ('K1500S500Br500Cl29', ['Br', 'Cl', 'K', 'S']),
+    ),
+    'H3((BrS2)0.16Sn0.43Rb2)0.918': (
+        ('Rb10206Sn2194H16676S1633Br816', ['Br', 'H', 'Rb', 'S', 'Sn']),
+        ('Rb10200Sn2193H16667S1632Br816', ['Br', 'H', 'Rb', 'S', 'Sn']),
+    ),
+    '(S3(Rb2C2O0.629)0.659(SPb3I0.775)2)': (
+        ('Rb5972Pb27186C5972S22655I7023O1878', ['C', 'I', 'O', 'Pb', 'Rb', 'S']),
+        ('Rb3621Pb16484C3621S13736I4258O1139', ['C', 'I', 'O', 'Pb', 'Rb', 'S']),
+    ),
+}
+
+
+def _random_amount(rng):
+    return rng.choice(['', '2', '3', f'{rng.random():.{rng.randint(1, 3)}f}'])
+
+
+def _random_group(rng, symbols, depth):
+    group = ''
+    for _ in range(rng.randint(1, 3)):
+        if depth < 2 and rng.random() < 0.4:
+            group += f'({_random_group(rng, symbols, depth + 1)}){_random_amount(rng)}'
+        else:
+            group += f'{rng.choice(symbols)}{_random_amount(rng)}'
+    return group
+
+
+def random_formulas(count=500):
+    rng = random.Random(0)
+    symbols = ['Cs', 'Rb', 'K', 'Pb', 'Sn', 'Ge', 'I', 'Br', 'Cl', 'O', 'H', 'N', 'C']
+    formulas = []
+    for _ in range(count):
+        formula = ''
+        for symbol in rng.sample(symbols, rng.randint(1, 5)):
+            formula += f'{symbol}{_random_amount(rng)}'
+        formulas.append(formula)
+    # nested parentheses with fractional multipliers
+    formulas.extend(_random_group(rng, symbols, 0) for _ in range(count))
+    return formulas
+
+
+def has_exact_gcd(formula):
+    """
+    Whether all amounts of the formula are multiples of the gcd tolerance 1e-4.
+    """
+    return all(
+        (amount * 10000).denominator == 1 for amount in parse_formula(formula).values()
+    )
+
+
+def exact_proportions(formula):
+    amounts = parse_formula(formula)
+    total = sum(amounts.values())
+    return {symbol: amount / total for symbol, amount in amounts.items()}
+
+
+def same_proportions(expected, actual, tolerance=1e-3):
+    from pymatgen.core import Composition
+
+    expected = Composition(expected).fractional_composition
+    actual = Composition(actual).fractional_composition
+    return set(expected) == set(actual) and all(
+        abs(actual[element] - amount) <= tolerance * amount
+        for element, amount in expected.items()
+    )
+
+
+@pytest.mark.parametrize(
+    'formula, expected',
+    [
+        ('CsPbI3', ('Cs1Pb1I3', ['Cs', 'I', 'Pb'])),
+        ('Cs2Pb2I6', ('Cs1Pb1I3', ['Cs', 'I', 'Pb'])),
+        ('(CH3NH3)PbI3', ('H6Pb1C1I3N1', ['C', 'H', 'I', 'N', 'Pb'])),
+        (
+            'Cs0.1Rb0.9Pb(I0.5Br0.5)3',
+            ('Cs1Rb9Pb10I15Br15', ['Br', 'Cs', 'I', 'Pb', 'Rb']),
+        ),
+        ('D2O', ('H2O1', ['H', 'O'])),
+        ('H', ('H2', ['H'])),
+        ('Cs1e-1PbI3', ('Cs1Pb10I30', ['Cs', 'I', 'Pb'])),
+    ],
+)
+def test_reduce_formula(formula, expected):
+    assert reduce_formula(formula) == expected
+
+
+@pytest.mark.parametrize(
+    'formula', ['', '12', 'O0.0', 'CsPb(I3', 'CsPbI3)', 'Cs()PbI3', 'XyPbI3']
+)
+def test_reduce_formula_invalid(formula):
+    with pytest.raises(ValueError):
+        reduce_formula(formula)
+
+
+def test_clean_formula_matches_baseline_on_database_formulas():
+    pytest.importorskip('pymatgen')
+    formulas = database_formulas()
+    assert len(formulas) > 2000
+    divergences = {}
+    for formula in formulas:
+        expected = clean_formula(formula, baseline_reduce_formula)
+        actual = clean_formula(formula, reduce_formula)
+        if actual != expected:
+            divergences[formula] = (expected, actual)
+    assert divergences == EXPECTED_DIVERGENCES
+
+
+@pytest.mark.parametrize('formula', EXPECTED_NESTED_DIVERGENCES)
+def test_nested_divergences(formula):
+    pytest.importorskip('pymatgen')
+    expected, actual = EXPECTED_NESTED_DIVERGENCES[formula]
+    assert baseline_reduce_formula(formula) == expected
+    assert reduce_formula(formula) == actual
+
+
+def test_clean_formula_matches_baseline_on_synthetic_formulas():
+    pytest.importorskip('pymatgen')
+    divergences = {
+        'dummy_species': 0,
+        'no_amounts': 0,
+        'four_decimals': 0,
+        'inexact_gcd': 0,
+    }
+    formulas = random_formulas() + formula_corpus() + ['Sn0.0', '(CsPbI3)0']
+    for formula in formulas:
+        expected = clean_formula(formula, baseline_reduce_formula)
+        actual = clean_formula(formula, reduce_formula)
+        if actual == expected:
+            continue
+        replaced_formula = PerovskiteFormulaNormalizer(formula).replace_formula()
+        if has_dummy_species(replaced_formula):
+            # unknown symbols are dummy species in pymatgen and invalid here
+            assert actual == (None, None), formula
+            divergences['dummy_species'] += 1
+        elif expected == 'IndexError':
+            # pymatgen fails on formulas without any non-zero amount
+            assert not parse_formula(replaced_formula), formula
+            assert actual == (None, None), formula
+            divergences['no_amounts'] += 1
+        else:
+            assert actual[1] == expected[1], formula
+            assert same_proportions(expected[0], actual[0]), formula
+            if has_exact_gcd(replaced_formula):
+                # amounts with four decimals are scaled exactly, the float gcd of
+                # the baseline stops one step early and rounds the amounts
+                assert exact_proportions(actual[0]) == exact_proportions(
+                    replaced_formula
+                ), formula
+                divergences['four_decimals'] += 1
+            else:
+                # the greatest common divisor of amounts with more than four
+                # decimals is approximate
+                divergences['inexact_gcd'] += 1
+    assert all(divergences.values()), divergences
@@ -0,0 +1,104 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+PACKAGE = 'perovskite_solar_cell_database'
+
+# packages that are only needed to process entries
+HEAVY = ['temporalio', 'rdkit', 'pymatgen', 'requests_cache']
+
+# modules of the entry points with the budget for the cold import of the modules of
+# this package in ms, about three times the measured time, and the packages they
+# must not import. The forbidden imports are always checked, the budgets depend on
+# the load of the machine and are only checked if PEROVSKITE_IMPORT_TIME_BUDGETS
+# is set.
+ENTRY_POINT_IMPORTS = {
+    PACKAGE: (50, [*HEAVY, 'nomad.datamodel', f'{PACKAGE}.schema_sections']),
+    f'{PACKAGE}.actions': (50, [*HEAVY, f'{PACKAGE}.schema_sections']),
+    f'{PACKAGE}.apps': (500, [*HEAVY, f'{PACKAGE}.schema_sections']),
+    f'{PACKAGE}.parsers': (50, [*HEAVY, f'{PACKAGE}.schema_sections']),
+    f'{PACKAGE}.schema_packages': (50, [*HEAVY, f'{PACKAGE}.schema_sections']),
+    # the schemas need rdkit for the ion structures
+    f'{PACKAGE}.schema': (2000, ['temporalio', 'pymatgen', 'requests_cache']),
+    f'{PACKAGE}.composition': (1000, ['temporalio', 'pymatgen', 'requests_cache']),
+    f'{PACKAGE}.llm_extraction_schema': (
+        2000,
+        ['temporalio', 'pymatgen', 'requests_cache'],
+    ),
+    f'{PACKAGE}.schema_packages.tandem.schema': (
+        4000,
+        ['temporalio', 'pymatgen', 'requests_cache'],
+    ),
+}
+
+
+def cold_import(module: str) -> dict[str, int]:
+    """
+    Imports a module in a new interpreter and returns the self time of each imported
+    module in µs as reported by `-X importtime`.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_time, _, name = line[len('import time:') :].split('|')
+        times[name.strip()] = int(self_time)
+    return times
+
+
+@pytest.mark.parametrize('module', ENTRY_POINT_IMPORTS)
+def test_entry_point_imports(module):
+    _, forbidden = ENTRY_POINT_IMPORTS[module]
+    times = cold_import(module)
+
+    for name in forbidden:
+        assert not any(
+            imported == name or imported.startswith(f'{name}.') for imported in times
+        ), f'{module} imports {name}'
+
+
+@pytest.mark.skipif(
+    not os.environ.get('PEROVSKITE_IMPORT_TIME_BUDGETS'),
+    reason='set PEROVSKITE_IMPORT_TIME_BUDGETS to check the import time budgets',
+)
+@pytest.mark.parametrize('module', ENTRY_POINT_IMPORTS)
+def test_entry_point_import_time(module):
+    budget, _ = ENTRY_POINT_IMPORTS[module]
+    # the best of a few imports is less sensitive to the load of the machine
+    own_time = min(
+        sum(
+            time
+            for imported, time in cold_import(module).items()
+            if imported == PACKAGE or imported.startswith(f'{PACKAGE}.')
+        )
+        for _ in range(3)
+    )
+    assert own_time / 1000 < budget
+
+
+def test_workflow_sandbox_imports():
+    # the entry points are imported again in the workflow sandbox of the worker
+    pytest.importorskip('temporalio')
+    import asyncio
+
+    from temporalio.worker.workflow_sandbox import SandboxedWorkflowRunner
+    from temporalio.workflow import _Definition
+
+    from perovskite_solar_cell_database.actions.llm_extractor.workflows import (
+        ExtractWorkflow,
+    )
+
+    async def prepare():
+        SandboxedWorkflowRunner().prepare_workflow(
+            _Definition.must_from_class(ExtractWorkflow)
+        )
+
+    asyncio.run(prepare())
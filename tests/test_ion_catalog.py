@@ -0,0 +1,84 @@
+from unittest.mock import Mock
+
+from perovskite_solar_cell_database.schema_sections.ions.ion import (
+    Ion,
+    IonCatalog,
+    find_ion_by_name,
+    read_ions_from_xlsx,
+    resolve_ion_sites,
+)
+from perovskite_solar_cell_database.schema_sections.ions.ion_tables import (
+    ION_TYPES,
+    compile_ion_tables,
+    is_compiled_ion_tables_stale,
+    read_compiled_ion_tables,
+    read_ion_rows_from_xlsx,
+)
+
+
+def test_ion_catalog_lookup():
+    catalog = IonCatalog()
+
+    assert catalog.find('MA', 'A').name == 'MA'
+    assert catalog.find('(PEA)', 'A').name == 'PEA'
+    assert catalog.find('Pb', 'B').smile == '[Pb+2]'
+    assert catalog.find('I', 'C').molecular_formula == 'I-'
+    # alternative abbreviations
+    assert catalog.find('F3EA', 'A').name == 'TFEA'
+    # case-insensitive fallback
+    assert catalog.find('pea', 'A').name == 'PEA'
+    assert catalog.find('not-an-ion', 'A') is None
+    assert catalog.find('', 'A') is None
+
+
+def test_ion_catalog_matches_linear_search():
+    catalog = IonCatalog()
+    for ion_type in ('A', 'B', 'C'):
+        ions = read_ions_from_xlsx(ion_type)
+        for ion in ions:
+            for name in [ion.name, *ion.alternative_names]:
+                if name is None:
+                    continue
+                expected = find_ion_by_name(f'({name})', ions)
+                assert catalog.find(f'({name})', ion_type).name == expected.name
+
+
+def test_resolve_ion_sites():
+    logger = Mock()
+    sites = {
+        'A': ('Cs; (PEA); unknown', '0.05; x; 0.16'),
+        'B': ('Pb; Sn', '1'),
+        'C': ('I; Br', '2.5; 0.5'),
+    }
+    ions = resolve_ion_sites(sites, logger)
+    logger.warn.assert_called_once()
+    # the B site is skipped because the numbers of names and coefficients differ
+    assert [(ion.ion_type, ion.name, ion.coefficients) for ion in ions] == [
+        ('A', 'Cs', 0.05),
+        ('A', 'PEA', None),
+        ('A', 'unknown', 0.16),
+        ('C', 'I', 2.5),
+        ('C', 'Br', 0.5),
+    ]
+
+    # ions are completed like by Ion.normalize
+    for ion_type in ('A', 'C'):
+        names = sites[ion_type][0].split('; ')
+        for ion, name in zip([ion for ion in ions if ion.ion_type == ion_type], names):
+            expected = Ion(name=name, ion_type=ion_type)
+            expected.normalize(None, None)
+            assert ion.smile == expected.smile
+            assert ion.alternative_names == expected.alternative_names
+
+
+def test_compiled_ion_tables_up_to_date():
+    assert not is_compiled_ion_tables_stale()
+    compiled = read_compiled_ion_tables()
+    for ion_type in ION_TYPES:
+        assert compiled[ion_type] == read_ion_rows_from_xlsx(ion_type)
+
+
+def test_compiled_ion_tables_missing(tmp_path):
+    assert is_compiled_ion_tables_stale(str(tmp_path / 'ion_data.arrow'))
+    target = compile_ion_tables(str(tmp_path / 'ion_data.arrow'))
+    assert not is_compiled_ion_tables_stale(target)
@@ -0,0 +1,101 @@
+from nomad.datamodel import EntryArchive
+from nomad.datamodel.metainfo.basesections import PubChemPureSubstanceSection
+
+from perovskite_solar_cell_database.cache import PersistentCache
+from perovskite_solar_cell_database.network import TokenBucket
+from perovskite_solar_cell_database.pubchem import (
+    PubChemResolver,
+    _memory_cache,
+    normalize_pub_chem_section,
+    prefetch_pub_chem_sections,
+    pub_chem_cache_key,
+    set_cached_pub_chem_values,
+    set_offline_mode,
+)
+
+
+def test_pub_chem_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        'perovskite_solar_cell_database.pubchem._disk_cache',
+        PersistentCache('pubchem', path=str(tmp_path / 'pubchem.sqlite')),
+    )
+    _memory_cache.clear()
+
+    def normalize(archive, logger):
+        raise AssertionError('PubChem was queried.')
+
+    section = PubChemPureSubstanceSection(smile='C[NH3+]')
+    set_cached_pub_chem_values(
+        {pub_chem_cache_key(section): {'pub_chem_cid': 644041, 'name': 'MA'}}
+    )
+    normalize_pub_chem_section(section, EntryArchive(), None, normalize=normalize)
+    assert section.pub_chem_cid == 644041
+    assert section.name == 'MA'
+
+
+def test_pub_chem_offline_mode(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        'perovskite_solar_cell_database.pubchem._disk_cache',
+        PersistentCache('pubchem', path=str(tmp_path / 'pubchem.sqlite')),
+    )
+    _memory_cache.clear()
+    set_offline_mode(True)
+    try:
+        section = PubChemPureSubstanceSection(smile='[Pb+2]')
+        normalize_pub_chem_section(section, EntryArchive(), None)
+        assert section.pub_chem_cid is None
+        assert section.cas_number == '14280-50-3'
+        assert section.iupac_name == 'lead(2+)'
+    finally:
+        set_offline_mode(None)
+
+
+class FakeResponse:
+    def __init__(self, data, status_code=200):
+        self.data = data
+        self.status_code = status_code
+        self.ok = status_code == 200
+        self.reason = 'OK'
+        self.url = ''
+
+    def json(self):
+        return self.data
+
+
+class FakeSession:
+    def __init__(self):
+        self.urls = []
+
+    def get(self, url, timeout=None):
+        self.urls.append(url)
+        if '/cids/' in url:
+            return FakeResponse({'IdentifierList': {'CID': [644041]}})
+        if '/property/' in url:
+            return FakeResponse(
+                {'PropertyTable': {'Properties': [{'Title': 'Methylammonium'}]}}
+            )
+        return FakeResponse({'InformationList': {'Information': [{'Synonym': []}]}})
+
+
+def test_prefetch_pub_chem_sections(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        'perovskite_solar_cell_database.pubchem._disk_cache',
+        PersistentCache('pubchem', path=str(tmp_path / 'pubchem.sqlite')),
+    )
+    _memory_cache.clear()
+    session = FakeSession()
+    resolver = PubChemResolver(session=session, rate_limiter=TokenBucket(1000))
+
+    sections = [PubChemPureSubstanceSection(smile='C[NH3+]') for _ in range(3)]
+    assert prefetch_pub_chem_sections(sections, resolver=resolver) == 1
+    assert len(session.urls) == 3
+    assert sections[0].pub_chem_cid is None
+
+    def normalize(archive, logger):
+        raise AssertionError('PubChem was queried.')
+
+    normalize_pub_chem_section(sections[1], EntryArchive(), None, normalize=normalize)
+    assert sections[1].pub_chem_cid == 644041
+    assert sections[1].name == 'Methylammonium'
+    assert prefetch_pub_chem_sections(sections[::2], resolver=resolver) == 0
+    assert len(session.urls) == 3
@@ -0,0 +1,41 @@
+from ase import Atoms
+from nomad.datamodel.results import System
+from nomad.normalizing.common import nomad_atoms_from_ase_atoms
+
+from perovskite_solar_cell_database.topology import (
+    cached_topology_system,
+    clear_topology_cache,
+    structure_atoms,
+)
+
+
+def test_cached_topology_system():
+    clear_topology_cache()
+    built = []
+
+    def build():
+        built.append(1)
+        return System(label='Perovskite B Ion: Pb')
+
+    first = cached_topology_system(('Pb', '[Pb+2]'), build)
+    first.label = 'modified'
+    second = cached_topology_system(('Pb', '[Pb+2]'), build)
+    assert len(built) == 1
+    assert second.label == 'Perovskite B Ion: Pb'
+    assert second is not first
+
+    cached_topology_system(('Sn', '[Sn+2]'), build, keep=lambda system: False)
+    cached_topology_system(('Sn', '[Sn+2]'), build, keep=lambda system: False)
+    assert len(built) == 3
+
+
+def test_structure_atoms():
+    for ase_atoms in (
+        Atoms(numbers=[82], positions=[[0.0, 0.0, 0.0]]),
+        Atoms(numbers=[53, 1], positions=[[0.86, 0.0, 0.0], [-0.86, 0.0, 0.0]]),
+    ):
+        expected = nomad_atoms_from_ase_atoms(ase_atoms).m_to_dict()
+        assert structure_atoms(ase_atoms).m_to_dict() == expected
+        # copies are independent
+        assert structure_atoms(ase_atoms) is not structure_atoms(ase_atoms)
+    assert structure_atoms(None) is None
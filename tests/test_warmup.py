@@ -0,0 +1,44 @@
+import pytest
+
+from perovskite_solar_cell_database import warmup as warmup_module
+from perovskite_solar_cell_database.warmup import WARMUP_STEPS, warmup
+
+
+@pytest.fixture
+def fresh_warmup(monkeypatch):
+    monkeypatch.setattr(warmup_module, '_done', set())
+
+
+def test_warmup(fresh_warmup):
+    durations = warmup()
+    assert list(durations) == list(WARMUP_STEPS)
+    assert all(duration >= 0 for duration in durations.values())
+
+    # every step runs once per process
+    assert warmup() == {}
+
+
+def test_warmup_continues_after_failure(fresh_warmup, monkeypatch):
+    def fail():
+        raise RuntimeError('unavailable')
+
+    monkeypatch.setitem(WARMUP_STEPS, 'rdkit', fail)
+    durations = warmup(['rdkit', 'formula_normalizer'])
+    assert list(durations) == ['rdkit', 'formula_normalizer']
+
+
+def test_warmup_unknown_step(fresh_warmup):
+    with pytest.raises(ValueError):
+        warmup(['pymatgen'])
+
+
+def test_open_persistent_cache(tmp_path):
+    from perovskite_solar_cell_database.cache import PersistentCache
+
+    cache = PersistentCache('test', path=str(tmp_path / 'test.sqlite'))
+    assert cache.open()
+    assert (tmp_path / 'test.sqlite').exists()
+
+    not_a_directory = tmp_path / 'not_a_directory'
+    not_a_directory.write_text('')
+    assert not PersistentCache('test', path=str(not_a_directory / 'test.sqlite')).open()